@@ -1,7 +1,10 @@
 """Entry point for the SystemLink CLI application.
 
-Performs system trust store injection (via truststore) before loading the main CLI.
+When an ``slcli daemon`` is running, the command is forwarded to it before any
+of the CLI is imported. Otherwise the main CLI is loaded; system trust store
+injection (via truststore) happens on the first HTTPS request.
 Environment controls:
+    SLCLI_NO_DAEMON=1         -> never forward commands to the daemon
     SLCLI_DISABLE_OS_TRUST=1  -> skip injection
     SLCLI_FORCE_OS_TRUST=1    -> raise if injection fails
     SLCLI_DEBUG_OS_TRUST=1    -> show traceback on injection failure
@@ -9,15 +12,42 @@ Environment controls:
 
 from __future__ import annotations
 
-# Use absolute import to remain robust when executed as a standalone script
-# (e.g. PyInstaller / Homebrew launcher contexts)
-from slcli.ssl_trust import inject_os_trust  # noqa: E402,I100,I202
+import sys
+from typing import Any
 
-# Perform trust injection before importing the main CLI so that any subsequent
-# imports of requests-based utilities see the patched SSL configuration.
-inject_os_trust()
 
-from slcli.main import cli  # noqa: E402,I100,I202
+def _load_cli() -> Any:
+    """Import the main CLI group."""
+    # Use absolute imports to remain robust when executed as a standalone script
+    # (e.g. PyInstaller / Homebrew launcher contexts)
+    from slcli.main import cli
+
+    return cli
+
+
+def main() -> None:
+    """Run slcli, forwarding to a running daemon when one is available."""
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        # Answer without importing Click, Rich or any command module.
+        from slcli.version import get_version
+
+        print(f"slcli version {get_version()}")
+        return
+
+    from slcli.daemon import forward_to_daemon
+
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    _load_cli()()
+
+
+def __getattr__(name: str) -> Any:
+    """Provide ``cli`` lazily for launchers that still reference ``slcli.__main__:cli``."""
+    if name == "cli":
+        return _load_cli()
+    raise AttributeError(name)
+
 
 if __name__ == "__main__":
-    cli()
+    main()
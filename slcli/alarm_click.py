@@ -1,17 +1,19 @@
 """CLI commands for SystemLink Alarm Management."""
 
 import datetime
+import functools
 import json
 import re
 import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 import click
 import questionary
 
-from .cli_utils import confirm_bulk_operation, validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, confirm_bulk_operation, validate_output_format
+from .field_projection import fields_table, parse_fields, project_items
 from .rich_output import render_table
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
@@ -22,6 +24,7 @@ from .utils import (
     get_workspace_map,
     handle_api_error,
     make_api_request,
+    pooled_http_session,
 )
 from .workspace_utils import get_effective_workspace, resolve_workspace_filter
 
@@ -29,6 +32,7 @@ _MAX_QUERY_TAKE = 1000
 _MAX_ACKNOWLEDGE_IDS = 1000
 _MAX_DELETE_IDS = 5000
 _MAX_SEVERITY = 2_147_483_647
+_MAX_MONITOR_ALARMS = 100_000
 
 
 def _get_alarm_base_url() -> str:
@@ -76,11 +80,14 @@ def _build_alarm_filter(
     workspace: Optional[str],
     filter_query: Optional[str],
     substitutions: Tuple[str, ...],
+    workspace_map: Optional[Dict[str, str]] = None,
 ) -> Tuple[Optional[str], List[Any], Dict[str, str]]:
-    """Build a Dynamic LINQ alarm filter and resolve workspace display data."""
+    """Build a Dynamic LINQ alarm filter and resolve workspace display data.
+
+    A previously resolved ``workspace_map`` can be passed to avoid fetching it again.
+    """
     parts: List[str] = []
     filter_substitutions: List[Any] = []
-    workspace_map: Dict[str, str] = {}
 
     if state == "active":
         parts.append("active == true")
@@ -96,10 +103,11 @@ def _build_alarm_filter(
 
     effective_workspace = get_effective_workspace(workspace)
     if effective_workspace:
-        try:
-            workspace_map = get_workspace_map()
-        except Exception:
-            workspace_map = {}
+        if workspace_map is None:
+            try:
+                workspace_map = get_workspace_map()
+            except Exception:
+                workspace_map = {}
         workspace_id = resolve_workspace_filter(effective_workspace, workspace_map)
         _append_filter(parts, filter_substitutions, "workspace == @{index}", workspace_id)
 
@@ -113,7 +121,129 @@ def _build_alarm_filter(
             parts.append(filter_query)
             filter_substitutions = user_substitutions
 
-    return (" && ".join(parts) if parts else None), filter_substitutions, workspace_map
+    return (" && ".join(parts) if parts else None), filter_substitutions, workspace_map or {}
+
+
+def _build_alarm_predicate(
+    state: str,
+    alarm_id: Optional[str],
+    display_name: Optional[str],
+    channel: Optional[str],
+    resource_type: Optional[str],
+    min_severity: Optional[int],
+    max_severity: Optional[int],
+) -> Callable[[Dict[str, Any]], bool]:
+    """Build a client-side check mirroring the convenience filters.
+
+    The monitor polls for updates without these criteria so it can notice alarms
+    that stop matching (for example when they clear or drop in severity).
+    """
+
+    def matches(alarm: Dict[str, Any]) -> bool:
+        if state == "active" and not alarm.get("active"):
+            return False
+        if state == "inactive" and alarm.get("active"):
+            return False
+        if alarm_id and alarm.get("alarmId") != alarm_id:
+            return False
+        if display_name and display_name not in (alarm.get("displayName") or ""):
+            return False
+        if channel and channel not in (alarm.get("channel") or ""):
+            return False
+        if resource_type and alarm.get("resourceType") != resource_type:
+            return False
+        severity = alarm.get("currentSeverityLevel")
+        if min_severity is not None and (severity is None or severity < min_severity):
+            return False
+        if max_severity is not None and (severity is None or severity > max_severity):
+            return False
+        return True
+
+    return matches
+
+
+def _parse_alarm_timestamp(value: Any) -> Optional[datetime.datetime]:
+    """Parse an ISO-8601 alarm timestamp, returning None when unavailable."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class _AlarmIndex:
+    """Keyed in-memory view of the alarms tracked by ``alarm monitor``.
+
+    Updates are applied per instance ID, so each poll only touches alarms the
+    server reported as changed. The index also tracks the newest ``updatedAt``
+    seen, which becomes the watermark for the next incremental query.
+    """
+
+    def __init__(self, predicate: Callable[[Dict[str, Any]], bool]) -> None:
+        """Create an empty index that keeps alarms accepted by ``predicate``."""
+        self.alarms: Dict[str, Dict[str, Any]] = {}
+        self.watermark: Optional[str] = None
+        self._watermark_time: Optional[datetime.datetime] = None
+        self._predicate = predicate
+
+    @staticmethod
+    def _key(alarm: Dict[str, Any]) -> str:
+        return str(alarm.get("instanceId") or alarm.get("alarmId") or "")
+
+    def _advance_watermark(self, alarm: Dict[str, Any]) -> None:
+        updated_at = _parse_alarm_timestamp(alarm.get("updatedAt"))
+        if updated_at is not None and (
+            self._watermark_time is None or updated_at > self._watermark_time
+        ):
+            self._watermark_time = updated_at
+            self.watermark = alarm["updatedAt"]
+
+    def apply(self, alarms: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Upsert or drop updated alarms and return the resulting changes.
+
+        Returns:
+            ``(change, alarm)`` pairs where change is ``added``, ``updated`` or
+            ``removed``. Alarms identical to the indexed copy produce no change.
+        """
+        changes: List[Tuple[str, Dict[str, Any]]] = []
+        for alarm in alarms:
+            self._advance_watermark(alarm)
+            key = self._key(alarm)
+            if not key:
+                continue
+            existing = self.alarms.get(key)
+            if not self._predicate(alarm):
+                if existing is not None:
+                    del self.alarms[key]
+                    changes.append(("removed", alarm))
+                continue
+            if existing is None:
+                changes.append(("added", alarm))
+            elif existing != alarm:
+                changes.append(("updated", alarm))
+            else:
+                continue
+            self.alarms[key] = alarm
+        return changes
+
+    def replace(self, alarms: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Reconcile the index with a complete result set from a full query.
+
+        Indexed alarms missing from ``alarms`` are reported as removed; this
+        catches deletions and alarms that left a raw ``--filter`` expression.
+        """
+        current_keys = {self._key(alarm) for alarm in alarms}
+        changes: List[Tuple[str, Dict[str, Any]]] = []
+        for key in [key for key in self.alarms if key not in current_keys]:
+            changes.append(("removed", self.alarms.pop(key)))
+        return changes + self.apply(alarms)
+
+    def snapshot(self, take: int) -> List[Dict[str, Any]]:
+        """Return up to ``take`` indexed alarms, most recently updated first."""
+        return sorted(
+            self.alarms.values(), key=lambda alarm: str(alarm.get("updatedAt") or ""), reverse=True
+        )[:take]
 
 
 def _extract_json(resp: Any) -> Any:
@@ -202,6 +332,26 @@ def _query_all_alarms(
     return alarms[:max_items]
 
 
+def _query_alarm_updates(
+    filter_expr: Optional[str],
+    substitutions: List[Any],
+    watermark: str,
+    include_transitions: bool,
+    most_recent_only: bool,
+) -> List[Dict[str, Any]]:
+    """Fetch every alarm updated at or after the watermark."""
+    index = len(substitutions)
+    since_expr = f"updatedAt >= DateTime.parse(@{index})"
+    delta_expr = f"({filter_expr}) && {since_expr}" if filter_expr else since_expr
+    return _query_all_alarms(
+        delta_expr,
+        [*substitutions, watermark],
+        _MAX_MONITOR_ALARMS,
+        include_transitions,
+        most_recent_only,
+    )
+
+
 def _format_timestamp(value: Any) -> str:
     """Format a timestamp for a compact table cell."""
     if not value:
@@ -237,6 +387,43 @@ def _alarm_formatter(item: Dict[str, Any], workspace_map: Dict[str, str]) -> Lis
     ]
 
 
+def _display_alarm_changes(
+    changes: List[Tuple[str, Dict[str, Any]]],
+    format_output: str,
+    workspace_map: Dict[str, str],
+) -> None:
+    """Render only the alarms that changed since the previous poll."""
+    if format_output.lower() == "jsonl":
+        observed_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        for change, alarm in changes:
+            event = {
+                "event": change,
+                "observedAt": observed_at,
+                "instanceId": alarm.get("instanceId"),
+                "alarm": alarm,
+            }
+            click.echo(json.dumps(event, default=str))
+        return
+
+    render_table(
+        headers=[
+            "Change",
+            "State",
+            "Severity",
+            "Name",
+            "Alarm ID",
+            "Occurred",
+            "Workspace",
+            "Instance ID",
+        ],
+        column_widths=[8, 18, 8, 28, 28, 20, 20, 28],
+        rows=[
+            [change.upper(), *_alarm_formatter(alarm, workspace_map)] for change, alarm in changes
+        ],
+        show_total=False,
+    )
+
+
 def _get_transition_count(item: Dict[str, Any]) -> int:
     """Return the number of transitions when the response contains a list."""
     transitions = item.get("transitions")
@@ -250,20 +437,30 @@ def _display_alarm_list(
     total_count: Optional[int] = None,
     shown_count: Optional[int] = None,
     include_transitions: bool = False,
+    fields: Optional[List[str]] = None,
 ) -> None:
-    """Render alarms in JSON or a compact operational table."""
+    """Render alarms in JSON or a compact operational table, limited to ``fields`` if given."""
 
-    def formatter(item: Dict[str, Any]) -> List[str]:
+    def _format(item: Dict[str, Any]) -> List[str]:
         return _alarm_formatter(item, workspace_map)
 
+    headers = ["State", "Severity", "Name", "Alarm ID", "Occurred", "Workspace", "Instance ID"]
+    column_widths = [18, 8, 28, 28, 20, 20, 28]
+    formatter: Callable[[Dict[str, Any]], List[str]] = _format
+    if fields:
+        # The alarm query API has no projection; trim on the client
+        headers, column_widths, formatter = fields_table(fields)
+        if format_output.lower() == "json":
+            alarms = project_items(alarms, fields)
+
     UniversalResponseHandler.handle_list_response(
         resp=FilteredResponse({"alarms": alarms}),
         data_key="alarms",
         item_name="alarm",
         format_output=format_output,
         formatter_func=formatter,
-        headers=["State", "Severity", "Name", "Alarm ID", "Occurred", "Workspace", "Instance ID"],
-        column_widths=[18, 8, 28, 28, 20, 20, 28],
+        headers=headers,
+        column_widths=column_widths,
         empty_message="No alarms found.",
         enable_pagination=False,
         page_size=len(alarms) or 1,
@@ -368,13 +565,13 @@ def _confirm_alarm_operation(action: str, count: int, force: bool) -> bool:
     return confirm_bulk_operation(action, "alarm", count, force=force)
 
 
-def _list_alarm_options(function: Any) -> Any:
+def _list_alarm_options(function: Any, formats: Sequence[str] = ("table", "json")) -> Any:
     """Apply shared list/search options to a Click command."""
     options = [
         click.option(
             "--format",
             "-f",
-            type=click.Choice(["table", "json"]),
+            type=click.Choice(list(formats)),
             default="table",
             show_default=True,
             help="Output format",
@@ -441,6 +638,7 @@ def _run_list_alarms(
     substitutions: Tuple[str, ...],
     include_transitions: bool,
     most_recent_only: bool,
+    fields: Optional[List[str]] = None,
 ) -> None:
     """Execute the shared alarm list/search workflow."""
     format_output = validate_output_format(format)
@@ -461,7 +659,7 @@ def _run_list_alarms(
         substitutions,
     )
 
-    if format_output.lower() == "json":
+    if format_output.lower() != "table":
         alarms = _query_all_alarms(
             filter_expr,
             filter_substitutions,
@@ -470,7 +668,11 @@ def _run_list_alarms(
             most_recent_only,
         )
         _display_alarm_list(
-            alarms, format_output, workspace_map, include_transitions=include_transitions
+            alarms,
+            format_output,
+            workspace_map,
+            include_transitions=include_transitions,
+            fields=fields,
         )
         return
 
@@ -498,6 +700,7 @@ def _run_list_alarms(
             total_count=total_count,
             shown_count=shown_count,
             include_transitions=include_transitions,
+            fields=fields,
         )
         if not continuation_token:
             break
@@ -513,7 +716,13 @@ def register_alarm_commands(cli: Any) -> None:
         """View and manage SystemLink alarms."""
 
     @alarm.command(name="list")
-    @_list_alarm_options
+    @functools.partial(_list_alarm_options, formats=LIST_OUTPUT_FORMATS)
+    @click.option(
+        "--fields",
+        "fields_option",
+        default=None,
+        help="Comma-separated fields to show, e.g. instanceId,displayName,currentSeverityLevel",
+    )
     def list_alarms(
         format: str,
         take: int,
@@ -529,8 +738,10 @@ def register_alarm_commands(cli: Any) -> None:
         substitutions: Tuple[str, ...],
         include_transitions: bool,
         most_recent_only: bool,
+        fields_option: Optional[str],
     ) -> None:
         """List active alarms or search alarm history."""
+        fields = parse_fields(fields_option)
         try:
             _run_list_alarms(
                 format,
@@ -547,6 +758,7 @@ def register_alarm_commands(cli: Any) -> None:
                 substitutions,
                 include_transitions,
                 most_recent_only,
+                fields,
             )
         except Exception as exc:  # noqa: BLE001
             handle_api_error(exc)
@@ -804,7 +1016,19 @@ def register_alarm_commands(cli: Any) -> None:
         help="Seconds between refreshes",
     )
     @click.option("--once", is_flag=True, help="Render one snapshot and exit")
-    @click.option("--no-clear", is_flag=True, help="Keep previous snapshots in the terminal")
+    @click.option(
+        "--events",
+        is_flag=True,
+        help="Emit one JSON object per added/updated/removed alarm (JSON lines)",
+    )
+    @click.option(
+        "--resync-every",
+        type=click.IntRange(min=0),
+        default=120,
+        show_default=True,
+        help="Re-run the full query every N polls to catch deletions (0 disables)",
+    )
+    @click.option("--no-clear", is_flag=True, hidden=True)
     def monitor_alarms(
         format: str,
         take: int,
@@ -822,13 +1046,29 @@ def register_alarm_commands(cli: Any) -> None:
         most_recent_only: bool,
         interval: float,
         once: bool,
+        events: bool,
+        resync_every: int,
         no_clear: bool,
     ) -> None:
-        """Continuously refresh an alarm dashboard until Ctrl+C."""
+        """Continuously refresh an alarm dashboard until Ctrl+C.
+
+        The first poll loads every matching alarm into a local index and renders
+        a snapshot of the first --take of them. Later polls only request alarms updated since the
+        newest timestamp already seen and render just the rows that changed.
+        With --format json the full snapshot is re-emitted whenever it changes.
+        """
         format_output = validate_output_format(format)
+        if events:
+            format_output = "jsonl"
         if min_severity is not None and max_severity is not None and min_severity > max_severity:
             click.echo("✗ --min-severity cannot be greater than --max-severity", err=True)
             sys.exit(ExitCodes.INVALID_INPUT)
+        if no_clear:
+            click.echo(
+                "⚠️ --no-clear is deprecated and has no effect: the monitor prints only "
+                "changed alarms and never clears the terminal.",
+                err=True,
+            )
 
         try:
             filter_expr, filter_substitutions, workspace_map = _build_alarm_filter(
@@ -843,38 +1083,90 @@ def register_alarm_commands(cli: Any) -> None:
                 filter_query,
                 substitutions,
             )
-            previous_snapshot: Optional[str] = None
-            while True:
-                alarms, _, _ = _query_alarm_page(
-                    filter_expr,
-                    filter_substitutions,
-                    take,
-                    include_transitions=include_transitions,
-                    most_recent_only=most_recent_only,
+            update_expr, update_substitutions, _ = _build_alarm_filter(
+                "all",
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                workspace,
+                filter_query,
+                substitutions,
+                workspace_map=workspace_map,
+            )
+            index = _AlarmIndex(
+                _build_alarm_predicate(
+                    state,
+                    alarm_id,
+                    display_name,
+                    channel,
+                    resource_type,
+                    min_severity,
+                    max_severity,
                 )
-                snapshot = json.dumps(alarms, sort_keys=True, default=str)
-                if snapshot != previous_snapshot:
-                    if (
-                        format_output.lower() == "table"
-                        and previous_snapshot is not None
-                        and not no_clear
-                    ):
-                        click.clear()
-                    if format_output.lower() == "table":
-                        click.echo(
-                            f"Alarm monitor | {datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')} | {len(alarms)} alarm(s)"
+            )
+            poll = 0
+            with pooled_http_session():
+                while True:
+                    full_query = poll == 0 or index.watermark is None
+                    full_query = full_query or bool(resync_every and poll % resync_every == 0)
+                    if full_query:
+                        changes = index.replace(
+                            _query_all_alarms(
+                                filter_expr,
+                                filter_substitutions,
+                                _MAX_MONITOR_ALARMS,
+                                include_transitions,
+                                most_recent_only,
+                            )
+                        )
+                    else:
+                        changes = index.apply(
+                            _query_alarm_updates(
+                                update_expr,
+                                update_substitutions,
+                                index.watermark or "",
+                                include_transitions,
+                                most_recent_only,
+                            )
                         )
-                    _display_alarm_list(
-                        alarms,
-                        format_output,
-                        workspace_map,
-                        include_transitions=include_transitions,
-                    )
-                    previous_snapshot = snapshot
 
-                if once:
-                    break
-                time.sleep(interval)
+                    if poll == 0 and format_output != "jsonl":
+                        if format_output == "table":
+                            click.echo(
+                                f"Alarm monitor | {datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')} | {len(index.alarms)} alarm(s)"
+                            )
+                        _display_alarm_list(
+                            index.snapshot(take),
+                            format_output,
+                            workspace_map,
+                            include_transitions=include_transitions,
+                        )
+                    elif changes and format_output == "json":
+                        _display_alarm_list(
+                            index.snapshot(take),
+                            format_output,
+                            workspace_map,
+                            include_transitions=include_transitions,
+                        )
+                    elif changes:
+                        if format_output == "table":
+                            counts = {
+                                change: sum(1 for name, _ in changes if name == change)
+                                for change in ("added", "updated", "removed")
+                            }
+                            click.echo(
+                                f"\nAlarm monitor | {datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')} | {len(index.alarms)} alarm(s) | "
+                                + ", ".join(f"{count} {name}" for name, count in counts.items())
+                            )
+                        _display_alarm_changes(changes, format_output, workspace_map)
+
+                    if once:
+                        break
+                    poll += 1
+                    time.sleep(interval)
         except KeyboardInterrupt:
             click.echo("\nAlarm monitor stopped.")
         except Exception as exc:  # noqa: BLE001
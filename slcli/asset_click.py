@@ -7,12 +7,13 @@ number, bus type, asset type, calibration status, and connection state.
 
 import json
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 import questionary
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .field_projection import fields_table, parse_fields, project_items
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -457,7 +458,7 @@ def register_asset_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -535,6 +536,12 @@ def register_asset_commands(cli: Any) -> None:
         is_flag=True,
         help="Show summary statistics instead of listing assets",
     )
+    @click.option(
+        "--fields",
+        "fields_option",
+        default=None,
+        help="Comma-separated fields to show, e.g. id,name,modelName,location.minionId",
+    )
     def list_assets(
         format: str,
         take: int,
@@ -550,6 +557,7 @@ def register_asset_commands(cli: Any) -> None:
         order_by: Optional[str],
         descending: bool,
         summary: bool,
+        fields_option: Optional[str],
     ) -> None:
         """List and query assets with optional filtering.
 
@@ -561,6 +569,7 @@ def register_asset_commands(cli: Any) -> None:
         ModelName.Contains("PXI") and BusType = "PCI_PXI"
         """
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
 
         try:
             # Resolve workspace if provided
@@ -613,8 +622,12 @@ def register_asset_commands(cli: Any) -> None:
                 "ID",
             ]
             column_widths = [24, 20, 16, 12, 16, 16, 16, 36]
+            formatter: Callable[[Dict[str, Any]], List[str]] = asset_formatter
+            if fields:
+                # The asset query API has no projection; trim on the client
+                headers, column_widths, formatter = fields_table(fields)
 
-            if format_output.lower() == "json":
+            if format_output.lower() != "table":
                 _warn_if_large_dataset(filter_expr, calibratable)
                 assets = _query_all_assets(
                     filter_expr,
@@ -628,13 +641,13 @@ def register_asset_commands(cli: Any) -> None:
                     summary_stats = _summarize_assets(assets)
                     click.echo(json.dumps(summary_stats, indent=2))
                 else:
-                    mock_resp: Any = FilteredResponse({"assets": assets})
+                    mock_resp: Any = FilteredResponse({"assets": project_items(assets, fields)})
                     UniversalResponseHandler.handle_list_response(
                         resp=mock_resp,
                         data_key="assets",
                         item_name="asset",
                         format_output=format_output,
-                        formatter_func=asset_formatter,
+                        formatter_func=formatter,
                         headers=headers,
                         column_widths=column_widths,
                         empty_message="No assets found.",
@@ -663,7 +676,7 @@ def register_asset_commands(cli: Any) -> None:
                         descending=descending,
                         take=take,
                         calibratable_only=calibratable,
-                        formatter_func=asset_formatter,
+                        formatter_func=formatter,
                         headers=headers,
                         column_widths=column_widths,
                         empty_message="No assets found.",
@@ -0,0 +1,260 @@
+"""Concurrent API requests over an optional async HTTP/2 transport.
+
+Commands that issue many independent requests describe them as
+:class:`ApiCall` values and hand them to :func:`run_api_calls`; today these
+are the Test Monitor summary count probes and the MCP ``read_tag_values``
+tool. By default each call goes through :func:`~slcli.utils.make_api_request`
+on a small thread pool. With ``SLCLI_HTTP_TRANSPORT=async`` and ``httpx``
+installed (``httpx2``, which the ``httpx`` and ``mcp`` extras install, works
+too) the calls instead share one event loop and one client, multiplexed over
+a few HTTP/2 connections when ``h2`` is installed and pooled HTTP/1.1
+connections otherwise.
+
+Continuation-token paging stays on ``requests``: each page needs the token
+from the one before, so there is nothing to send concurrently.
+
+The async transport keeps the semantics of ``make_api_request``: the same
+authentication headers and SSL trust, responses returned as
+:class:`requests.Response` objects, ``requests`` exceptions for HTTP and
+connection errors, and ``handle_api_error`` reporting when ``handle_errors``
+is set. Requests show up in ``--trace`` like any other.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import importlib
+import importlib.util
+import os
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+TRANSPORT_ENV = "SLCLI_HTTP_TRANSPORT"
+DEFAULT_CONCURRENCY = 16
+# Connections per host for the async client; HTTP/2 multiplexes streams over each.
+HTTP2_CONNECTIONS = 4
+
+ApiResult = Union["requests.Response", BaseException]
+
+
+@dataclass(frozen=True)
+class ApiCall:
+    """One request for :func:`run_api_calls`, mirroring ``make_api_request`` arguments."""
+
+    method: str
+    url: str
+    payload: Optional[Union[Dict[str, Any], List[Any]]] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+def _httpx_module() -> Optional[ModuleType]:
+    for name in ("httpx", "httpx2"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+def async_transport_enabled() -> bool:
+    """Return whether ``SLCLI_HTTP_TRANSPORT`` selects the async transport and it is installed."""
+    requested = os.environ.get(TRANSPORT_ENV, "").strip().lower()
+    return requested in ("async", "http2") and _httpx_module() is not None
+
+
+def _to_requests_response(response: Any, prepared: requests.PreparedRequest) -> requests.Response:
+    import requests
+
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content
+    converted.headers = requests.structures.CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.charset_encoding
+    converted.elapsed = response.elapsed
+    converted.request = prepared
+    return converted
+
+
+def _to_requests_error(httpx: ModuleType, exc: Exception) -> requests.RequestException:
+    import requests
+
+    if isinstance(exc, httpx.TimeoutException):
+        return requests.Timeout(str(exc))
+    if isinstance(exc, httpx.TransportError):
+        return requests.ConnectionError(str(exc))
+    return requests.RequestException(str(exc))
+
+
+class AsyncApiClient:
+    """Async client sending :class:`ApiCall` requests with ``make_api_request`` semantics.
+
+    Use as ``async with AsyncApiClient() as client: await client.send(call)``.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Prepare a client allowing ``concurrency`` requests in flight."""
+        httpx = _httpx_module()
+        if httpx is None:
+            raise ImportError("The async transport needs httpx: pip install 'httpx[http2]'")
+        self._httpx = httpx
+        self._http2 = importlib.util.find_spec("h2") is not None
+        self._concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._clients: Dict[Any, Any] = {}
+
+    @property
+    def http2(self) -> bool:
+        """Whether requests are multiplexed over HTTP/2."""
+        return self._http2
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        """Open the client."""
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close every connection pool."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def _client_for(self, ssl_verify: Union[bool, str]) -> Any:
+        # One client per trust setting, so a managed CA bundle is honoured per server
+        client = self._clients.get(ssl_verify)
+        if client is None:
+            from .ssl_trust import build_ssl_context
+
+            connections = HTTP2_CONNECTIONS if self._http2 else self._concurrency
+            client = self._httpx.AsyncClient(
+                http2=self._http2,
+                verify=build_ssl_context(ssl_verify),
+                timeout=None,  # make_api_request sets no timeout either
+                limits=self._httpx.Limits(
+                    max_connections=connections, max_keepalive_connections=connections
+                ),
+                trust_env=True,
+            )
+            self._clients[ssl_verify] = client
+        return client
+
+    async def send(self, call: ApiCall) -> requests.Response:
+        """Send ``call``; raise ``requests`` exceptions exactly as ``make_api_request`` does."""
+        import requests
+
+        from .http_trace import active_tracer
+        from .utils import get_headers, get_ssl_verify
+
+        headers = get_headers()
+        if call.headers:
+            headers.update(call.headers)
+        method = call.method.upper()
+        prepared = requests.Request(
+            method, call.url, headers=headers, json=call.payload if method != "GET" else None
+        ).prepare()
+        client = self._client_for(get_ssl_verify(call.url))
+
+        assert self._semaphore is not None, "use AsyncApiClient as an async context manager"
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                raw = await client.request(
+                    method, prepared.url, headers=dict(prepared.headers), content=prepared.body
+                )
+            except self._httpx.HTTPError as exc:
+                tracer = active_tracer()
+                if tracer is not None:
+                    tracer.record(prepared, None, started, time.perf_counter(), False, exc)
+                raise _to_requests_error(self._httpx, exc) from exc
+        response = _to_requests_response(raw, prepared)
+        tracer = active_tracer()
+        if tracer is not None:
+            tracer.record(prepared, response, started, time.perf_counter(), False)
+        response.raise_for_status()
+        return response
+
+
+async def gather_api_calls(
+    calls: Sequence[ApiCall], concurrency: int = DEFAULT_CONCURRENCY
+) -> List[ApiResult]:
+    """Send ``calls`` over one async client; failures are returned in place of responses."""
+    async with AsyncApiClient(concurrency) as client:
+        return list(
+            await asyncio.gather(*(client.send(call) for call in calls), return_exceptions=True)
+        )
+
+
+def _run_async(calls: Sequence[ApiCall], concurrency: int) -> List[ApiResult]:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_api_calls(calls, concurrency))
+    # Already inside an event loop (e.g. an MCP tool): use a private loop in a worker thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, gather_api_calls(calls, concurrency)).result()
+
+
+def _run_threaded(
+    calls: Sequence[ApiCall], concurrency: int, send: Callable[..., Any]
+) -> List[ApiResult]:
+    def _send(call: ApiCall) -> Any:
+        return send(
+            call.method, call.url, payload=call.payload, headers=call.headers, handle_errors=False
+        )
+
+    workers = max(1, min(concurrency, len(calls)))
+    results: List[ApiResult] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(_send, call) for call in calls]:
+            try:
+                results.append(future.result())
+            except Exception as exc:  # noqa: BLE001 - returned to the caller
+                results.append(exc)
+    return results
+
+
+def run_api_calls(
+    calls: Sequence[ApiCall],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    handle_errors: bool = True,
+    return_exceptions: bool = False,
+    send: Optional[Callable[..., Any]] = None,
+) -> List[Any]:
+    """Send ``calls`` concurrently and return their responses in order.
+
+    Args:
+        calls: Requests to send.
+        concurrency: Maximum number of requests in flight.
+        handle_errors: Report the first failure with ``handle_api_error`` (which
+            exits), as ``make_api_request`` does. Ignored with ``return_exceptions``.
+        return_exceptions: Return failures in place of responses instead of
+            raising, like :func:`asyncio.gather`.
+        send: Function used without the async transport; defaults to
+            :func:`~slcli.utils.make_api_request`.
+
+    Returns:
+        One ``requests.Response`` (or exception) per call, in call order.
+    """
+    from . import utils
+
+    if not calls:
+        return []
+    if async_transport_enabled():
+        results = _run_async(calls, concurrency)
+    else:
+        results = _run_threaded(calls, concurrency, send or utils.make_api_request)
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, BaseException):
+                if handle_errors and isinstance(result, Exception):
+                    utils.handle_api_error(result)
+                raise result
+    return results
@@ -0,0 +1,301 @@
+"""CLI command that runs many slcli commands in one process."""
+
+import concurrent.futures
+import io
+import json
+import shlex
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import click
+
+from .daemon import NonInteractiveStdin
+from .platform import clear_platform_cache
+from .profiles import get_profile_override, set_profile_override
+from .rich_output import reset_consoles
+from .utils import ExitCodes, pooled_http_session, set_workspace_map_cache_ttl
+
+_PROFILE_OPTIONS = ("-p", "--profile")
+
+
+def parse_batch(text: str) -> List[List[str]]:
+    """Parse a batch script into argv lists.
+
+    The script is either a JSON array whose items are argv lists (or command
+    strings), or one command per line with shell-style quoting. Blank lines and
+    lines starting with ``#`` are skipped, and a leading ``slcli`` is optional.
+
+    Raises:
+        ValueError: If the script cannot be parsed.
+    """
+    stripped = text.strip()
+    if stripped.startswith("["):
+        try:
+            items = json.loads(stripped)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON batch: {exc}") from exc
+        commands = []
+        for index, item in enumerate(items, start=1):
+            if isinstance(item, str):
+                commands.append(shlex.split(item))
+            elif isinstance(item, list) and all(isinstance(arg, str) for arg in item):
+                commands.append(list(item))
+            else:
+                raise ValueError(f"Batch item {index} must be a string or a list of strings")
+    else:
+        commands = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                commands.append(shlex.split(line))
+            except ValueError as exc:
+                raise ValueError(f"Line {number}: {exc}") from exc
+    return [argv[1:] if argv and argv[0] == "slcli" else argv for argv in commands]
+
+
+def _sets_profile(argv: Sequence[str]) -> bool:
+    """Return whether ``argv`` passes the global ``--profile`` option."""
+    return any(arg in _PROFILE_OPTIONS or arg.startswith("--profile=") for arg in argv)
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """Text stream that sends each thread's writes to that thread's own buffer.
+
+    Threads without a buffer (for example helper threads started by a command)
+    write straight through to the fallback stream.
+    """
+
+    def __init__(self, fallback: TextIO, local: threading.local, name: str) -> None:
+        """Create a stream that falls back to ``fallback``."""
+        super().__init__()
+        self._fallback = fallback
+        self._local = local
+        self._name = name
+
+    def _target(self) -> TextIO:
+        return getattr(self._local, self._name, None) or self._fallback
+
+    def writable(self) -> bool:
+        """Return True."""
+        return True
+
+    def isatty(self) -> bool:
+        """Report a non-terminal stream so output is rendered for capture."""
+        return False
+
+    def write(self, text: str) -> int:
+        """Write ``text`` to the current thread's buffer."""
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        """Flush the current thread's target."""
+        self._target().flush()
+
+
+class BatchRunner:
+    """Run argv lists through a Click command, capturing output per command."""
+
+    def __init__(self, root_command: Any) -> None:
+        """Create a runner for ``root_command`` (the slcli group)."""
+        self.root_command = root_command
+        self._local = threading.local()
+        self._profile_override = get_profile_override()
+
+    def run_one(self, index: int, argv: List[str]) -> Dict[str, Any]:
+        """Run one command and return its result record."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        self._local.stdout, self._local.stderr = stdout, stderr
+        started = time.perf_counter()
+        exit_code = 0
+        sets_profile = _sets_profile(argv)
+        if sets_profile:
+            # The platform detected for the previous profile does not apply to this line
+            clear_platform_cache()
+        try:
+            if argv and argv[0] == "run-batch":
+                click.echo("✗ run-batch cannot be nested", err=True)
+                exit_code = ExitCodes.INVALID_INPUT
+            else:
+                self.root_command.main(args=list(argv), prog_name="slcli")
+        except SystemExit as exc:
+            code = exc.code
+            if code is None or isinstance(code, int):
+                exit_code = code or 0
+            else:
+                stderr.write(f"{code}\n")
+                exit_code = ExitCodes.GENERAL_ERROR
+        except Exception as exc:  # noqa: BLE001 - one failing line must not stop the batch
+            stderr.write(f"✗ {type(exc).__name__}: {exc}\n")
+            exit_code = ExitCodes.GENERAL_ERROR
+        finally:
+            self._local.stdout = self._local.stderr = None
+            if sets_profile:
+                set_profile_override(self._profile_override)
+                clear_platform_cache()
+        return {
+            "index": index,
+            "argv": argv,
+            "exitCode": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "durationMs": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def run(
+        self, commands: List[List[str]], parallel: int, stop_on_error: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield result records in input order.
+
+        With ``parallel`` above one, up to that many commands run at once; with
+        ``stop_on_error`` no further commands are started after a failure.
+        """
+        saved = (sys.stdin, sys.stdout, sys.stderr)
+        sys.stdin = NonInteractiveStdin()
+        sys.stdout = _ThreadRoutedStream(saved[1], self._local, "stdout")  # type: ignore[assignment]
+        sys.stderr = _ThreadRoutedStream(saved[2], self._local, "stderr")  # type: ignore[assignment]
+        reset_consoles()
+        try:
+            if parallel <= 1:
+                for index, argv in enumerate(commands, start=1):
+                    record = self.run_one(index, argv)
+                    yield record
+                    if stop_on_error and record["exitCode"]:
+                        return
+                return
+
+            failed = threading.Event()
+
+            def _run(index: int, argv: List[str]) -> Optional[Dict[str, Any]]:
+                if stop_on_error and failed.is_set():
+                    return None
+                record = self.run_one(index, argv)
+                if record["exitCode"]:
+                    failed.set()
+                return record
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+                futures = [
+                    executor.submit(_run, index, argv)
+                    for index, argv in enumerate(commands, start=1)
+                ]
+                for future in futures:
+                    result = future.result()
+                    if result is not None:
+                        yield result
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved
+            reset_consoles()
+
+
+def _write_raw(text: str, err: bool = False) -> None:
+    """Write already-rendered text without restyling it."""
+    stream = sys.stderr if err else sys.stdout
+    stream.write(text)
+    stream.flush()
+
+
+def _emit_text(record: Dict[str, Any], verbose: bool) -> None:
+    """Replay one command's captured output."""
+    if verbose:
+        click.echo(f"[{record['index']}] slcli {shlex.join(record['argv'])}", err=True)
+    _write_raw(record["stdout"])
+    _write_raw(record["stderr"], err=True)
+    if verbose or record["exitCode"]:
+        click.echo(
+            f"[{record['index']}] exit {record['exitCode']} ({record['durationMs']:.0f} ms)",
+            err=True,
+        )
+
+
+def register_batch_commands(cli: Any) -> None:
+    """Register the 'run-batch' command."""
+
+    @cli.command(name="run-batch")
+    @click.argument("script", type=click.File("r", encoding="utf-8"))
+    @click.option(
+        "--parallel",
+        "-j",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Commands to run at once (only for independent commands)",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        "output_format",
+        type=click.Choice(["text", "jsonl"]),
+        default="text",
+        show_default=True,
+        help="Replay each command's output, or emit one JSON result per command",
+    )
+    @click.option(
+        "--stop-on-error",
+        is_flag=True,
+        help="Do not start further commands after one fails",
+    )
+    @click.option(
+        "--verbose",
+        "-v",
+        is_flag=True,
+        help="Print each command and its exit code (text format)",
+    )
+    @click.option(
+        "--workspace-cache-ttl",
+        type=click.FloatRange(min=0),
+        default=60.0,
+        show_default=True,
+        help="Seconds to reuse fetched workspace lists between commands (0 = off)",
+    )
+    @click.pass_context
+    def run_batch(
+        ctx: click.Context,
+        script: TextIO,
+        parallel: int,
+        output_format: str,
+        stop_on_error: bool,
+        verbose: bool,
+        workspace_cache_ttl: float,
+    ) -> None:
+        """Run many slcli commands from SCRIPT in this process.
+
+        SCRIPT ('-' for stdin) holds one command per line, or a JSON array of
+        argv lists. All commands share one pooled HTTP session, so a batch of
+        hundreds of commands avoids per-process startup and TLS handshakes.
+        Commands run non-interactively, and the exit code is non-zero when
+        any command failed.
+        """
+        try:
+            commands = parse_batch(script.read())
+        except ValueError as exc:
+            click.echo(f"✗ {exc}", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+        if parallel > 1 and any(_sets_profile(argv) for argv in commands):
+            click.echo("✗ --profile inside a batch requires --parallel 1", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+
+        runner = BatchRunner(ctx.find_root().command)
+        summary: Tuple[int, int] = (0, 0)
+        with pooled_http_session():
+            set_workspace_map_cache_ttl(workspace_cache_ttl)
+            try:
+                for record in runner.run(commands, parallel, stop_on_error):
+                    summary = (summary[0] + 1, summary[1] + (1 if record["exitCode"] else 0))
+                    if output_format == "jsonl":
+                        _write_raw(json.dumps(record) + "\n")
+                    else:
+                        _emit_text(record, verbose)
+            finally:
+                set_workspace_map_cache_ttl(0)
+
+        ran, failures = summary
+        if output_format == "text" and (verbose or failures):
+            click.echo(
+                f"{ran} of {len(commands)} command(s) run, {failures} failed",
+                err=True,
+            )
+        if failures:
+            sys.exit(ExitCodes.GENERAL_ERROR)
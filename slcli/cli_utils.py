@@ -8,6 +8,7 @@ import questionary
 import requests
 
 from .rich_output import print_json, render_table
+from .table_utils import formatted_rows, is_delimited_format, output_delimited_items
 from .utils import ExitCodes, handle_api_error
 
 
@@ -86,6 +87,10 @@ def confirm_bulk_operation(
     return click.confirm(f"Are you sure you want to {operation} {count} {resource_type}s?")
 
 
+# --format choices for list and query commands; other commands offer table and json
+LIST_OUTPUT_FORMATS = ["table", "json", "csv", "tsv"]
+
+
 def validate_output_format(format_output: str) -> str:
     """Validate and normalize output format.
 
@@ -95,7 +100,7 @@ def validate_output_format(format_output: str) -> str:
     Returns:
         Normalized format string
     """
-    valid_formats = ["table", "json"]
+    valid_formats = LIST_OUTPUT_FORMATS
     normalized = format_output.lower().strip()
 
     if normalized not in valid_formats:
@@ -353,13 +358,18 @@ def paginate_list_output(
     Args:
         items: List of items to paginate
         page_size: Number of items per page (default: 25)
-        format_output: 'json' or 'table'
+        format_output: 'json', 'csv', 'tsv' or 'table'
         formatter_func: Function to format table rows
         headers: Table headers
         column_widths: Table column widths
         empty_message: Message when no items found
         total_label: Label for count display
     """
+    # Delimited output is for scripts: write every row at once
+    if is_delimited_format(format_output):
+        output_delimited_items(items, format_output, headers, formatter_func)
+        return
+
     if not items:
         if format_output.lower() == "json":
             click.echo("[]")
@@ -458,11 +468,5 @@ def _output_formatted_page(
     if len(headers) != len(column_widths):
         raise ValueError("Headers and column_widths must have the same length")
 
-    rows = []
-    for item in items:
-        row_data = row_formatter_func(item)
-        if len(row_data) != len(column_widths):
-            raise ValueError("Row data must match column count")
-        rows.append(row_data)
-
+    rows = formatted_rows(items, len(column_widths), row_formatter_func)
     render_table(headers, column_widths, rows, show_total=False)
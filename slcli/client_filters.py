@@ -0,0 +1,121 @@
+"""Compiled predicates for filters applied on the client.
+
+Some filters cannot be expressed in a service's query language (case-insensitive
+file name matching, spec condition and limit bounds, installed packages). The
+helpers here build each filter once into a single predicate: needles are
+lower-cased and bounds parsed when the predicate is built, not once per item,
+and :func:`all_of` stops at the first failing check, so callers list the
+cheapest and most selective checks first. :func:`take_matches` stops scanning
+once enough items have matched.
+"""
+
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+Predicate = Callable[[Dict[str, Any]], bool]
+Getter = Callable[[Dict[str, Any]], Any]
+
+
+def field(path: str) -> Getter:
+    """Return a getter for a dotted ``path``; missing or non-object parents give ``None``.
+
+    >>> field("limit.min")({"limit": {"min": 1.5}})
+    1.5
+    """
+    parts = path.split(".")
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda item: item.get(key)
+
+    def get(item: Dict[str, Any]) -> Any:
+        value: Any = item
+        for part in parts:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    return get
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).lower()
+
+
+def contains_text(get: Getter, needle: str) -> Predicate:
+    """Match items whose value contains ``needle``, ignoring case.
+
+    >>> contains_text(field("name"), "VOLT")({"name": "voltage.csv"})
+    True
+    """
+    needle_lower = needle.lower()
+    return lambda item: needle_lower in _text(get(item))
+
+
+def equals_text(get: Getter, expected: str) -> Predicate:
+    """Match items whose value equals ``expected``, ignoring case."""
+    expected_lower = expected.lower()
+    return lambda item: _text(get(item)) == expected_lower
+
+
+def number_between(
+    get: Getter, minimum: Optional[float] = None, maximum: Optional[float] = None
+) -> Predicate:
+    """Match items whose value is a number within ``[minimum, maximum]``.
+
+    Either bound may be ``None``. Values that are not numbers never match.
+
+    >>> number_between(field("limit.max"), maximum=5)({"limit": {"max": 4}})
+    True
+    """
+    low = float(minimum) if minimum is not None else None
+    high = float(maximum) if maximum is not None else None
+
+    def predicate(item: Dict[str, Any]) -> bool:
+        value = get(item)
+        if not isinstance(value, (int, float)):
+            return False
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    return predicate
+
+
+def all_of(predicates: Sequence[Optional[Predicate]]) -> Optional[Predicate]:
+    """Combine ``predicates`` into one that requires every check, in order.
+
+    ``None`` entries are skipped; ``None`` is returned when nothing is left,
+    meaning every item matches.
+    """
+    checks = [predicate for predicate in predicates if predicate is not None]
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda item: all(check(item) for check in checks)
+
+
+def any_of(predicates: Sequence[Optional[Predicate]]) -> Optional[Predicate]:
+    """Combine ``predicates`` into one that requires at least one check, in order."""
+    checks = [predicate for predicate in predicates if predicate is not None]
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda item: any(check(item) for check in checks)
+
+
+def iter_matches(
+    items: Iterable[Dict[str, Any]], predicate: Optional[Predicate], take: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield items matching ``predicate`` (all when ``None``), stopping after ``take`` matches."""
+    matches = items if predicate is None else filter(predicate, items)
+    if take is None:
+        return iter(matches)
+    return islice(matches, max(take, 0))
+
+
+def take_matches(
+    items: Iterable[Dict[str, Any]], predicate: Optional[Predicate], take: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Return up to ``take`` items matching ``predicate``; see :func:`iter_matches`."""
+    return list(iter_matches(items, predicate, take))
@@ -19,7 +19,7 @@ from urllib.parse import urlencode
 
 import click
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .platform import require_feature
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
@@ -221,7 +221,7 @@ def register_comment_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format.",
@@ -255,7 +255,7 @@ def register_comment_commands(cli: Any) -> None:
                 click.echo(json.dumps(comments, indent=2))
                 return
 
-            if not comments:
+            if not comments and format_output == "table":
                 click.echo("No comments found.")
                 return
 
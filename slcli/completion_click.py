@@ -18,6 +18,7 @@ def get_cli_commands_dynamically() -> Dict[str, List[str]]:
         # Import the main CLI group to inspect its structure
         from slcli.main import cli
 
+        cli.load_all_commands()
         commands = {}
 
         # Get top-level commands
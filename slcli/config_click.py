@@ -12,6 +12,7 @@ from urllib.parse import urlparse
 import click
 import questionary
 
+from .cli_utils import LIST_OUTPUT_FORMATS
 from .platform import (
     PLATFORM_SLE,
     PLATFORM_SLS,
@@ -27,7 +28,7 @@ from .ssl_trust import (
     remove_managed_trust,
     save_managed_certificate,
 )
-from .table_utils import output_formatted_list
+from .table_utils import is_delimited_format, output_delimited, output_formatted_list
 from .utils import ExitCodes, get_base_url
 
 API_KEY_LENGTH = 42
@@ -459,7 +460,7 @@ def register_config_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         help="Output format",
     )
@@ -497,7 +498,7 @@ def register_config_commands(cli: Any) -> None:
             click.echo(json.dumps(output, indent=2))
             return
 
-        if not profiles:
+        if not profiles and format == "table":
             click.echo("No profiles configured.")
             click.echo("\nRun 'slcli login --profile <name>' to create a profile.")
             return
@@ -537,7 +538,7 @@ def register_config_commands(cli: Any) -> None:
 
         output_formatted_list(
             items=table_items,
-            output_format="table",
+            output_format=format,
             headers=["", "NAME", "SERVER", "WORKSPACE", "READONLY"],
             column_widths=[1, 15, 40, 20, 8],
             row_formatter_func=format_row,
@@ -679,7 +680,7 @@ def register_config_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "output_format",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         help="Output format",
     )
@@ -689,10 +690,8 @@ def register_config_commands(cli: Any) -> None:
         if output_format == "json":
             click.echo(json.dumps(records, indent=2))
             return
-        if not records:
-            click.echo("No managed server certificates.")
-            return
 
+        headers = ["SERVER", "SHA-256", "SELF-SIGNED"]
         rows = [
             [
                 str(record.get("origin", "")),
@@ -701,8 +700,15 @@ def register_config_commands(cli: Any) -> None:
             ]
             for record in records
         ]
+        if is_delimited_format(output_format):
+            output_delimited(headers, rows, output_format)
+            return
+        if not records:
+            click.echo("No managed server certificates.")
+            return
+
         render_table(
-            headers=["SERVER", "SHA-256", "SELF-SIGNED"],
+            headers=headers,
             column_widths=[40, 64, 12],
             rows=rows,
             show_total=True,
@@ -0,0 +1,576 @@
+"""Warm background process that runs slcli commands for thin clients.
+
+``slcli daemon start`` keeps one process per user with every command module
+imported, one pooled HTTP session and a short-lived workspace-map cache. It
+listens on a Unix domain socket in the slcli configuration directory. The
+``slcli`` entry point calls :func:`forward_to_daemon` before importing the
+CLI; when a daemon answers, argv, environment and working directory are sent
+to it and stdout, stderr and the exit code are streamed back. Otherwise the
+command runs in-process as usual. Only invocations with an empty stdin (such
+as ``/dev/null`` in scripts and agents) are forwarded, so prompts, paging and
+piped input always work in-process.
+
+This module is imported on every invocation, so it only uses the standard
+library at import time.
+
+Wire format: the client sends one length-prefixed JSON request. The daemon
+answers with frames of a one-byte channel, a four-byte big-endian length and
+the payload, finishing with an exit frame. Commands run one at a time: before
+running one the daemon sends an accepted frame and waits for the client's go
+byte, and a client that is not accepted within :data:`HANDSHAKE_TIMEOUT` runs
+the command in-process instead. A command whose client disconnects is
+interrupted with ``KeyboardInterrupt``.
+"""
+
+import io
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, BinaryIO, cast, Dict, List, Optional, Sequence, Tuple
+
+SOCKET_NAME = "daemon.sock"
+LOG_NAME = "daemon.log"
+DISABLE_ENV = "SLCLI_NO_DAEMON"
+
+# Commands that log in, manage the daemon or change configuration always run locally,
+# as do servers and watchers, which would hold the daemon for as long as they run
+LOCAL_COMMANDS = frozenset({"daemon", "login", "logout", "config", "mcp"})
+LOCAL_SUBCOMMANDS = frozenset({("alarm", "monitor"), ("tag", "watch"), ("file", "watch")})
+
+CHANNEL_STDOUT = b"1"
+CHANNEL_STDERR = b"2"
+CHANNEL_EXIT = b"x"
+CHANNEL_RUN_LOCALLY = b"r"
+CHANNEL_ACCEPTED = b"a"
+CLIENT_GO = b"g"
+
+# Seconds a client waits for the daemon to take its command before running it locally
+HANDSHAKE_TIMEOUT = 0.5
+# Seconds the daemon waits for an accepted client to confirm it is still waiting
+_GO_TIMEOUT = 5.0
+
+_HEADER = struct.Struct(">cI")
+_LENGTH = struct.Struct(">I")
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+_OPTIONS_WITH_VALUES = frozenset({"-p", "--profile"})
+
+
+def get_socket_path() -> Path:
+    """Return the daemon socket path for the current user."""
+    if "XDG_CONFIG_HOME" in os.environ:
+        config_dir = Path(os.environ["XDG_CONFIG_HOME"]) / "slcli"
+    else:
+        config_dir = Path.home() / ".config" / "slcli"
+    return config_dir / SOCKET_NAME
+
+
+def get_build_id() -> str:
+    """Identify the installed slcli code so a stale daemon is not used after an upgrade."""
+    stat = os.stat(__file__)
+    return f"{os.path.dirname(os.path.abspath(__file__))}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def daemon_supported() -> bool:
+    """Return whether this platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def _command_path(argv: Sequence[str]) -> Tuple[str, ...]:
+    """Return the command and subcommand names in ``argv``, skipping global options."""
+    path: List[str] = []
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif not path and arg in _OPTIONS_WITH_VALUES:
+            skip_next = True
+        elif not arg.startswith("-"):
+            path.append(arg)
+            if len(path) == 2:
+                break
+    return tuple(path)
+
+
+def _stdin_is_empty(stdin: Any) -> bool:
+    """Return whether ``stdin`` can neither prompt nor supply input.
+
+    That is the case when there is no usable stdin, or it is a character
+    device other than a terminal (``/dev/null``). Terminals, pipes and files
+    run locally, where prompts, pagination and piped input work as usual.
+    """
+    try:
+        mode = os.fstat(stdin.fileno()).st_mode
+    except (AttributeError, OSError, ValueError):
+        return True
+    return stat.S_ISCHR(mode) and not _isatty(stdin)
+
+
+def should_forward(argv: Sequence[str], stdin: Any = None) -> bool:
+    """Return whether ``argv`` may run in the daemon.
+
+    The daemon runs commands without stdin, so only invocations whose stdin
+    is empty (see :func:`_stdin_is_empty`) are forwarded; everything else,
+    including any command that prompts at a terminal, runs locally. Commands
+    that read stdin (a ``-`` argument), manage the daemon and configuration,
+    or keep running until interrupted also run locally, as does everything
+    when ``SLCLI_NO_DAEMON`` is set.
+    """
+    if os.environ.get(DISABLE_ENV, "").strip() not in ("", "0"):
+        return False
+    if not daemon_supported() or "-" in argv:
+        return False
+    if not _stdin_is_empty(sys.stdin if stdin is None else stdin):
+        return False
+    path = _command_path(argv)
+    return bool(path) and path[0] not in LOCAL_COMMANDS and path not in LOCAL_SUBCOMMANDS
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes or raise ``ConnectionError``."""
+    chunks: List[bytes] = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise ConnectionError("daemon connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message."""
+    body = json.dumps(message).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(body)) + body)
+
+
+def _recv_message(sock: socket.socket) -> Dict[str, Any]:
+    """Receive one length-prefixed JSON message."""
+    (length,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if length > _MAX_REQUEST_BYTES:
+        raise ValueError("daemon request too large")
+    message = json.loads(_recv_exact(sock, length).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("daemon request must be a JSON object")
+    return message
+
+
+def _connect(socket_path: Path, timeout: Optional[float] = None) -> Optional[socket.socket]:
+    """Connect to a running daemon, or return None when none is listening."""
+    if not daemon_supported() or not socket_path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def send_control(command: str, socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send a control command (``status`` or ``stop``) and return the daemon's reply."""
+    sock = _connect(socket_path or get_socket_path(), timeout=5)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            _send_message(sock, {"control": command})
+            return _recv_message(sock)
+        except (OSError, ValueError):
+            return None
+
+
+def forward_to_daemon(
+    argv: Sequence[str],
+    stdout: Optional[BinaryIO] = None,
+    stderr: Optional[BinaryIO] = None,
+    socket_path: Optional[Path] = None,
+) -> Optional[int]:
+    """Run ``argv`` in the daemon and stream its output.
+
+    Returns:
+        The command's exit code, or None when the command should run in-process
+        (no daemon, forwarding disabled or not allowed for this command, or a
+        daemon from a different installation).
+    """
+    if not should_forward(argv):
+        return None
+    sock = _connect(socket_path or get_socket_path(), timeout=HANDSHAKE_TIMEOUT)
+    if sock is None:
+        return None
+
+    out = stdout or sys.stdout.buffer
+    err = stderr or sys.stderr.buffer
+    streams = {CHANNEL_STDOUT: out, CHANNEL_STDERR: err}
+    started = False
+    with sock:
+        try:
+            _send_message(
+                sock,
+                {
+                    "argv": list(argv),
+                    "env": dict(os.environ),
+                    "cwd": os.getcwd(),
+                    "build": get_build_id(),
+                    "stdout_tty": _isatty(sys.stdout),
+                    "stderr_tty": _isatty(sys.stderr),
+                },
+            )
+            while True:
+                channel, length = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+                payload = _recv_exact(sock, length)
+                if channel == CHANNEL_RUN_LOCALLY and not started:
+                    return None
+                if channel == CHANNEL_ACCEPTED and not started:
+                    # From here on the daemon owns the command, however long it takes
+                    sock.sendall(CLIENT_GO)
+                    sock.settimeout(None)
+                    started = True
+                    continue
+                if channel == CHANNEL_EXIT:
+                    return int(payload.decode("ascii"))
+                started = True
+                stream = streams.get(channel)
+                if stream is not None:
+                    stream.write(payload)
+                    stream.flush()
+        except KeyboardInterrupt:
+            return 130
+        except (OSError, ValueError, struct.error):
+            if not started:
+                return None
+            err.write(b"\xe2\x9c\x97 Lost connection to slcli daemon\n")
+            err.flush()
+            return 1
+
+
+def _isatty(stream: Any) -> bool:
+    """Return whether a stream is a terminal, tolerating replaced streams."""
+    try:
+        return bool(stream.isatty())
+    except Exception:
+        return False
+
+
+class _FrameWriter(io.RawIOBase):
+    """Raw stream that sends everything written to it as frames on one channel."""
+
+    def __init__(
+        self, sock: socket.socket, channel: bytes, lock: threading.Lock, tty: bool
+    ) -> None:
+        """Create a writer for ``channel``; ``lock`` is shared by all channels."""
+        super().__init__()
+        self._sock = sock
+        self._channel = channel
+        self._lock = lock
+        self._tty = tty
+
+    def writable(self) -> bool:
+        """Return True."""
+        return True
+
+    def isatty(self) -> bool:
+        """Report whether the client's stream is a terminal."""
+        return self._tty
+
+    def write(self, data: Any) -> int:
+        """Send ``data`` as one frame."""
+        payload = bytes(data)
+        if payload:
+            with self._lock:
+                self._sock.sendall(_HEADER.pack(self._channel, len(payload)) + payload)
+        return len(payload)
+
+
+class NonInteractiveStdin(io.StringIO):
+    """Empty, non-terminal stdin matching the client's (only empty stdin is forwarded)."""
+
+    def isatty(self) -> bool:
+        """Report that stdin is not a terminal, as it is not in the client."""
+        return False
+
+
+class DaemonServer:
+    """Accept forwarded commands on a Unix socket and run them one at a time."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        cli: Any,
+        idle_timeout: Optional[float] = None,
+        before_command: Optional[Any] = None,
+    ) -> None:
+        """Create a server for ``cli``.
+
+        Args:
+            socket_path: Where to listen.
+            cli: The Click command that runs forwarded argv.
+            idle_timeout: Seconds without requests after which the daemon exits.
+            before_command: Optional callable run before every command to reset
+                per-invocation state.
+        """
+        self.socket_path = socket_path
+        self.cli = cli
+        self.idle_timeout = idle_timeout
+        self.before_command = before_command
+        self.build_id = get_build_id()
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._stopping = False
+        self._listener: Optional[socket.socket] = None
+
+    def bind(self) -> None:
+        """Create the listening socket, readable and writable by the owner only.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket.
+        """
+        if send_control("ping", self.socket_path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        self._listener = listener
+
+    def serve_forever(self) -> None:
+        """Handle connections until stopped or idle for ``idle_timeout`` seconds."""
+        if self._listener is None:
+            self.bind()
+        listener = self._listener
+        assert listener is not None
+        listener.settimeout(self.idle_timeout)
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    self.handle(conn)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        """Return process information for ``slcli daemon status``."""
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "startedAt": self.started_at,
+            "uptimeSeconds": round(time.time() - self.started_at, 1),
+            "requestsServed": self.requests_served,
+            "idleTimeoutSeconds": self.idle_timeout,
+        }
+
+    def handle(self, conn: socket.socket) -> None:
+        """Serve one connection."""
+        if not _same_user(conn):
+            return
+        try:
+            request = _recv_message(conn)
+        except (OSError, ValueError):
+            return
+
+        control = request.get("control")
+        if control is not None:
+            if control == "stop":
+                self._stopping = True
+            try:
+                _send_message(conn, dict(self.status(), stopping=self._stopping))
+            except OSError:
+                pass
+            return
+
+        if request.get("build") != self.build_id:
+            conn.sendall(_HEADER.pack(CHANNEL_RUN_LOCALLY, 0))
+            return
+
+        # A client that gave up waiting has already run the command itself
+        try:
+            conn.sendall(_HEADER.pack(CHANNEL_ACCEPTED, 0))
+            conn.settimeout(_GO_TIMEOUT)
+            go = conn.recv(1)
+            conn.settimeout(None)
+        except OSError:
+            return
+        if go != CLIENT_GO:
+            return
+
+        self.requests_served += 1
+        exit_code = self.run_command(conn, request)
+        try:
+            conn.sendall(_HEADER.pack(CHANNEL_EXIT, len(str(exit_code))) + str(exit_code).encode())
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def run_command(self, conn: socket.socket, request: Dict[str, Any]) -> int:
+        """Run one forwarded command with the client's environment and streams."""
+        lock = threading.Lock()
+        stdout = io.TextIOWrapper(
+            cast(
+                BinaryIO, _FrameWriter(conn, CHANNEL_STDOUT, lock, bool(request.get("stdout_tty")))
+            ),
+            encoding="utf-8",
+            errors="replace",
+            line_buffering=True,
+            write_through=True,
+        )
+        stderr = io.TextIOWrapper(
+            cast(
+                BinaryIO, _FrameWriter(conn, CHANNEL_STDERR, lock, bool(request.get("stderr_tty")))
+            ),
+            encoding="utf-8",
+            errors="replace",
+            line_buffering=True,
+            write_through=True,
+        )
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        exit_code = 0
+        try:
+            os.environ.clear()
+            os.environ.update({str(k): str(v) for k, v in dict(request.get("env") or {}).items()})
+            os.chdir(str(request.get("cwd") or saved_cwd))
+            sys.stdin, sys.stdout, sys.stderr = NonInteractiveStdin(), stdout, stderr
+            if self.before_command is not None:
+                self.before_command()
+            with _InterruptOnDisconnect(conn):
+                self.cli.main(args=list(request.get("argv") or []), prog_name="slcli")
+        except SystemExit as exc:
+            exit_code = _exit_code(exc.code)
+        except BaseException:  # noqa: BLE001 - report any failure to the client
+            exit_code = 1
+            try:
+                traceback.print_exc(file=stderr)
+            except OSError:
+                pass
+        finally:
+            for stream in (stdout, stderr):
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+        return exit_code
+
+
+class _InterruptOnDisconnect:
+    """Raise ``KeyboardInterrupt`` in the command thread when the client hangs up.
+
+    The client never sends anything after its go byte, so end of file on the
+    connection means it exited or was interrupted with Ctrl+C. Blocking calls
+    are interrupted once they return to Python code.
+    """
+
+    def __init__(self, conn: socket.socket) -> None:
+        """Watch ``conn`` on behalf of the calling thread."""
+        self._conn = conn
+        self._thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._active = False
+        self._interrupted = False
+        self._watcher = threading.Thread(target=self._watch, name="slcli-client-watch", daemon=True)
+
+    def __enter__(self) -> "_InterruptOnDisconnect":
+        """Start watching the connection."""
+        self._active = True
+        self._watcher.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop interrupting and drop an interrupt that has not been delivered yet."""
+        with self._lock:
+            self._active = False
+            if self._interrupted:
+                _set_async_exception(self._thread_id, None)
+
+    def _watch(self) -> None:
+        try:
+            while self._conn.recv(4096):
+                pass
+        except OSError:
+            pass
+        with self._lock:
+            if self._active:
+                self._interrupted = True
+                _set_async_exception(self._thread_id, KeyboardInterrupt)
+
+
+def _set_async_exception(thread_id: int, exc_type: Optional[type]) -> None:
+    """Schedule ``exc_type`` in thread ``thread_id``, or cancel it when None."""
+    import ctypes
+
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(exc_type) if exc_type else None
+    )
+
+
+def _exit_code(code: Any) -> int:
+    """Convert a ``SystemExit`` code to a process exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _same_user(conn: socket.socket) -> bool:
+    """Return whether the peer runs as this user (Linux only; True elsewhere)."""
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return True
+    try:
+        creds = conn.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+    except OSError:
+        return True
+    _, uid, _ = struct.unpack("3i", creds)
+    return bool(uid == os.getuid())
+
+
+def wait_for_daemon(socket_path: Path, timeout: float) -> Optional[Dict[str, Any]]:
+    """Poll until a daemon answers on ``socket_path`` or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        status = send_control("status", socket_path)
+        if status is not None or time.monotonic() >= deadline:
+            return status
+        time.sleep(0.1)
+
+
+def daemon_command(executable: str, frozen: bool) -> Tuple[str, ...]:
+    """Return the command line that runs the daemon in the foreground."""
+    prefix: Tuple[str, ...] = (executable,) if frozen else (executable, "-m", "slcli")
+    return prefix + ("daemon", "start", "--foreground")
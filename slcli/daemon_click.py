@@ -0,0 +1,189 @@
+"""CLI commands for the optional warm slcli daemon."""
+
+import datetime
+import json
+import subprocess
+import sys
+from typing import Any, Optional
+
+import click
+
+from .daemon import (
+    DaemonServer,
+    daemon_command,
+    daemon_supported,
+    get_socket_path,
+    LOG_NAME,
+    send_control,
+    wait_for_daemon,
+)
+from .platform import clear_platform_cache
+from .profiles import set_profile_override
+from .rich_output import reset_consoles
+from .utils import (
+    ExitCodes,
+    format_success,
+    pooled_http_session,
+    PooledSessions,
+    set_workspace_map_cache_ttl,
+)
+
+_START_TIMEOUT_SECONDS = 15.0
+
+
+def _require_support() -> None:
+    """Exit with an error on platforms without Unix domain sockets."""
+    if not daemon_supported():
+        click.echo("✗ The slcli daemon requires Unix domain socket support.", err=True)
+        sys.exit(ExitCodes.GENERAL_ERROR)
+
+
+def _reset_command_state(sessions: PooledSessions) -> None:
+    """Start a forwarded command like a fresh process, minus the imports."""
+    set_profile_override(None)
+    # The platform detected for one command's profile and environment must not leak
+    clear_platform_cache()
+    reset_consoles()
+    sessions.clear_cookies()
+
+
+def _serve(root_command: Any, idle_timeout: Optional[float], workspace_cache_ttl: float) -> None:
+    """Run the daemon in this process until it is stopped or idle."""
+    socket_path = get_socket_path()
+    with pooled_http_session() as sessions:
+        server = DaemonServer(
+            socket_path,
+            root_command,
+            idle_timeout=idle_timeout,
+            before_command=lambda: _reset_command_state(sessions),
+        )
+        try:
+            server.bind()
+        except RuntimeError as exc:
+            click.echo(f"✗ {exc}", err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        set_workspace_map_cache_ttl(workspace_cache_ttl)
+        click.echo(f"slcli daemon listening on {socket_path} (pid {server.status()['pid']})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.close()
+        finally:
+            set_workspace_map_cache_ttl(0)
+
+
+def register_daemon_commands(cli: Any) -> None:
+    """Register the 'daemon' command group and its subcommands."""
+
+    @cli.group()
+    def daemon() -> None:
+        """Keep a warm slcli process to speed up repeated invocations.
+
+        While the daemon runs, slcli forwards commands to it over a Unix socket
+        instead of starting Python and importing every module each time. Set
+        SLCLI_NO_DAEMON=1 to run a command in-process.
+        """
+        pass
+
+    @daemon.command(name="start")
+    @click.option(
+        "--foreground",
+        is_flag=True,
+        help="Run in this terminal instead of in the background",
+    )
+    @click.option(
+        "--idle-timeout",
+        type=click.FloatRange(min=0),
+        default=30.0,
+        show_default=True,
+        help="Exit after this many minutes without requests (0 = never)",
+    )
+    @click.option(
+        "--workspace-cache-ttl",
+        type=click.FloatRange(min=0),
+        default=60.0,
+        show_default=True,
+        help="Seconds to reuse fetched workspace lists between commands (0 = off)",
+    )
+    @click.pass_context
+    def start_daemon(
+        ctx: click.Context, foreground: bool, idle_timeout: float, workspace_cache_ttl: float
+    ) -> None:
+        """Start the daemon for the current user."""
+        _require_support()
+        timeout = idle_timeout * 60 if idle_timeout else None
+        if foreground:
+            _serve(ctx.find_root().command, timeout, workspace_cache_ttl)
+            return
+
+        socket_path = get_socket_path()
+        status = send_control("status", socket_path)
+        if status is not None:
+            format_success("Daemon already running", {"PID": status["pid"]})
+            return
+
+        log_path = socket_path.parent / LOG_NAME
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        command = daemon_command(sys.executable, bool(getattr(sys, "frozen", False)))
+        command += (
+            "--idle-timeout",
+            str(idle_timeout),
+            "--workspace-cache-ttl",
+            str(workspace_cache_ttl),
+        )
+        with open(log_path, "ab") as log_file:
+            subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+                close_fds=True,
+            )
+
+        status = wait_for_daemon(socket_path, _START_TIMEOUT_SECONDS)
+        if status is None:
+            click.echo(f"✗ The daemon did not start; see {log_path}", err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        format_success("Daemon started", {"PID": status["pid"], "Socket": str(socket_path)})
+
+    @daemon.command(name="stop")
+    def stop_daemon() -> None:
+        """Stop the running daemon."""
+        _require_support()
+        status = send_control("stop")
+        if status is None:
+            click.echo("✗ No slcli daemon is running.", err=True)
+            sys.exit(ExitCodes.NOT_FOUND)
+        format_success("Daemon stopped", {"PID": status["pid"]})
+
+    @daemon.command(name="status")
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def daemon_status(format: str) -> None:
+        """Show whether the daemon is running."""
+        _require_support()
+        status = send_control("status")
+        if format == "json":
+            click.echo(
+                json.dumps(dict(status, running=True) if status else {"running": False}, indent=2)
+            )
+            if status is None:
+                sys.exit(ExitCodes.NOT_FOUND)
+            return
+        if status is None:
+            click.echo("✗ No slcli daemon is running.", err=True)
+            sys.exit(ExitCodes.NOT_FOUND)
+        started = datetime.datetime.fromtimestamp(status["startedAt"]).isoformat(timespec="seconds")
+        idle = status.get("idleTimeoutSeconds")
+        click.echo(f"PID:          {status['pid']}")
+        click.echo(f"Socket:       {status['socket']}")
+        click.echo(f"Started:      {started}")
+        click.echo(f"Requests:     {status['requestsServed']}")
+        click.echo(f"Idle timeout: {f'{idle / 60:g} min' if idle else 'never'}")
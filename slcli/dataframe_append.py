@@ -0,0 +1,595 @@
+"""Chunked DataFrame appends from CSV, TSV, JSON Lines and Parquet files.
+
+The input is read ``chunk_rows`` rows at a time and each chunk is encoded as
+a JSON frame or an Arrow IPC stream (typed with the table schema) and posted
+to the table's ``data`` endpoint as soon as it is ready. A background thread
+reads and encodes the next chunk while the current one uploads; at most one
+encoded chunk waits at a time, so memory stays bounded for inputs of any
+size. ``endOfData`` is sent with the last chunk only.
+
+After every accepted chunk an optional checkpoint records how many rows have
+been appended, so an interrupted upload can resume at the next row. Parquet
+input and Arrow uploads require the optional ``pyarrow`` package.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, cast
+
+import requests
+
+from .json_codec import dumpb, loads
+from .utils import get_base_url, make_api_request, pooled_http_session
+
+SOURCE_FORMATS = ("csv", "tsv", "jsonl", "parquet")
+UPLOAD_FORMATS = ("auto", "json", "arrow")
+DEFAULT_CHUNK_ROWS = 10000
+
+SOURCE_EXTENSIONS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".arrows": "arrow",
+}
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+# Responses that mean the service did not take the chunk and it can be resent.
+_RETRY_STATUSES = (429, 503)
+_MAX_ATTEMPTS = 5
+
+T = TypeVar("T")
+TextRow = List[Optional[str]]
+
+
+def detect_source_format(path: Path) -> Optional[str]:
+    """Return the input format implied by the file extension, if it has a known one."""
+    return SOURCE_EXTENSIONS.get(path.suffix.lower())
+
+
+def default_upload_format() -> str:
+    """Return ``arrow`` when ``pyarrow`` is installed and ``json`` otherwise."""
+    try:
+        import pyarrow  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError:
+        return "json"
+    return "arrow"
+
+
+def _tables_url(table_id: str) -> str:
+    return f"{get_base_url()}/nidataframe/v1/tables/{table_id}"
+
+
+def fetch_table_columns(table_id: str) -> List[Dict[str, Any]]:
+    """Return the column definitions of a table (as shown by ``dataframe schema``)."""
+    data = make_api_request("GET", _tables_url(table_id), handle_errors=False).json()
+    columns = data.get("columns") if isinstance(data, dict) else None
+    return columns if isinstance(columns, list) else []
+
+
+def match_columns(
+    source_columns: Sequence[str], table_columns: Sequence[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Check input columns against the table schema and return their definitions in input order.
+
+    Raises:
+        ValueError: If the input has columns the table does not, or lacks a
+            column that is not ``NULLABLE``.
+    """
+    by_name = {str(column.get("name")): column for column in table_columns}
+    unknown = [name for name in source_columns if name not in by_name]
+    if unknown:
+        raise ValueError(f"Input columns not in the table schema: {', '.join(unknown)}")
+    missing = [
+        name
+        for name, column in by_name.items()
+        if name not in source_columns and column.get("columnType") != "NULLABLE"
+    ]
+    if missing:
+        raise ValueError(f"Input is missing table columns: {', '.join(missing)}")
+    if len(set(source_columns)) != len(source_columns):
+        raise ValueError("Input has duplicate column names")
+    return [by_name[name] for name in source_columns]
+
+
+class SourceChunk:
+    """Consecutive input rows: text ``rows``, or a pyarrow record ``batch`` for Parquet."""
+
+    def __init__(self, rows: Optional[List[TextRow]] = None, batch: Any = None) -> None:
+        """Wrap text rows or a record batch."""
+        self.rows = rows
+        self.batch = batch
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.rows) if self.rows is not None else int(self.batch.num_rows)
+
+
+class TableSource(ABC):
+    """Base class for input readers with a fixed column list."""
+
+    columns: List[str]
+
+    @abstractmethod
+    def iter_chunks(self, chunk_rows: int, skip_rows: int = 0) -> Iterator[SourceChunk]:
+        """Yield chunks of up to ``chunk_rows`` rows, after skipping ``skip_rows`` rows."""
+
+    def close(self) -> None:
+        """Close the input."""
+
+    def __enter__(self) -> "TableSource":
+        """Return the source for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the source."""
+        self.close()
+
+
+class CsvSource(TableSource):
+    """Read delimited text with a header line."""
+
+    def __init__(self, path: Path, delimiter: str = ",") -> None:
+        """Open ``path`` and read the header.
+
+        Raises:
+            ValueError: If the file is empty.
+        """
+        self._file = open(path, "r", encoding="utf-8-sig", newline="")
+        self._reader = csv.reader(self._file, delimiter=delimiter)
+        header = next(self._reader, None)
+        if not header:
+            self._file.close()
+            raise ValueError(f"{path} has no header line")
+        self.columns = [name.strip() for name in header]
+
+    def iter_chunks(self, chunk_rows: int, skip_rows: int = 0) -> Iterator[SourceChunk]:
+        """Yield parsed rows, checking that each has one value per column."""
+        width = len(self.columns)
+        for _ in islice(self._reader, skip_rows):
+            pass
+        row_number = skip_rows
+        while True:
+            rows = cast(List[TextRow], list(islice(self._reader, chunk_rows)))
+            if not rows:
+                return
+            for offset, row in enumerate(rows):
+                if len(row) != width:
+                    raise ValueError(
+                        f"Row {row_number + offset + 1} has {len(row)} values, expected {width}"
+                    )
+            row_number += len(rows)
+            yield SourceChunk(rows=rows)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+def _json_text(value: Any) -> Optional[str]:
+    """Render a JSON Lines value as frame text."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+class JsonlSource(TableSource):
+    """Read JSON Lines objects; the first object's keys are the columns."""
+
+    def __init__(self, path: Path) -> None:
+        """Open ``path`` and read the first record.
+
+        Raises:
+            ValueError: If the file has no records or the first is not an object.
+        """
+        self._file = open(path, "rb")
+        self._lines = (line for line in self._file if line.strip())
+        first_line = next(self._lines, None)
+        first = loads(first_line) if first_line is not None else None
+        if not isinstance(first, dict) or not first:
+            self._file.close()
+            raise ValueError(f"{path} must start with a JSON object")
+        self.columns = list(first)
+        self._first: Optional[Dict[str, Any]] = first
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        if self._first is not None:
+            yield self._first
+        for number, line in enumerate(self._lines, start=2):
+            record = loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"Record {number} is not a JSON object")
+            yield record
+
+    def iter_chunks(self, chunk_rows: int, skip_rows: int = 0) -> Iterator[SourceChunk]:
+        """Yield records as text rows in column order; missing keys become nulls."""
+        columns = self.columns
+        known = set(columns)
+        if skip_rows:
+            self._first = None
+            for _ in islice(self._lines, skip_rows - 1):
+                pass
+        records = self._records()
+        while True:
+            batch = list(islice(records, chunk_rows))
+            if not batch:
+                return
+            rows: List[TextRow] = []
+            for record in batch:
+                if len(record) > len(columns) or not known.issuperset(record):
+                    extra = sorted(set(record) - known)
+                    raise ValueError(f"Record has fields not in the first record: {extra}")
+                rows.append([_json_text(record.get(name)) for name in columns])
+            yield SourceChunk(rows=rows)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class ParquetSource(TableSource):
+    """Read Parquet record batches with pyarrow."""
+
+    def __init__(self, path: Path) -> None:
+        """Open ``path``.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+        """
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        self._file = pq.ParquetFile(str(path))
+        self.columns = list(self._file.schema_arrow.names)
+
+    def iter_chunks(self, chunk_rows: int, skip_rows: int = 0) -> Iterator[SourceChunk]:
+        """Yield record batches of up to ``chunk_rows`` rows."""
+        remaining_skip = skip_rows
+        for batch in self._file.iter_batches(batch_size=chunk_rows):
+            if remaining_skip >= batch.num_rows:
+                remaining_skip -= batch.num_rows
+                continue
+            if remaining_skip:
+                batch = batch.slice(remaining_skip)
+                remaining_skip = 0
+            yield SourceChunk(batch=batch)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+def open_source(path: Path, source_format: str) -> TableSource:
+    """Open a reader for one of :data:`SOURCE_FORMATS`.
+
+    Raises:
+        ValueError: If the format is not supported or the file has no header.
+        ImportError: If Parquet is requested and ``pyarrow`` is not installed.
+    """
+    source_format = source_format.lower()
+    if source_format in ("csv", "tsv"):
+        return CsvSource(path, "," if source_format == "csv" else "\t")
+    if source_format == "jsonl":
+        return JsonlSource(path)
+    if source_format == "parquet":
+        return ParquetSource(path)
+    raise ValueError(f"Unsupported input format: {source_format}")
+
+
+def arrow_type(data_type: Any) -> Any:
+    """Return the pyarrow type used for a DataFrame column data type."""
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    types = {
+        "BOOL": pa.bool_(),
+        "INT32": pa.int32(),
+        "INT64": pa.int64(),
+        "FLOAT32": pa.float32(),
+        "FLOAT64": pa.float64(),
+        "TIMESTAMP": pa.timestamp("ms", tz="UTC"),
+    }
+    return types.get(str(data_type).upper(), pa.string())
+
+
+def _parse_timestamps(values: Any, target: Any) -> Any:
+    """Parse ISO 8601 strings to ``target``; values without a zone offset are UTC."""
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    for parsed_type in (target, pa.timestamp("ns", tz="UTC"), pa.timestamp("ns")):
+        try:
+            return values.cast(parsed_type).cast(target, safe=False)
+        except pa.ArrowInvalid:
+            continue
+    return values.cast(target)  # raises with the parser's message
+
+
+def text_to_arrow(values: Sequence[Optional[str]], target: Any) -> Any:
+    """Convert one column of text cells to a pyarrow array of type ``target``.
+
+    Empty cells are nulls in every non-string column.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a cell cannot be parsed as ``target``.
+    """
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+
+    array = pa.array(values, type=pa.string())
+    if pa.types.is_string(target):
+        return array
+    array = pc.if_else(pc.equal(array, ""), pa.scalar(None, pa.string()), array)
+    if pa.types.is_boolean(target):
+        array = pc.utf8_lower(array)
+    if pa.types.is_timestamp(target):
+        return _parse_timestamps(array, target)
+    return array.cast(target)
+
+
+def _batch_text_rows(batch: Any) -> List[TextRow]:
+    """Render a record batch as text rows, with timestamps in ISO 8601 UTC."""
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+
+    columns: List[List[Optional[str]]] = []
+    for array in batch.columns:
+        if pa.types.is_timestamp(array.type):
+            utc = array.cast(pa.timestamp(array.type.unit, tz="UTC"))
+            array = pc.strftime(utc, format="%Y-%m-%dT%H:%M:%SZ")
+        columns.append(array.cast(pa.string()).to_pylist())
+    return [list(row) for row in zip(*columns)]
+
+
+def json_chunk_body(
+    chunk: SourceChunk,
+    columns: Sequence[str],
+    definitions: Sequence[Dict[str, Any]],
+    end_of_data: bool,
+) -> bytes:
+    """Encode a chunk as a JSON append request; empty cells are nulls outside string columns."""
+    rows = chunk.rows if chunk.rows is not None else _batch_text_rows(chunk.batch)
+    typed = [
+        index
+        for index, definition in enumerate(definitions)
+        if str(definition.get("dataType", "STRING")).upper() != "STRING"
+    ]
+    if typed and chunk.rows is not None:
+        for row in rows:
+            for index in typed:
+                if row[index] == "":
+                    row[index] = None
+    payload = {"frame": {"columns": list(columns), "data": rows}, "endOfData": end_of_data}
+    return dumpb(payload, ensure_ascii=False)
+
+
+def arrow_chunk_body(
+    chunk: SourceChunk, columns: Sequence[str], definitions: Sequence[Dict[str, Any]]
+) -> bytes:
+    """Encode a chunk as an Arrow IPC stream with one record batch typed by the schema."""
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    fields = [
+        pa.field(name, arrow_type(definition.get("dataType")))
+        for name, definition in zip(columns, definitions)
+    ]
+    if chunk.batch is not None:
+        arrays = [chunk.batch.column(index).cast(field.type) for index, field in enumerate(fields)]
+    else:
+        assert chunk.rows is not None
+        cells = list(zip(*chunk.rows))
+        arrays = [text_to_arrow(values, field.type) for values, field in zip(cells, fields)]
+    schema = pa.schema(fields)
+    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+def _with_last(items: Iterator[T]) -> Iterator[Tuple[T, bool]]:
+    """Yield ``(item, is_last)`` pairs, reading one item ahead."""
+    previous = next(items, None)
+    if previous is None:
+        return
+    for item in items:
+        yield previous, False
+        previous = item
+    yield previous, True
+
+
+def _prefetched(items: Iterator[T], depth: int = 1) -> Iterator[T]:
+    """Produce ``items`` on a background thread, keeping at most ``depth`` ready ahead."""
+    ready: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                while not stopped.is_set():
+                    try:
+                        ready.put(("item", item), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stopped.is_set():
+                    return
+            ready.put(("done", None))
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+            ready.put(("error", exc))
+
+    thread = threading.Thread(target=produce, name="dataframe-append-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = ready.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stopped.set()
+
+
+def post_chunk(table_id: str, body: bytes, content_type: str, end_of_data: bool) -> None:
+    """Post one encoded chunk, resending it while the service answers 429 or 503.
+
+    Raises:
+        requests.RequestException: If the request fails.
+    """
+    url = f"{_tables_url(table_id)}/data"
+    if end_of_data and content_type == ARROW_CONTENT_TYPE:
+        url += "?endOfData=true"
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            make_api_request(
+                "POST", url, headers={"Content-Type": content_type}, data=body, handle_errors=False
+            )
+            return
+        except requests.HTTPError as exc:
+            response = exc.response
+            status = response.status_code if response is not None else None
+            if status not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS:
+                raise
+            retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+            delay = float(retry_after) if retry_after.isdigit() else 2.0 ** (attempt - 1)
+            time.sleep(min(delay, 60.0))
+
+
+def append_signature(table_id: str, input_path: Path, source_format: str) -> str:
+    """Return a stable hash of the table and input file, used to validate resumes."""
+    stat = input_path.stat()
+    text = json.dumps(
+        {
+            "table": table_id,
+            "input": str(input_path.resolve()),
+            "format": source_format,
+            "size": stat.st_size,
+            "modified": stat.st_mtime_ns,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
+    """Load an append checkpoint, if one exists."""
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return data if isinstance(data, dict) else None
+
+
+def save_checkpoint(path: Path, checkpoint: Dict[str, Any]) -> None:
+    """Write an append checkpoint atomically."""
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(checkpoint, handle, indent=2)
+    os.replace(temp_path, path)
+
+
+def append_file(
+    table_id: str,
+    input_path: Path,
+    source_format: str,
+    upload_format: str = "json",
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    end_of_data: bool = False,
+    checkpoint_path: Optional[Path] = None,
+    resume: bool = False,
+    table_columns: Optional[List[Dict[str, Any]]] = None,
+    on_chunk: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Append the rows of ``input_path`` to a table in chunks.
+
+    Args:
+        table_id: Table to append to.
+        input_path: Input file.
+        source_format: One of :data:`SOURCE_FORMATS`.
+        upload_format: ``json`` frames or ``arrow`` IPC streams.
+        chunk_rows: Rows per request.
+        end_of_data: Mark the table complete with the last chunk.
+        checkpoint_path: File recording progress after every chunk.
+        resume: Continue from ``checkpoint_path``.
+        table_columns: Column definitions, when already known; fetched otherwise.
+        on_chunk: Called with the checkpoint after each appended chunk.
+
+    Returns:
+        The final checkpoint, with ``rowsAppended`` and ``chunks`` counts.
+
+    Raises:
+        ValueError: If the input does not match the table schema, or ``resume``
+            is set but the checkpoint is missing or belongs to another upload.
+        ImportError: If Parquet input or Arrow upload is requested without ``pyarrow``.
+    """
+    checkpoint: Dict[str, Any] = {
+        "signature": append_signature(table_id, input_path, source_format),
+        "rowsAppended": 0,
+        "chunks": 0,
+        "complete": False,
+    }
+    if resume:
+        previous = load_checkpoint(checkpoint_path) if checkpoint_path else None
+        if previous is None:
+            raise ValueError(f"No append checkpoint found at {checkpoint_path}")
+        if previous.get("signature") != checkpoint["signature"]:
+            raise ValueError("The checkpoint was written for a different table or input file")
+        checkpoint.update(previous)
+        if checkpoint["complete"]:
+            return checkpoint
+
+    if upload_format == "arrow":
+        import pyarrow  # type: ignore[import-not-found]  # noqa: F401
+
+        content_type = ARROW_CONTENT_TYPE
+    else:
+        content_type = "application/json"
+
+    if table_columns is None:
+        table_columns = fetch_table_columns(table_id)
+
+    with open_source(input_path, source_format) as source:
+        columns = source.columns
+        definitions = match_columns(columns, table_columns)
+
+        def encode(chunk: SourceChunk, last: bool) -> Tuple[int, bytes]:
+            if upload_format == "arrow":
+                return len(chunk), arrow_chunk_body(chunk, columns, definitions)
+            return len(chunk), json_chunk_body(chunk, columns, definitions, end_of_data and last)
+
+        chunks = source.iter_chunks(chunk_rows, checkpoint["rowsAppended"])
+        bodies = (encode(chunk, last) for chunk, last in _with_last(chunks))
+        sent = False
+        with pooled_http_session():
+            for (row_count, body), last in _with_last(_prefetched(bodies)):
+                post_chunk(table_id, body, content_type, end_of_data and last)
+                sent = True
+                checkpoint["rowsAppended"] += row_count
+                checkpoint["chunks"] += 1
+                checkpoint["complete"] = last
+                if checkpoint_path is not None:
+                    save_checkpoint(checkpoint_path, checkpoint)
+                if on_chunk is not None:
+                    on_chunk(checkpoint)
+            if end_of_data and not sent:
+                post_chunk(table_id, dumpb({"endOfData": True}), "application/json", False)
+
+    checkpoint["complete"] = True
+    if checkpoint_path is not None:
+        save_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint
@@ -3,15 +3,29 @@
 import json
 import sys
 from collections import defaultdict
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, NoReturn, Optional, Tuple
 
 import click
 import requests as requests_lib
 from click.core import ParameterSource
 
-from .cli_utils import confirm_bulk_operation, validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, confirm_bulk_operation, validate_output_format
+from .dataframe_append import (
+    DEFAULT_CHUNK_ROWS,
+    SOURCE_FORMATS,
+    UPLOAD_FORMATS,
+    append_file,
+    default_upload_format,
+    detect_source_format,
+    fetch_table_columns,
+)
+from .dataframe_frames import BINARY_FRAME_FORMATS, FRAME_FILE_FORMATS, open_frame_writer
+from .dataframe_schema import DEFAULT_SAMPLE_ROWS, infer_columns, table_columns
 from .platform import require_feature
 from .rich_output import render_table
+from .table_utils import is_delimited_format, output_delimited
+from .tabular_writers import PYARROW_INSTALL_HINT
 from .utils import (
     ExitCodes,
     check_readonly_mode,
@@ -52,6 +66,10 @@ FILTER_OPERATION_CHOICES = [
 DECIMATION_METHOD_CHOICES = ["LOSSY", "MAX_MIN", "ENTRY_EXIT"]
 DECIMATION_DISTRIBUTION_CHOICES = ["EQUAL_FREQUENCY", "EQUAL_WIDTH"]
 
+_TABLE_LIST_HEADERS = ["Name", "ID", "Workspace", "Rows", "Append", "Modified"]
+# Query pages hold up to 10,000 rows; column widths come from the first few.
+_WIDTH_SAMPLE_ROWS = 100
+
 
 def _get_dataframe_base_url() -> str:
     """Return the DataFrame service base URL."""
@@ -212,14 +230,15 @@ def _format_bool(value: Any) -> str:
 def _calculate_column_widths(
     headers: List[str], rows: List[List[str]], maximum: int = 36
 ) -> List[int]:
-    """Calculate display widths for Rich table rendering."""
-    widths: List[int] = []
-    for index, header in enumerate(headers):
-        width = len(header)
-        for row in rows:
-            width = max(width, len(row[index]))
-        widths.append(min(max(width, 8), maximum))
-    return widths
+    """Calculate display widths for Rich table rendering.
+
+    Widths are sized from the headers and the first ``_WIDTH_SAMPLE_ROWS`` rows;
+    longer values further down are truncated like any value over ``maximum``.
+    """
+    widths = [len(header) for header in headers]
+    for row in rows[:_WIDTH_SAMPLE_ROWS]:
+        widths = [max(width, len(value)) for width, value in zip(widths, row)]
+    return [min(max(width, 8), maximum) for width in widths]
 
 
 def _render_grid(
@@ -373,6 +392,18 @@ def _confirm_next_page() -> bool:
     return click.confirm("Show next page?", default=True)
 
 
+def _table_list_row(table: Dict[str, Any], workspace_map: Dict[str, str]) -> List[str]:
+    """Format one query-tables result as a ``dataframe list`` row."""
+    return [
+        str(table.get("name", "")),
+        str(table.get("id", "")),
+        get_workspace_display_name(table.get("workspace", ""), workspace_map),
+        str(table.get("rowCount", "")),
+        _format_bool(table.get("supportsAppend", False)),
+        str(table.get("rowsModifiedAt", "")),
+    ]
+
+
 def _display_table_pages(initial_payload: Dict[str, Any], workspace_map: Dict[str, str]) -> None:
     """Interactively page through query-tables results for table output."""
     payload = dict(initial_payload)
@@ -390,18 +421,8 @@ def _display_table_pages(initial_payload: Dict[str, Any], workspace_map: Dict[st
         if not tables:
             return
 
-        rows = [
-            [
-                str(table.get("name", "")),
-                str(table.get("id", "")),
-                get_workspace_display_name(table.get("workspace", ""), workspace_map),
-                str(table.get("rowCount", "")),
-                _format_bool(table.get("supportsAppend", False)),
-                str(table.get("rowsModifiedAt", "")),
-            ]
-            for table in tables
-        ]
-        _render_grid(["Name", "ID", "Workspace", "Rows", "Append", "Modified"], rows)
+        rows = [_table_list_row(table, workspace_map) for table in tables]
+        _render_grid(_TABLE_LIST_HEADERS, rows)
 
         shown += len(tables)
         if not continuation_token:
@@ -499,6 +520,61 @@ def _display_query_pages(table_id: str, payload: Dict[str, Any], endpoint: str)
         first_page = False
 
 
+def _write_query_frames(
+    table_id: str,
+    payload: Dict[str, Any],
+    endpoint: str,
+    file_format: str,
+    output: Optional[str],
+    follow_pages: bool,
+) -> None:
+    """Write query frames to a typed file, appending continuation pages as they arrive."""
+    output_path = Path(output) if output else None
+    if output_path is None and file_format in BINARY_FRAME_FORMATS:
+        _exit_invalid_input(f"--format {file_format} requires --output")
+
+    try:
+        data_types: Dict[str, str] = {}
+        if file_format != "csv":
+            data_types = {
+                str(column.get("name")): str(column.get("dataType", "STRING"))
+                for column in fetch_table_columns(table_id)
+            }
+        query_payload = dict(payload)
+        with open_frame_writer(output_path, file_format, data_types) as writer:
+            while True:
+                data = make_api_request(
+                    "POST",
+                    f"{_get_dataframe_base_url()}/tables/{table_id}/{endpoint}",
+                    payload=query_payload,
+                ).json()
+                writer.write_frame(data.get("frame") or {})
+                if output_path is not None:
+                    click.echo(f"  Wrote {writer.rows_written} rows", err=True)
+                continuation_token = data.get("continuationToken")
+                if not follow_pages or not continuation_token:
+                    break
+                query_payload["continuationToken"] = continuation_token
+    except ImportError:
+        click.echo(PYARROW_INSTALL_HINT, err=True)
+        sys.exit(ExitCodes.GENERAL_ERROR)
+    except ValueError as exc:
+        _exit_invalid_input(str(exc))
+    except Exception as exc:  # noqa: BLE001
+        handle_api_error(exc)
+
+    if output_path is not None:
+        format_success(
+            "DataFrame rows written",
+            {
+                "id": table_id,
+                "output": str(output_path),
+                "format": file_format,
+                "rows": writer.rows_written,
+            },
+        )
+
+
 def _build_decimation_payload(
     request: Optional[str],
     columns: Optional[str],
@@ -654,6 +730,61 @@ def _post_arrow_append(table_id: str, input_path: str, end_of_data: bool) -> req
         raise
 
 
+def _append_chunked(
+    table_id: str,
+    input_path: Path,
+    source_format: str,
+    upload_format: str,
+    chunk_rows: int,
+    end_of_data: bool,
+    checkpoint_path: Optional[Path],
+    resume: bool,
+    schema_columns: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Stream a CSV, TSV, JSON Lines or Parquet file into a table in chunks.
+
+    Returns the final append checkpoint; exits on invalid input or API errors.
+    """
+    if resume and checkpoint_path is None:
+        _exit_invalid_input("--resume requires --checkpoint")
+    if not resume and checkpoint_path is not None and checkpoint_path.exists():
+        _exit_invalid_input(
+            f"{checkpoint_path} already exists. Use --resume to continue that append "
+            "or choose another checkpoint file."
+        )
+    if upload_format == "auto":
+        upload_format = default_upload_format()
+
+    def _report_chunk(checkpoint: Dict[str, Any]) -> None:
+        click.echo(
+            f"  Appended {checkpoint['rowsAppended']} rows in {checkpoint['chunks']} chunks",
+            err=True,
+        )
+
+    try:
+        checkpoint = append_file(
+            table_id,
+            input_path,
+            source_format,
+            upload_format=upload_format,
+            chunk_rows=chunk_rows,
+            end_of_data=end_of_data,
+            checkpoint_path=checkpoint_path,
+            resume=resume,
+            table_columns=schema_columns,
+            on_chunk=_report_chunk,
+        )
+    except ImportError:
+        click.echo(PYARROW_INSTALL_HINT, err=True)
+        sys.exit(ExitCodes.GENERAL_ERROR)
+    except ValueError as exc:
+        _exit_invalid_input(str(exc))
+    except Exception as exc:  # noqa: BLE001
+        handle_api_error(exc)
+    checkpoint["format"] = upload_format
+    return checkpoint
+
+
 def register_dataframe_commands(cli: Any) -> None:
     """Register the dataframe command group and subcommands."""
 
@@ -696,12 +827,12 @@ def register_dataframe_commands(cli: Any) -> None:
         type=int,
         default=25,
         show_default=True,
-        help="Maximum tables to return (table page size; JSON list total)",
+        help="Maximum tables to return (table page size; JSON and CSV list total)",
     )
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -736,6 +867,15 @@ def register_dataframe_commands(cli: Any) -> None:
             if format_output == "json":
                 click.echo(json.dumps(_fetch_all_table_pages(payload, max_items=take), indent=2))
                 return
+            if is_delimited_format(format_output):
+                tables = _fetch_all_table_pages(payload, max_items=take)["tables"]
+                workspace_map = get_workspace_map()
+                output_delimited(
+                    _TABLE_LIST_HEADERS,
+                    (_table_list_row(table, workspace_map) for table in tables),
+                    format_output,
+                )
+                return
 
             _display_table_pages(payload, get_workspace_map())
         except Exception as exc:
@@ -813,7 +953,14 @@ def register_dataframe_commands(cli: Any) -> None:
         multiple=True,
         help="Sort clause in the form column[:asc|desc]. Repeat for multiple clauses.",
     )
-    @click.option("--take", "-t", type=int, default=100, show_default=True, help="Rows per page")
+    @click.option(
+        "--take",
+        "-t",
+        type=int,
+        default=100,
+        show_default=True,
+        help="Rows per page (10000 when writing a file format)",
+    )
     @click.option("--continuation-token", help="Continuation token for paged reads")
     @click.option(
         "--request",
@@ -823,10 +970,16 @@ def register_dataframe_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(["table", "json", *FRAME_FILE_FORMATS]),
         default="table",
         show_default=True,
-        help="Output format",
+        help="Output format; csv, arrow, parquet and npy fetch every page",
+    )
+    @click.option(
+        "--output",
+        "-o",
+        type=click.Path(dir_okay=False, writable=True),
+        help="Output file (required for arrow, parquet and npy)",
     )
     def query_table_data(
         table_id: str,
@@ -837,12 +990,23 @@ def register_dataframe_commands(cli: Any) -> None:
         continuation_token: Optional[str],
         request: Optional[str],
         format: str,
+        output: Optional[str],
     ) -> None:
-        """Query row data from a DataFrame table."""
-        format_output = validate_output_format(format)
+        """Query row data from a DataFrame table.
+
+        With --format csv, arrow, parquet or npy, every page is fetched and
+        appended to one file (or CSV to stdout) with columns typed by the table
+        schema. npy writes a NumPy structured array of numeric, boolean and
+        timestamp columns.
+        """
         ctx = click.get_current_context()
         take_source = ctx.get_parameter_source("take")
-        effective_take = None if request and take_source == ParameterSource.DEFAULT else take
+        effective_take: Optional[int] = take
+        if take_source == ParameterSource.DEFAULT:
+            if request:
+                effective_take = None
+            elif format in FRAME_FILE_FORMATS:
+                effective_take = 10000
         payload = _build_data_query_payload(
             request=request,
             columns=columns,
@@ -852,6 +1016,11 @@ def register_dataframe_commands(cli: Any) -> None:
             continuation_token=continuation_token,
         )
 
+        if format in FRAME_FILE_FORMATS:
+            _write_query_frames(table_id, payload, "query-data", format, output, follow_pages=True)
+            return
+        format_output = validate_output_format(format)
+
         try:
             if format_output == "json":
                 data = make_api_request(
@@ -899,11 +1068,17 @@ def register_dataframe_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(["table", "json", *FRAME_FILE_FORMATS]),
         default="table",
         show_default=True,
         help="Output format",
     )
+    @click.option(
+        "--output",
+        "-o",
+        type=click.Path(dir_okay=False, writable=True),
+        help="Output file (required for arrow, parquet and npy)",
+    )
     def decimate_table_data(
         table_id: str,
         columns: Optional[str],
@@ -915,9 +1090,13 @@ def register_dataframe_commands(cli: Any) -> None:
         distribution: Optional[str],
         request: Optional[str],
         format: str,
+        output: Optional[str],
     ) -> None:
-        """Query decimated row data for numeric or timeseries tables."""
-        format_output = validate_output_format(format)
+        """Query decimated row data for numeric or timeseries tables.
+
+        --format csv, arrow, parquet or npy writes the rows with columns typed
+        by the table schema, as for 'dataframe query'.
+        """
         ctx = click.get_current_context()
         intervals_source = ctx.get_parameter_source("intervals")
         effective_intervals = (
@@ -934,6 +1113,13 @@ def register_dataframe_commands(cli: Any) -> None:
             distribution=distribution,
         )
 
+        if format in FRAME_FILE_FORMATS:
+            _write_query_frames(
+                table_id, payload, "query-decimated-data", format, output, follow_pages=False
+            )
+            return
+        format_output = validate_output_format(format)
+
         try:
             data = make_api_request(
                 "POST",
@@ -1023,17 +1209,78 @@ def register_dataframe_commands(cli: Any) -> None:
     )
     @click.option(
         "--input-format",
-        type=click.Choice(["json", "arrow"]),
-        default="json",
+        type=click.Choice(["json", "arrow", *SOURCE_FORMATS]),
+        help="Input format (default: from the file extension, otherwise json)",
+    )
+    @click.option(
+        "--chunk-rows",
+        type=click.IntRange(min=1),
+        default=DEFAULT_CHUNK_ROWS,
         show_default=True,
-        help="Input payload format",
+        help="Rows per request for csv, tsv, jsonl and parquet input",
     )
+    @click.option(
+        "--upload-format",
+        type=click.Choice(list(UPLOAD_FORMATS)),
+        default="auto",
+        show_default=True,
+        help="Chunk encoding; auto uses Arrow when pyarrow is installed, JSON otherwise",
+    )
+    @click.option(
+        "--checkpoint",
+        "checkpoint_file",
+        type=click.Path(dir_okay=False),
+        help="File recording appended rows after every chunk",
+    )
+    @click.option("--resume", is_flag=True, help="Continue an interrupted append from --checkpoint")
     @click.option("--end-of-data", is_flag=True, help="Mark the table as complete after append")
     def append_table_data(
-        table_id: str, input_path: str, input_format: str, end_of_data: bool
+        table_id: str,
+        input_path: str,
+        input_format: Optional[str],
+        chunk_rows: int,
+        upload_format: str,
+        checkpoint_file: Optional[str],
+        resume: bool,
+        end_of_data: bool,
     ) -> None:
-        """Append JSON or Arrow row data to a DataFrame table."""
+        """Append JSON, Arrow, CSV, TSV, JSON Lines or Parquet rows to a DataFrame table.
+
+        JSON and Arrow files are sent as a single request. CSV, TSV, JSON Lines
+        and Parquet files are checked against the table schema and streamed in
+        chunks of --chunk-rows rows, with --end-of-data sent on the last chunk.
+        With --checkpoint, progress is saved after every chunk; rerun with
+        --resume to continue an interrupted append.
+        """
         check_readonly_mode("append dataframe rows")
+        input_format = input_format or detect_source_format(Path(input_path)) or "json"
+
+        if input_format in SOURCE_FORMATS:
+            checkpoint = _append_chunked(
+                table_id,
+                Path(input_path),
+                input_format,
+                upload_format,
+                chunk_rows,
+                end_of_data,
+                Path(checkpoint_file) if checkpoint_file else None,
+                resume,
+            )
+            format_success(
+                "DataFrame rows appended",
+                {
+                    "id": table_id,
+                    "rows": checkpoint["rowsAppended"],
+                    "chunks": checkpoint["chunks"],
+                    "format": checkpoint["format"],
+                    "endOfData": end_of_data,
+                },
+            )
+            return
+        if checkpoint_file or resume:
+            _exit_invalid_input(
+                "--checkpoint and --resume apply to csv, tsv, jsonl and parquet input"
+            )
 
         try:
             if input_format == "arrow":
@@ -1070,9 +1317,48 @@ def register_dataframe_commands(cli: Any) -> None:
     @click.option(
         "--definition",
         type=click.Path(exists=True, dir_okay=False, readable=True),
-        required=True,
         help="Create request JSON",
     )
+    @click.option(
+        "--from",
+        "from_path",
+        type=click.Path(exists=True, dir_okay=False, readable=True),
+        help="CSV, TSV, JSON Lines or Parquet file to infer the schema from and append",
+    )
+    @click.option(
+        "--input-format",
+        type=click.Choice(list(SOURCE_FORMATS)),
+        help="Format of the --from file (default: from the file extension)",
+    )
+    @click.option("--index-column", help="Index column for --from (default: inferred)")
+    @click.option(
+        "--sample-rows",
+        type=click.IntRange(min=1),
+        default=DEFAULT_SAMPLE_ROWS,
+        show_default=True,
+        help="Rows of the --from file used to infer column types",
+    )
+    @click.option(
+        "--chunk-rows",
+        type=click.IntRange(min=1),
+        default=DEFAULT_CHUNK_ROWS,
+        show_default=True,
+        help="Rows per append request for --from",
+    )
+    @click.option(
+        "--upload-format",
+        type=click.Choice(list(UPLOAD_FORMATS)),
+        default="auto",
+        show_default=True,
+        help="Chunk encoding for --from; auto uses Arrow when pyarrow is installed",
+    )
+    @click.option(
+        "--checkpoint",
+        "checkpoint_file",
+        type=click.Path(dir_okay=False),
+        help="File recording appended rows, for 'dataframe append --resume'",
+    )
+    @click.option("--end-of-data", is_flag=True, help="Mark the table as complete after --from")
     @click.option("--name", help="Override the table name in the definition file")
     @click.option("--workspace", "workspace_name", "-w", help="Workspace name or ID")
     @click.option(
@@ -1084,18 +1370,57 @@ def register_dataframe_commands(cli: Any) -> None:
         help="Output format",
     )
     def create_table(
-        definition: str,
+        definition: Optional[str],
+        from_path: Optional[str],
+        input_format: Optional[str],
+        index_column: Optional[str],
+        sample_rows: int,
+        chunk_rows: int,
+        upload_format: str,
+        checkpoint_file: Optional[str],
+        end_of_data: bool,
         name: Optional[str],
         workspace_name: Optional[str],
         format: str,
     ) -> None:
-        """Create a new DataFrame table."""
+        """Create a new DataFrame table.
+
+        With --definition the table is created from a create request JSON file.
+        With --from, column types and the index column are inferred from the
+        first --sample-rows rows of a CSV, TSV, JSON Lines or Parquet file, the
+        table is created (named after the file unless --name is given), and the
+        file's rows are appended in chunks as with 'dataframe append'.
+        """
         check_readonly_mode("create a dataframe table")
         format_output = validate_output_format(format)
-
-        payload = load_json_file(definition)
-        if not isinstance(payload, dict):
-            _exit_invalid_input("Table definition must contain a JSON object")
+        if (definition is None) == (from_path is None):
+            _exit_invalid_input("Specify exactly one of --definition or --from")
+
+        source_format = ""
+        if from_path is not None:
+            source_format = input_format or detect_source_format(Path(from_path)) or ""
+            if source_format not in SOURCE_FORMATS:
+                _exit_invalid_input(
+                    "Cannot tell the --from file format from its extension; use --input-format"
+                )
+            if checkpoint_file and Path(checkpoint_file).exists():
+                _exit_invalid_input(f"{checkpoint_file} already exists")
+            try:
+                columns = table_columns(
+                    infer_columns(Path(from_path), source_format, sample_rows), index_column
+                )
+            except ImportError:
+                click.echo(PYARROW_INSTALL_HINT, err=True)
+                sys.exit(ExitCodes.GENERAL_ERROR)
+            except ValueError as exc:
+                _exit_invalid_input(str(exc))
+            payload: Dict[str, Any] = {"name": Path(from_path).stem, "columns": columns}
+        else:
+            assert definition is not None
+            loaded = load_json_file(definition)
+            if not isinstance(loaded, dict):
+                _exit_invalid_input("Table definition must contain a JSON object")
+            payload = loaded
         if name is not None:
             payload["name"] = name
 
@@ -1108,16 +1433,51 @@ def register_dataframe_commands(cli: Any) -> None:
                 "POST", f"{_get_dataframe_base_url()}/tables", payload=payload
             )
             created = response.json() if response.text.strip() else {}
+        except Exception as exc:
+            handle_api_error(exc)
+
+        if from_path is None:
             if format_output == "json":
                 click.echo(json.dumps(created, indent=2))
                 return
-
             format_success(
                 "DataFrame table created",
                 {"id": created.get("id", ""), "name": payload.get("name", "")},
             )
-        except Exception as exc:
-            handle_api_error(exc)
+            return
+
+        table_id = str(created.get("id", ""))
+        if format_output != "json":
+            format_success(
+                "DataFrame table created",
+                {"id": table_id, "name": payload.get("name", ""), "columns": len(columns)},
+            )
+        checkpoint = _append_chunked(
+            table_id,
+            Path(from_path),
+            source_format,
+            upload_format,
+            chunk_rows,
+            end_of_data,
+            Path(checkpoint_file) if checkpoint_file else None,
+            False,
+            schema_columns=columns,
+        )
+        if format_output == "json":
+            created.setdefault("columns", columns)
+            created["rowsAppended"] = checkpoint["rowsAppended"]
+            click.echo(json.dumps(created, indent=2))
+            return
+        format_success(
+            "DataFrame rows appended",
+            {
+                "id": table_id,
+                "rows": checkpoint["rowsAppended"],
+                "chunks": checkpoint["chunks"],
+                "format": checkpoint["format"],
+                "endOfData": end_of_data,
+            },
+        )
 
     @dataframe.command(name="update")
     @click.argument("table_id")
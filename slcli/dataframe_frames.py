@@ -0,0 +1,298 @@
+"""Typed columnar files from DataFrame query frames.
+
+``query-data`` and ``query-decimated-data`` return split-oriented frames:
+a list of column names and ``data`` rows of strings. The writers here turn
+each page into column buffers typed by the table schema and append it to one
+output file, so continuation pages stream into the file as they arrive and
+no per-row dicts are built.
+
+* ``csv`` writes the frame rows as they are, with one header line.
+* ``arrow`` (IPC file) and ``parquet`` write one record batch (row group) per
+  page with Arrow types from the schema; they require ``pyarrow``.
+* ``npy`` writes a NumPy structured array (one field per column), readable
+  with ``numpy.load``. It needs no extra packages; string columns cannot be
+  stored in it and empty values are only allowed in floating-point (NaN)
+  and timestamp (NaT) columns.
+"""
+
+import csv
+import struct
+import sys
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from itertools import starmap
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Sequence
+
+from .dataframe_append import arrow_type, text_to_arrow
+
+FRAME_FILE_FORMATS = ("csv", "arrow", "parquet", "npy")
+# Formats that cannot be written to standard output.
+BINARY_FRAME_FORMATS = ("arrow", "parquet", "npy")
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+# Space reserved in the .npy header for the row count, filled in on close.
+_NPY_SHAPE_DIGITS = 20
+_NAT = -(2**63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+# DataFrame data type -> (struct code, NumPy dtype descriptor)
+_NPY_TYPES = {
+    "INT32": ("i", "<i4"),
+    "INT64": ("q", "<i8"),
+    "FLOAT32": ("f", "<f4"),
+    "FLOAT64": ("d", "<f8"),
+    "BOOL": ("?", "|b1"),
+    "TIMESTAMP": ("q", "<M8[ms]"),
+}
+
+
+class FrameWriter(ABC):
+    """Base class for writers that append query frame pages to one file.
+
+    The column list is taken from the first page; later pages must have the
+    same columns.
+    """
+
+    def __init__(self, data_types: Dict[str, str]) -> None:
+        """Create a writer; ``data_types`` maps column names to DataFrame data types."""
+        self.data_types = data_types
+        self.columns: Optional[List[str]] = None
+        self.rows_written = 0
+
+    def write_frame(self, frame: Dict[str, Any]) -> None:
+        """Append the rows of one ``frame`` page.
+
+        Raises:
+            ValueError: If the page's columns differ from the first page's, or a
+                value cannot be stored in its column type.
+        """
+        columns = [str(name) for name in frame.get("columns") or []]
+        rows = frame.get("data") or []
+        if self.columns is None:
+            self.columns = columns
+            self._start(columns)
+        elif columns != self.columns:
+            raise ValueError("Query pages returned different columns")
+        if rows:
+            self._write_rows(rows)
+            self.rows_written += len(rows)
+
+    def column_types(self) -> List[str]:
+        """Return the DataFrame data type of each column (``STRING`` when unknown)."""
+        return [str(self.data_types.get(name, "STRING")).upper() for name in self.columns or []]
+
+    @abstractmethod
+    def _start(self, columns: List[str]) -> None:
+        """Begin the output once the column list is known."""
+
+    @abstractmethod
+    def _write_rows(self, rows: List[List[Optional[str]]]) -> None:
+        """Append the rows of one page."""
+
+    def close(self) -> None:
+        """Finish and close the output."""
+
+    def __enter__(self) -> "FrameWriter":
+        """Return the writer for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the writer."""
+        self.close()
+
+
+class CsvFrameWriter(FrameWriter):
+    """Write frame rows as CSV to a file or standard output."""
+
+    def __init__(self, path: Optional[Path], data_types: Dict[str, str]) -> None:
+        """Open ``path``, or use standard output when it is ``None``."""
+        super().__init__(data_types)
+        self._owned = path is not None
+        self._file: IO[str] = (
+            open(path, "w", encoding="utf-8", newline="") if path is not None else sys.stdout
+        )
+        self._writer = csv.writer(self._file, lineterminator="\n")
+
+    def _start(self, columns: List[str]) -> None:
+        self._writer.writerow(columns)
+
+    def _write_rows(self, rows: List[List[Optional[str]]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        """Close the file, or flush standard output."""
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class _PyArrowFrameWriter(FrameWriter):
+    """Convert pages to typed record batches and write them to a pyarrow sink."""
+
+    def __init__(self, path: Path, data_types: Dict[str, str]) -> None:
+        """Prepare to write ``path``.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+        """
+        super().__init__(data_types)
+        import pyarrow as pa  # type: ignore[import-not-found]
+
+        self._pa = pa
+        self._path = path
+        self._schema: Any = None
+        self._writer: Any = None
+
+    def _start(self, columns: List[str]) -> None:
+        fields = [
+            self._pa.field(name, arrow_type(data_type))
+            for name, data_type in zip(columns, self.column_types())
+        ]
+        self._schema = self._pa.schema(fields)
+        self._writer = self._open_sink(self._path, self._schema)
+
+    @abstractmethod
+    def _open_sink(self, path: Path, schema: Any) -> Any:
+        """Return an object with ``write_batch`` and ``close`` methods."""
+
+    def _write_rows(self, rows: List[List[Optional[str]]]) -> None:
+        arrays = [
+            text_to_arrow(values, field.type) for values, field in zip(zip(*rows), self._schema)
+        ]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        """Close the file, writing an empty one when no page was received."""
+        if self._writer is None:
+            self._start([])
+        self._writer.close()
+
+
+class ArrowFrameWriter(_PyArrowFrameWriter):
+    """Write pages to an Arrow IPC file, one record batch per page."""
+
+    def _open_sink(self, path: Path, schema: Any) -> Any:
+        return self._pa.ipc.new_file(str(path), schema)
+
+
+class ParquetFrameWriter(_PyArrowFrameWriter):
+    """Write pages to a Parquet file, one row group per page."""
+
+    def _open_sink(self, path: Path, schema: Any) -> Any:
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        return pq.ParquetWriter(str(path), schema)
+
+
+def _timestamp_ms(value: str) -> int:
+    """Return milliseconds since the epoch for an ISO 8601 timestamp (UTC when unzoned)."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // _MILLISECOND
+
+
+def _npy_values(name: str, data_type: str, values: Sequence[Optional[str]]) -> List[Any]:
+    """Convert one column of frame text to Python values for ``struct`` packing."""
+    if data_type == "TIMESTAMP":
+        return [_NAT if value is None or value == "" else _timestamp_ms(value) for value in values]
+    if None in values or "" in values:
+        if data_type not in ("FLOAT32", "FLOAT64"):
+            raise ValueError(f"Column '{name}' has empty values, which npy cannot store")
+        values = ["nan" if value is None or value == "" else value for value in values]
+    if data_type == "BOOL":
+        return list(map("true".__eq__, map(str.lower, values)))  # type: ignore[arg-type]
+    if data_type in ("INT32", "INT64"):
+        return list(map(int, values))  # type: ignore[arg-type]
+    return list(map(float, values))  # type: ignore[arg-type]
+
+
+class NpyFrameWriter(FrameWriter):
+    """Write pages to a ``.npy`` file holding one structured array.
+
+    The header is written with room for the row count, and rewritten with
+    the final count on close.
+    """
+
+    def __init__(self, path: Path, data_types: Dict[str, str]) -> None:
+        """Open ``path`` for writing."""
+        super().__init__(data_types)
+        self._file = open(path, "wb")
+        self._descr: List[Any] = []
+        self._types: List[str] = []
+        self._packer: Optional[struct.Struct] = None
+        self._header_length = 0
+
+    def _header(self, rows: int) -> bytes:
+        shape = f"({rows},)".ljust(_NPY_SHAPE_DIGITS + 3)
+        text = f"{{'descr': {self._descr!r}, 'fortran_order': False, 'shape': {shape}}}"
+        if not self._header_length:
+            # Pad so the data starts on a 64-byte boundary, as numpy.save does
+            unpadded = len(_NPY_MAGIC) + 2 + len(text) + 1
+            self._header_length = len(text) + 1 + (-unpadded % 64)
+        return text.ljust(self._header_length - 1).encode("latin-1") + b"\n"
+
+    def _start(self, columns: List[str]) -> None:
+        self._types = self.column_types()
+        unsupported = [name for name, kind in zip(columns, self._types) if kind not in _NPY_TYPES]
+        if unsupported:
+            raise ValueError(
+                "npy output supports numeric, boolean and timestamp columns; "
+                f"not {', '.join(unsupported)} (select columns with --columns)"
+            )
+        self._descr = [(name, _NPY_TYPES[kind][1]) for name, kind in zip(columns, self._types)]
+        codes = "".join(_NPY_TYPES[kind][0] for kind in self._types)
+        self._packer = struct.Struct("<" + codes)
+        self._write_header(0)
+
+    def _write_header(self, rows: int) -> None:
+        header = self._header(rows)
+        self._file.write(_NPY_MAGIC + struct.pack("<H", len(header)) + header)
+
+    def _write_rows(self, rows: List[List[Optional[str]]]) -> None:
+        assert self.columns is not None and self._packer is not None
+        columns = [
+            _npy_values(name, kind, values)
+            for name, kind, values in zip(self.columns, self._types, zip(*rows))
+        ]
+        self._file.write(b"".join(starmap(self._packer.pack, zip(*columns))))
+
+    def close(self) -> None:
+        """Record the final row count in the header and close the file."""
+        try:
+            if self.columns is None:
+                self.columns = []
+                self._start([])
+            if self._packer is not None:
+                self._file.seek(0)
+                self._write_header(self.rows_written)
+        finally:
+            self._file.close()
+
+
+def open_frame_writer(
+    path: Optional[Path], file_format: str, data_types: Dict[str, str]
+) -> FrameWriter:
+    """Open a frame writer for one of :data:`FRAME_FILE_FORMATS`.
+
+    ``path`` may be ``None`` only for ``csv``, which then writes to standard output.
+
+    Raises:
+        ValueError: If the format is not supported or needs a path.
+        ImportError: If Arrow or Parquet is requested and ``pyarrow`` is not installed.
+    """
+    file_format = file_format.lower()
+    if file_format == "csv":
+        return CsvFrameWriter(path, data_types)
+    if path is None:
+        raise ValueError(f"{file_format} output needs --output")
+    if file_format == "arrow":
+        return ArrowFrameWriter(path, data_types)
+    if file_format == "parquet":
+        return ParquetFrameWriter(path, data_types)
+    if file_format == "npy":
+        return NpyFrameWriter(path, data_types)
+    raise ValueError(f"Unsupported output format: {file_format}")
@@ -0,0 +1,177 @@
+"""Column type and index inference for ``dataframe create --from``.
+
+Types are inferred from the first ``sample_rows`` rows of the input. Parquet
+columns take their type from the Arrow schema. Text columns (CSV, TSV, JSON
+Lines) are checked a whole column at a time: each candidate type has one
+precompiled pattern that is full-matched against every non-empty cell, which
+costs far less than a Python ``try``/``except`` conversion per cell. Each
+pattern can match a given cell in only one way, so a non-matching cell is
+rejected in linear time. Candidates are tried from the narrowest type
+(``INT32``, ``INT64``, ``FLOAT64``, ``BOOL``, ``TIMESTAMP``) to ``STRING``.
+
+The index is the first integer or timestamp column with no empty cells whose
+values strictly increase over the sample. Every other column is created as
+``NULLABLE``, since empty cells may appear after the sample.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .dataframe_append import open_source
+
+DEFAULT_SAMPLE_ROWS = 1000
+INDEX_TYPES = ("INT32", "INT64", "TIMESTAMP")
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+_INT_CELL = r"[+-]?\d+"
+_FLOAT_CELL = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?|[+-]?(?:inf|infinity|nan)"
+_BOOL_CELL = r"true|false"
+_TIMESTAMP_CELL = (
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+
+_INT_MATCH = re.compile(_INT_CELL).fullmatch
+_FLOAT_MATCH = re.compile(_FLOAT_CELL, re.IGNORECASE).fullmatch
+_BOOL_MATCH = re.compile(_BOOL_CELL, re.IGNORECASE).fullmatch
+_TIMESTAMP_MATCH = re.compile(_TIMESTAMP_CELL, re.IGNORECASE).fullmatch
+
+
+@dataclass(frozen=True)
+class InferredColumn:
+    """Inferred type of one input column."""
+
+    name: str
+    data_type: str
+    has_nulls: bool
+    increasing: bool = False
+
+    @property
+    def can_index(self) -> bool:
+        """Whether the sample allows this column to be the table index."""
+        return self.data_type in INDEX_TYPES and not self.has_nulls
+
+
+def _strictly_increasing(values: List[Any]) -> bool:
+    return values == sorted(set(values))
+
+
+def infer_text_column(name: str, cells: Sequence[Optional[str]]) -> InferredColumn:
+    """Infer the type of a column of text cells; empty cells and ``None`` are nulls.
+
+    >>> infer_text_column("Index", ["1", "2", "3000000000"]).data_type
+    'INT64'
+    >>> infer_text_column("Ok", ["True", "", "false"])
+    InferredColumn(name='Ok', data_type='BOOL', has_nulls=True, increasing=False)
+    """
+    present: List[str] = list(filter(None, cells))
+    has_nulls = len(present) < len(cells)
+    if not present:
+        return InferredColumn(name, "STRING", has_nulls)
+    if all(map(_INT_MATCH, present)):
+        numbers = list(map(int, present))
+        in_int32 = _INT32_MIN <= min(numbers) and max(numbers) <= _INT32_MAX
+        return InferredColumn(
+            name, "INT32" if in_int32 else "INT64", has_nulls, _strictly_increasing(numbers)
+        )
+    if all(map(_FLOAT_MATCH, present)):
+        return InferredColumn(name, "FLOAT64", has_nulls)
+    if all(map(_BOOL_MATCH, present)):
+        return InferredColumn(name, "BOOL", has_nulls)
+    if all(map(_TIMESTAMP_MATCH, present)):
+        # ISO 8601 text of one shape sorts in time order
+        uniform = len(set(map(len, present))) == 1
+        return InferredColumn(
+            name, "TIMESTAMP", has_nulls, uniform and _strictly_increasing(present)
+        )
+    return InferredColumn(name, "STRING", has_nulls)
+
+
+def infer_arrow_column(name: str, array: Any) -> InferredColumn:
+    """Infer the type of a pyarrow array from its Arrow type."""
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+
+    arrow_type = array.type
+    has_nulls = array.null_count > 0
+    if pa.types.is_boolean(arrow_type):
+        data_type = "BOOL"
+    elif pa.types.is_integer(arrow_type):
+        narrow = arrow_type.bit_width < 32 or arrow_type == pa.int32()
+        data_type = "INT32" if narrow else "INT64"
+    elif pa.types.is_floating(arrow_type):
+        data_type = "FLOAT32" if arrow_type.bit_width <= 32 else "FLOAT64"
+    elif pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        data_type = "TIMESTAMP"
+    else:
+        data_type = "STRING"
+
+    increasing = False
+    if data_type in INDEX_TYPES and not has_nulls:
+        increasing = len(array) < 2 or bool(
+            pc.all(pc.greater(array.slice(1), array.slice(0, len(array) - 1))).as_py()
+        )
+    return InferredColumn(name, data_type, has_nulls, increasing)
+
+
+def infer_columns(
+    input_path: Path, source_format: str, sample_rows: int = DEFAULT_SAMPLE_ROWS
+) -> List[InferredColumn]:
+    """Infer the type of every input column from the first ``sample_rows`` rows.
+
+    Raises:
+        ValueError: If the input has no data rows.
+        ImportError: If Parquet input is given and ``pyarrow`` is not installed.
+    """
+    with open_source(input_path, source_format) as source:
+        sample = next(source.iter_chunks(sample_rows), None)
+        if sample is None or not len(sample):
+            raise ValueError(f"{input_path} has no rows to infer column types from")
+        if sample.batch is not None:
+            return [
+                infer_arrow_column(name, sample.batch.column(index))
+                for index, name in enumerate(source.columns)
+            ]
+        assert sample.rows is not None
+        return [
+            infer_text_column(name, cells) for name, cells in zip(source.columns, zip(*sample.rows))
+        ]
+
+
+def table_columns(
+    inferred: Sequence[InferredColumn], index_column: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Build create-table column definitions, with one ``INDEX`` column.
+
+    Raises:
+        ValueError: If ``index_column`` cannot be the index, or no column qualifies.
+    """
+    if index_column is not None:
+        chosen = next((column for column in inferred if column.name == index_column), None)
+        if chosen is None:
+            raise ValueError(f"Index column '{index_column}' is not in the input")
+        if not chosen.can_index:
+            raise ValueError(
+                f"Index column '{index_column}' must be an integer or timestamp column "
+                "without empty values"
+            )
+    else:
+        chosen = next(
+            (column for column in inferred if column.can_index and column.increasing), None
+        )
+        if chosen is None:
+            raise ValueError(
+                "No column can be used as the index (an increasing integer or timestamp "
+                "column without empty values); choose one with --index-column"
+            )
+    return [
+        {
+            "name": column.name,
+            "dataType": column.data_type,
+            "columnType": "INDEX" if column is chosen else "NULLABLE",
+        }
+        for column in inferred
+    ]
@@ -9,6 +9,7 @@ import click
 import questionary
 import requests
 
+from .cli_utils import LIST_OUTPUT_FORMATS
 from .platform import require_feature
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
@@ -414,10 +415,10 @@ def register_dff_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"], case_sensitive=False),
+        type=click.Choice(LIST_OUTPUT_FORMATS, case_sensitive=False),
         default="table",
         show_default=True,
-        help="Output format: table or json",
+        help="Output format",
     )
     def list_configurations(
         workspace: Optional[str] = None, take: int = 25, format: str = "table"
@@ -434,7 +435,7 @@ def register_dff_commands(cli: Any) -> None:
             all_configurations = _query_all_configurations(
                 workspace,
                 workspace_map,
-                max_items=take if format.lower() == "json" else None,
+                max_items=take if format.lower() != "table" else None,
             )
 
             # Use UniversalResponseHandler for consistent pagination
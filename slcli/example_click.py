@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 import click
 
+from .cli_utils import LIST_OUTPUT_FORMATS
 from .example_loader import ExampleLoader
 from .example_provisioner import ExampleProvisioner, ProvisioningAction, ProvisioningResult
 from .universal_handlers import UniversalResponseHandler, FilteredResponse
@@ -183,7 +184,7 @@ def register_example_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         help="Output format",
     )
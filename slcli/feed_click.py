@@ -4,26 +4,35 @@ This module provides commands for managing package feeds in SystemLink,
 supporting both SLE (/nifeed/v1) and SLS (/nirepo/v1) APIs.
 """
 
+import hashlib
+import io
 import json
+import os
 import sys
+import tarfile
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 import questionary
 import requests
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .platform import PLATFORM_SLS, get_platform
+from .polling_utils import CompletionWaiter
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
+    MultipartFileStream,
+    _extract_response_error_message,
     format_success,
     get_base_url,
     get_workspace_id_with_fallback,
     handle_api_error,
     make_api_request,
+    pooled_http_session,
 )
 from .workspace_utils import get_effective_workspace, get_workspace_display_name, get_workspace_map
 
@@ -312,7 +321,34 @@ def _list_packages(feed_id: str) -> List[Dict[str, Any]]:
     return data.get("packages", [])
 
 
-def _upload_package_sle(feed_id: str, file_path: str, overwrite: bool = False) -> Dict[str, Any]:
+def _post_package_file(url: str, file_path: str, handle_errors: bool = True) -> Dict[str, Any]:
+    """Upload a package file as a streamed multipart body.
+
+    The file is read in chunks while it is sent instead of being loaded into
+    memory, which keeps concurrent uploads of large packages cheap.
+
+    Args:
+        url: Upload endpoint
+        file_path: Path to the package file
+        handle_errors: Report request errors and exit (False raises them instead)
+
+    Returns:
+        Parsed JSON response
+    """
+    with MultipartFileStream("package", file_path) as body:
+        resp = make_api_request(
+            "POST",
+            url,
+            headers={"Content-Type": body.content_type},
+            data=body,
+            handle_errors=handle_errors,
+        )
+    return resp.json()
+
+
+def _upload_package_sle(
+    feed_id: str, file_path: str, overwrite: bool = False, handle_errors: bool = True
+) -> Dict[str, Any]:
     """Upload a package to a feed on SLE.
 
     SLE uploads directly to the feed.
@@ -321,6 +357,7 @@ def _upload_package_sle(feed_id: str, file_path: str, overwrite: bool = False) -
         feed_id: Feed ID
         file_path: Path to the package file
         overwrite: Whether to overwrite existing package
+        handle_errors: Report request errors and exit (False raises them instead)
 
     Returns:
         Response dictionary containing job ID or package details
@@ -330,11 +367,49 @@ def _upload_package_sle(feed_id: str, file_path: str, overwrite: bool = False) -
     if overwrite:
         url += "?shouldOverwrite=true"
 
-    file_name = Path(file_path).name
-    with open(file_path, "rb") as f:
-        files = {"package": (file_name, f, "application/octet-stream")}
-        resp = make_api_request("POST", url, files=files)
+    return _post_package_file(url, file_path, handle_errors)
+
+
+def _start_pool_upload_sls(
+    file_path: str, overwrite: bool = False, handle_errors: bool = True
+) -> str:
+    """Upload a package file to the SLS package pool.
+
+    Args:
+        file_path: Path to the package file
+        overwrite: Whether to overwrite an existing package
+        handle_errors: Report request errors and exit (False raises them instead)
+
+    Returns:
+        ID of the job that imports the package into the pool
+    """
+    upload_url = f"{_get_feed_base_url()}/upload-packages"
+    if overwrite:
+        upload_url += "?shouldOverwrite=true"
+
+    job_ids = _post_package_file(upload_url, file_path, handle_errors).get("jobIds", [])
+    if not job_ids:
+        raise PackageUploadError("No job ID returned from package upload")
+    return job_ids[0]
+
+
+def _add_package_references_sls(
+    feed_id: str, package_ids: List[str], handle_errors: bool = True
+) -> Dict[str, Any]:
+    """Add pool packages to a feed on SLS.
 
+    Args:
+        feed_id: Feed ID
+        package_ids: IDs of packages already in the package pool
+        handle_errors: Report request errors and exit (False raises them instead)
+
+    Returns:
+        Response dictionary, usually containing the job ID
+    """
+    ref_url = f"{_get_feed_base_url()}/feeds/{feed_id}/add-package-references"
+    resp = make_api_request(
+        "POST", ref_url, payload={"packageReferences": package_ids}, handle_errors=handle_errors
+    )
     return resp.json()
 
 
@@ -354,37 +429,18 @@ def _upload_package_sls(feed_id: str, file_path: str, overwrite: bool = False) -
     Returns:
         Response dictionary containing job ID and package ID
     """
-    base_url = _get_feed_base_url()
-
     # Step 1: Upload to package pool
-    upload_url = f"{base_url}/upload-packages"
-    if overwrite:
-        upload_url += "?shouldOverwrite=true"
-
-    file_name = Path(file_path).name
-    with open(file_path, "rb") as f:
-        files = {"package": (file_name, f, "application/octet-stream")}
-        resp = make_api_request("POST", upload_url, files=files)
-
-    data = resp.json()
-    job_ids = data.get("jobIds", [])
-
-    if not job_ids:
-        raise PackageUploadError("No job ID returned from package upload")
+    job_id = _start_pool_upload_sls(file_path, overwrite)
 
     # Wait for upload to complete to get package ID
-    job = _wait_for_job(job_ids[0], timeout=300)
+    job = _wait_for_job(job_id, timeout=300)
     package_id = job.get("resourceId")
 
     if not package_id:
         raise PackageUploadError("Package upload completed but no package ID returned")
 
     # Step 2: Add package reference to feed
-    ref_url = f"{base_url}/feeds/{feed_id}/add-package-references"
-    ref_payload = {"packageReferences": [package_id]}
-    resp = make_api_request("POST", ref_url, payload=ref_payload)
-
-    data = resp.json()
+    data = _add_package_references_sls(feed_id, [package_id])
     # Inject packageId into response for CLI usage
     result = data.copy()
     result["packageId"] = package_id
@@ -431,6 +487,198 @@ def _delete_package(package_id: str) -> str:
     return data.get("jobId", data.get("job", {}).get("id", ""))
 
 
+_PACKAGE_FILE_SUFFIXES = (".nipkg", ".ipk", ".deb")
+_JOB_SUCCESS_STATUSES = ("SUCCESS", "SUCCEEDED", "COMPLETED", "COMPLETED_WITH_ERROR")
+_JOB_FAILURE_STATUSES = ("FAILED", "ERROR", "NOT_FOUND")
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def _collect_package_files(paths: List[str]) -> List[Path]:
+    """Expand files and directories into a sorted, de-duplicated list of package files.
+
+    Directories contribute the package files directly inside them.
+    """
+    files: Dict[Path, None] = {}
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_dir():
+            for child in sorted(path.iterdir()):
+                if child.is_file() and child.suffix.lower() in _PACKAGE_FILE_SUFFIXES:
+                    files[child.resolve()] = None
+        elif path.is_file():
+            files[path.resolve()] = None
+    return list(files)
+
+
+def _parse_control_fields(text: str) -> Dict[str, str]:
+    """Parse ``Key: value`` lines of a package control file into lowercase keys."""
+    fields: Dict[str, str] = {}
+    for line in text.splitlines():
+        if not line or line[0].isspace() or ":" not in line:
+            continue
+        key, _, value = line.partition(":")
+        fields[key.strip().lower()] = value.strip()
+    return fields
+
+
+def _read_package_control(file_path: Path) -> Dict[str, str]:
+    """Read the control fields of an ar-based package (.nipkg, .ipk, .deb).
+
+    Only the control archive is read; the data archive is skipped.
+
+    Returns:
+        Lowercase control fields such as ``package``, ``version`` and
+        ``architecture``, or an empty dictionary if the file is not a readable
+        package.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if f.read(8) != b"!<arch>\n":
+                return {}
+            while True:
+                header = f.read(60)
+                if len(header) < 60:
+                    return {}
+                name = header[:16].decode("ascii", "replace").strip().rstrip("/")
+                size = int(header[48:58].decode("ascii").strip())
+                if not name.startswith("control.tar"):
+                    f.seek(size + size % 2, os.SEEK_CUR)
+                    continue
+                with tarfile.open(fileobj=io.BytesIO(f.read(size)), mode="r:*") as tar:
+                    for member in tar.getmembers():
+                        if member.isfile() and member.name.split("/")[-1] == "control":
+                            control = tar.extractfile(member)
+                            if control is not None:
+                                return _parse_control_fields(control.read().decode("utf-8"))
+                return {}
+    except (OSError, ValueError, tarfile.TarError):
+        return {}
+
+
+def _file_checksums(file_path: Path) -> Dict[str, str]:
+    """Compute the SHA-256 and MD5 digests of a file in one pass."""
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+            md5.update(chunk)
+    return {"sha256": sha256.hexdigest(), "md5": md5.hexdigest()}
+
+
+def _remote_checksums(package: Dict[str, Any]) -> Dict[str, str]:
+    """Extract the checksums a feed reports for a package, keyed like ``_file_checksums``."""
+    checksums: Dict[str, str] = {}
+    for source in (package, package.get("metadata") or {}):
+        for key, value in source.items():
+            normalized = key.lower().replace("_", "")
+            if not isinstance(value, str) or not value:
+                continue
+            if normalized in ("sha256", "sha256sum"):
+                checksums["sha256"] = value.lower()
+            elif normalized in ("md5", "md5sum"):
+                checksums["md5"] = value.lower()
+    return checksums
+
+
+def _package_identity(name: str, version: str, architecture: str) -> str:
+    """Build the key used to match local and remote packages."""
+    return f"{name.lower()}|{version}|{architecture.lower()}"
+
+
+def _index_feed_packages(packages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index feed packages by name/version/architecture and by file name."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for package in packages:
+        metadata = package.get("metadata") or {}
+        name = metadata.get("packageName")
+        version = metadata.get("version")
+        if name and version:
+            identity = _package_identity(name, version, metadata.get("architecture") or "")
+            index[identity] = package
+        file_name = package.get("fileName") or metadata.get("fileName")
+        if file_name:
+            index[f"file:{file_name}"] = package
+    return index
+
+
+def _match_existing_package(
+    file_path: Path,
+    control: Dict[str, str],
+    index: Dict[str, Dict[str, Any]],
+    checksum_cache: Dict[str, str],
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Compare a local package with the packages already in a feed.
+
+    Args:
+        file_path: Local package file
+        control: Control fields read from the local package
+        index: Feed index built by ``_index_feed_packages``
+        checksum_cache: Local checksums; filled on first use so each file is hashed
+            at most once across feeds
+
+    Returns:
+        ``("new", None)``, ``("identical", package)`` when the feed already has
+        the same name/version and no differing checksum, or
+        ``("changed", package)`` when the checksums differ.
+    """
+    remote = None
+    if control.get("package") and control.get("version"):
+        identity = _package_identity(
+            control["package"], control["version"], control.get("architecture", "")
+        )
+        remote = index.get(identity)
+    if remote is None:
+        remote = index.get(f"file:{file_path.name}")
+    if remote is None:
+        return "new", None
+
+    remote_checksums = _remote_checksums(remote)
+    if remote_checksums:
+        if not checksum_cache:
+            checksum_cache.update(_file_checksums(file_path))
+        for algorithm, digest in remote_checksums.items():
+            if checksum_cache.get(algorithm) != digest:
+                return "changed", remote
+    return "identical", remote
+
+
+def _get_job_status(job_id: str, feed_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fetch a job once for the bulk upload poller.
+
+    Returns:
+        The job dictionary, ``{"status": "NOT_FOUND"}`` when the job no longer
+        exists, or None when the request failed and should be retried.
+    """
+    base_url = _get_feed_base_url()
+    if feed_id:
+        url = f"{base_url}/feeds/{feed_id}/jobs/{job_id}"
+    else:
+        url = f"{base_url}/jobs/{job_id}"
+    try:
+        data = make_api_request("GET", url, handle_errors=False).json()
+    except requests.exceptions.HTTPError as exc:
+        if exc.response is not None and exc.response.status_code == 404:
+            return {"id": job_id, "status": "NOT_FOUND"}
+        return None
+    except requests.RequestException:
+        return None
+    return data.get("job", data)
+
+
+def _job_status(job: Dict[str, Any]) -> str:
+    """Return a job's upper-cased status."""
+    return str(job.get("status", "")).upper()
+
+
+def _job_error_message(job: Dict[str, Any]) -> str:
+    """Return the error message reported by a failed job."""
+    if _job_status(job) == "NOT_FOUND":
+        return "Job not found"
+    error = job.get("error") or {}
+    return error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
+
+
 def register_feed_commands(cli: Any) -> None:
     """Register the 'feed' command group and its subcommands."""
 
@@ -453,7 +701,7 @@ def register_feed_commands(cli: Any) -> None:
         "--format",
         "-f",
         "format_",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         help="Output format",
     )
@@ -736,7 +984,7 @@ def register_feed_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "format_",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         help="Output format",
     )
@@ -850,6 +1098,315 @@ def register_feed_commands(cli: Any) -> None:
         except Exception as exc:
             handle_api_error(exc)
 
+    @package.command(name="bulk-upload")
+    @click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+    @click.option(
+        "--feed-id",
+        "-f",
+        "feed_ids",
+        multiple=True,
+        required=True,
+        help="Feed ID to upload to (repeat for several feeds)",
+    )
+    @click.option(
+        "--overwrite",
+        is_flag=True,
+        help="Replace packages whose name and version already exist with different content",
+    )
+    @click.option(
+        "--skip-existing/--no-skip-existing",
+        default=True,
+        show_default=True,
+        help="Skip packages a feed already has with the same name, version and checksum",
+    )
+    @click.option(
+        "--concurrency",
+        "-c",
+        type=click.IntRange(min=1, max=32),
+        default=4,
+        show_default=True,
+        help="Number of uploads to run at the same time",
+    )
+    @click.option(
+        "--timeout",
+        type=int,
+        default=1800,
+        show_default=True,
+        help="Overall timeout in seconds for all uploads and feed jobs",
+    )
+    @click.option(
+        "--poll-interval",
+        type=click.FloatRange(min=0.1),
+        default=1.0,
+        show_default=True,
+        help="Initial job polling interval; backs off while nothing finishes",
+    )
+    @click.option(
+        "--max-poll-interval",
+        type=click.FloatRange(min=0.1),
+        default=15.0,
+        show_default=True,
+        help="Upper bound for the polling interval",
+    )
+    @click.option(
+        "--format",
+        "format_",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def bulk_upload_packages(
+        paths: Tuple[str, ...],
+        feed_ids: Tuple[str, ...],
+        overwrite: bool,
+        skip_existing: bool,
+        concurrency: int,
+        timeout: int,
+        poll_interval: float,
+        max_poll_interval: float,
+        format_: str,
+    ) -> None:
+        """Upload many packages to one or more feeds concurrently.
+
+        PATHS are package files or directories containing .nipkg, .ipk or .deb
+        files. Uploads are streamed from disk, and every resulting feed job is
+        tracked by one poller that backs off while nothing finishes. Packages a
+        feed already has with the same name, version and checksum are skipped.
+        Exits non-zero if any package was not uploaded.
+        """
+        from .utils import check_readonly_mode
+
+        check_readonly_mode("upload feed packages")
+        format_output = validate_output_format(format_)
+
+        package_files = _collect_package_files(list(paths))
+        if not package_files:
+            click.echo("✗ No package files found", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+        feeds = list(dict.fromkeys(feed_ids))
+        is_sls = get_platform() == PLATFORM_SLS
+        results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        def report(
+            file_path: Path, feed_id: str, status: str, package_id: str = "", detail: str = ""
+        ) -> None:
+            results[(str(file_path), feed_id)] = {
+                "file": file_path.name,
+                "path": str(file_path),
+                "feedId": feed_id,
+                "status": status,
+                "packageId": package_id,
+                "detail": detail,
+            }
+            if format_output == "json":
+                return
+            failed = status not in ("uploaded", "skipped")
+            marker = "✗" if failed else "✓" if status == "uploaded" else "-"
+            suffix = f" ({detail})" if detail else ""
+            click.echo(f"{marker} {file_path.name} -> {feed_id}: {status}{suffix}", err=failed)
+
+        # Shut down by hand: uploads still sending at the deadline are abandoned, not awaited
+        uploads = ThreadPoolExecutor(max_workers=concurrency)
+        timed_out = False
+        try:
+            with pooled_http_session(), ThreadPoolExecutor(max_workers=concurrency) as polls:
+                # Decide per feed which packages need uploading
+                indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+                if skip_existing:
+                    listings = uploads.map(_list_packages, feeds)
+                    indexes = dict(zip(feeds, map(_index_feed_packages, listings)))
+                targets: Dict[Path, List[str]] = {}
+                for file_path in package_files:
+                    control = _read_package_control(file_path) if skip_existing else {}
+                    checksum_cache: Dict[str, str] = {}
+                    for feed_id in feeds:
+                        if skip_existing:
+                            state, remote = _match_existing_package(
+                                file_path, control, indexes[feed_id], checksum_cache
+                            )
+                            remote_id = (remote or {}).get("id", "")
+                            if state == "identical":
+                                report(file_path, feed_id, "skipped", remote_id, "already in feed")
+                                continue
+                            if state == "changed" and not overwrite:
+                                report(
+                                    file_path,
+                                    feed_id,
+                                    "failed",
+                                    remote_id,
+                                    "same version with different content exists; "
+                                    "use --overwrite",
+                                )
+                                continue
+                        targets.setdefault(file_path, []).append(feed_id)
+
+                job_feeds: Dict[str, Optional[str]] = {}
+                job_targets: Dict[str, Tuple[Path, List[str], str]] = {}
+
+                def fetch_statuses(job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+                    jobs = polls.map(
+                        lambda job_id: _get_job_status(job_id, job_feeds[job_id]), job_ids
+                    )
+                    return {job_id: job for job_id, job in zip(job_ids, jobs) if job is not None}
+
+                waiter = CompletionWaiter(
+                    fetch_statuses,
+                    lambda job: _job_status(job) in _JOB_SUCCESS_STATUSES + _JOB_FAILURE_STATUSES,
+                    initial_interval=poll_interval,
+                    max_interval=max_poll_interval,
+                    timeout=timeout,
+                )
+                next_poll = 0.0
+
+                def track(
+                    job_id: str,
+                    feed_id: Optional[str],
+                    file_path: Path,
+                    feed_list: List[str],
+                    package_id: str = "",
+                ) -> None:
+                    nonlocal next_poll
+                    if not waiter.pending:
+                        next_poll = time.monotonic() + waiter.interval
+                    job_feeds[job_id] = feed_id
+                    job_targets[job_id] = (file_path, feed_list, package_id)
+                    waiter.add(job_id)
+
+                def add_references(file_path: Path, feed_list: List[str], package_id: str) -> None:
+                    for feed_id in feed_list:
+                        try:
+                            response = _add_package_references_sls(
+                                feed_id, [package_id], handle_errors=False
+                            )
+                        except Exception as exc:  # noqa: BLE001
+                            detail = _extract_response_error_message(exc) or str(exc)
+                            report(file_path, feed_id, "failed", package_id, detail)
+                            continue
+                        job_id = response.get("jobId", response.get("job", {}).get("id", ""))
+                        if job_id:
+                            track(job_id, feed_id, file_path, [feed_id], package_id)
+                        else:
+                            report(file_path, feed_id, "uploaded", package_id)
+
+                def upload_finished(future: "Future[Any]") -> None:
+                    file_path, feed_list = upload_futures.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        detail = _extract_response_error_message(exc) or str(exc)
+                        for feed_id in feed_list:
+                            report(file_path, feed_id, "failed", detail=detail)
+                        return
+                    if is_sls:
+                        # Pool upload job; feeds reference the package once it finishes
+                        track(response, None, file_path, feed_list)
+                        return
+                    job_id = response.get("jobId", response.get("job", {}).get("id", ""))
+                    if job_id:
+                        track(job_id, feed_list[0], file_path, feed_list)
+                    else:
+                        package_id = response.get("id", response.get("packageId", ""))
+                        report(file_path, feed_list[0], "uploaded", package_id)
+
+                def job_finished(job_id: str, job: Dict[str, Any]) -> None:
+                    feed_id = job_feeds.pop(job_id)
+                    file_path, feed_list, package_id = job_targets.pop(job_id)
+                    status = _job_status(job)
+                    package_id = job.get("resourceId") or package_id
+                    if status == "NOT_FOUND" and feed_id and package_id:
+                        # The job record is gone but the package is known; assume success
+                        status = "SUCCEEDED"
+                    if status in _JOB_FAILURE_STATUSES:
+                        for target in feed_list:
+                            report(file_path, target, "failed", package_id, _job_error_message(job))
+                        return
+                    if feed_id is None:
+                        if package_id:
+                            add_references(file_path, feed_list, package_id)
+                        else:
+                            for target in feed_list:
+                                report(file_path, target, "failed", detail="no package ID returned")
+                        return
+                    detail = "completed with errors" if status == "COMPLETED_WITH_ERROR" else ""
+                    report(file_path, feed_id, "uploaded", package_id, detail)
+
+                upload_futures: Dict["Future[Any]", Tuple[Path, List[str]]] = {}
+                future: "Future[Any]"
+                for file_path, feed_list in targets.items():
+                    if is_sls:
+                        future = uploads.submit(
+                            _start_pool_upload_sls, str(file_path), overwrite, handle_errors=False
+                        )
+                        upload_futures[future] = (file_path, feed_list)
+                        continue
+                    for feed_id in feed_list:
+                        future = uploads.submit(
+                            _upload_package_sle,
+                            feed_id,
+                            str(file_path),
+                            overwrite,
+                            handle_errors=False,
+                        )
+                        upload_futures[future] = (file_path, [feed_id])
+
+                try:
+                    while upload_futures or waiter.pending:
+                        if waiter.expired():
+                            raise TimeoutError
+                        # Wake for the next poll, and never sleep past the overall deadline
+                        delay = max(next_poll - time.monotonic(), 0.0) if waiter.pending else None
+                        remaining = waiter.remaining()
+                        if remaining is not None:
+                            delay = remaining if delay is None else min(delay, remaining)
+                        if upload_futures:
+                            done, _ = wait(
+                                list(upload_futures), timeout=delay, return_when=FIRST_COMPLETED
+                            )
+                            for future in done:
+                                upload_finished(future)
+                        elif delay:
+                            time.sleep(delay)
+                        if waiter.pending and time.monotonic() >= next_poll:
+                            for job_id, job in waiter.poll():
+                                job_finished(job_id, job)
+                            next_poll = time.monotonic() + waiter.interval
+                except TimeoutError:
+                    timed_out = True
+                    for job_id in waiter.pending:
+                        file_path, feed_list, package_id = job_targets[job_id]
+                        for feed_id in feed_list:
+                            report(file_path, feed_id, "timed out", package_id, f"job {job_id}")
+                    for future, (file_path, feed_list) in upload_futures.items():
+                        future.cancel()
+                        for feed_id in feed_list:
+                            report(file_path, feed_id, "timed out", detail="upload not finished")
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
+        finally:
+            uploads.shutdown(wait=not timed_out, cancel_futures=True)
+
+        ordered = [
+            results[(str(file_path), feed_id)]
+            for file_path in package_files
+            for feed_id in feeds
+            if (str(file_path), feed_id) in results
+        ]
+        counts = {status: 0 for status in ("uploaded", "skipped")}
+        for record in ordered:
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+        not_uploaded = len(ordered) - counts["uploaded"] - counts["skipped"]
+
+        if format_output == "json":
+            click.echo(json.dumps(ordered, indent=2))
+        else:
+            click.echo(
+                f"\nProcessed {len(ordered)} package upload(s): {counts['uploaded']} uploaded, "
+                f"{counts['skipped']} skipped, {not_uploaded} failed"
+            )
+        if not_uploaded:
+            sys.exit(ExitCodes.GENERAL_ERROR)
+
     @package.command(name="delete")
     @click.option("--id", "-i", "package_id", required=True, help="Package ID to delete")
     @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
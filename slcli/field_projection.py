@@ -0,0 +1,123 @@
+"""Field selection for list and query commands (``--fields``).
+
+``--fields id,name,status.statusType`` limits the output to the named fields.
+Services whose query APIs accept a field-list projection (Test Monitor
+results and products, work items) are sent one so only those fields are
+downloaded; everything else is trimmed on the client before output. Table
+output without ``--fields`` requests just the columns it renders.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import click
+
+_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+_MISSING = object()
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Split a ``--fields`` value into field paths, keeping order and dropping duplicates.
+
+    >>> parse_fields("id, status.statusType,id")
+    ['id', 'status.statusType']
+
+    Raises:
+        click.BadParameter: If a field name is empty or malformed.
+    """
+    if value is None:
+        return None
+    fields: List[str] = []
+    for raw in value.split(","):
+        name = raw.strip()
+        if not _FIELD_RE.match(name):
+            raise click.BadParameter(
+                f"invalid field name {name!r}; use comma-separated names such as id,name,status.statusType",
+                param_hint="'--fields'",
+            )
+        if name not in fields:
+            fields.append(name)
+    return fields
+
+
+def _lookup(item: Any, path: str) -> Any:
+    value = item
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def project_item(item: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Return ``item`` reduced to ``fields``, keeping nested paths nested.
+
+    >>> project_item({"id": "1", "status": {"statusType": "PASSED", "statusName": "Passed"}},
+    ...              ["status.statusType", "id", "missing"])
+    {'status': {'statusType': 'PASSED'}, 'id': '1'}
+    """
+    projected: Dict[str, Any] = {}
+    for path in fields:
+        value = _lookup(item, path)
+        if value is _MISSING:
+            continue
+        *parents, leaf = path.split(".")
+        target = projected
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return projected
+
+
+def project_items(
+    items: Iterable[Dict[str, Any]], fields: Optional[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """Apply :func:`project_item` to every item; no ``fields`` returns the items unchanged."""
+    if not fields:
+        return list(items)
+    return [project_item(item, fields) for item in items]
+
+
+def enum_projection(fields: Sequence[str], supported: Sequence[str]) -> Optional[List[str]]:
+    """Build a field-list projection (``["ID", "STATUS"]``) for services that take one.
+
+    Each field's top-level name is converted from camelCase to the service's
+    UPPER_SNAKE field name. Returns ``None`` when any field is not in
+    ``supported``, so the full objects are fetched and trimmed on the client.
+
+    >>> enum_projection(["id", "status.statusType", "totalTimeInSeconds"],
+    ...                 ["ID", "STATUS", "TOTAL_TIME_IN_SECONDS"])
+    ['ID', 'STATUS', 'TOTAL_TIME_IN_SECONDS']
+    """
+    projection: List[str] = []
+    for path in fields:
+        top = path.split(".", 1)[0]
+        name = re.sub(r"(?<!^)(?=[A-Z])", "_", top).upper()
+        if name not in supported:
+            return None
+        if name not in projection:
+            projection.append(name)
+    return projection
+
+
+def _format_cell(value: Any) -> str:
+    if value is _MISSING or value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(entry) for entry in value)
+    if isinstance(value, dict):
+        return ", ".join(f"{key}={entry}" for key, entry in value.items())
+    return str(value)
+
+
+def fields_table(
+    fields: Sequence[str],
+) -> Tuple[List[str], List[int], Callable[[Dict[str, Any]], List[str]]]:
+    """Return ``(headers, column_widths, formatter)`` for a table of ``fields``."""
+    leaves = [path.split(".")[-1] for path in fields]
+    widths = [36 if leaf == "id" or leaf.endswith("Id") else 24 for leaf in leaves]
+
+    def formatter(item: Dict[str, Any]) -> List[str]:
+        return [_format_cell(_lookup(item, path)) for path in fields]
+
+    return list(fields), widths, formatter
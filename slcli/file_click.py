@@ -7,14 +7,16 @@ import sys
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import click
 import questionary
 import requests as requests_lib
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .client_filters import all_of, any_of, contains_text, equals_text, Predicate, take_matches
+from .field_projection import fields_table, parse_fields, project_items
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -87,19 +89,13 @@ def _filter_files_by_name_or_extension(
     take: int,
 ) -> List[dict]:
     """Filter files by name or extension using case-insensitive contains matching."""
-    needle_lower = needle.lower()
-    extension_needle = needle_lower.lstrip(".")
-    filtered: List[dict] = []
-
-    for file_item in files:
-        file_name = _get_file_name(file_item).lower()
-        file_extension = _get_file_extension(file_item).lower()
-        if needle_lower in file_name or extension_needle in file_extension:
-            filtered.append(file_item)
-            if len(filtered) >= take:
-                break
-
-    return filtered
+    predicate = any_of(
+        [
+            contains_text(_get_file_name, needle),
+            contains_text(_get_file_extension, needle.lstrip(".")),
+        ]
+    )
+    return take_matches(files, predicate, take)
 
 
 def _build_structured_file_query(
@@ -320,22 +316,17 @@ def _parse_case_insensitive_filter_value(field_name: str, value: str) -> Tuple[s
     return ("equal", value)
 
 
-def _matches_case_insensitive_filter(
-    file_item: dict,
-    field_name: str,
-    operation: str,
-    value: str,
-) -> bool:
-    """Return whether a file matches a parsed case-insensitive client-side filter."""
-    candidate = (
-        _get_file_name(file_item) if field_name == "name" else _get_file_extension(file_item)
-    )
-    candidate_lower = candidate.lower()
-    value_lower = value.lower()
-
-    if operation == "contains":
-        return value_lower in candidate_lower
-    return candidate_lower == value_lower
+def _compile_case_insensitive_filters(
+    client_filters: List[Tuple[str, str, str]],
+) -> Optional[Predicate]:
+    """Build one predicate for parsed name/extension filters, exact matches first."""
+    checks: List[Predicate] = []
+    for field_name, operation, value in sorted(client_filters, key=lambda f: f[1] != "equal"):
+        get = _get_file_name if field_name == "name" else _get_file_extension
+        checks.append(
+            contains_text(get, value) if operation == "contains" else equals_text(get, value)
+        )
+    return all_of(checks)
 
 
 def _apply_case_insensitive_query_filters(
@@ -344,20 +335,7 @@ def _apply_case_insensitive_query_filters(
     take: int,
 ) -> List[dict]:
     """Apply parsed name/extension filters to a query-files response."""
-    if not client_filters:
-        return files[:take]
-
-    filtered: List[dict] = []
-    for file_item in files:
-        if all(
-            _matches_case_insensitive_filter(file_item, field_name, operation, value)
-            for field_name, operation, value in client_filters
-        ):
-            filtered.append(file_item)
-            if len(filtered) >= take:
-                break
-
-    return filtered
+    return take_matches(files, _compile_case_insensitive_filters(client_filters), take)
 
 
 def _convert_search_filter_to_query_files(
@@ -503,6 +481,34 @@ def _get_file_by_id(file_id: str) -> Optional[dict]:
         raise
 
 
+def _file_formatter(file_item: dict) -> List[str]:
+    name = _get_file_name(file_item)
+    file_id = file_item.get("id", "")
+    size = _format_file_size(_get_file_size(file_item))
+    created = _format_timestamp(file_item.get("created"))
+    return [name, file_id, size, created]
+
+
+def _file_list_output(
+    resp: Any, format_output: str, fields: Optional[List[str]]
+) -> Tuple[Any, List[str], List[int], Callable[[Dict[str, Any]], List[str]]]:
+    """Return the response, headers, widths and formatter for a file listing.
+
+    The file search APIs have no projection, so ``--fields`` is applied on the
+    client: JSON output is trimmed to the fields and the table shows one
+    column per field.
+    """
+    if not fields:
+        return resp, ["Name", "ID", "Size", "Created"], [35, 36, 12, 20], _file_formatter
+    if format_output.lower() == "json":
+        data = resp.json()
+        resp = FilteredResponse(
+            {**data, "availableFiles": project_items(data.get("availableFiles", []), fields)}
+        )
+    headers, column_widths, formatter = fields_table(fields)
+    return resp, headers, column_widths, formatter
+
+
 def register_file_commands(cli: Any) -> None:
     """Register the 'file' command group and its subcommands."""
 
@@ -515,7 +521,7 @@ def register_file_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -542,18 +548,26 @@ def register_file_commands(cli: Any) -> None:
         "name_filter",
         help="Filter by file name or extension (contains search)",
     )
+    @click.option(
+        "--fields",
+        "fields_option",
+        default=None,
+        help="Comma-separated fields to show, e.g. id,properties.Name,size64,created",
+    )
     def list_files(
         format: str = "table",
         take: int = 25,
         workspace: Optional[str] = None,
         id_filter: Optional[str] = None,
         name_filter: Optional[str] = None,
+        fields_option: Optional[str] = None,
     ) -> None:
         """List files.
 
         Use --filter to search for files by name or extension.
         """
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
 
         try:
             # Resolve workspace name to ID if needed
@@ -579,8 +593,8 @@ def register_file_commands(cli: Any) -> None:
                 # Search by name or extension contains using wildcard syntax
                 filter_parts.append(f'(name:("*{name_filter}*") OR extension:("*{name_filter}*"))')
 
-            # For JSON format, respect the take parameter exactly
-            if format_output.lower() == "json":
+            # For JSON and CSV/TSV output, respect the take parameter exactly
+            if format_output.lower() != "table":
                 api_take = take
             else:
                 api_take = take if take != 25 else 1000
@@ -604,21 +618,15 @@ def register_file_commands(cli: Any) -> None:
                 id_filter=id_filter,
             )
 
-            def file_formatter(file_item: dict) -> list:
-                name = _get_file_name(file_item)
-                file_id = file_item.get("id", "")
-                size = _format_file_size(_get_file_size(file_item))
-                created = _format_timestamp(file_item.get("created"))
-                return [name, file_id, size, created]
-
+            resp, headers, column_widths, formatter = _file_list_output(resp, format_output, fields)
             UniversalResponseHandler.handle_list_response(
                 resp=resp,
                 data_key="availableFiles",
                 item_name="file",
                 format_output=format_output,
-                formatter_func=file_formatter,
-                headers=["Name", "ID", "Size", "Created"],
-                column_widths=[35, 36, 12, 20],
+                formatter_func=formatter,
+                headers=headers,
+                column_widths=column_widths,
                 empty_message="No files found.",
                 enable_pagination=True,
                 page_size=take,
@@ -892,7 +900,7 @@ def register_file_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -924,6 +932,12 @@ def register_file_commands(cli: Any) -> None:
         "-w",
         help="Filter by workspace name or ID",
     )
+    @click.option(
+        "--fields",
+        "fields_option",
+        default=None,
+        help="Comma-separated fields to show, e.g. id,properties.Name,size64,created",
+    )
     def query_files(
         format: str = "table",
         take: int = 25,
@@ -931,6 +945,7 @@ def register_file_commands(cli: Any) -> None:
         order_by: Optional[str] = None,
         descending: bool = True,
         workspace: Optional[str] = None,
+        fields_option: Optional[str] = None,
     ) -> None:
         """Search files with a query.
 
@@ -947,10 +962,11 @@ def register_file_commands(cli: Any) -> None:
           - name:("*test*") AND extension:("csv")
         """
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
 
         try:
             # Build request body for search-files
-            api_take = take if format_output.lower() == "json" else (take if take != 25 else 1000)
+            api_take = take if format_output.lower() != "table" else (take if take != 25 else 1000)
             query_body: Dict[str, Any] = {
                 "take": api_take,
                 "orderByDescending": descending,
@@ -1016,21 +1032,15 @@ def register_file_commands(cli: Any) -> None:
                 else:
                     resp = structured_resp
 
-            def file_formatter(file_item: dict) -> list:
-                name = _get_file_name(file_item)
-                file_id = file_item.get("id", "")
-                size = _format_file_size(_get_file_size(file_item))
-                created = _format_timestamp(file_item.get("created"))
-                return [name, file_id, size, created]
-
+            resp, headers, column_widths, formatter = _file_list_output(resp, format_output, fields)
             UniversalResponseHandler.handle_list_response(
                 resp=resp,
                 data_key="availableFiles",
                 item_name="file",
                 format_output=format_output,
-                formatter_func=file_formatter,
-                headers=["Name", "ID", "Size", "Created"],
-                column_widths=[35, 36, 12, 20],
+                formatter_func=formatter,
+                headers=headers,
+                column_widths=column_widths,
                 empty_message="No files match the query.",
                 enable_pagination=True,
                 page_size=take,
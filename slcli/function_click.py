@@ -10,7 +10,7 @@ import click
 import questionary
 import requests
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .function_templates import (
     download_and_extract_template,
     TEMPLATE_REPO,
@@ -397,7 +397,7 @@ def register_function_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -429,7 +429,7 @@ def register_function_commands(cli: Any) -> None:
                 interface_filter=interface_contains,
                 custom_filter=filter,
                 workspace_map=workspace_map,
-                max_items=take if format_output.lower() == "json" else None,
+                max_items=take if format_output.lower() != "table" else None,
             )
 
             # Create a mock response with all data
@@ -1047,7 +1047,7 @@ def register_function_commands(cli: Any) -> None:
     )
     @click.option(
         "--format",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1080,7 +1080,7 @@ def register_function_commands(cli: Any) -> None:
                 status_filter,
                 function_id,
                 workspace_map,
-                max_items=take if format_output.lower() == "json" else None,
+                max_items=take if format_output.lower() != "table" else None,
             )
 
             # Create a mock response with all data
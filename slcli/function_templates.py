@@ -16,6 +16,7 @@ from typing import Dict
 import click
 import requests
 
+from .ssl_trust import ensure_os_trust
 from .utils import ExitCodes
 
 TEMPLATE_REPO = "ni/systemlink-enterprise-examples"
@@ -42,6 +43,7 @@ def download_and_extract_template(language: str, destination: Path) -> None:
     subfolder = TEMPLATE_SUBFOLDERS[language]
     tarball_url = f"https://codeload.github.com/{TEMPLATE_REPO}/tar.gz/{TEMPLATE_BRANCH}"
     resp = None
+    ensure_os_trust()
     try:
         resp = requests.get(tarball_url, timeout=_DOWNLOAD_TIMEOUT_SECONDS)
     except requests.RequestException as exc:  # noqa: BLE001
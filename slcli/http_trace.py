@@ -0,0 +1,237 @@
+"""Per-command HTTP tracing for ``--trace`` and ``SLCLI_TRACE``.
+
+Tracing wraps :meth:`requests.Session.send`, which every request goes through:
+:func:`~slcli.utils.make_api_request` (and the MCP helpers built on it), the
+pooled session, and modules that call ``requests.get``/``post`` directly such
+as the DataFrame Arrow append, notebook execution and the web editor proxy.
+Nothing is patched until tracing is started, so untraced commands pay nothing.
+The async transport in :mod:`slcli.async_http` records through
+:func:`active_tracer` instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+TRACE_ENV = "SLCLI_TRACE"
+_SUMMARY_VALUES = {"1", "true", "yes", "on", "-", "stderr"}
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|(?=[^/]*\d)[^/]{8,})$"
+)
+
+
+@dataclass
+class TraceRecord:
+    """One HTTP request observed while tracing."""
+
+    method: str
+    route: str
+    url: str
+    status: Optional[int]
+    bytes_out: Optional[int]
+    bytes_in: Optional[int]
+    ttfb_ms: Optional[float]
+    total_ms: float
+    page: int
+    start_ms: float
+    thread: int
+    error: Optional[str] = None
+
+
+def route_template(url: str) -> str:
+    """Return the URL path with ID-like segments replaced by ``{id}``.
+
+    >>> route_template("https://x/nifile/v1/service-groups/Default/files/5f3e9a1b2c/data?a=1")
+    '/nifile/v1/service-groups/Default/files/{id}/data'
+    """
+    segments = urlsplit(url).path.split("/")
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments)
+
+
+def _body_size(request: requests.PreparedRequest) -> Optional[int]:
+    body: Any = request.body
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    length = request.headers.get("Content-Length")
+    return int(length) if length else None
+
+
+def _response_size(response: requests.Response, stream: bool) -> Optional[int]:
+    if not stream:
+        return len(response.content or b"")
+    length = response.headers.get("Content-Length")
+    return int(length) if length else None
+
+
+class HttpTracer:
+    """Collect :class:`TraceRecord` entries for one command."""
+
+    def __init__(self) -> None:
+        """Start an empty trace."""
+        self.records: List[TraceRecord] = []
+        self._lock = threading.Lock()
+        self._pages: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._origin = time.perf_counter()
+
+    def record(
+        self,
+        request: requests.PreparedRequest,
+        response: Optional[requests.Response],
+        started: float,
+        finished: float,
+        stream: bool,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Add one request; ``started``/``finished`` are ``time.perf_counter()`` values."""
+        method = str(request.method or "GET").upper()
+        route = route_template(str(request.url))
+        status = bytes_in = ttfb_ms = None
+        if response is not None:
+            status = response.status_code
+            bytes_in = _response_size(response, stream)
+            ttfb_ms = round(response.elapsed.total_seconds() * 1000, 2)
+        with self._lock:
+            self._pages[(method, route)] += 1
+            self.records.append(
+                TraceRecord(
+                    method=method,
+                    route=route,
+                    url=str(request.url),
+                    status=status,
+                    bytes_out=_body_size(request),
+                    bytes_in=bytes_in,
+                    ttfb_ms=ttfb_ms,
+                    total_ms=round((finished - started) * 1000, 2),
+                    page=self._pages[(method, route)],
+                    start_ms=round((started - self._origin) * 1000, 2),
+                    thread=threading.get_ident(),
+                    error=type(error).__name__ if error is not None else None,
+                )
+            )
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Return per-route totals, slowest first."""
+        groups: Dict[Tuple[str, str], List[TraceRecord]] = defaultdict(list)
+        for item in self.records:
+            groups[(item.method, item.route)].append(item)
+        rows = []
+        for (method, route), items in groups.items():
+            statuses: Dict[str, int] = defaultdict(int)
+            for item in items:
+                statuses[str(item.status) if item.status is not None else "error"] += 1
+            ttfbs = [item.ttfb_ms for item in items if item.ttfb_ms is not None]
+            rows.append(
+                {
+                    "method": method,
+                    "route": route,
+                    "requests": len(items),
+                    "pages": max(item.page for item in items),
+                    "statuses": dict(sorted(statuses.items())),
+                    "bytesOut": sum(item.bytes_out or 0 for item in items),
+                    "bytesIn": sum(item.bytes_in or 0 for item in items),
+                    "ttfbMs": round(sum(ttfbs) / len(ttfbs), 2) if ttfbs else None,
+                    "totalMs": round(sum(item.total_ms for item in items), 2),
+                }
+            )
+        return sorted(rows, key=lambda row: row["totalMs"], reverse=True)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": f"{item.method} {item.route}",
+                    "cat": "http",
+                    "ph": "X",
+                    "ts": int(item.start_ms * 1000),
+                    "dur": int(item.total_ms * 1000),
+                    "pid": pid,
+                    "tid": item.thread,
+                    "args": asdict(item),
+                }
+                for item in self.records
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: str) -> None:
+        """Write a Chrome trace (``.json``) or one JSON record per line (other names)."""
+        with open(path, "w", encoding="utf-8") as handle:
+            if path.lower().endswith(".json"):
+                json.dump(self.chrome_trace(), handle)
+            else:
+                for item in self.records:
+                    handle.write(json.dumps(asdict(item)) + "\n")
+
+
+_active: Optional[HttpTracer] = None
+_original_send: Optional[Callable[..., requests.Response]] = None
+_install_lock = threading.Lock()
+
+
+def _traced_send(
+    session: requests.Session, request: requests.PreparedRequest, **kwargs: Any
+) -> requests.Response:
+    assert _original_send is not None
+    tracer = _active
+    if tracer is None:
+        return _original_send(session, request, **kwargs)
+    started = time.perf_counter()
+    try:
+        response = _original_send(session, request, **kwargs)
+    except BaseException as exc:
+        tracer.record(request, None, started, time.perf_counter(), True, exc)
+        raise
+    tracer.record(request, response, started, time.perf_counter(), bool(kwargs.get("stream")), None)
+    return response
+
+
+def start_trace() -> HttpTracer:
+    """Begin recording requests and return the tracer."""
+    global _active, _original_send
+    import requests
+
+    with _install_lock:
+        if _original_send is None:
+            _original_send = requests.Session.send
+            requests.Session.send = _traced_send  # type: ignore[method-assign,assignment]
+        _active = HttpTracer()
+        return _active
+
+
+def stop_trace() -> Optional[HttpTracer]:
+    """Stop recording and return the finished tracer, if one was active."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def active_tracer() -> Optional[HttpTracer]:
+    """Return the running tracer, for transports that bypass ``requests.Session``."""
+    return _active
+
+
+def trace_target(flag: bool) -> Tuple[bool, Optional[str]]:
+    """Return ``(print_summary, file_path)`` from ``--trace`` and ``SLCLI_TRACE``."""
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return flag, None
+    if value.lower() in _SUMMARY_VALUES:
+        return True, None
+    return flag, value
@@ -0,0 +1,173 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+``orjson`` or ``msgspec`` is used when installed and the standard library
+``json`` module otherwise. The fast backends work on bytes, so responses are
+decoded straight from the body and output is encoded without building an
+intermediate ``str``. Set ``SLCLI_JSON_BACKEND`` to ``orjson``, ``msgspec`` or
+``stdlib`` to pick one explicitly; ``auto`` (the default) takes the first
+available.
+
+Every backend produces the same document for the data slcli handles: two-space
+indentation, keys in insertion order and non-ASCII text written as ``\\u``
+escapes, so output can be printed on any console encoding.
+Values a fast backend cannot encode (integers wider than 64 bits, non-string
+keys) fall back to the standard library, and values the standard library
+cannot encode (datetimes, dataclasses) are always passed to ``default``.
+When decoding, ``orjson`` returns integers wider than 64 bits as floats;
+SystemLink services do not send them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from types import ModuleType
+from typing import Any, Callable, Optional, Tuple, Union
+
+BACKEND_ENV = "SLCLI_JSON_BACKEND"
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+Default = Optional[Callable[[Any], Any]]
+
+_backend: Optional[Tuple[str, Optional[ModuleType]]] = None
+
+
+def _select_backend() -> Tuple[str, Optional[ModuleType]]:
+    global _backend
+    if _backend is None:
+        requested = os.environ.get(BACKEND_ENV, "auto").strip().lower() or "auto"
+        candidates = BACKENDS if requested not in BACKENDS else (requested, "stdlib")
+        for name in candidates:
+            if name == "stdlib":
+                _backend = ("stdlib", None)
+                break
+            try:
+                module = __import__(f"{name}.json" if name == "msgspec" else name)
+            except ImportError:
+                continue
+            _backend = (name, module)
+            break
+    assert _backend is not None
+    return _backend
+
+
+def backend_name() -> str:
+    """Return the name of the backend in use (``orjson``, ``msgspec`` or ``stdlib``)."""
+    return _select_backend()[0]
+
+
+def reset_backend() -> None:
+    """Forget the selected backend so the next call re-reads ``SLCLI_JSON_BACKEND``."""
+    global _backend
+    _backend = None
+
+
+def loads(data: JsonInput) -> Any:
+    """Decode a JSON document from bytes or text.
+
+    Documents a fast backend rejects (``NaN`` literals, out-of-range numbers)
+    are retried with the standard library, which accepts them.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    name, module = _select_backend()
+    if module is not None:
+        decode = module.loads if name == "orjson" else module.json.decode
+        try:
+            return decode(data)
+        except ValueError:  # orjson.JSONDecodeError and msgspec.DecodeError
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumpb(
+    obj: Any, *, indent: bool = False, default: Default = None, ensure_ascii: bool = True
+) -> bytes:
+    """Encode ``obj`` as JSON bytes, two-space indented when ``indent`` is set.
+
+    Non-ASCII text is written as ``\\u`` escapes, as :func:`json.dumps` does,
+    unless ``ensure_ascii`` is False, in which case it is written as UTF-8.
+    ``default`` is called for objects the standard library encoder does not
+    support and should return a serializable replacement.
+    """
+    name, module = _select_backend()
+    encoded: Optional[bytes] = None
+    try:
+        if name == "orjson":
+            assert module is not None
+            option = (
+                module.OPT_NON_STR_KEYS
+                | module.OPT_PASSTHROUGH_DATETIME
+                | module.OPT_PASSTHROUGH_DATACLASS
+                | (module.OPT_INDENT_2 if indent else 0)
+            )
+            encoded = module.dumps(obj, default=default, option=option)
+        # msgspec encodes datetimes itself and cannot pass them to ``default``
+        elif name == "msgspec" and default is None:
+            assert module is not None
+            encoded = module.json.encode(obj)
+            if indent:
+                encoded = module.json.format(encoded, indent=2)
+    except (TypeError, OverflowError, ValueError):
+        pass  # let the standard library encode it or raise its usual error
+    if encoded is None:
+        return _stdlib_dumps(obj, indent, default, ensure_ascii).encode("utf-8")
+    if ensure_ascii and not encoded.isascii():
+        # Outside strings, JSON is ASCII, so every non-ASCII character is string content
+        return _NON_ASCII.sub(_escape_char, encoded.decode("utf-8")).encode("ascii")
+    return encoded
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, default: Default = None, ensure_ascii: bool = True
+) -> str:
+    """Encode ``obj`` as a JSON string; see :func:`dumpb`.
+
+    >>> dumps({"name": "Zoë", "values": [1, 2]}, indent=True)
+    '{\\n  "name": "Zo\\\\u00eb",\\n  "values": [\\n    1,\\n    2\\n  ]\\n}'
+    """
+    if _select_backend()[0] == "stdlib":
+        return _stdlib_dumps(obj, indent, default, ensure_ascii)
+    return dumpb(obj, indent=indent, default=default, ensure_ascii=ensure_ascii).decode("utf-8")
+
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_char(match: "re.Match[str]") -> str:
+    """Return the ``json.dumps`` escape of one non-ASCII character."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | code >> 10:04x}\\u{0xDC00 | code & 0x3FF:04x}"
+
+
+def _stdlib_dumps(obj: Any, indent: bool, default: Default, ensure_ascii: bool) -> str:
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii, default=default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii, default=default)
+
+
+def response_json(response: Any) -> Any:
+    """Decode a response body, parsing the raw bytes of a :class:`requests.Response`.
+
+    Other response-like objects (and bodies a fast backend rejects, such as
+    UTF-16 documents) go through ``response.json()`` so callers see the usual
+    ``requests`` behaviour and errors.
+    """
+    import requests
+
+    if isinstance(response, requests.Response):
+        content = response.content
+        if isinstance(content, bytes) and content:
+            try:
+                return loads(content)
+            except ValueError:
+                pass
+    return response.json()
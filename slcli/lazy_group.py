@@ -0,0 +1,79 @@
+"""Click group that imports command modules only when a command is used.
+
+Every ``*_click`` module pulls in its own dependencies, so importing all of them
+up front dominates slcli start-up. :class:`LazyGroup` keeps a lightweight
+placeholder per top-level command, carrying just the name and short help shown
+by ``slcli --help``, and imports the module and calls its ``register_*``
+function the first time the command is resolved for execution or completion.
+"""
+
+import importlib
+import threading
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import click
+
+
+class LazyCommandSpec(NamedTuple):
+    """Where to find a top-level command and what ``--help`` says about it."""
+
+    module: str
+    register: str
+    short_help: str
+    hidden: bool = False
+
+
+class _PlaceholderCommand(click.Command):
+    """Stand-in listed in help output until the real command is loaded."""
+
+    def __init__(self, name: str, spec: LazyCommandSpec) -> None:
+        super().__init__(name, help=spec.short_help, short_help=spec.short_help, hidden=spec.hidden)
+
+
+class LazyGroup(click.Group):
+    """Group whose top-level commands are registered on first use."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Mapping[str, LazyCommandSpec]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create the group with ``lazy_commands`` mapping command name to spec."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, LazyCommandSpec] = {}
+        self._load_lock = threading.RLock()
+        for name, spec in (lazy_commands or {}).items():
+            self.add_lazy_command(name, spec)
+
+    def add_lazy_command(self, name: str, spec: LazyCommandSpec) -> None:
+        """Register ``name`` to be loaded from ``spec`` when first used."""
+        self.lazy_commands[name] = spec
+        self.commands.setdefault(name, _PlaceholderCommand(name, spec))
+
+    def load_command(self, name: str) -> Optional[click.Command]:
+        """Import and register ``name`` if needed, then return the real command."""
+        with self._load_lock:
+            spec = self.lazy_commands.pop(name, None)
+            if spec is not None:
+                self.commands.pop(name, None)
+                module = importlib.import_module(spec.module)
+                getattr(module, spec.register)(self)
+            return self.commands.get(name)
+
+    def load_all_commands(self) -> None:
+        """Load every lazily registered command (for introspection and docs)."""
+        for name in list(self.lazy_commands):
+            self.load_command(name)
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        """Load the command named by ``args[0]`` before Click resolves it."""
+        if args:
+            name = click.utils.make_str(args[0])
+            if ctx.token_normalize_func is not None:
+                name = ctx.token_normalize_func(name)
+            if name in self.lazy_commands:
+                self.load_command(name)
+        return super().resolve_command(ctx, args)
@@ -5,47 +5,17 @@ import json
 import os
 import socket
 import ssl
-import tomllib
-from pathlib import Path
 from types import ModuleType
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import click as base_click
-import keyring
-import questionary
-
-from .alarm_click import register_alarm_commands
-from .asset_click import register_asset_commands
-from .comment_click import register_comment_commands
-from .completion_click import register_completion_command
-from .config_click import register_config_commands
-from .dataframe_click import register_dataframe_commands
-from .dff_click import register_dff_commands
-from .example_click import register_example_commands
-from .feed_click import register_feed_commands
-from .file_click import register_file_commands
-from .function_click import register_function_commands
-from .mcp_click import register_mcp_commands
-from .notebook_click import register_notebook_commands
-from .platform import get_platform_info
-from .policy_click import register_policy_commands
+
+from .http_trace import HttpTracer, start_trace, stop_trace, trace_target
+from .lazy_group import LazyCommandSpec, LazyGroup
 from .profiles import set_profile_override
 from .rich_output import install_rich_output, render_table
-from .routine_click import register_routine_commands
-from .skill_click import register_skill_commands
-from .spec_click import register_spec_commands
-from .ssl_trust import OS_TRUST_INJECTED, OS_TRUST_REASON
-from .state_click import register_state_commands
-from .system_click import register_system_commands
-from .tag_click import register_tag_commands
-from .templates_click import register_templates_commands
-from .testmonitor_click import register_testmonitor_commands
-from .user_click import register_user_commands
-from .utils import describe_config_source
-from .webapp_click import register_webapp_commands
-from .workitem_click import register_workitem_commands
-from .workspace_click import register_workspace_commands
+from .version import get_version
 
 click: ModuleType
 try:
@@ -71,7 +41,16 @@ def _configure_rich_click_command_groups() -> None:
         "slcli": [
             {
                 "name": "Configure",
-                "commands": ["config", "login", "logout", "info", "completion", "example"],
+                "commands": [
+                    "config",
+                    "login",
+                    "logout",
+                    "info",
+                    "completion",
+                    "example",
+                    "daemon",
+                    "run-batch",
+                ],
             },
             {
                 "name": "Administer",
@@ -89,6 +68,7 @@ def _configure_rich_click_command_groups() -> None:
                     "feed",
                     "comment",
                     "dataframe",
+                    "mirror",
                 ],
             },
             {
@@ -115,14 +95,16 @@ def _get_ca_source_display() -> str:
     except (OSError, ValueError):
         pass
 
-    if OS_TRUST_INJECTED:
-        return f"system (reason={OS_TRUST_REASON})"
+    from . import ssl_trust
+
+    if ssl_trust.OS_TRUST_INJECTED:
+        return f"system (reason={ssl_trust.OS_TRUST_REASON})"
 
     verify_env = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("SSL_CERT_FILE")
     if verify_env:
         return f"custom-pem ({verify_env})"
 
-    return f"certifi (reason={OS_TRUST_REASON})"
+    return f"certifi (reason={ssl_trust.OS_TRUST_REASON})"
 
 
 def _build_tls_debug_context(ssl_verify: Union[bool, str]) -> ssl.SSLContext:
@@ -140,7 +122,9 @@ def _build_tls_debug_context(ssl_verify: Union[bool, str]) -> ssl.SSLContext:
     if verify_env:
         return ssl.create_default_context(cafile=verify_env)
 
-    if OS_TRUST_INJECTED:
+    from . import ssl_trust
+
+    if ssl_trust.OS_TRUST_INJECTED:
         try:
             import truststore  # type: ignore[import-not-found]
 
@@ -304,27 +288,6 @@ def _emit_info_debug_diagnostics(api_url: str) -> None:
 _configure_rich_click_command_groups()
 
 
-def get_version() -> str:
-    """Get version from _version.py (built binary) or pyproject.toml (development)."""
-    try:
-        # Try to import from _version.py first (works in built binary)
-        from ._version import __version__
-
-        return __version__
-    except ImportError:
-        # Fall back to reading pyproject.toml (works in development)
-        try:
-            current_dir = Path(__file__).parent
-            pyproject_path = current_dir.parent / "pyproject.toml"
-
-            with open(pyproject_path, "rb") as f:
-                pyproject_data = tomllib.load(f)
-
-            return pyproject_data["tool"]["poetry"]["version"]
-        except Exception:
-            return "unknown"
-
-
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
@@ -340,7 +303,167 @@ def get_ascii_art() -> str:
 """
 
 
-@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+# Top-level command modules, imported on first use so start-up stays fast.
+# The short help is what `slcli --help` shows; test_main checks it against the
+# loaded command.
+LAZY_COMMANDS = {
+    "alarm": LazyCommandSpec(
+        "slcli.alarm_click",
+        "register_alarm_commands",
+        "View and manage SystemLink alarms.",
+    ),
+    "asset": LazyCommandSpec(
+        "slcli.asset_click",
+        "register_asset_commands",
+        "Manage SystemLink assets.",
+    ),
+    "auth": LazyCommandSpec(
+        "slcli.policy_click",
+        "register_policy_commands",
+        "Manage SystemLink authorization policies and policy templates.",
+    ),
+    "comment": LazyCommandSpec(
+        "slcli.comment_click",
+        "register_comment_commands",
+        "Manage SystemLink comments.",
+    ),
+    "completion": LazyCommandSpec(
+        "slcli.completion_click",
+        "register_completion_command",
+        "Generate shell completion scripts and optionally install them.",
+    ),
+    "config": LazyCommandSpec(
+        "slcli.config_click",
+        "register_config_commands",
+        "Manage slcli settings and profiles.",
+    ),
+    "customfield": LazyCommandSpec(
+        "slcli.dff_click",
+        "register_dff_commands",
+        "Manage SystemLink custom field configurations.",
+    ),
+    "daemon": LazyCommandSpec(
+        "slcli.daemon_click",
+        "register_daemon_commands",
+        "Keep a warm slcli process to speed up repeated invocations.",
+    ),
+    "dataframe": LazyCommandSpec(
+        "slcli.dataframe_click",
+        "register_dataframe_commands",
+        "Manage SystemLink DataFrame tables and rows.",
+    ),
+    "example": LazyCommandSpec(
+        "slcli.example_click",
+        "register_example_commands",
+        "Browse and provision example SystemLink resource configurations.",
+    ),
+    "feed": LazyCommandSpec(
+        "slcli.feed_click",
+        "register_feed_commands",
+        "Manage SystemLink package feeds and packages.",
+    ),
+    "file": LazyCommandSpec(
+        "slcli.file_click",
+        "register_file_commands",
+        "Manage SystemLink files.",
+    ),
+    "function": LazyCommandSpec(
+        "slcli.function_click",
+        "register_function_commands",
+        "Manage function definitions and executions.",
+        hidden=True,
+    ),
+    "mcp": LazyCommandSpec(
+        "slcli.mcp_click",
+        "register_mcp_commands",
+        "Run and configure the SystemLink MCP server for AI assistants.",
+    ),
+    "mirror": LazyCommandSpec(
+        "slcli.mirror_click",
+        "register_mirror_commands",
+        "Keep a local SQLite mirror of systems, assets, products, results and work items.",
+    ),
+    "notebook": LazyCommandSpec(
+        "slcli.notebook_click",
+        "register_notebook_commands",
+        "Create, run, and manage SystemLink notebooks.",
+    ),
+    "routine": LazyCommandSpec(
+        "slcli.routine_click",
+        "register_routine_commands",
+        "Manage SystemLink routines.",
+    ),
+    "run-batch": LazyCommandSpec(
+        "slcli.batch_click",
+        "register_batch_commands",
+        "Run many slcli commands from SCRIPT in this process.",
+    ),
+    "skill": LazyCommandSpec(
+        "slcli.skill_click",
+        "register_skill_commands",
+        "Install bundled AI assistant skills.",
+    ),
+    "spec": LazyCommandSpec(
+        "slcli.spec_click",
+        "register_spec_commands",
+        "Manage SystemLink specifications.",
+    ),
+    "state": LazyCommandSpec(
+        "slcli.state_click",
+        "register_state_commands",
+        "Manage SystemLink states.",
+    ),
+    "system": LazyCommandSpec(
+        "slcli.system_click",
+        "register_system_commands",
+        "Manage SystemLink systems.",
+    ),
+    "tag": LazyCommandSpec("slcli.tag_click", "register_tag_commands", "Manage SystemLink tags."),
+    "template": LazyCommandSpec(
+        "slcli.templates_click",
+        "register_templates_commands",
+        "Manage SystemLink test plan templates.",
+    ),
+    "testmonitor": LazyCommandSpec(
+        "slcli.testmonitor_click",
+        "register_testmonitor_commands",
+        "Manage SystemLink Test Monitor products and results.",
+    ),
+    "user": LazyCommandSpec(
+        "slcli.user_click",
+        "register_user_commands",
+        "Manage SystemLink users.",
+    ),
+    "webapp": LazyCommandSpec(
+        "slcli.webapp_click",
+        "register_webapp_commands",
+        "Build, publish, and manage SystemLink web applications.",
+    ),
+    "workitem": LazyCommandSpec(
+        "slcli.workitem_click",
+        "register_workitem_commands",
+        "Manage SystemLink work items, templates, and workflows.",
+    ),
+    "workspace": LazyCommandSpec(
+        "slcli.workspace_click",
+        "register_workspace_commands",
+        "Manage SystemLink workspaces.",
+    ),
+}
+
+_GroupBase: Any = getattr(click, "RichGroup", base_click.Group)
+
+
+class _CliGroup(LazyGroup, _GroupBase):  # type: ignore[misc, valid-type]
+    """Top-level slcli group: rich help output and lazily imported commands."""
+
+
+@click.group(
+    cls=_CliGroup,
+    lazy_commands=LAZY_COMMANDS,
+    context_settings=CONTEXT_SETTINGS,
+    invoke_without_command=True,
+)
 @click.option("--version", "-v", is_flag=True, help="Show version and exit")
 @click.option(
     "--profile",
@@ -348,8 +471,14 @@ def get_ascii_art() -> str:
     envvar="SLCLI_PROFILE",
     help="Use a specific profile for this command",
 )
+@click.option(
+    "--trace",
+    is_flag=True,
+    help="Print a per-route HTTP timing report when the command finishes "
+    "(SLCLI_TRACE=path writes every request to a file instead)",
+)
 @click.pass_context
-def cli(ctx: base_click.Context, version: bool, profile: Optional[str]) -> None:
+def cli(ctx: base_click.Context, version: bool, profile: Optional[str], trace: bool) -> None:
     """SystemLink CLI for managing SystemLink resources."""  # noqa: D403
     install_rich_output()
 
@@ -361,6 +490,11 @@ def cli(ctx: base_click.Context, version: bool, profile: Optional[str]) -> None:
     if profile:
         set_profile_override(profile)
 
+    print_summary, trace_path = trace_target(trace)
+    if print_summary or trace_path:
+        start_trace()
+        ctx.call_on_close(lambda: _finish_trace(print_summary, trace_path))
+
     # Check for mandatory migration BEFORE any command runs
     # Skip migration check only for version flag and config migrate command
     if ctx.invoked_subcommand not in (None, "config"):
@@ -404,6 +538,52 @@ def cli(ctx: base_click.Context, version: bool, profile: Optional[str]) -> None:
         click.echo(ctx.get_help())
 
 
+def _finish_trace(print_summary: bool, trace_path: Optional[str]) -> None:
+    """Stop HTTP tracing and emit the report and/or trace file."""
+    tracer: Optional[HttpTracer] = stop_trace()
+    if tracer is None:
+        return
+    if trace_path:
+        try:
+            tracer.write(trace_path)
+        except OSError as exc:
+            click.echo(f"✗ Could not write trace to {trace_path}: {exc}", err=True)
+    if not print_summary:
+        return
+
+    from .cli_formatters import _format_file_size
+
+    def _ms(value: Optional[float]) -> str:
+        return f"{value:,.0f} ms" if value is not None else "-"
+
+    rows = tracer.summary()
+    click.echo("", err=True)
+    render_table(
+        ["Method", "Route", "Requests", "Pages", "Status", "Sent", "Received", "TTFB", "Total"],
+        [7, 60, 8, 5, 14, 9, 9, 9, 10],
+        [
+            [
+                row["method"],
+                row["route"],
+                row["requests"],
+                row["pages"],
+                ", ".join(f"{code}×{count}" for code, count in row["statuses"].items()),
+                _format_file_size(row["bytesOut"]),
+                _format_file_size(row["bytesIn"]),
+                _ms(row["ttfbMs"]),
+                _ms(row["totalMs"]),
+            ]
+            for row in rows
+        ],
+        err=True,
+    )
+    total_ms = sum(row["totalMs"] for row in rows)
+    click.echo(
+        f"{len(tracer.records)} request(s) to {len(rows)} route(s), {total_ms:,.0f} ms in HTTP",
+        err=True,
+    )
+
+
 @cli.command(hidden=True, name="_ca-info")
 def ca_info() -> None:
     """Show TLS CA trust source (hidden diagnostic)."""
@@ -514,6 +694,9 @@ def logout(profile: Optional[str], remove_all: bool, force: bool) -> None:
 
     Also cleans up any legacy keyring entries.
     """
+    import keyring
+    import questionary
+
     from .profiles import ProfileConfig
 
     cfg = ProfileConfig.load()
@@ -615,7 +798,12 @@ def info(format: str, skip_health: bool, debug: bool) -> None:
         logging.basicConfig(level=logging.DEBUG)
         logging.getLogger("urllib3").setLevel(logging.DEBUG)
 
+    from .platform import get_platform_info
     from .profiles import ProfileConfig, get_active_profile
+    from .ssl_trust import ensure_os_trust
+    from .utils import describe_config_source
+
+    ensure_os_trust()
 
     platform_info = get_platform_info(skip_health=skip_health)
 
@@ -743,31 +931,3 @@ def info(format: str, skip_health: bool, debug: bool) -> None:
             show_total=False,
         )
         click.echo()
-
-
-register_completion_command(cli)
-register_alarm_commands(cli)
-register_asset_commands(cli)
-register_comment_commands(cli)
-register_dataframe_commands(cli)
-register_dff_commands(cli)
-register_config_commands(cli)
-register_example_commands(cli)
-register_feed_commands(cli)
-register_file_commands(cli)
-register_function_commands(cli)
-register_mcp_commands(cli)
-register_templates_commands(cli)
-register_notebook_commands(cli)
-register_policy_commands(cli)
-register_routine_commands(cli)
-register_state_commands(cli)
-register_system_commands(cli)
-register_spec_commands(cli)
-register_tag_commands(cli)
-register_testmonitor_commands(cli)
-register_webapp_commands(cli)
-register_skill_commands(cli)
-register_user_commands(cli)
-register_workitem_commands(cli)
-register_workspace_commands(cli)
@@ -15,6 +15,7 @@ from mcp.server.mcpserver import MCPServer
 from mcp.types import ToolAnnotations
 from pydantic import BaseModel, Field
 
+from . import json_codec
 from ._version import __version__
 
 server = MCPServer(
@@ -206,6 +207,7 @@ def review_fleet_calibration(
 
 def _dump(data: Any) -> str:
     """Serialize MCP tool output as JSON."""
+    # Keep json.dumps' spaced separators, which the fast json_codec backends cannot write
     return json.dumps(data, default=str)
 
 
@@ -225,14 +227,16 @@ def _get_json(url: str) -> Any:
     """Issue a GET request and return JSON."""
     from .utils import make_api_request
 
-    return make_api_request("GET", url, handle_errors=False).json()
+    return json_codec.response_json(make_api_request("GET", url, handle_errors=False))
 
 
 def _post_json(url: str, payload: Dict[str, Any]) -> Any:
     """Issue a POST request and return JSON."""
     from .utils import make_api_request
 
-    return make_api_request("POST", url, payload=payload, handle_errors=False).json()
+    return json_codec.response_json(
+        make_api_request("POST", url, payload=payload, handle_errors=False)
+    )
 
 
 def _call_cli_helper(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -399,18 +403,25 @@ def search_tags(
 @server.tool(annotations=_READ_ONLY_TOOL_ANNOTATIONS)
 def read_tag_values(paths: List[str]) -> str:
     """Read current values for multiple tag paths."""
-    from .utils import get_base_url, make_api_request
+    from .async_http import ApiCall, run_api_calls
+    from .utils import get_base_url
 
     if not paths:
         raise ValueError("'paths' must contain at least one tag path")
 
+    base_url = get_base_url()
+    calls = [
+        ApiCall(
+            "GET", f"{base_url}/nitag/v2/tags/{urllib.parse.quote(path, safe='')}/values/current"
+        )
+        for path in paths
+    ]
     results: List[Dict[str, Any]] = []
-    for path in paths:
-        encoded_path = urllib.parse.quote(path, safe="")
-        url = f"{get_base_url()}/nitag/v2/tags/{encoded_path}/values/current"
+    for path, response in zip(paths, run_api_calls(calls, return_exceptions=True)):
         try:
-            current_value = make_api_request("GET", url, handle_errors=False).json()
-            results.append({"path": path, "currentValue": current_value})
+            if isinstance(response, BaseException):
+                raise response
+            results.append({"path": path, "currentValue": json_codec.response_json(response)})
         except Exception as exc:  # noqa: BLE001
             results.append({"path": path, "currentValue": None, "error": str(exc)})
 
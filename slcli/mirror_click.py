@@ -0,0 +1,551 @@
+"""CLI commands for a local SQLite mirror of SystemLink entities.
+
+``mirror sync`` copies systems, assets, products, test results and work items
+into a SQLite database per profile. The first sync bulk-loads every entity in
+parallel; later syncs only request items whose last-updated timestamp is at or
+after the newest one already mirrored. ``mirror query`` runs read-only SQL
+against the mirror so repeated reporting questions never reach the server.
+"""
+
+import concurrent.futures
+import datetime
+import json
+import queue
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import click
+
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .rich_output import render_table
+from .table_utils import is_delimited_format, output_delimited
+from .utils import ExitCodes, get_base_url, handle_api_error, make_api_request
+
+
+@dataclass(frozen=True)
+class MirrorEntity:
+    """Describe how one entity type is queried and stored."""
+
+    name: str
+    path: str
+    items_key: str
+    updated_field: str
+    paging: str
+    page_size: int
+    columns: Tuple[Tuple[str, str], ...]
+    watermark_clause: str
+    # Query fields that sort skip-paged results by ``updated_field``, oldest first
+    order: Tuple[Tuple[str, Any], ...] = ()
+
+    def watermark_filter(self, watermark: str) -> Tuple[str, List[Any]]:
+        """Return a filter selecting items updated at or after ``watermark``.
+
+        Services that accept substitutions get the timestamp as ``@0``; the
+        others get it inlined as a quoted literal.
+        """
+        if "@0" in self.watermark_clause:
+            return self.watermark_clause, [watermark]
+        return self.watermark_clause.format(value=watermark), []
+
+
+MIRROR_ENTITIES: Dict[str, MirrorEntity] = {
+    entity.name: entity
+    for entity in (
+        MirrorEntity(
+            name="systems",
+            path="/nisysmgmt/v1/query-systems",
+            items_key="data",
+            updated_field="lastUpdatedTimestamp",
+            paging="skip",
+            page_size=100,
+            columns=(
+                ("alias", "alias"),
+                ("workspace", "workspace"),
+                ("state", "connected.data.state"),
+                ("host", "grains.data.host"),
+                ("kernel", "grains.data.kernel"),
+            ),
+            watermark_clause='lastUpdatedTimestamp >= "{value}"',
+            order=(("orderBy", "lastUpdatedTimestamp ascending"),),
+        ),
+        MirrorEntity(
+            name="assets",
+            path="/niapm/v1/query-assets",
+            items_key="assets",
+            updated_field="lastUpdatedTimestamp",
+            paging="skip",
+            page_size=1000,
+            columns=(
+                ("name", "name"),
+                ("model_name", "modelName"),
+                ("vendor_name", "vendorName"),
+                ("serial_number", "serialNumber"),
+                ("workspace", "workspace"),
+                ("system_id", "location.minionId"),
+            ),
+            watermark_clause='LastUpdatedTimestamp >= "{value}"',
+            order=(("orderBy", "LAST_UPDATED_TIMESTAMP"), ("descending", False)),
+        ),
+        MirrorEntity(
+            name="products",
+            path="/nitestmonitor/v2/query-products",
+            items_key="products",
+            updated_field="updatedAt",
+            paging="token",
+            page_size=1000,
+            columns=(
+                ("part_number", "partNumber"),
+                ("name", "name"),
+                ("family", "family"),
+                ("workspace", "workspace"),
+            ),
+            watermark_clause="updatedAt >= @0",
+        ),
+        MirrorEntity(
+            name="results",
+            path="/nitestmonitor/v2/query-results",
+            items_key="results",
+            updated_field="updatedAt",
+            paging="token",
+            page_size=1000,
+            columns=(
+                ("program_name", "programName"),
+                ("status", "status.statusType"),
+                ("part_number", "partNumber"),
+                ("serial_number", "serialNumber"),
+                ("started_at", "startedAt"),
+                ("system_id", "systemId"),
+                ("host_name", "hostName"),
+                ("operator", "operator"),
+                ("workspace", "workspace"),
+            ),
+            watermark_clause="updatedAt >= @0",
+        ),
+        MirrorEntity(
+            name="workitems",
+            path="/niworkitem/v1/query-workitems",
+            items_key="workItems",
+            updated_field="updatedAt",
+            paging="token",
+            page_size=100,
+            columns=(
+                ("name", "name"),
+                ("type", "type"),
+                ("state", "state"),
+                ("part_number", "partNumber"),
+                ("workspace", "workspace"),
+            ),
+            watermark_clause="updatedAt >= @0",
+        ),
+    )
+}
+
+_SYNC_STATE_TABLE = "_sync_state"
+
+
+def _get_mirror_path(database: Optional[str]) -> Path:
+    """Return the mirror database path, defaulting to one file per profile."""
+    if database:
+        return Path(database)
+
+    from .config import get_config_file_path
+    from .profiles import get_active_profile_name
+
+    profile = get_active_profile_name() or "default"
+    safe_profile = re.sub(r"[^A-Za-z0-9._-]+", "_", profile)
+    return get_config_file_path().parent / "mirror" / f"{safe_profile}.sqlite3"
+
+
+def _extract_path(item: Dict[str, Any], path: str) -> Any:
+    """Return the value at a dotted path, or None when any part is missing."""
+    value: Any = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def _open_mirror(path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the mirror database and its tables."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path))
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(
+        f"CREATE TABLE IF NOT EXISTS {_SYNC_STATE_TABLE} ("
+        "entity TEXT PRIMARY KEY, watermark TEXT, synced_at TEXT, "
+        "row_count INTEGER, server TEXT)"
+    )
+    for entity in MIRROR_ENTITIES.values():
+        columns = "".join(f", {column} TEXT" for column, _ in entity.columns)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {entity.name} "
+            f"(id TEXT PRIMARY KEY, updated_at TEXT{columns}, data TEXT NOT NULL)"
+        )
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{entity.name}_updated_at "
+            f"ON {entity.name} (updated_at)"
+        )
+    connection.commit()
+    return connection
+
+
+def _upsert_items(
+    connection: sqlite3.Connection, entity: MirrorEntity, items: Sequence[Dict[str, Any]]
+) -> Optional[str]:
+    """Insert or replace items and return the newest updated timestamp among them."""
+    column_names = ["id", "updated_at"] + [column for column, _ in entity.columns] + ["data"]
+    placeholders = ", ".join("?" for _ in column_names)
+    updates = ", ".join(f"{column} = excluded.{column}" for column in column_names[1:])
+    rows: List[Tuple[Any, ...]] = []
+    newest: Optional[str] = None
+    for item in items:
+        item_id = item.get("id")
+        if item_id is None:
+            continue
+        updated = item.get(entity.updated_field)
+        if updated and (newest is None or str(updated) > newest):
+            newest = str(updated)
+        rows.append(
+            (str(item_id), updated)
+            + tuple(_extract_path(item, path) for _, path in entity.columns)
+            + (json.dumps(item, sort_keys=True),)
+        )
+    connection.executemany(
+        f"INSERT INTO {entity.name} ({', '.join(column_names)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}",
+        rows,
+    )
+    return newest
+
+
+def _iter_entity_pages(
+    entity: MirrorEntity, watermark: Optional[str]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of items for an entity, limited to changes after ``watermark``."""
+    url = f"{get_base_url()}{entity.path}"
+    payload: Dict[str, Any] = {"take": entity.page_size}
+    if entity.paging == "skip":
+        # Skip paging over an unordered query can repeat or miss items between pages
+        payload.update(entity.order)
+    if watermark:
+        filter_expr, substitutions = entity.watermark_filter(watermark)
+        payload["filter"] = filter_expr
+        if substitutions:
+            payload["substitutions"] = substitutions
+
+    skip = 0
+    continuation_token: Optional[str] = None
+    while True:
+        if entity.paging == "skip":
+            payload["skip"] = skip
+        elif continuation_token:
+            payload["continuationToken"] = continuation_token
+
+        data = make_api_request("POST", url, payload=dict(payload)).json()
+        if isinstance(data, dict):
+            items = data.get(entity.items_key, [])
+            continuation_token = data.get("continuationToken")
+        else:
+            # The systems API may return a list of {data: {...}} wrappers
+            items = [item.get("data", item) for item in data if isinstance(item, dict)]
+            continuation_token = None
+        items = [item for item in items if isinstance(item, dict)]
+        if items:
+            yield items
+
+        if entity.paging == "skip":
+            skip += len(items)
+            if len(items) < entity.page_size:
+                return
+        elif not continuation_token or not items:
+            return
+
+
+def _load_sync_state(connection: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
+    """Return the sync state row of every mirrored entity."""
+    cursor = connection.execute(
+        f"SELECT entity, watermark, synced_at, row_count, server FROM {_SYNC_STATE_TABLE}"
+    )
+    return {
+        row[0]: {"watermark": row[1], "syncedAt": row[2], "rows": row[3], "server": row[4]}
+        for row in cursor.fetchall()
+    }
+
+
+def sync_mirror(
+    connection: sqlite3.Connection,
+    entity_names: Sequence[str],
+    full: bool = False,
+    max_workers: int = 4,
+) -> Dict[str, Dict[str, Any]]:
+    """Synchronize entities into the mirror.
+
+    Entities are fetched concurrently; pages are handed to the calling thread,
+    which owns the SQLite connection, through a queue. The watermark of an
+    entity only advances once all of its pages are stored, so a failed sync
+    is retried from the previous watermark.
+
+    Args:
+        connection: Open mirror database.
+        entity_names: Entities to synchronize.
+        full: Discard mirrored rows and reload everything.
+        max_workers: Entities fetched at the same time.
+
+    Returns:
+        Per-entity statistics: ``mode`` (full or incremental), ``fetched`` and ``rows``.
+    """
+    server = get_base_url()
+    state = _load_sync_state(connection)
+    stats: Dict[str, Dict[str, Any]] = {}
+    pages: "queue.Queue[Tuple[str, Optional[List[Dict[str, Any]]]]]" = queue.Queue()
+
+    watermarks: Dict[str, Optional[str]] = {}
+    for name in entity_names:
+        previous = state.get(name, {})
+        incremental = not full and previous.get("server") == server and previous.get("watermark")
+        watermarks[name] = previous["watermark"] if incremental else None
+        if not incremental:
+            connection.execute(f"DELETE FROM {name}")
+        stats[name] = {"mode": "incremental" if incremental else "full", "fetched": 0}
+
+    def _fetch(name: str) -> None:
+        try:
+            for page in _iter_entity_pages(MIRROR_ENTITIES[name], watermarks[name]):
+                pages.put((name, page))
+        finally:
+            pages.put((name, None))
+
+    newest: Dict[str, Optional[str]] = dict(watermarks)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, name): name for name in entity_names}
+        remaining = len(futures)
+        while remaining:
+            name, page = pages.get()
+            if page is None:
+                remaining -= 1
+                continue
+            page_newest = _upsert_items(connection, MIRROR_ENTITIES[name], page)
+            stats[name]["fetched"] += len(page)
+            if page_newest and (newest[name] is None or page_newest > str(newest[name])):
+                newest[name] = page_newest
+        for future in futures:
+            future.result()
+
+    synced_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    for name in entity_names:
+        row_count = connection.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+        stats[name]["rows"] = row_count
+        connection.execute(
+            f"INSERT OR REPLACE INTO {_SYNC_STATE_TABLE} "
+            "(entity, watermark, synced_at, row_count, server) VALUES (?, ?, ?, ?, ?)",
+            (name, newest[name], synced_at, row_count, server),
+        )
+    connection.commit()
+    return stats
+
+
+def _open_read_only(path: Path) -> sqlite3.Connection:
+    """Open an existing mirror database without write access."""
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def register_mirror_commands(cli: Any) -> None:
+    """Register the 'mirror' command group and its subcommands."""
+
+    @cli.group()
+    def mirror() -> None:
+        """Keep a local SQLite mirror of systems, assets, products, results and work items."""
+
+    database_option = click.option(
+        "--database",
+        "--db",
+        "database",
+        type=click.Path(dir_okay=False),
+        help="Mirror database file (default: one file per profile in the config directory)",
+    )
+
+    @mirror.command(name="sync")
+    @click.option(
+        "--entity",
+        "-e",
+        "entities",
+        multiple=True,
+        type=click.Choice(list(MIRROR_ENTITIES)),
+        help="Entity to synchronize (repeatable; default: all)",
+    )
+    @click.option(
+        "--full",
+        is_flag=True,
+        help="Discard mirrored rows and reload, picking up deletions",
+    )
+    @click.option(
+        "--concurrency",
+        "-c",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="Number of entities fetched at the same time",
+    )
+    @database_option
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def sync(
+        entities: Tuple[str, ...],
+        full: bool,
+        concurrency: int,
+        database: Optional[str],
+        format: str,
+    ) -> None:
+        """Synchronize the local mirror with the server.
+
+        The first sync of an entity (or any sync with --full) loads every item.
+        Later syncs only fetch items updated at or after the newest timestamp
+        already mirrored. Incremental syncs cannot detect deleted items; run
+        with --full periodically to drop them.
+        """
+        format_output = validate_output_format(format)
+        names = list(entities) or list(MIRROR_ENTITIES)
+        path = _get_mirror_path(database)
+
+        try:
+            connection = _open_mirror(path)
+            try:
+                stats = sync_mirror(connection, names, full=full, max_workers=concurrency)
+            finally:
+                connection.close()
+        except sqlite3.Error as exc:
+            click.echo(f"✗ Mirror database error: {exc}", err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
+
+        if format_output == "json":
+            click.echo(json.dumps({"database": str(path), "entities": stats}, indent=2))
+            return
+
+        render_table(
+            ["Entity", "Mode", "Fetched", "Rows"],
+            [12, 12, 10, 10],
+            [
+                [name, stats[name]["mode"], stats[name]["fetched"], stats[name]["rows"]]
+                for name in names
+            ],
+        )
+        click.echo(f"✓ Mirror synchronized: {path}")
+
+    @mirror.command(name="status")
+    @database_option
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def status(database: Optional[str], format: str) -> None:
+        """Show what the mirror holds and when each entity was last synchronized."""
+        format_output = validate_output_format(format)
+        path = _get_mirror_path(database)
+        if not path.exists():
+            click.echo(f"✗ No mirror found at {path}. Run 'slcli mirror sync' first.", err=True)
+            sys.exit(ExitCodes.NOT_FOUND)
+
+        connection = _open_read_only(path)
+        try:
+            state = _load_sync_state(connection)
+        finally:
+            connection.close()
+
+        if format_output == "json":
+            click.echo(json.dumps({"database": str(path), "entities": state}, indent=2))
+            return
+
+        if not state:
+            click.echo("Mirror is empty. Run 'slcli mirror sync' first.")
+            return
+        render_table(
+            ["Entity", "Rows", "Last Sync", "Watermark"],
+            [12, 10, 32, 32],
+            [
+                [name, entry["rows"], entry["syncedAt"], entry["watermark"] or ""]
+                for name, entry in sorted(state.items())
+            ],
+        )
+
+    @mirror.command(name="query")
+    @click.argument("sql")
+    @click.option(
+        "--param",
+        "-p",
+        "params",
+        multiple=True,
+        help="Positional value for a ? placeholder in SQL (repeatable)",
+    )
+    @database_option
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(LIST_OUTPUT_FORMATS),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def query(sql: str, params: Tuple[str, ...], database: Optional[str], format: str) -> None:
+        """Run a read-only SQL query against the mirror.
+
+        Each entity is a table with an id, updated_at, a few common columns
+        and the full item as JSON in "data" (use json_extract for other
+        fields). Example:
+
+            slcli mirror query "SELECT s.alias, COUNT(a.id) FROM systems s
+            LEFT JOIN assets a ON a.system_id = s.id GROUP BY s.alias"
+        """
+        format_output = validate_output_format(format)
+        path = _get_mirror_path(database)
+        if not path.exists():
+            click.echo(f"✗ No mirror found at {path}. Run 'slcli mirror sync' first.", err=True)
+            sys.exit(ExitCodes.NOT_FOUND)
+
+        connection = _open_read_only(path)
+        try:
+            cursor = connection.execute(sql, params)
+            columns = [description[0] for description in cursor.description or []]
+            if is_delimited_format(format_output):
+                # Stream rows straight from the cursor
+                output_delimited(columns, cursor, format_output)
+                return
+            rows = cursor.fetchall()
+        except sqlite3.Error as exc:
+            click.echo(f"✗ Query failed: {exc}", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+        finally:
+            connection.close()
+
+        if format_output == "json":
+            click.echo(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+            return
+
+        if not rows:
+            click.echo("No rows returned.")
+            return
+        render_table(
+            columns,
+            [max(len(column), 12) for column in columns],
+            rows,
+            show_total=True,
+            total_label="row(s)",
+        )
@@ -0,0 +1,265 @@
+"""Streaming writers for NI package (.nipkg) archives.
+
+A .nipkg is a Debian-style ar archive with ``debian-binary``, ``control.tar.gz``
+and ``data.tar.gz`` members. The helpers here write those members straight to
+disk so packing large folders needs constant memory, and produce reproducible
+output: entry order, ownership, permissions and timestamps are normalized.
+"""
+
+import gzip
+import io
+import os
+import struct
+import tarfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, Optional, Tuple, cast
+
+# 1980-01-01T00:00:00Z, used when SOURCE_DATE_EPOCH is not set
+DEFAULT_SOURCE_DATE_EPOCH = 315532800
+
+_GZIP_BLOCK_SIZE = 1024 * 1024
+_DEFLATE_WINDOW = 32 * 1024
+_MAX_GZIP_WORKERS = 8
+
+
+def get_source_date_epoch() -> int:
+    """Return the timestamp stamped on every archive entry.
+
+    Honors the ``SOURCE_DATE_EPOCH`` convention for reproducible builds and
+    falls back to a fixed date so identical inputs produce identical packages.
+    """
+    value = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    try:
+        return int(value) if value else DEFAULT_SOURCE_DATE_EPOCH
+    except ValueError:
+        return DEFAULT_SOURCE_DATE_EPOCH
+
+
+def ar_header(name: str, size: int, mtime: int, mode: int = 0o100644) -> bytes:
+    """Build a 60-byte ar member header.
+
+    Names longer than 16 bytes are truncated, which is sufficient for the fixed
+    member names used by packages.
+    """
+    name_field = name.encode("utf-8")[:16]
+    return (
+        name_field.ljust(16, b" ")
+        + str(int(mtime)).encode("ascii").ljust(12, b" ")
+        + b"0".ljust(6, b" ")
+        + b"0".ljust(6, b" ")
+        + oct(mode)[2:].encode("ascii").ljust(8, b" ")
+        + str(int(size)).encode("ascii").ljust(10, b" ")
+        + b"`\n"
+    )
+
+
+def write_ar_member(out: BinaryIO, name: str, data: bytes, mtime: int) -> None:
+    """Write a complete in-memory ar member, padded to an even length."""
+    out.write(ar_header(name, len(data), mtime))
+    out.write(data)
+    if len(data) % 2:
+        out.write(b"\n")
+
+
+def _deflate_block(block: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """Deflate one block as a byte-aligned piece of a larger raw deflate stream."""
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(block) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipWriter:
+    """Write-only file object producing a single gzip member on worker threads.
+
+    Input is split into fixed-size blocks that are deflated concurrently (zlib
+    releases the GIL while compressing). Each block is primed with the last
+    32 KiB of the previous block as a preset dictionary and ends on a byte
+    boundary, so the blocks concatenate into one standard deflate stream. This
+    is the approach pigz uses; any gzip reader can decompress the result.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        level: int = 6,
+        workers: Optional[int] = None,
+        block_size: int = _GZIP_BLOCK_SIZE,
+        mtime: int = 0,
+    ) -> None:
+        """Write the gzip header and start the compression workers.
+
+        Args:
+            fileobj: Binary destination; it is not closed by :meth:`close`.
+            level: zlib compression level.
+            workers: Number of compression threads (defaults to the CPU count, max 8).
+            block_size: Uncompressed bytes per block.
+            mtime: Timestamp stored in the gzip header.
+        """
+        self._out = fileobj
+        self._level = level
+        self._block_size = block_size
+        worker_count = workers or min(os.cpu_count() or 1, _MAX_GZIP_WORKERS)
+        self._executor = ThreadPoolExecutor(max_workers=worker_count)
+        self._max_pending = worker_count * 2
+        self._pending: Deque["Future[bytes]"] = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+        # ID1 ID2 CM FLG MTIME XFL OS (255 = unknown keeps output platform independent)
+        self._out.write(b"\x1f\x8b\x08\x00" + struct.pack("<I", mtime) + b"\x00\xff")
+
+    def write(self, data: Any) -> int:
+        """Buffer data and hand full blocks to the compression workers."""
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block, last=False)
+        return len(data)
+
+    def _submit(self, block: bytes, last: bool) -> None:
+        """Queue a block for compression, writing finished blocks in order."""
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        self._pending.append(
+            self._executor.submit(_deflate_block, block, self._dictionary, self._level, last)
+        )
+        self._dictionary = block[-_DEFLATE_WINDOW:]
+        while len(self._pending) > self._max_pending:
+            self._out.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        """Flush remaining data and write the gzip trailer."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer.clear()
+            while self._pending:
+                self._out.write(self._pending.popleft().result())
+            self._out.write(struct.pack("<II", self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF))
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelGzipWriter":
+        """Return the writer for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the writer."""
+        self.close()
+
+
+def iter_folder_entries(folder: Path) -> Iterator[Tuple[Path, str]]:
+    """Yield ``(path, arcname)`` for a folder tree in a stable order.
+
+    The order matches ``tarfile.add(folder, arcname=".")``: the root first, then
+    every directory's children sorted by name, depth first. Symbolic links are
+    yielded but not followed.
+    """
+    yield folder, "."
+    yield from _iter_subtree(folder, ".")
+
+
+def _iter_subtree(directory: Path, arc_directory: str) -> Iterator[Tuple[Path, str]]:
+    """Yield the sorted, depth-first contents of one directory."""
+    for entry in sorted(os.scandir(directory), key=lambda item: item.name):
+        arcname = f"{arc_directory}/{entry.name}"
+        yield Path(entry.path), arcname
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_subtree(Path(entry.path), arcname)
+
+
+def normalize_tarinfo(info: tarfile.TarInfo, mtime: int) -> tarfile.TarInfo:
+    """Strip host-specific ownership, permissions and timestamps from an entry."""
+    info.mtime = mtime
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    if info.isdir() or info.mode & 0o111:
+        info.mode = 0o755
+    else:
+        info.mode = 0o644
+    return info
+
+
+def _add_path(tar: tarfile.TarFile, path: Path, arcname: str, mtime: int) -> None:
+    """Stream one file system entry into a tar archive with normalized metadata."""
+    info = normalize_tarinfo(tar.gettarinfo(str(path), arcname), mtime)
+    if info.isreg():
+        with open(path, "rb") as source:
+            tar.addfile(info, source)
+    else:
+        tar.addfile(info)
+
+
+def write_nipkg(
+    output: Path,
+    control: bytes,
+    folder: Path,
+    extra_files: Optional[Dict[str, Path]] = None,
+    level: int = 6,
+    workers: Optional[int] = None,
+) -> Path:
+    """Write a .nipkg whose payload is the contents of ``folder``.
+
+    ``data.tar.gz`` is streamed through :class:`ParallelGzipWriter` directly
+    into the ar member; its header is written with a placeholder size and
+    patched once the compressed length is known.
+
+    Args:
+        output: Destination .nipkg path.
+        control: Contents of the ``control`` file.
+        folder: Folder whose contents become the package payload.
+        extra_files: Virtual payload entries mapping a root-level file name to
+            the file that provides its contents. They replace folder entries
+            with the same name, so nothing has to be copied into ``folder``.
+        level: gzip compression level.
+        workers: Compression threads for the payload.
+
+    Returns:
+        The output path.
+    """
+    mtime = get_source_date_epoch()
+    virtual = {f"./{name}": source for name, source in (extra_files or {}).items()}
+
+    control_buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=control_buffer, mode="wb", mtime=0) as control_gzip:
+        with tarfile.open(fileobj=control_gzip, mode="w|") as control_tar:
+            info = normalize_tarinfo(tarfile.TarInfo(name="control"), mtime)
+            info.size = len(control)
+            control_tar.addfile(info, io.BytesIO(control))
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "wb") as out:
+        out.write(b"!<arch>\n")
+        write_ar_member(out, "debian-binary", b"2.0\n", mtime)
+        write_ar_member(out, "control.tar.gz", control_buffer.getvalue(), mtime)
+
+        header_offset = out.tell()
+        out.write(ar_header("data.tar.gz", 0, mtime))
+        data_start = out.tell()
+        with ParallelGzipWriter(out, level=level, workers=workers) as data_gzip:
+            with tarfile.open(fileobj=cast(BinaryIO, data_gzip), mode="w|") as data_tar:
+                for path, arcname in iter_folder_entries(folder):
+                    if arcname not in virtual:
+                        _add_path(data_tar, path, arcname, mtime)
+                    if arcname == ".":
+                        for virtual_name, source in virtual.items():
+                            _add_path(data_tar, source, virtual_name, mtime)
+        data_size = out.tell() - data_start
+        if data_size % 2:
+            out.write(b"\n")
+        out.seek(header_offset)
+        out.write(ar_header("data.tar.gz", data_size, mtime))
+
+    return output
@@ -4,20 +4,23 @@ Provides CLI commands for listing, creating, updating, downloading, and deleting
 All commands use Click for robust CLI interfaces and error handling.
 """
 
+import csv
 import datetime
+import io
 import json
 import re
 import sys
 import time
 import urllib.parse
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import click
 import requests
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .platform import PLATFORM_SLS, get_platform
+from .polling_utils import CompletionWaiter
 from .universal_handlers import UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -29,6 +32,7 @@ from .utils import (
     get_workspace_id_with_fallback,
     get_workspace_map,
     handle_api_error,
+    pooled_http_session,
     save_json_file,
     validate_workspace_access,
 )
@@ -51,6 +55,12 @@ PREDEFINED_NOTEBOOK_INTERFACES = [
     "Work Item Scheduler",
 ]
 
+# Execution statuses after which the service no longer updates an execution
+TERMINAL_EXECUTION_STATUSES = {"SUCCEEDED", "FAILED", "CANCELED", "TIMED_OUT"}
+
+# Maximum execution IDs looked up per bulk query-executions request
+_EXECUTION_STATUS_QUERY_SIZE = 100
+
 WINDOWS_RESERVED_FILENAMES = {
     "CON",
     "PRN",
@@ -270,6 +280,12 @@ def _get_notebook_execution_base() -> str:
     return f"{get_base_url()}/ninbexecution/v1"
 
 
+def _escape_filter_value(value: str) -> str:
+    """Escape special characters in filter string values."""
+    # Escape backslashes and quotes to prevent filter injection
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
 def _query_notebook_executions(
     workspace_id: Optional[str] = None,
     status: Optional[str] = None,
@@ -293,11 +309,6 @@ def _query_notebook_executions(
     continuation_token: Optional[str] = None
     is_sls = get_platform() == PLATFORM_SLS
 
-    def _escape_filter_value(value: str) -> str:
-        """Escape special characters in filter string values."""
-        # Escape backslashes and quotes to prevent filter injection
-        return value.replace("\\", "\\\\").replace('"', '\\"')
-
     # Build filter based on platform
     base_parts: List[str] = []
     if is_sls:
@@ -348,6 +359,78 @@ def _query_notebook_executions(
     return all_execs
 
 
+def _query_executions_by_id(execution_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch the current state of many executions with bulk query requests.
+
+    Args:
+        execution_ids: Execution IDs to look up.
+
+    Returns:
+        Mapping of execution ID to execution dictionary for IDs the service returned.
+    """
+    url = f"{_get_notebook_execution_base()}/query-executions"
+    found: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(execution_ids), _EXECUTION_STATUS_QUERY_SIZE):
+        chunk = execution_ids[start : start + _EXECUTION_STATUS_QUERY_SIZE]
+        payload: Dict[str, Any] = {
+            "take": len(chunk),
+            "filter": " || ".join(f'id == "{_escape_filter_value(item)}"' for item in chunk),
+        }
+        resp = make_api_request("POST", url, payload)
+        data = resp.json() if resp.text else {}
+        executions = data if isinstance(data, list) else data.get("executions", [])
+        for execution in executions:
+            if isinstance(execution, dict) and execution.get("id"):
+                found[execution["id"]] = execution
+    return found
+
+
+def _coerce_matrix_value(value: str) -> Any:
+    """Parse a CSV cell as JSON when possible so numbers and booleans keep their type."""
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
+
+def _load_parameter_matrix(path: str) -> List[Dict[str, Any]]:
+    """Load notebook parameter sets from a CSV, JSON or JSON lines file.
+
+    Args:
+        path: File path, or ``-`` to read JSON lines from stdin.
+
+    Returns:
+        One parameter dictionary per execution.
+
+    Raises:
+        ValueError: If the file does not contain parameter objects.
+    """
+    if path == "-":
+        text = sys.stdin.read()
+        suffix = ".jsonl"
+    else:
+        text = Path(path).read_text(encoding="utf-8")
+        suffix = Path(path).suffix.lower()
+
+    rows: List[Any]
+    if suffix == ".csv":
+        rows = [
+            {key: _coerce_matrix_value(value) for key, value in row.items() if key}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    elif suffix == ".json":
+        rows = json.loads(text)
+        if not isinstance(rows, list):
+            raise ValueError("JSON parameter matrix must be an array of objects")
+    else:
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            raise ValueError(f"Parameter set {number} is not an object")
+    return rows
+
+
 def _build_create_execution_payload(
     notebook_id: str,
     workspace: str,
@@ -424,6 +507,25 @@ def _parse_execution_response(resp_data: Any, is_sls: bool) -> List[Dict[str, An
     )
 
 
+def _match_created_rows(
+    rows: List[int], payload: List[Dict[str, Any]], executions: List[Dict[str, Any]]
+) -> List[Tuple[Optional[int], Dict[str, Any]]]:
+    """Pair executions from a partly failed batch request with their matrix rows.
+
+    Executions are matched on the parameters the service echoes back; the row
+    is None when an execution cannot be matched.
+    """
+    unmatched = dict(zip(rows, (item.get("parameters") for item in payload)))
+    pairs: List[Tuple[Optional[int], Dict[str, Any]]] = []
+    for execution in executions:
+        parameters = execution.get("parameters")
+        row = next((row for row, sent in unmatched.items() if sent == parameters), None)
+        if row is not None:
+            del unmatched[row]
+        pairs.append((row, execution))
+    return pairs
+
+
 def _create_notebook_http(name: str, workspace: str, content: bytes) -> Dict[str, Any]:
     """Create a notebook using HTTP. Only available on SLE."""
     if get_platform() == PLATFORM_SLS:
@@ -872,7 +974,7 @@ def register_notebook_commands(cli: Any) -> None:
         "--format",
         "-f",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -964,11 +1066,8 @@ def register_notebook_commands(cli: Any) -> None:
                         err=True,
                     )
 
-            if not notebooks:
-                if format_output.lower() == "json":
-                    click.echo("[]")
-                else:
-                    click.echo("No notebooks found.")
+            if not notebooks and format_output == "table":
+                click.echo("No notebooks found.")
                 return
 
             # Use universal response handler (create a mock response for consistency)
@@ -1327,7 +1426,7 @@ def register_notebook_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1721,7 +1820,6 @@ def register_notebook_commands(cli: Any) -> None:
                 click.echo("✗ Execution response missing ID", err=True)
                 sys.exit(ExitCodes.GENERAL_ERROR)
             # Polling loop
-            terminal_statuses = {"SUCCEEDED", "FAILED", "CANCELED", "TIMED_OUT"}
             spinner_frames = ["|", "/", "-", "\\"]
             spinner_index = 0
             start_time = time.time()
@@ -1730,7 +1828,7 @@ def register_notebook_commands(cli: Any) -> None:
             )
             status = execution.get("status", "QUEUED")
             last_print_status = ""
-            while status not in terminal_statuses:
+            while status not in TERMINAL_EXECUTION_STATUSES:
                 # Respect client-side max wait
                 if computed_max_wait is not None and (time.time() - start_time) > computed_max_wait:
                     click.echo("\n✗ Reached client-side max wait timeout", err=True)
@@ -1784,6 +1882,225 @@ def register_notebook_commands(cli: Any) -> None:
         except Exception as exc:  # noqa: BLE001
             handle_api_error(exc)
 
+    @notebook_execute.command(name="batch")
+    @click.option(
+        "--notebook-id",
+        "-n",
+        required=True,
+        help="Notebook ID (SLE) or notebook path (SLS) to execute",
+    )
+    @click.option(
+        "--matrix",
+        "-m",
+        "matrix_path",
+        required=True,
+        type=click.Path(dir_okay=False, allow_dash=True),
+        help="Parameter sets as CSV, JSON array or JSON lines ('-' reads JSON lines from stdin)",
+    )
+    @click.option(
+        "--workspace",
+        "-w",
+        default="Default",
+        help="Workspace name or ID (SLE only, default: 'Default')",
+    )
+    @click.option(
+        "--parameters",
+        "-p",
+        help="Base parameters (raw JSON or @file) merged under every parameter set",
+    )
+    @click.option(
+        "--timeout",
+        "-t",
+        type=int,
+        default=1800,
+        show_default=True,
+        help="Execution timeout in seconds (server-side; 0 for infinite)",
+    )
+    @click.option(
+        "--max-in-flight",
+        type=click.IntRange(min=1),
+        default=10,
+        show_default=True,
+        help="Maximum executions queued or running at the same time",
+    )
+    @click.option(
+        "--poll-interval",
+        type=click.FloatRange(min=0.1),
+        default=2.0,
+        show_default=True,
+        help="Initial polling interval; backs off while nothing finishes",
+    )
+    @click.option(
+        "--max-poll-interval",
+        type=click.FloatRange(min=0.1),
+        default=30.0,
+        show_default=True,
+        help="Upper bound for the polling interval",
+    )
+    @click.option(
+        "--max-wait",
+        type=int,
+        default=None,
+        help="Maximum seconds to wait for the whole batch client-side",
+    )
+    @click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Disable result caching (sets resultCachePeriod=0)",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format (json emits one JSON object per finished execution)",
+    )
+    def execute_notebook_batch(
+        notebook_id: str,
+        matrix_path: str,
+        workspace: str = "Default",
+        parameters: Optional[str] = None,
+        timeout: int = 1800,
+        max_in_flight: int = 10,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        max_wait: Optional[int] = None,
+        no_cache: bool = False,
+        format: str = "table",
+    ) -> None:
+        """Execute a notebook once per parameter set and stream results.
+
+        Executions are submitted in batched requests while keeping at most
+        --max-in-flight running, and all of them are tracked by one poller that
+        queries their statuses in bulk. Results are printed as each execution
+        finishes. Exits non-zero if any execution did not succeed.
+        """
+        format_output = validate_output_format(format)
+        is_sls = get_platform() == PLATFORM_SLS
+
+        try:
+            matrix = _load_parameter_matrix(matrix_path)
+        except (OSError, ValueError) as exc:
+            click.echo(f"✗ Invalid parameter matrix: {exc}", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+        if not matrix:
+            click.echo("✗ Parameter matrix is empty", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+
+        template = _build_create_execution_payload(
+            notebook_id=notebook_id,
+            workspace=workspace,
+            timeout=timeout,
+            no_cache=no_cache,
+            parameters=parameters,
+            is_sls=is_sls,
+        )
+        base_parameters = template.pop("parameters", {})
+        url = f"{_get_notebook_execution_base()}/executions"
+        waiter = CompletionWaiter(
+            _query_executions_by_id,
+            lambda execution: execution.get("status") in TERMINAL_EXECUTION_STATUSES,
+            initial_interval=poll_interval,
+            max_interval=max_poll_interval,
+            backoff_factor=1.5,
+            timeout=max_wait,
+        )
+        row_by_execution: Dict[str, int] = {}
+        next_row = 0
+        failures = 0
+
+        def report(row: int, execution: Dict[str, Any]) -> None:
+            nonlocal failures
+            status = execution.get("status", "UNKNOWN")
+            if status != "SUCCEEDED":
+                failures += 1
+            if format_output == "json":
+                click.echo(
+                    json.dumps({"index": row, "parameters": matrix[row], "execution": execution})
+                )
+                return
+            marker = "✓" if status == "SUCCEEDED" else "✗"
+            click.echo(
+                f"{marker} [{row + 1}/{len(matrix)}] {execution.get('id', 'N/A')} {status} "
+                f"{json.dumps(matrix[row], sort_keys=True)}"
+            )
+            if execution.get("errorMessage"):
+                click.echo(f"    {execution['errorMessage']}", err=True)
+
+        def report_created(
+            created: List[Tuple[Optional[int], Dict[str, Any]]], requested: int
+        ) -> None:
+            # List every execution already started, so reruns can skip their rows
+            click.echo(
+                f"Created {len(created)} of {requested} execution(s) in the failed request:",
+                err=True,
+            )
+            for row, execution in created:
+                label = "?" if row is None else str(row + 1)
+                click.echo(f"  row {label}: {execution.get('id', 'N/A')}", err=True)
+            if waiter.pending:
+                click.echo("Executions from earlier requests still running:", err=True)
+                for execution_id in waiter.pending:
+                    row = row_by_execution[execution_id]
+                    click.echo(f"  row {row + 1}: {execution_id}", err=True)
+
+        try:
+            with pooled_http_session():
+                while next_row < len(matrix) or waiter.pending:
+                    free_slots = max_in_flight - len(waiter.pending)
+                    if free_slots > 0 and next_row < len(matrix):
+                        rows = list(range(next_row, min(next_row + free_slots, len(matrix))))
+                        payload = [
+                            {**template, "parameters": {**base_parameters, **matrix[row]}}
+                            for row in rows
+                        ]
+                        resp_data = make_api_request("POST", url, payload=payload).json()
+                        executions = _parse_execution_response(resp_data, is_sls)
+                        if len(executions) != len(rows):
+                            error_obj = (
+                                resp_data.get("error") if isinstance(resp_data, dict) else None
+                            )
+                            message = (error_obj or {}).get("message", "unexpected response")
+                            click.echo(f"✗ Error creating executions: {message}", err=True)
+                            report_created(
+                                _match_created_rows(rows, payload, executions), len(rows)
+                            )
+                            sys.exit(ExitCodes.GENERAL_ERROR)
+                        next_row += len(rows)
+                        for row, execution in zip(rows, executions):
+                            if execution.get("status") in TERMINAL_EXECUTION_STATUSES:
+                                report(row, execution)
+                            else:
+                                row_by_execution[execution["id"]] = row
+                                waiter.add(execution["id"], execution)
+                        continue
+
+                    if waiter.expired():
+                        raise TimeoutError
+                    waiter.sleep()
+                    for execution_id, execution in waiter.poll():
+                        report(row_by_execution.pop(execution_id), execution)
+        except TimeoutError:
+            click.echo(
+                f"✗ Reached client-side max wait with {len(waiter.pending)} execution(s) "
+                "still running",
+                err=True,
+            )
+            for execution_id in waiter.pending:
+                click.echo(f"  {execution_id}", err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
+
+        if format_output == "table":
+            click.echo(
+                f"\nCompleted {len(matrix)} execution(s): "
+                f"{len(matrix) - failures} succeeded, {failures} did not succeed"
+            )
+        if failures:
+            sys.exit(ExitCodes.GENERAL_ERROR)
+
     @notebook_execute.command(name="cancel")
     @click.option("--id", "-i", "execution_id", required=True, help="Execution ID to cancel")
     def cancel_notebook_execution(execution_id: str) -> None:
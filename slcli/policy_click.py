@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 import click
 import questionary
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .policy_utils import (
     _build_policy_payload,
     _display_policy_details,
@@ -17,6 +17,7 @@ from .policy_utils import (
     _format_template_list_row,
     _parse_properties_from_cli,
 )
+from .table_utils import is_delimited_format, output_delimited_items
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -79,7 +80,7 @@ def register_policy_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -128,7 +129,8 @@ def register_policy_commands(cli: Any) -> None:
                     query_params["name"] = f"*{name}*"
                 return f"{base_url}?{urlencode(query_params)}"
 
-            if format == "json":
+            headers = ["ID", "Name", "Type", "Built-in", "Statements"]
+            if format != "table":
                 import json
 
                 all_policies: List[Dict[str, Any]] = []
@@ -158,7 +160,10 @@ def register_policy_commands(cli: Any) -> None:
 
                     current_skip += page_take
 
-                click.echo(json.dumps(all_policies, indent=2) if all_policies else "[]")
+                if is_delimited_format(format):
+                    output_delimited_items(all_policies, format, headers, _format_policy_list_row)
+                else:
+                    click.echo(json.dumps(all_policies, indent=2) if all_policies else "[]")
                 return
 
             current_skip = skip
@@ -183,7 +188,7 @@ def register_policy_commands(cli: Any) -> None:
                     item_name="policy",
                     format_output=format,
                     formatter_func=_format_policy_list_row,
-                    headers=["ID", "Name", "Type", "Built-in", "Statements"],
+                    headers=headers,
                     column_widths=[36, 30, 12, 10, 15],
                     enable_pagination=False,
                     page_size=take,
@@ -492,7 +497,7 @@ def register_policy_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -541,7 +546,8 @@ def register_policy_commands(cli: Any) -> None:
                     query_params["name"] = f"*{name}*"
                 return f"{base_url}?{urlencode(query_params)}"
 
-            if format == "json":
+            headers = ["ID", "Name", "Type", "Built-in", "Statements"]
+            if format != "table":
                 import json
 
                 all_templates: List[Dict[str, Any]] = []
@@ -571,7 +577,12 @@ def register_policy_commands(cli: Any) -> None:
 
                     current_skip += page_take
 
-                click.echo(json.dumps(all_templates, indent=2) if all_templates else "[]")
+                if is_delimited_format(format):
+                    output_delimited_items(
+                        all_templates, format, headers, _format_template_list_row
+                    )
+                else:
+                    click.echo(json.dumps(all_templates, indent=2) if all_templates else "[]")
                 return
 
             current_skip = skip
@@ -596,7 +607,7 @@ def register_policy_commands(cli: Any) -> None:
                     item_name="template",
                     format_output=format,
                     formatter_func=_format_template_list_row,
-                    headers=["ID", "Name", "Type", "Built-in", "Statements"],
+                    headers=headers,
                     column_widths=[36, 30, 12, 10, 15],
                     enable_pagination=False,
                     page_size=take,
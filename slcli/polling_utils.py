@@ -0,0 +1,124 @@
+"""Polling utilities for commands that wait on many server-side operations."""
+
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+StatusFetcher = Callable[[List[str]], Dict[str, Dict[str, Any]]]
+
+
+class CompletionWaiter:
+    """Track many asynchronous operations with a single adaptive-backoff poller.
+
+    Every poll fetches the status of all pending operations in one call to
+    ``fetch_statuses``. The interval resets to ``initial_interval`` whenever an
+    operation finishes and grows by ``backoff_factor`` (up to ``max_interval``)
+    while nothing changes. Operations can be added while waiting, which lets
+    callers keep a bounded number of operations in flight.
+    """
+
+    def __init__(
+        self,
+        fetch_statuses: StatusFetcher,
+        is_terminal: Callable[[Dict[str, Any]], bool],
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+        timeout: Optional[float] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """Create a waiter.
+
+        Args:
+            fetch_statuses: Returns a status dictionary per operation ID for the
+                IDs passed in. IDs missing from the result are treated as pending.
+            is_terminal: Returns True when a status dictionary is final.
+            initial_interval: Seconds between polls while operations are finishing.
+            max_interval: Upper bound for the poll interval.
+            backoff_factor: Interval multiplier applied when a poll finds no progress.
+            timeout: Overall seconds to wait before :meth:`wait` raises TimeoutError.
+            sleep: Sleep function; defaults to ``time.sleep``.
+        """
+        self._fetch_statuses = fetch_statuses
+        self._is_terminal = is_terminal
+        self._initial_interval = initial_interval
+        self._max_interval = max(max_interval, initial_interval)
+        self._backoff_factor = backoff_factor
+        self._sleep = sleep or time.sleep
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self.interval = initial_interval
+
+    @property
+    def pending(self) -> List[str]:
+        """Return the IDs of operations that have not reached a terminal status."""
+        return list(self._pending)
+
+    def add(self, operation_id: str, status: Optional[Dict[str, Any]] = None) -> None:
+        """Start tracking an operation, optionally with its last known status."""
+        self._pending[operation_id] = status or {}
+
+    def last_status(self, operation_id: str) -> Dict[str, Any]:
+        """Return the most recent status seen for a pending operation."""
+        return self._pending.get(operation_id, {})
+
+    def expired(self) -> bool:
+        """Return True once the overall timeout has elapsed."""
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left before the overall timeout, or None without one."""
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def poll(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Fetch all pending statuses once and return operations that finished.
+
+        Returns:
+            ``(operation_id, status)`` pairs for newly finished operations.
+        """
+        if not self._pending:
+            return []
+
+        statuses = self._fetch_statuses(list(self._pending))
+        finished: List[Tuple[str, Dict[str, Any]]] = []
+        for operation_id, status in statuses.items():
+            if operation_id not in self._pending:
+                continue
+            if self._is_terminal(status):
+                del self._pending[operation_id]
+                finished.append((operation_id, status))
+            else:
+                self._pending[operation_id] = status
+
+        if finished:
+            self.interval = self._initial_interval
+        else:
+            self.interval = min(self.interval * self._backoff_factor, self._max_interval)
+        return finished
+
+    def sleep(self) -> None:
+        """Sleep for the current interval, never past the overall deadline."""
+        delay = self.interval
+        remaining = self.remaining()
+        if remaining is not None:
+            delay = min(delay, remaining)
+        if delay > 0:
+            self._sleep(delay)
+
+    def wait(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield operations as they finish until none are pending.
+
+        Raises:
+            TimeoutError: If the overall timeout elapses first. Operations that
+                are still pending remain available through :attr:`pending`.
+        """
+        while self._pending:
+            yield from self.poll()
+            if not self._pending:
+                return
+            if self.expired():
+                raise TimeoutError(
+                    f"{len(self._pending)} operation(s) did not finish before the timeout"
+                )
+            self.sleep()
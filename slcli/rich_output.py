@@ -6,11 +6,10 @@ benefit from Rich styling without rewriting every command implementation.
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
-from typing import Any, Iterable, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence
 
 import click
 from rich.box import ROUNDED
@@ -20,6 +19,8 @@ from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
+from . import json_codec
+
 _THEME = Theme(
     {
         "brand": "bold cyan",
@@ -71,7 +72,7 @@ def print_json(data: Any, err: bool = False) -> None:
         _get_console(err=err).print(JSON.from_data(data))
         return
 
-    _ORIGINAL_CLICK_ECHO(message=json.dumps(data, indent=2), err=err)
+    _ORIGINAL_CLICK_ECHO(message=json_codec.dumps(data, indent=True), err=err)
 
 
 def render_table(
@@ -82,9 +83,15 @@ def render_table(
     show_total: bool = False,
     total_label: str = "item(s)",
     total_count: Optional[int] = None,
+    err: bool = False,
 ) -> None:
     """Render a boxed table using Rich.
 
+    On a terminal the rows are styled and laid out by Rich. Otherwise (output
+    piped or redirected) the rows are written as they are produced, without
+    per-cell styling, so ``rows`` can be a generator over any number of items
+    without holding them all in memory. Both paths produce the same layout.
+
     Args:
         headers: Column headers.
         column_widths: Maximum widths for each column.
@@ -92,6 +99,7 @@ def render_table(
         show_total: Whether to print a total footer.
         total_label: Label for the total footer.
         total_count: Optional explicit total count for the footer.
+        err: Render to stderr instead of stdout.
     """
     table = Table(
         box=ROUNDED,
@@ -109,18 +117,92 @@ def render_table(
             no_wrap=True,
         )
 
-    row_count = 0
-    for row in rows:
-        styled_row = [_style_table_cell(value) for value in row]
-        table.add_row(*styled_row)
-        row_count += 1
-
-    _get_console().print(table)
+    console = _get_console(err)
+    if console.is_terminal:
+        row_count = 0
+        for row in rows:
+            styled_row = [_style_table_cell(value) for value in row]
+            table.add_row(*styled_row)
+            row_count += 1
+        console.print(table)
+    else:
+        row_count = _stream_plain_table(console, table, rows)
 
     if show_total:
         count = total_count if total_count is not None else row_count
-        _get_console().print()
-        _get_console().print(Text.assemble(("Total: ", "summary"), str(count), f" {total_label}"))
+        console.print()
+        console.print(Text.assemble(("Total: ", "summary"), str(count), f" {total_label}"))
+
+
+def _stream_plain_table(console: Console, table: Table, rows: Iterable[Sequence[Any]]) -> int:
+    """Write ``table`` with ``rows`` line by line, matching Rich's layout; return the row count.
+
+    Every column has a fixed width, so the layout does not depend on the rows:
+    Rich renders the header once and its top border gives the final column
+    widths. Each row is then truncated and padded the way Rich would.
+    """
+    with console.capture() as capture:
+        console.print(table)
+    header_lines = capture.get().splitlines()
+    if not header_lines[0].endswith(ROUNDED.top_right):
+        # Wider than the console: Rich crops the right-hand columns, so let it lay them out
+        row_count = 0
+        for row in rows:
+            table.add_row(*("" if value is None else str(value) for value in row))
+            row_count += 1
+        console.print(table)
+        return row_count
+
+    closing = header_lines.pop()  # bottom border, written after the rows
+    # The top border looks like "╭──────┬────╮"; each run of "─" spans one padded column.
+    # Rich squeezes columns, padding included, when the table is too wide to fit.
+    widths = [len(run) - 2 for run in header_lines[0][1:-1].split(ROUNDED.top_divider)]
+    edge, divider = ROUNDED.head_left, ROUNDED.head_vertical
+
+    out = console.file
+    out.write("\n".join(header_lines) + "\n")
+    row_count = 0
+    for row in rows:
+        values = ["" if value is None else str(value) for value in row]
+        if all(value.isascii() and value.isprintable() for value in values):
+            # Fast path: one cell per character, no line breaks or tabs
+            parts = [_fit_ascii_cell(value, width) for value, width in zip(values, widths)]
+            out.write(f"{edge}{divider.join(parts)}{edge}\n")
+        else:
+            out.write("\n".join(_plain_row_lines(values, widths, edge, divider)) + "\n")
+        row_count += 1
+    out.write(closing + "\n")
+    out.flush()
+    return row_count
+
+
+def _fit_ascii_cell(value: str, width: int) -> str:
+    """Pad or ellipsize a printable ASCII cell to ``width`` plus the one-space padding."""
+    if width <= 0:
+        return " " * (width + 2)
+    if len(value) > width:
+        return f" {value[: width - 1]}… "
+    return f" {value.ljust(width)} "
+
+
+def _plain_row_lines(values: List[str], widths: List[int], edge: str, divider: str) -> List[str]:
+    """Lay out one row with line breaks, tabs or wide characters the way Rich does."""
+    cells = [Text(value).split("\n", allow_blank=True) for value in values]
+    # Columns squeezed to nothing do not add to the row height
+    height = max((len(lines) for width, lines in zip(widths, cells) if width > 0), default=1)
+    lines = []
+    for line_index in range(height):
+        parts = []
+        for width, cell_lines in zip(widths, cells):
+            if width <= 0:
+                parts.append(_fit_ascii_cell("", width))
+                continue
+            text = cell_lines[line_index] if line_index < len(cell_lines) else Text()
+            text.expand_tabs()
+            text.truncate(width, overflow="ellipsis", pad=True)
+            parts.append(f" {text.plain} ")
+        lines.append(f"{edge}{divider.join(parts)}{edge}")
+    return lines
 
 
 def _rich_echo(
@@ -212,6 +294,12 @@ def _configure_consoles() -> None:
     )
 
 
+def reset_consoles() -> None:
+    """Drop the cached consoles so the next write re-reads color policy and streams."""
+    global _STDOUT_CONSOLE, _STDERR_CONSOLE
+    _STDOUT_CONSOLE = _STDERR_CONSOLE = None
+
+
 def _get_console(err: bool = False) -> Console:
     """Return the configured Rich console."""
     if _console_needs_refresh(err=err):
@@ -240,8 +328,8 @@ def _try_parse_json(message: str) -> Optional[Any]:
         return None
 
     try:
-        return json.loads(stripped)
-    except json.JSONDecodeError:
+        return json_codec.loads(stripped)
+    except ValueError:
         return None
 
 
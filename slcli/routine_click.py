@@ -13,6 +13,7 @@ import click
 import questionary
 import requests
 
+from .cli_utils import LIST_OUTPUT_FORMATS
 from .utils import (
     ExitCodes,
     format_success,
@@ -146,7 +147,7 @@ def register_routine_commands(cli: Any) -> None:
         "--format",
         "-f",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -266,11 +267,11 @@ def register_routine_commands(cli: Any) -> None:
                 click.echo(json.dumps(routines, indent=2))
                 return
 
-            if not routines:
+            if not routines and format_output == "table":
                 click.echo("No routines found.")
                 return
 
-            from .table_utils import output_formatted_list
+            from .table_utils import is_delimited_format, output_formatted_list
 
             if api_version == "v1":
                 headers = ["Name", "ID", "Type", "Enabled", "Workspace"]
@@ -281,6 +282,16 @@ def register_routine_commands(cli: Any) -> None:
                 widths = [30, 36, 15, 8, 30]
                 formatter = _make_v2_formatter(workspace_map)
 
+            if is_delimited_format(format_output):
+                output_formatted_list(
+                    routines[:take] if take > 0 else routines,
+                    format_output,
+                    headers,
+                    widths,
+                    formatter,
+                )
+                return
+
             # Interactive pagination: show `take` items per page
             total = len(routines)
             offset = 0
@@ -8,7 +8,16 @@ from typing import Any, Dict, List, Optional, Tuple
 import click
 import questionary
 
-from .cli_utils import confirm_bulk_operation, validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, confirm_bulk_operation, validate_output_format
+from .client_filters import (
+    all_of,
+    contains_text,
+    equals_text,
+    field,
+    number_between,
+    Predicate,
+    take_matches,
+)
 from .rich_output import render_table
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
@@ -456,126 +465,97 @@ def _projection_field_set(
     return [field for field in SPEC_PROJECTION_FIELDS if field in field_set]
 
 
-def _matches_limit_filters(
-    specification: Dict[str, Any],
-    limit_min_ge: Optional[float],
-    limit_min_le: Optional[float],
-    limit_typical_ge: Optional[float],
-    limit_typical_le: Optional[float],
-    limit_max_ge: Optional[float],
-    limit_max_le: Optional[float],
-) -> bool:
-    """Apply client-side limit filters to a specification."""
-    limit = specification.get("limit")
-    if not isinstance(limit, dict):
-        no_limit_filters = all(
-            value is None
-            for value in (
-                limit_min_ge,
-                limit_min_le,
-                limit_typical_ge,
-                limit_typical_le,
-                limit_max_ge,
-                limit_max_le,
-            )
-        )
-        return no_limit_filters
-
-    def limit_value(name: str) -> Optional[float]:
-        value = limit.get(name)
-        if isinstance(value, (int, float)):
-            return float(value)
+def _limit_bounds(
+    name: str, minimum: Optional[float], maximum: Optional[float]
+) -> Optional[Predicate]:
+    """Build a check for one limit value, or ``None`` when it has no bounds."""
+    if minimum is None and maximum is None:
         return None
+    return number_between(field(f"limit.{name}"), minimum, maximum)
 
-    min_value = limit_value("min")
-    typical_value = limit_value("typical")
-    max_value = limit_value("max")
-
-    checks = [
-        (limit_min_ge, min_value, lambda threshold, actual: actual >= threshold),
-        (limit_min_le, min_value, lambda threshold, actual: actual <= threshold),
-        (limit_typical_ge, typical_value, lambda threshold, actual: actual >= threshold),
-        (limit_typical_le, typical_value, lambda threshold, actual: actual <= threshold),
-        (limit_max_ge, max_value, lambda threshold, actual: actual >= threshold),
-        (limit_max_le, max_value, lambda threshold, actual: actual <= threshold),
-    ]
 
-    for threshold, actual, predicate in checks:
-        if threshold is None:
-            continue
-        if actual is None or not predicate(threshold, actual):
+def _condition_value_contains(needle: str) -> Predicate:
+    """Match conditions whose discrete or range values contain ``needle``."""
+    needle_lower = needle.lower()
+
+    def predicate(condition: Dict[str, Any]) -> bool:
+        value_object = condition.get("value")
+        if not isinstance(value_object, dict):
             return False
-    return True
+        discrete = value_object.get("discrete", [])
+        if isinstance(discrete, list) and any(
+            needle_lower in str(item).lower() for item in discrete
+        ):
+            return True
+        range_values = value_object.get("range", [])
+        if isinstance(range_values, list):
+            for range_item in range_values:
+                if isinstance(range_item, dict) and any(
+                    range_item.get(key) is not None and needle_lower in str(range_item[key]).lower()
+                    for key in ("min", "max", "step")
+                ):
+                    return True
+        return False
+
+    return predicate
 
 
-def _matches_condition_filters(
-    specification: Dict[str, Any],
+def _compile_condition_filters(
     condition_name: Optional[str],
     condition_type: Optional[str],
     condition_unit: Optional[str],
     condition_value: Optional[str],
-) -> bool:
-    """Apply client-side condition filters to a specification."""
+) -> Optional[Predicate]:
+    """Build a predicate matching specs with at least one condition meeting every filter."""
     normalized_type = _normalize_condition_type(condition_type)
-    normalized_name = condition_name.lower() if condition_name else None
-    normalized_unit = condition_unit.lower() if condition_unit else None
-    normalized_value = condition_value.lower() if condition_value else None
-
-    no_condition_filters = all(
-        value is None
-        for value in (normalized_name, normalized_type, normalized_unit, normalized_value)
+    condition_matches = all_of(
+        [
+            equals_text(field("value.conditionType"), normalized_type) if normalized_type else None,
+            contains_text(field("name"), condition_name) if condition_name else None,
+            contains_text(field("value.unit"), condition_unit) if condition_unit else None,
+            _condition_value_contains(condition_value) if condition_value else None,
+        ]
     )
-    if no_condition_filters:
-        return True
-
-    conditions = specification.get("conditions")
-    if not isinstance(conditions, list):
-        return False
-
-    for condition in conditions:
-        if not isinstance(condition, dict):
-            continue
-        if normalized_name:
-            name = str(condition.get("name", "")).lower()
-            if normalized_name not in name:
-                continue
-
-        value_object = condition.get("value")
-        if not isinstance(value_object, dict):
-            if normalized_type or normalized_unit or normalized_value:
-                continue
-            return True
+    if condition_matches is None:
+        return None
+    matches: Predicate = condition_matches
 
-        if normalized_type:
-            if str(value_object.get("conditionType", "")).upper() != normalized_type:
-                continue
+    def predicate(specification: Dict[str, Any]) -> bool:
+        conditions = specification.get("conditions")
+        if not isinstance(conditions, list):
+            return False
+        return any(isinstance(condition, dict) and matches(condition) for condition in conditions)
 
-        if normalized_unit:
-            unit = str(value_object.get("unit", "")).lower()
-            if normalized_unit not in unit:
-                continue
+    return predicate
 
-        if normalized_value:
-            discrete = value_object.get("discrete", [])
-            range_values = value_object.get("range", [])
-            rendered_parts: List[str] = []
-            if isinstance(discrete, list):
-                rendered_parts.extend(str(item).lower() for item in discrete)
-            if isinstance(range_values, list):
-                for range_item in range_values:
-                    if not isinstance(range_item, dict):
-                        continue
-                    rendered_parts.extend(
-                        str(range_item.get(key, "")).lower()
-                        for key in ("min", "max", "step")
-                        if range_item.get(key) is not None
-                    )
-            if not any(normalized_value in part for part in rendered_parts):
-                continue
 
-        return True
+def _compile_client_side_filters(
+    condition_name: Optional[str],
+    condition_type: Optional[str],
+    condition_unit: Optional[str],
+    condition_value: Optional[str],
+    limit_min_ge: Optional[float],
+    limit_min_le: Optional[float],
+    limit_typical_ge: Optional[float],
+    limit_typical_le: Optional[float],
+    limit_max_ge: Optional[float],
+    limit_max_le: Optional[float],
+) -> Optional[Predicate]:
+    """Build one predicate for the condition and limit filters, or ``None`` without any.
 
-    return False
+    Limit bounds are plain number comparisons and run before the scan over
+    each spec's conditions.
+    """
+    return all_of(
+        [
+            _limit_bounds("min", limit_min_ge, limit_min_le),
+            _limit_bounds("typical", limit_typical_ge, limit_typical_le),
+            _limit_bounds("max", limit_max_ge, limit_max_le),
+            _compile_condition_filters(
+                condition_name, condition_type, condition_unit, condition_value
+            ),
+        ]
+    )
 
 
 def _apply_client_side_filters(
@@ -592,28 +572,19 @@ def _apply_client_side_filters(
     limit_max_le: Optional[float],
 ) -> List[Dict[str, Any]]:
     """Filter queried specifications client-side for condition and limit fields."""
-    filtered_specs: List[Dict[str, Any]] = []
-    for specification in specifications:
-        if not _matches_condition_filters(
-            specification,
-            condition_name,
-            condition_type,
-            condition_unit,
-            condition_value,
-        ):
-            continue
-        if not _matches_limit_filters(
-            specification,
-            limit_min_ge,
-            limit_min_le,
-            limit_typical_ge,
-            limit_typical_le,
-            limit_max_ge,
-            limit_max_le,
-        ):
-            continue
-        filtered_specs.append(specification)
-    return filtered_specs
+    predicate = _compile_client_side_filters(
+        condition_name,
+        condition_type,
+        condition_unit,
+        condition_value,
+        limit_min_ge,
+        limit_min_le,
+        limit_typical_ge,
+        limit_typical_le,
+        limit_max_ge,
+        limit_max_le,
+    )
+    return take_matches(specifications, predicate)
 
 
 def _default_export_filename(product_ids: List[str]) -> str:
@@ -894,6 +865,18 @@ def _collect_specs(
     limit_max_le: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Collect specifications across query pages, applying client-side filters."""
+    predicate = _compile_client_side_filters(
+        condition_name,
+        condition_type,
+        condition_unit,
+        condition_value,
+        limit_min_ge,
+        limit_min_le,
+        limit_typical_ge,
+        limit_typical_le,
+        limit_max_ge,
+        limit_max_le,
+    )
     collected_specs: List[Dict[str, Any]] = []
     continuation_token: Optional[str] = None
 
@@ -912,20 +895,7 @@ def _collect_specs(
         if not isinstance(specs, list) or not specs:
             break
 
-        filtered_specs = _apply_client_side_filters(
-            specs,
-            condition_name,
-            condition_type,
-            condition_unit,
-            condition_value,
-            limit_min_ge,
-            limit_min_le,
-            limit_typical_ge,
-            limit_typical_le,
-            limit_max_ge,
-            limit_max_le,
-        )
-        collected_specs.extend(filtered_specs)
+        collected_specs.extend(take_matches(specs, predicate, take - len(collected_specs)))
 
         continuation_token = page.get("continuationToken")
         if not continuation_token:
@@ -959,6 +929,18 @@ def _fetch_spec_page(
     Returns:
         Tuple of (page_items up to *take*, next continuation_token or None).
     """
+    predicate = _compile_client_side_filters(
+        condition_name,
+        condition_type,
+        condition_unit,
+        condition_value,
+        limit_min_ge,
+        limit_min_le,
+        limit_typical_ge,
+        limit_typical_le,
+        limit_max_ge,
+        limit_max_le,
+    )
     collected: List[Dict[str, Any]] = []
     token = continuation_token
 
@@ -977,20 +959,7 @@ def _fetch_spec_page(
             token = None
             break
 
-        filtered = _apply_client_side_filters(
-            specs,
-            condition_name,
-            condition_type,
-            condition_unit,
-            condition_value,
-            limit_min_ge,
-            limit_min_le,
-            limit_typical_ge,
-            limit_typical_le,
-            limit_max_ge,
-            limit_max_le,
-        )
-        collected.extend(filtered)
+        collected.extend(take_matches(specs, predicate, take - len(collected)))
 
         token = page.get("continuationToken")
         if not token:
@@ -1332,7 +1301,7 @@ def register_spec_commands(cli: Any) -> None:
         "-f",
         "--format",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1388,8 +1357,11 @@ def register_spec_commands(cli: Any) -> None:
         )
 
         try:
-            if normalized_format == "json":
-                # JSON: collect all matching specs up to --take and dump at once
+            if normalized_format != "table":
+                # JSON/CSV/TSV: collect all matching specs up to --take and write at once
+                if normalized_format != "json":
+                    _spec_formatter.workspace_map = get_workspace_map()  # type: ignore[attr-defined]
+                    _spec_formatter.product_map = _build_product_name_map(resolved_product_ids)  # type: ignore[attr-defined]
                 specs = _collect_specs(
                     product_ids=resolved_product_ids,
                     take=take,
@@ -1529,7 +1501,7 @@ def register_spec_commands(cli: Any) -> None:
         "-f",
         "--format",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="json",
         show_default=True,
         help="Output format. JSON preserves the continuation token.",
@@ -1625,7 +1597,9 @@ def register_spec_commands(cli: Any) -> None:
                 return
 
             specs = response_data.get("specs", [])
-            if not isinstance(specs, list) or not specs:
+            if not isinstance(specs, list):
+                specs = []
+            if not specs and normalized_format == "table":
                 click.echo("No specifications found.")
                 return
 
@@ -1644,8 +1618,11 @@ def register_spec_commands(cli: Any) -> None:
             )
             next_token = response_data.get("continuationToken")
             if next_token:
+                # Keep the hint out of CSV/TSV data on stdout
                 click.echo(
-                    "\nMore results are available. " "Re-run with --continuation-token to continue."
+                    "\nMore results are available. "
+                    "Re-run with --continuation-token to continue.",
+                    err=normalized_format != "table",
                 )
         except Exception as exc:
             handle_api_error(exc)
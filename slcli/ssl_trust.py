@@ -22,14 +22,15 @@ import traceback
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 from urllib.parse import urlparse
 
-from cryptography import x509
-from cryptography.hazmat.primitives import hashes, serialization
+if TYPE_CHECKING:
+    from cryptography import x509
 
 OS_TRUST_INJECTED: bool = False
 OS_TRUST_REASON: str = "not-attempted"
+_OS_TRUST_ATTEMPTED: bool = False
 _STANDARD_SSL_CONTEXT = ssl.SSLContext
 
 
@@ -65,10 +66,12 @@ __all__ = [
     "OS_TRUST_INJECTED",
     "OS_TRUST_REASON",
     "ServerCertificate",
+    "build_ssl_context",
     "get_managed_trust_path",
     "get_managed_trust_records",
     "get_ssl_server_origin",
     "inspect_server_certificate",
+    "ensure_os_trust",
     "inject_os_trust",
     "remove_managed_trust",
     "save_managed_certificate",
@@ -125,6 +128,30 @@ def use_standard_ssl_context(ssl_verify: Union[bool, str]) -> Iterator[None]:
             setattr(requests.adapters, "_preloaded_ssl_context", patched_preloaded_context)
 
 
+def build_ssl_context(ssl_verify: Union[bool, str]) -> Union[bool, ssl.SSLContext]:
+    """Return the SSL context ``requests`` would verify with for ``ssl_verify``.
+
+    Used by HTTP clients other than ``requests`` so they trust the same roots:
+    ``False`` disables verification, a CA bundle path is verified with the
+    standard implementation (as :func:`use_standard_ssl_context` does), and
+    ``True`` uses the OS trust store when injected, otherwise certifi.
+    """
+    if ssl_verify is False:
+        return False
+    if isinstance(ssl_verify, str):
+        context = _STANDARD_SSL_CONTEXT(ssl.PROTOCOL_TLS_CLIENT)
+        if os.path.isdir(ssl_verify):
+            context.load_verify_locations(capath=ssl_verify)
+        else:
+            context.load_verify_locations(cafile=ssl_verify)
+        return context
+    if OS_TRUST_INJECTED:
+        return ssl.create_default_context()
+    import certifi
+
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 def _get_trust_directory() -> Path:
     """Return the managed certificate directory, creating it when needed."""
     from .profiles import ProfileConfig
@@ -220,6 +247,10 @@ def inspect_server_certificate(api_url: str, timeout: float = 5) -> ServerCertif
     if not certificate_der:
         raise ssl.SSLError("The server did not provide a TLS certificate.")
 
+    # cryptography is only needed when a certificate is inspected for trust approval
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+
     certificate = x509.load_der_x509_certificate(certificate_der)
     not_before, not_after = _certificate_validity(certificate)
     sans: List[str] = []
@@ -306,6 +337,19 @@ def remove_managed_trust(api_url: str) -> bool:
     return removed
 
 
+def ensure_os_trust() -> None:
+    """Inject the system trust store once, before the first HTTPS request.
+
+    Injection is deferred from start-up so commands that never reach the
+    network (``--help``, ``--version``, ``config``) do not import truststore,
+    urllib3 and requests.
+    """
+    global _OS_TRUST_ATTEMPTED
+    if not _OS_TRUST_ATTEMPTED:
+        _OS_TRUST_ATTEMPTED = True
+        inject_os_trust()
+
+
 def inject_os_trust() -> None:
     """Inject system certificate store into requests via truststore.
 
@@ -11,6 +11,7 @@ import click
 import questionary
 import requests
 
+from .cli_utils import LIST_OUTPUT_FORMATS
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -524,7 +525,7 @@ def register_state_commands(cli: Any) -> None:
         "--format",
         "-f",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -542,7 +543,7 @@ def register_state_commands(cli: Any) -> None:
                 workspace=workspace_name,
                 architecture=architecture,
                 distribution=distribution,
-                max_items=take if format_output.lower() == "json" else None,
+                max_items=take if format_output.lower() != "table" else None,
             )
             workspace_map = get_workspace_map()
             filtered_resp: Any = FilteredResponse(response_data)
@@ -8,17 +8,25 @@ Also provides job management and system metadata updates.
 
 import concurrent.futures
 import datetime
+import itertools
 import json
 import shutil
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus
 
 import click
 import questionary
 import requests as requests_lib
 
-from .cli_utils import validate_output_format
+from .cli_formatters import _format_file_size
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .client_filters import Predicate, take_matches
+from .json_codec import response_json
 from .rich_output import render_table
 from .system_query_utils import (
     DEFAULT_SYSTEM_JSON_FIELDS,
@@ -34,6 +42,13 @@ from .system_query_utils import (
     parse_system_property_filter as _parse_system_property_filter,
     quote_search_value as _quote_search_value,
 )
+from .tabular_writers import (
+    iter_csv_rows,
+    open_tabular_writer,
+    PYARROW_INSTALL_HINT,
+    TABULAR_FORMATS,
+    TabularWriter,
+)
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -411,7 +426,7 @@ def _query_all_items(
             payload["projection"] = projection
 
         resp = make_api_request("POST", url, payload=payload)
-        page_items = response_parser(resp.json())
+        page_items = response_parser(response_json(resp))
         page_count = len(page_items)
 
         if page_count == 0:
@@ -470,7 +485,7 @@ def _fetch_materialized_system_page(
         payload=payload,
         handle_errors=False,
     )
-    return _parse_materialized_search_systems_response(resp.json())
+    return _parse_materialized_search_systems_response(response_json(resp))
 
 
 def _query_materialized_systems_with_fallback(
@@ -580,7 +595,7 @@ def _fetch_page(
         payload["projection"] = projection
 
     resp = make_api_request("POST", url, payload=payload)
-    return response_parser(resp.json())
+    return response_parser(response_json(resp))
 
 
 def _handle_interactive_pagination(
@@ -774,6 +789,22 @@ def _handle_materialized_system_pagination_with_fallback(
             break
 
 
+def _package_filter(package_search: str) -> Predicate:
+    """Build a predicate for systems with a package whose name contains ``package_search``."""
+    search_lower = package_search.lower()
+
+    def predicate(system: Dict[str, Any]) -> bool:
+        packages = system.get("packages")
+        if not isinstance(packages, dict):
+            return False
+        # Non-projected shape: packages -> {data: {...}}; projected: the data dict directly
+        pkg_data = packages.get("data")
+        pkg_names = pkg_data if isinstance(pkg_data, dict) else packages
+        return any(search_lower in pkg_name.lower() for pkg_name in pkg_names)
+
+    return predicate
+
+
 def _filter_by_package(
     systems: List[Dict[str, Any]],
     package_search: str,
@@ -787,25 +818,7 @@ def _filter_by_package(
     Returns:
         Filtered list of systems that have a matching package installed.
     """
-    search_lower = package_search.lower()
-    result: List[Dict[str, Any]] = []
-    for system in systems:
-        packages = system.get("packages")
-        if isinstance(packages, dict):
-            # Non-projected shape: packages -> {data: {...}}
-            pkg_data = packages.get("data")
-            if isinstance(pkg_data, dict):
-                pkg_names = pkg_data
-            else:
-                # Projected shape: packages is the data dict directly
-                pkg_names = packages
-        else:
-            continue
-        for pkg_name in pkg_names:
-            if search_lower in pkg_name.lower():
-                result.append(system)
-                break
-    return result
+    return take_matches(systems, _package_filter(package_search))
 
 
 def _get_system_state(system: Dict[str, Any]) -> str:
@@ -1539,6 +1552,37 @@ def _get_packages(system: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return {}
 
 
+def _normalize_package_entry(entry: Any, key: str) -> Dict[str, str]:
+    """Normalize a package entry to a dict shape for safe comparison."""
+    if isinstance(entry, dict):
+        displayname = entry.get("displayname") or key
+        version = entry.get("version") or ""
+        displayversion = entry.get("displayversion") or ""
+        return {
+            "displayname": str(displayname),
+            "version": str(version),
+            "displayversion": str(displayversion),
+        }
+
+    if isinstance(entry, str):
+        return {
+            "displayname": key,
+            "version": entry,
+            "displayversion": entry,
+        }
+
+    if entry is None:
+        normalized_value = ""
+    else:
+        normalized_value = str(entry)
+
+    return {
+        "displayname": key,
+        "version": normalized_value,
+        "displayversion": normalized_value,
+    }
+
+
 def _compare_packages(
     pkgs_a: Dict[str, Dict[str, Any]],
     pkgs_b: Dict[str, Dict[str, Any]],
@@ -1564,36 +1608,6 @@ def _compare_packages(
     version_diffs: List[Dict[str, str]] = []
     matching: List[str] = []
 
-    def _normalize_package_entry(entry: Any, key: str) -> Dict[str, str]:
-        """Normalize a package entry to a dict shape for safe comparison."""
-        if isinstance(entry, dict):
-            displayname = entry.get("displayname") or key
-            version = entry.get("version") or ""
-            displayversion = entry.get("displayversion") or ""
-            return {
-                "displayname": str(displayname),
-                "version": str(version),
-                "displayversion": str(displayversion),
-            }
-
-        if isinstance(entry, str):
-            return {
-                "displayname": key,
-                "version": entry,
-                "displayversion": entry,
-            }
-
-        if entry is None:
-            normalized_value = ""
-        else:
-            normalized_value = str(entry)
-
-        return {
-            "displayname": key,
-            "version": normalized_value,
-            "displayversion": normalized_value,
-        }
-
     for key in all_keys:
         in_a = key in pkgs_a
         in_b = key in pkgs_b
@@ -1849,6 +1863,380 @@ def _compare_assets(
     return result
 
 
+_DRIFT_PROJECTION = "new(id, alias, packages.data as packages)"
+_DRIFT_ASSET_FETCH_LIMIT = 1000
+
+
+def _get_drift_packages(system: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract packages from either a full or a projected system record.
+
+    Full records nest packages under ``packages.data``; the drift projection
+    returns the package dictionary directly under ``packages``.
+    """
+    packages = system.get("packages")
+    if not isinstance(packages, dict):
+        return {}
+    pkg_data = packages.get("data")
+    if isinstance(pkg_data, dict):
+        return pkg_data
+    if "data" in packages:
+        return {}
+    return packages
+
+
+def _build_package_index(
+    systems: List[Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, List[str]]], Dict[str, str]]:
+    """Build an inverted ``package -> version -> system IDs`` index.
+
+    Args:
+        systems: Fleet system records (full or projected shape).
+
+    Returns:
+        Tuple of the index and a mapping of package key to display name.
+    """
+    index: Dict[str, Dict[str, List[str]]] = {}
+    display_names: Dict[str, str] = {}
+    for system in systems:
+        system_id = str(system.get("id", ""))
+        for key, entry in _get_drift_packages(system).items():
+            pkg = _normalize_package_entry(entry, key)
+            version = pkg["version"] or pkg["displayversion"]
+            index.setdefault(key, {}).setdefault(version, []).append(system_id)
+            display_names.setdefault(key, pkg["displayname"])
+    return index, display_names
+
+
+def _analyze_package_drift(
+    baseline: Dict[str, Any],
+    fleet: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Compare the packages of every fleet system against a baseline system.
+
+    The fleet is indexed once, so the cost grows with the number of distinct
+    package versions rather than with one pairwise diff per system.
+
+    Args:
+        baseline: Baseline system record.
+        fleet: Fleet system records, excluding the baseline.
+
+    Returns:
+        Dictionary with ``systems`` (per-system deviations) and ``packages``
+        (fleet-wide version histograms).
+    """
+    baseline_versions: Dict[str, str] = {}
+    display_names: Dict[str, str] = {}
+    for key, entry in _get_drift_packages(baseline).items():
+        pkg = _normalize_package_entry(entry, key)
+        baseline_versions[key] = pkg["version"] or pkg["displayversion"]
+        display_names[key] = pkg["displayname"]
+
+    index, fleet_names = _build_package_index(fleet)
+    for key, name in fleet_names.items():
+        display_names.setdefault(key, name)
+
+    fleet_ids = [str(system.get("id", "")) for system in fleet]
+    deviations: Dict[str, Dict[str, List[Any]]] = {
+        system_id: {"missing": [], "extra": [], "version_differences": []}
+        for system_id in fleet_ids
+    }
+
+    histograms: List[Dict[str, Any]] = []
+    for key in sorted(set(baseline_versions) | set(index)):
+        versions = index.get(key, {})
+        installed = sum(len(ids) for ids in versions.values())
+        name = display_names.get(key, key)
+        baseline_version = baseline_versions.get(key)
+
+        if baseline_version is None:
+            for ids in versions.values():
+                for system_id in ids:
+                    deviations[system_id]["extra"].append(key)
+        else:
+            holders = set()
+            for version, ids in versions.items():
+                holders.update(ids)
+                if version == baseline_version:
+                    continue
+                for system_id in ids:
+                    deviations[system_id]["version_differences"].append(
+                        {
+                            "package": name,
+                            "baseline_version": baseline_version,
+                            "version": version,
+                        }
+                    )
+            for system_id in fleet_ids:
+                if system_id not in holders:
+                    deviations[system_id]["missing"].append(key)
+
+        histograms.append(
+            {
+                "package": key,
+                "displayname": name,
+                "baseline_version": baseline_version,
+                "versions": {
+                    version: len(ids)
+                    for version, ids in sorted(
+                        versions.items(), key=lambda item: (-len(item[1]), item[0])
+                    )
+                },
+                "installed_count": installed,
+                "missing_count": len(fleet_ids) - installed,
+            }
+        )
+
+    systems: List[Dict[str, Any]] = []
+    for system in fleet:
+        system_id = str(system.get("id", ""))
+        entry = deviations[system_id]
+        systems.append(
+            {
+                "id": system_id,
+                "alias": system.get("alias") or system_id,
+                "missing": entry["missing"],
+                "extra": entry["extra"],
+                "version_differences": entry["version_differences"],
+            }
+        )
+
+    return {"systems": systems, "packages": histograms}
+
+
+def _asset_counts(assets: List[Dict[str, Any]]) -> Dict[Tuple[str, str], int]:
+    """Count assets by ``(model, vendor)`` identity."""
+    counts: Dict[Tuple[str, str], int] = {}
+    for asset in assets:
+        identity = (asset.get("modelName") or "", asset.get("vendorName") or "")
+        counts[identity] = counts.get(identity, 0) + 1
+    return counts
+
+
+def _analyze_asset_drift(
+    baseline_assets: List[Dict[str, Any]],
+    fleet_assets: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Compare a system's assets with the baseline by ``(model, vendor)`` count.
+
+    Args:
+        baseline_assets: Assets connected to the baseline system.
+        fleet_assets: Assets connected to the fleet system.
+
+    Returns:
+        Dictionary with ``missing``, ``extra`` and ``count_mismatches`` lists.
+    """
+    expected = _asset_counts(baseline_assets)
+    actual = _asset_counts(fleet_assets)
+    missing: List[Dict[str, Any]] = []
+    extra: List[Dict[str, Any]] = []
+    count_mismatches: List[Dict[str, Any]] = []
+    for model, vendor in sorted(set(expected) | set(actual)):
+        count_baseline = expected.get((model, vendor), 0)
+        count_system = actual.get((model, vendor), 0)
+        if not count_system:
+            missing.append({"model": model, "vendor": vendor, "count": count_baseline})
+        elif not count_baseline:
+            extra.append({"model": model, "vendor": vendor, "count": count_system})
+        elif count_baseline != count_system:
+            count_mismatches.append(
+                {
+                    "model": model,
+                    "vendor": vendor,
+                    "count_baseline": count_baseline,
+                    "count_system": count_system,
+                }
+            )
+    return {"missing": missing, "extra": extra, "count_mismatches": count_mismatches}
+
+
+def _fetch_fleet_assets(
+    system_ids: List[str], max_workers: int
+) -> Dict[str, Tuple[List[Dict[str, Any]], int]]:
+    """Fetch connected assets for many systems concurrently.
+
+    Args:
+        system_ids: Systems to fetch assets for.
+        max_workers: Maximum number of concurrent asset queries.
+
+    Returns:
+        Mapping of system ID to ``(assets, total_count)``.
+    """
+    results: Dict[str, Tuple[List[Dict[str, Any]], int]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_assets_for_system, system_id, _DRIFT_ASSET_FETCH_LIMIT): (
+                system_id
+            )
+            for system_id in system_ids
+        }
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def _system_has_drift(entry: Dict[str, Any]) -> bool:
+    """Return True when a drift entry has any package or asset deviation."""
+    if entry["missing"] or entry["extra"] or entry["version_differences"]:
+        return True
+    assets = entry.get("assets")
+    if isinstance(assets, dict):
+        return bool(assets["missing"] or assets["extra"] or assets["count_mismatches"])
+    return False
+
+
+_REPORT_CHUNK_SIZE = 64 * 1024
+_REPORT_PROGRESS_INTERVAL = 0.25
+
+
+class _ByteProgress:
+    """Thread-safe byte counter that redraws a single progress line on stderr."""
+
+    def __init__(self, enabled: bool) -> None:
+        """Create a counter; nothing is printed unless ``enabled``."""
+        self.enabled = enabled
+        self.total = 0
+        self._lock = threading.Lock()
+        self._last_render = 0.0
+
+    def add(self, count: int) -> None:
+        """Record ``count`` downloaded bytes."""
+        with self._lock:
+            self.total += count
+            now = time.monotonic()
+            if self.enabled and now - self._last_render >= _REPORT_PROGRESS_INTERVAL:
+                self._last_render = now
+                self._render()
+
+    def _render(self) -> None:
+        click.echo(f"\r  Downloaded {_format_file_size(self.total)}", err=True, nl=False)
+
+    def finish(self) -> None:
+        """Print the final byte count and end the progress line."""
+        if self.enabled:
+            self._render()
+            click.echo("", err=True)
+
+
+def _iter_report_chunks(payload: Dict[str, Any], progress: _ByteProgress) -> Iterator[bytes]:
+    """Request a systems report and yield its body in chunks as it arrives."""
+    url = f"{_get_sysmgmt_base_url()}/generate-systems-report"
+    resp = make_api_request("POST", url, payload=payload, stream=True)
+    for chunk in resp.iter_content(chunk_size=_REPORT_CHUNK_SIZE):
+        if chunk:
+            progress.add(len(chunk))
+            yield chunk
+
+
+def _build_report_payload(
+    report_type: str, filter_query: Optional[str], partition: Optional[str]
+) -> Dict[str, Any]:
+    """Build a report request, combining the base filter with a partition filter."""
+    payload: Dict[str, Any] = {"type": report_type}
+    parts = [f"({expr})" if partition else expr for expr in (filter_query, partition) if expr]
+    if parts:
+        payload["filter"] = " and ".join(parts)
+    return payload
+
+
+def _write_report(
+    chunk_streams: Iterable[Iterable[bytes]], output: Path, file_format: str
+) -> Optional[int]:
+    """Write one or more CSV report bodies to ``output`` as a single file.
+
+    CSV bodies are copied byte for byte; the header line of every body after
+    the first is dropped. Other formats are converted row by row while the
+    bodies stream in.
+
+    Returns:
+        Number of data rows written, or None for CSV, which is not parsed.
+    """
+    if file_format == "csv":
+        header: Optional[bytes] = None
+        ends_with_newline = True
+        with open(output, "wb") as out:
+            for chunks in chunk_streams:
+                body = iter(chunks)
+                head = b""
+                for chunk in body:
+                    head += chunk
+                    if b"\n" in head:
+                        break
+                if not head:
+                    continue
+                end = head.find(b"\n") + 1 or len(head)
+                line, rest = head[:end], head[end:]
+                if header is None:
+                    header = line
+                    pieces: List[bytes] = [line, rest]
+                elif line.rstrip(b"\r\n") != header.rstrip(b"\r\n"):
+                    raise ValueError("Report partitions returned different columns")
+                else:
+                    pieces = [rest]
+                if not ends_with_newline:
+                    out.write(b"\n")
+                for piece in itertools.chain(pieces, body):
+                    if piece:
+                        out.write(piece)
+                        ends_with_newline = piece.endswith(b"\n")
+        return None
+
+    writer: Optional[TabularWriter] = None
+    try:
+        for chunks in chunk_streams:
+            rows = iter_csv_rows(chunks)
+            columns = next(rows, None)
+            if columns is None:
+                continue
+            if writer is None:
+                writer = open_tabular_writer(output, file_format, columns)
+            elif columns != writer.columns:
+                raise ValueError("Report partitions returned different columns")
+            for row in rows:
+                writer.write_row(row)
+        if writer is None:
+            writer = open_tabular_writer(output, file_format, [])
+        return writer.rows_written
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _download_report_partitions(
+    payloads: List[Dict[str, Any]],
+    directory: Path,
+    progress: _ByteProgress,
+    max_workers: int,
+) -> List[Path]:
+    """Generate report partitions concurrently into temporary files.
+
+    Returns:
+        Paths of the raw partition files, in the order of ``payloads``.
+    """
+
+    def _download(index: int, payload: Dict[str, Any]) -> Path:
+        path = directory / f"partition-{index:04d}.csv"
+        with open(path, "wb") as out:
+            for chunk in _iter_report_chunks(payload, progress):
+                out.write(chunk)
+        return path
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_download, index, payload) for index, payload in enumerate(payloads)
+        ]
+        return [future.result() for future in futures]
+
+
+def _iter_file_chunks(path: Path) -> Iterator[bytes]:
+    """Yield a file's contents in report-sized chunks."""
+    with open(path, "rb") as source:
+        while True:
+            chunk = source.read(_REPORT_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
 def register_system_commands(cli: Any) -> None:
     """Register the 'system' command group and its subcommands.
 
@@ -1877,7 +2265,7 @@ def register_system_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -2087,7 +2475,7 @@ def register_system_commands(cli: Any) -> None:
                     order_by
                 )
 
-            if format_output.lower() == "json":
+            if format_output.lower() != "table":
                 if use_materialized_search:
                     systems = _query_materialized_systems_with_fallback(
                         materialized_filter_expr,
@@ -2719,34 +3107,105 @@ def register_system_commands(cli: Any) -> None:
         required=True,
         help="File path to save the report",
     )
+    @click.option(
+        "--format",
+        "-f",
+        "file_format",
+        type=click.Choice(list(TABULAR_FORMATS)),
+        default="csv",
+        show_default=True,
+        help="Output file format; formats other than CSV are converted while streaming",
+    )
+    @click.option(
+        "--partition",
+        "partitions",
+        multiple=True,
+        help=(
+            "Filter expression for one slice of the report (repeatable). Slices are "
+            "generated in parallel and concatenated in the order given"
+        ),
+    )
+    @click.option(
+        "--concurrency",
+        "-c",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="Number of partitions generated at the same time",
+    )
+    @click.option(
+        "--progress/--no-progress",
+        default=None,
+        help="Show a downloaded-bytes counter (default: when stderr is a terminal)",
+    )
     def system_report(
         report_type: str,
         filter_query: Optional[str],
         output_path: str,
+        file_format: str,
+        partitions: Tuple[str, ...],
+        concurrency: int,
+        progress: Optional[bool],
     ) -> None:
         """Generate a software or hardware report for systems.
 
-        The report is saved to the specified output file.
+        The report is streamed to the specified output file in chunks, so it is
+        never held in memory. Use --format to convert the CSV report to JSON
+        Lines or Parquet while it downloads. Use --partition to split a large
+        report into slices (for example by workspace or alias prefix) that the
+        server generates in parallel; they are joined into one file with a
+        single header.
         """
         check_readonly_mode("generate a system report")
 
-        try:
-            url = f"{_get_sysmgmt_base_url()}/generate-systems-report"
-            payload: Dict[str, Any] = {"type": report_type}
-            if filter_query:
-                payload["filter"] = filter_query
+        output = Path(output_path)
+        show_progress = sys.stderr.isatty() if progress is None else progress
+        byte_progress = _ByteProgress(show_progress)
 
-            resp = make_api_request("POST", url, payload=payload)
-
-            with open(output_path, "wb") as f:
-                f.write(resp.content if hasattr(resp, "content") else resp.text.encode())
-
-            format_success(
-                "Report generated",
-                {"Type": report_type, "Output": output_path},
-            )
+        try:
+            if partitions:
+                payloads = [
+                    _build_report_payload(report_type, filter_query, partition)
+                    for partition in partitions
+                ]
+                with tempfile.TemporaryDirectory(
+                    prefix=".slcli-report-", dir=output.parent if output.parent.is_dir() else None
+                ) as temp_dir:
+                    parts = _download_report_partitions(
+                        payloads, Path(temp_dir), byte_progress, concurrency
+                    )
+                    rows = _write_report(
+                        (_iter_file_chunks(part) for part in parts), output, file_format
+                    )
+            else:
+                payload = _build_report_payload(report_type, filter_query, None)
+                rows = _write_report(
+                    [_iter_report_chunks(payload, byte_progress)], output, file_format
+                )
+            byte_progress.finish()
 
+            details: Dict[str, Any] = {
+                "Type": report_type,
+                "Output": output_path,
+                "Format": file_format.upper(),
+                "Downloaded": _format_file_size(byte_progress.total),
+            }
+            if partitions:
+                details["Partitions"] = len(partitions)
+            if rows is not None:
+                details["Rows"] = rows
+            format_success("Report generated", details)
+
+        except ImportError:
+            byte_progress.finish()
+            click.echo(PYARROW_INSTALL_HINT, err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        except ValueError as exc:
+            byte_progress.finish()
+            click.echo(f"✗ {exc}", err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
         except Exception as exc:  # noqa: BLE001
+            byte_progress.finish()
             handle_api_error(exc)
 
     # ------------------------------------------------------------------
@@ -2764,7 +3223,7 @@ def register_system_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -2847,7 +3306,7 @@ def register_system_commands(cli: Any) -> None:
 
             query_url = f"{_get_sysmgmt_base_url()}/query-jobs"
 
-            if format_output.lower() == "json":
+            if format_output.lower() != "table":
                 jobs = _query_all_items(
                     query_url,
                     filter_expr,
@@ -3118,3 +3577,251 @@ def register_system_commands(cli: Any) -> None:
             raise
         except Exception as exc:  # noqa: BLE001
             handle_api_error(exc)
+
+    @system.command(name="drift")
+    @click.option(
+        "--baseline",
+        "-b",
+        required=True,
+        help="Baseline system ID or alias (the golden image)",
+    )
+    @click.option("--alias", "-a", help="Filter fleet by system alias (contains match)")
+    @click.option(
+        "--state",
+        "-s",
+        type=click.Choice(
+            [
+                "CONNECTED",
+                "DISCONNECTED",
+                "VIRTUAL",
+                "APPROVED",
+                "CONNECTED_REFRESH_PENDING",
+                "CONNECTED_REFRESH_FAILED",
+                "ACTIVATED_WITHOUT_CONNECTION",
+            ],
+            case_sensitive=True,
+        ),
+        help="Filter fleet by connection state",
+    )
+    @click.option("--os", "os_filter", help="Filter fleet by OS (kernel contains match)")
+    @click.option("--host", help="Filter fleet by hostname (contains match)")
+    @click.option(
+        "--has-keyword",
+        multiple=True,
+        help="Filter fleet systems that have this keyword (repeatable)",
+    )
+    @click.option(
+        "--property",
+        "property_filters",
+        multiple=True,
+        help="Filter fleet by property key=value (repeatable)",
+    )
+    @click.option("--workspace", "-w", help="Filter fleet by workspace name or ID")
+    @click.option(
+        "--filter",
+        "filter_query",
+        help="Advanced API filter expression for the fleet",
+    )
+    @click.option(
+        "--take",
+        "-t",
+        type=click.IntRange(min=1),
+        default=1000,
+        show_default=True,
+        help="Maximum number of fleet systems to analyze",
+    )
+    @click.option(
+        "--assets",
+        "include_assets",
+        is_flag=True,
+        help="Also compare connected assets (model and vendor counts)",
+    )
+    @click.option(
+        "--concurrency",
+        "-c",
+        type=click.IntRange(min=1),
+        default=8,
+        show_default=True,
+        help="Number of concurrent asset queries when --assets is set",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format.",
+    )
+    def drift_systems(
+        baseline: str,
+        alias: Optional[str],
+        state: Optional[str],
+        os_filter: Optional[str],
+        host: Optional[str],
+        has_keyword: Tuple[str, ...],
+        property_filters: Tuple[str, ...],
+        workspace: Optional[str],
+        filter_query: Optional[str],
+        take: int,
+        include_assets: bool,
+        concurrency: int,
+        format: str,
+    ) -> None:
+        """Report how a fleet of systems drifts from a baseline system.
+
+        Packages for every matching system are fetched with one projected,
+        paged query and indexed by package and version. The report lists, per
+        system, packages that are missing, extra, or at a different version
+        than on the baseline, plus a fleet-wide version histogram for each
+        package. With --assets, connected assets are fetched in parallel and
+        compared by model and vendor counts.
+        """
+        format_output = validate_output_format(format)
+
+        try:
+            baseline_system = _resolve_system(baseline)
+            baseline_id = str(baseline_system.get("id", baseline))
+            baseline_alias = baseline_system.get("alias") or baseline_id
+
+            workspace_id: Optional[str] = None
+            workspace = get_effective_workspace(workspace)
+            if workspace:
+                try:
+                    workspace_map = get_workspace_map()
+                except Exception:
+                    workspace_map = {}
+                workspace_id = resolve_workspace_filter(workspace, workspace_map)
+
+            filter_expr = _build_system_filter(
+                alias=alias,
+                state=state,
+                os_filter=os_filter,
+                host=host,
+                has_keyword=has_keyword if has_keyword else None,
+                property_filters=property_filters if property_filters else None,
+                workspace_id=workspace_id,
+                custom_filter=filter_query,
+            )
+
+            # The baseline may match the fleet filter; fetch one extra so the
+            # analyzed fleet still holds up to --take systems.
+            fleet = _query_all_items(
+                _get_system_query_url(),
+                filter_expr,
+                "alias",
+                _parse_systems_response,
+                projection=_DRIFT_PROJECTION,
+                take=take + 1,
+            )
+            fleet = [system for system in fleet if str(system.get("id", "")) != baseline_id]
+            fleet = fleet[:take]
+
+            result = _analyze_package_drift(baseline_system, fleet)
+
+            truncated_assets: List[str] = []
+            if include_assets:
+                fleet_ids = [entry["id"] for entry in result["systems"]]
+                asset_results = _fetch_fleet_assets([baseline_id] + fleet_ids, concurrency)
+                baseline_assets, baseline_total = asset_results[baseline_id]
+                if baseline_total > _DRIFT_ASSET_FETCH_LIMIT:
+                    truncated_assets.append(baseline_alias)
+                for entry in result["systems"]:
+                    assets, total = asset_results[entry["id"]]
+                    if total > _DRIFT_ASSET_FETCH_LIMIT:
+                        truncated_assets.append(entry["alias"])
+                    entry["assets"] = _analyze_asset_drift(baseline_assets, assets)
+
+            if truncated_assets:
+                click.echo(
+                    "✗ Error: asset drift would be incomplete because asset retrieval "
+                    f"is limited to the first {_DRIFT_ASSET_FETCH_LIMIT} assets. "
+                    "Affected system(s): " + ", ".join(truncated_assets),
+                    err=True,
+                )
+                sys.exit(ExitCodes.GENERAL_ERROR)
+
+            drifted = [entry for entry in result["systems"] if _system_has_drift(entry)]
+
+            if format_output.lower() == "json":
+                output: Dict[str, Any] = {
+                    "baseline": {"id": baseline_id, "alias": baseline_alias},
+                    "system_count": len(result["systems"]),
+                    "drifted_count": len(drifted),
+                    "systems": result["systems"],
+                    "packages": result["packages"],
+                }
+                click.echo(json.dumps(output, indent=2))
+                return
+
+            click.echo(f"\n  Drift against baseline: {baseline_alias}")
+            click.echo("  " + "═" * 60)
+            if not result["systems"]:
+                click.echo("  No systems matched the fleet filter.")
+                click.echo()
+                return
+
+            if drifted:
+                headers = ["System", "ID", "Missing", "Extra", "Version Diffs"]
+                widths = [30, 38, 8, 8, 13]
+                if include_assets:
+                    headers.append("Asset Diffs")
+                    widths.append(11)
+
+                def _drift_row(entry: Dict[str, Any]) -> List[str]:
+                    row = [
+                        entry["alias"],
+                        entry["id"],
+                        str(len(entry["missing"])),
+                        str(len(entry["extra"])),
+                        str(len(entry["version_differences"])),
+                    ]
+                    if include_assets:
+                        assets = entry["assets"]
+                        row.append(
+                            str(
+                                len(assets["missing"])
+                                + len(assets["extra"])
+                                + len(assets["count_mismatches"])
+                            )
+                        )
+                    return row
+
+                click.echo()
+                render_table(headers, widths, [_drift_row(entry) for entry in drifted])
+            else:
+                click.echo("  ✓ All systems match the baseline.")
+
+            drifting_packages = [
+                pkg
+                for pkg in result["packages"]
+                if pkg["missing_count"]
+                or pkg["baseline_version"] is None
+                or any(version != pkg["baseline_version"] for version in pkg["versions"])
+            ]
+            if drifting_packages:
+                click.echo("\n  Package Version Histograms")
+                click.echo("  " + "─" * 60)
+                for pkg in drifting_packages:
+                    baseline_version = pkg["baseline_version"]
+                    label = (
+                        f"baseline {baseline_version}"
+                        if baseline_version is not None
+                        else "not on baseline"
+                    )
+                    click.echo(f"    {pkg['displayname']}  ({label})")
+                    for version, count in pkg["versions"].items():
+                        marker = "=" if version == baseline_version else "≠"
+                        click.echo(f"      {marker} {version or '(unknown)'}: {count}")
+                    if pkg["missing_count"] and baseline_version is not None:
+                        click.echo(f"      - missing: {pkg['missing_count']}")
+
+            click.echo(
+                f"\n  Summary: {len(result['systems']) - len(drifted)} matching, "
+                f"{len(drifted)} drifted, {len(drifting_packages)} drifting packages"
+            )
+            click.echo()
+
+        except SystemExit:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
@@ -1,11 +1,83 @@
 """Table formatting utilities for CLI commands."""
 
-from typing import Any, Callable, Dict, List
+import csv
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 import click
 
+from .field_projection import fields_table
 from .rich_output import print_json, render_table
 
+# Delimited output formats accepted by list commands, by field separator
+DELIMITED_FORMATS = {"csv": ",", "tsv": "\t"}
+
+
+def is_delimited_format(output_format: str) -> bool:
+    """Return whether ``output_format`` is ``csv`` or ``tsv``."""
+    return output_format.lower() in DELIMITED_FORMATS
+
+
+def output_delimited(
+    headers: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    output_format: str,
+    include_header: bool = True,
+) -> int:
+    """Write rows to stdout as CSV or TSV as they are produced.
+
+    Args:
+        headers: Column headers, written as the first line.
+        rows: Row values; ``None`` is written as an empty field.
+        output_format: 'csv' or 'tsv'
+        include_header: Set to False for later pages of a paged listing.
+
+    Returns:
+        Number of rows written.
+    """
+    writer = csv.writer(
+        sys.stdout, delimiter=DELIMITED_FORMATS[output_format.lower()], lineterminator="\n"
+    )
+    if include_header:
+        writer.writerow(headers)
+    row_count = 0
+    for row in rows:
+        writer.writerow(row)
+        row_count += 1
+    sys.stdout.flush()
+    return row_count
+
+
+def formatted_rows(
+    items: Iterable[Dict[str, Any]],
+    column_count: int,
+    row_formatter_func: Callable[[Dict[str, Any]], List[str]],
+) -> Iterator[List[str]]:
+    """Format ``items`` into rows lazily, checking each has ``column_count`` values."""
+    for item in items:
+        row_data = row_formatter_func(item)
+        if len(row_data) != column_count:
+            raise ValueError("Row data must match column count")
+        yield row_data
+
+
+def output_delimited_items(
+    items: List[Dict[str, Any]],
+    output_format: str,
+    headers: Optional[List[str]] = None,
+    row_formatter_func: Optional[Callable[[Dict[str, Any]], List[str]]] = None,
+) -> None:
+    """Write items as CSV or TSV using the table columns.
+
+    Without a row formatter every top-level field of the items becomes a column.
+    """
+    if row_formatter_func is None or not headers:
+        keys = list(dict.fromkeys(key for item in items for key in item))
+        headers, _, row_formatter_func = fields_table(keys)
+    output_delimited(
+        headers, formatted_rows(items, len(headers), row_formatter_func), output_format
+    )
+
 
 def output_formatted_list(
     items: List[Dict[str, Any]],
@@ -16,17 +88,21 @@ def output_formatted_list(
     empty_message: str = "No items found.",
     total_label: str = "item(s)",
 ) -> None:
-    """Handle JSON and table output with Rich-backed table rendering.
+    """Handle JSON, CSV/TSV and table output with Rich-backed table rendering.
 
     Args:
         items: List of items to output
-        output_format: 'json' or 'table'
+        output_format: 'json', 'csv', 'tsv' or 'table'
         headers: List of header names for table output
         column_widths: List of column widths for table formatting
         row_formatter_func: Function that converts item to list of column values
         empty_message: Message to display when no items are found
         total_label: Label for total count (e.g., "configuration(s)", "template(s)")
     """
+    if is_delimited_format(output_format):
+        output_delimited_items(items, output_format, headers, row_formatter_func)
+        return
+
     if not items:
         if output_format.lower() == "json":
             click.echo("[]")
@@ -41,13 +117,7 @@ def output_formatted_list(
     if len(headers) != len(column_widths):
         raise ValueError("Headers and column_widths must have the same length")
 
-    rows = []
-    for item in items:
-        row_data = row_formatter_func(item)
-        if len(row_data) != len(column_widths):
-            raise ValueError("Row data must match column count")
-        rows.append(row_data)
-
+    rows = formatted_rows(items, len(column_widths), row_formatter_func)
     render_table(headers, column_widths, rows, show_total=True, total_label=total_label)
 
 
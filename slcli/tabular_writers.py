@@ -0,0 +1,204 @@
+"""Streaming readers and writers for tabular export files.
+
+Rows are written one at a time so exports of any size need constant memory.
+CSV and JSON Lines use the standard library; Parquet and Arrow IPC require the
+optional ``pyarrow`` package and buffer at most one record batch at a time.
+"""
+
+import codecs
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, IO, Iterable, Iterator, List, Optional, Sequence
+
+TABULAR_FORMATS = ("csv", "jsonl", "parquet", "arrow")
+
+TABULAR_EXTENSIONS = {
+    "csv": ".csv",
+    "jsonl": ".jsonl",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+PYARROW_INSTALL_HINT = (
+    "✗ The 'pyarrow' package is required for Parquet and Arrow output.\n"
+    "  Install it with: pip install pyarrow"
+)
+
+_PARQUET_BATCH_ROWS = 10000
+
+
+class TabularWriter(ABC):
+    """Base class for row writers with a fixed column list."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        """Create a writer for ``columns``."""
+        self.columns = list(columns)
+        self.rows_written = 0
+
+    @abstractmethod
+    def write_row(self, values: Sequence[Any]) -> None:
+        """Write one row whose values line up with :attr:`columns`."""
+
+    def close(self) -> None:
+        """Flush and close the output."""
+
+    def __enter__(self) -> "TabularWriter":
+        """Return the writer for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the writer."""
+        self.close()
+
+
+class CsvRowWriter(TabularWriter):
+    """Write rows as CSV with a header line."""
+
+    def __init__(self, path: Path, columns: Sequence[str]) -> None:
+        """Open ``path`` and write the header."""
+        super().__init__(columns)
+        self._file: IO[str] = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """Write one CSV record."""
+        self._writer.writerow(values)
+        self.rows_written += 1
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class JsonlRowWriter(TabularWriter):
+    """Write rows as JSON Lines objects keyed by column name."""
+
+    def __init__(self, path: Path, columns: Sequence[str]) -> None:
+        """Open ``path`` for writing."""
+        super().__init__(columns)
+        self._file: IO[str] = open(path, "w", encoding="utf-8", newline="\n")
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """Write one JSON object on its own line."""
+        record = dict(zip(self.columns, values))
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._file.write("\n")
+        self.rows_written += 1
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class _PyArrowRowWriter(TabularWriter):
+    """Buffer rows as string columns and write them to a pyarrow sink in batches."""
+
+    def __init__(
+        self, path: Path, columns: Sequence[str], batch_rows: int = _PARQUET_BATCH_ROWS
+    ) -> None:
+        """Open the sink for ``path``.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+        """
+        super().__init__(columns)
+        import pyarrow as pa  # type: ignore[import-not-found]
+
+        self._pa = pa
+        self._schema = pa.schema([(name, pa.string()) for name in self.columns])
+        self._writer = self._open_sink(path)
+        self._batch_rows = batch_rows
+        self._batch: List[List[Optional[str]]] = [[] for _ in self.columns]
+        self._pending = 0
+
+    @abstractmethod
+    def _open_sink(self, path: Path) -> Any:
+        """Return an object with ``write_table`` and ``close`` methods."""
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """Buffer one row and flush a batch when it is full."""
+        for index in range(len(self.columns)):
+            value = values[index] if index < len(values) else None
+            self._batch[index].append(None if value is None else str(value))
+        self._pending += 1
+        self.rows_written += 1
+        if self._pending >= self._batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered rows as one batch."""
+        if not self._pending:
+            return
+        arrays = [self._pa.array(column, type=self._pa.string()) for column in self._batch]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+        self._batch = [[] for _ in self.columns]
+        self._pending = 0
+
+    def close(self) -> None:
+        """Flush the last batch and close the file."""
+        self._flush()
+        self._writer.close()
+
+
+class ParquetRowWriter(_PyArrowRowWriter):
+    """Write rows to a Parquet file as string columns, one row group per batch."""
+
+    def _open_sink(self, path: Path) -> Any:
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        return pq.ParquetWriter(str(path), self._schema)
+
+
+class ArrowRowWriter(_PyArrowRowWriter):
+    """Write rows to an Arrow IPC file as string columns, one record batch per batch."""
+
+    def _open_sink(self, path: Path) -> Any:
+        return self._pa.ipc.new_file(str(path), self._schema)
+
+
+def open_tabular_writer(path: Path, file_format: str, columns: Sequence[str]) -> TabularWriter:
+    """Open a row writer for one of :data:`TABULAR_FORMATS`.
+
+    Raises:
+        ValueError: If the format is not supported.
+        ImportError: If Parquet or Arrow is requested and ``pyarrow`` is not installed.
+    """
+    file_format = file_format.lower()
+    if file_format == "csv":
+        return CsvRowWriter(path, columns)
+    if file_format == "jsonl":
+        return JsonlRowWriter(path, columns)
+    if file_format == "parquet":
+        return ParquetRowWriter(path, columns)
+    if file_format == "arrow":
+        return ArrowRowWriter(path, columns)
+    raise ValueError(f"Unsupported tabular format: {file_format}")
+
+
+def iter_text_lines(chunks: Iterable[bytes], encoding: str = "utf-8-sig") -> Iterator[str]:
+    """Decode a byte stream incrementally and yield lines with their endings.
+
+    Lines are split on ``\\n`` only, so carriage returns and Unicode line
+    separators inside CSV fields are passed through untouched.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        end = buffer.rfind("\n")
+        if end < 0:
+            continue
+        complete, buffer = buffer[: end + 1], buffer[end + 1 :]
+        for line in complete[:-1].split("\n"):
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def iter_csv_rows(chunks: Iterable[bytes], encoding: str = "utf-8-sig") -> Iterator[List[str]]:
+    """Parse CSV records from a byte stream without buffering the whole body."""
+    yield from csv.reader(iter_text_lines(chunks, encoding))
@@ -4,17 +4,20 @@ Provides CLI commands for creating, reading, updating, deleting, and managing
 tag values. All tag operations are scoped to workspaces with proper error handling.
 """
 
+import datetime
 import json
 import math
 import shutil
 import sys
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import click
 import questionary
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -22,10 +25,14 @@ from .utils import (
     get_base_url,
     handle_api_error,
     make_api_request,
+    pooled_http_session,
 )
 from .workspace_utils import resolve_workspace_id
 
 _TAG_HISTORY_GRAPH_HEIGHT = 6
+_TAG_HISTORY_PAGE_SIZE = 10000
+_TAG_WATCH_PAGE_SIZE = 1000
+_TAG_WATCH_BACKOFF_FACTOR = 1.5
 
 
 def _tag_formatter(item: Dict[str, Any]) -> List[str]:
@@ -87,14 +94,158 @@ def _tag_history_numeric_value(item: Dict[str, Any]) -> Optional[float]:
     return numeric_value if math.isfinite(numeric_value) else None
 
 
-def _downsample_history(values: List[float], width: int) -> List[float]:
-    """Downsample values to fit the available graph width."""
-    if len(values) <= width:
-        return values
-    if width <= 1:
-        return [values[-1]]
+def _triangle_area(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Return twice the area of the triangle spanned by three points."""
+    return abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
 
-    return [values[round(index * (len(values) - 1) / (width - 1))] for index in range(width)]
+
+class _HistoryDecimator:
+    """Stream numeric samples into a fixed number of min/max envelope columns.
+
+    Samples are folded into at most ``2 * width`` buckets whose size doubles
+    whenever the buckets fill up, so memory stays O(width) no matter how many
+    history pages are consumed. Each bucket keeps its min/max envelope, and
+    :meth:`columns` picks one representative point per column with
+    Largest-Triangle-Three-Buckets so spikes survive decimation.
+    """
+
+    def __init__(self, width: int) -> None:
+        """Create a decimator producing at most ``width`` columns."""
+        self._width = max(width, 1)
+        self._capacity = self._width * 2
+        self._bucket_size = 1
+        self._consumed = 0
+        self._pending = array("d")
+        self._starts = array("q")
+        self._counts = array("q")
+        self._sums = array("d")
+        self._lows = array("d")
+        self._highs = array("d")
+        self._low_positions = array("q")
+        self._high_positions = array("q")
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def extend(self, values: "array[float]") -> None:
+        """Consume the next page of samples in arrival order."""
+        if not values:
+            return
+
+        self.count += len(values)
+        self.minimum = min(self.minimum, min(values))
+        self.maximum = max(self.maximum, max(values))
+        self._pending.extend(values)
+
+        offset = 0
+        while len(self._pending) - offset >= self._bucket_size:
+            size = self._bucket_size
+            self._append_bucket(self._pending[offset : offset + size])
+            offset += size
+            if len(self._counts) >= self._capacity:
+                self._merge_bucket_pairs()
+        del self._pending[:offset]
+
+    def _append_bucket(self, chunk: "array[float]") -> None:
+        """Summarize a contiguous chunk of samples as one bucket."""
+        low = min(chunk)
+        high = max(chunk)
+        self._starts.append(self._consumed)
+        self._counts.append(len(chunk))
+        self._sums.append(math.fsum(chunk))
+        self._lows.append(low)
+        self._highs.append(high)
+        self._low_positions.append(self._consumed + chunk.index(low))
+        self._high_positions.append(self._consumed + chunk.index(high))
+        self._consumed += len(chunk)
+
+    def _merge_bucket_pairs(self) -> None:
+        """Halve the bucket count by merging adjacent buckets."""
+        starts, counts, sums = array("q"), array("q"), array("d")
+        lows, highs = array("d"), array("d")
+        low_positions, high_positions = array("q"), array("q")
+        for index in range(0, len(self._counts) - 1, 2):
+            other = index + 1
+            starts.append(self._starts[index])
+            counts.append(self._counts[index] + self._counts[other])
+            sums.append(self._sums[index] + self._sums[other])
+            low_index = index if self._lows[index] <= self._lows[other] else other
+            high_index = index if self._highs[index] >= self._highs[other] else other
+            lows.append(self._lows[low_index])
+            low_positions.append(self._low_positions[low_index])
+            highs.append(self._highs[high_index])
+            high_positions.append(self._high_positions[high_index])
+
+        self._starts, self._counts, self._sums = starts, counts, sums
+        self._lows, self._highs = lows, highs
+        self._low_positions, self._high_positions = low_positions, high_positions
+        self._bucket_size *= 2
+
+    def columns(self, reverse: bool = False) -> List[Tuple[float, float, float]]:
+        """Return ``(point, low, high)`` per column.
+
+        Args:
+            reverse: Emit columns in reverse arrival order, e.g. to turn
+                newest-first history into chronological order.
+
+        Returns:
+            One tuple per graph column. ``point`` is the LTTB-selected sample
+            and is always one of the column's envelope bounds.
+        """
+        if self._pending:
+            self._append_bucket(self._pending)
+            self._pending = array("d")
+
+        bucket_count = len(self._counts)
+        column_count = min(self._width, bucket_count)
+        envelopes: List[Tuple[float, float, float, float, float, float]] = []
+        for column in range(column_count):
+            first = column * bucket_count // column_count
+            last = (column + 1) * bucket_count // column_count
+            low_index = min(range(first, last), key=self._lows.__getitem__)
+            high_index = max(range(first, last), key=self._highs.__getitem__)
+            count = sum(self._counts[first:last])
+            start = self._starts[first]
+            envelopes.append(
+                (
+                    self._position(self._low_positions[low_index], reverse),
+                    self._lows[low_index],
+                    self._position(self._high_positions[high_index], reverse),
+                    self._highs[high_index],
+                    self._position(start + (count - 1) / 2, reverse),
+                    math.fsum(self._sums[first:last]) / count,
+                )
+            )
+        if reverse:
+            envelopes.reverse()
+
+        selected: List[Tuple[float, float, float]] = []
+        previous_x, previous_y = (envelopes[0][4], envelopes[0][5]) if envelopes else (0.0, 0.0)
+        for column, (low_x, low, high_x, high, mean_x, mean_y) in enumerate(envelopes):
+            next_x, next_y = (
+                envelopes[column + 1][4:6] if column + 1 < len(envelopes) else (mean_x, mean_y)
+            )
+
+            high_score = (
+                _triangle_area(previous_x, previous_y, high_x, high, next_x, next_y),
+                abs(high - mean_y),
+            )
+            low_score = (
+                _triangle_area(previous_x, previous_y, low_x, low, next_x, next_y),
+                abs(low - mean_y),
+            )
+            if high_score >= low_score:
+                point_x, point = high_x, high
+            else:
+                point_x, point = low_x, low
+            selected.append((point, low, high))
+            previous_x, previous_y = point_x, point
+
+        return selected
+
+    def _position(self, position: float, reverse: bool) -> float:
+        """Map an arrival position onto the output x axis."""
+        return self.count - 1 - position if reverse else position
 
 
 def _format_graph_value(value: float) -> str:
@@ -103,55 +254,70 @@ def _format_graph_value(value: float) -> str:
 
 
 def _render_tag_history_graph(
-    tag_path: str, workspace_label: str, history: List[Dict[str, Any]]
+    tag_path: str, workspace_label: str, pages: Iterable[List[Dict[str, Any]]]
 ) -> None:
-    """Render numeric tag history as a terminal sparkline."""
-    if not history:
-        click.echo(f"No tag history found in workspace '{workspace_label}'")
-        return
+    """Render numeric tag history as a terminal sparkline.
 
-    chronological_history = list(reversed(history))
-    numeric_values = [_tag_history_numeric_value(item) for item in chronological_history]
-    if any(value is None for value in numeric_values):
-        click.echo(
-            f"Cannot graph non-numeric tag history for '{tag_path}' "
-            f"in workspace '{workspace_label}'."
-        )
-        click.echo("Run without --graph to view the history table.")
-        return
-
-    values = [value for value in numeric_values if value is not None]
-    minimum = min(values)
-    maximum = max(values)
-    latest = values[-1]
+    History pages arrive most recent first and are decimated as they stream
+    in, so only one page plus the graph columns are held in memory. Each
+    column shows its min/max envelope with the LTTB-selected point on top.
+    """
     terminal_width = max(shutil.get_terminal_size().columns, 1)
-    graph_width = max(1, min(len(values), terminal_width - 16))
-    graph_values = _downsample_history(values, graph_width)
-    value_range = maximum - minimum
-    point_rows = [
-        (
-            _TAG_HISTORY_GRAPH_HEIGHT // 2
-            if value_range == 0
-            else round((maximum - value) / value_range * (_TAG_HISTORY_GRAPH_HEIGHT - 1))
-        )
-        for value in graph_values
-    ]
-    graph_rows = [[" "] * len(graph_values) for _ in range(_TAG_HISTORY_GRAPH_HEIGHT)]
-    for index, point_row in enumerate(point_rows):
-        graph_rows[point_row][index] = "●"
-        if index == 0:
-            continue
+    decimator = _HistoryDecimator(max(1, terminal_width - 16))
+    latest = 0.0
+    first_timestamp: Any = "N/A"
+    last_timestamp: Any = "N/A"
 
-        previous_row = point_rows[index - 1]
-        if previous_row == point_row:
+    for page in pages:
+        if not page:
             continue
+        values = array("d")
+        for item in page:
+            numeric_value = _tag_history_numeric_value(item)
+            if numeric_value is None:
+                click.echo(
+                    f"Cannot graph non-numeric tag history for '{tag_path}' "
+                    f"in workspace '{workspace_label}'."
+                )
+                click.echo("Run without --graph to view the history table.")
+                return
+            values.append(numeric_value)
+
+        if decimator.count == 0:
+            latest = values[0]
+            last_timestamp = page[0].get("timestamp", "N/A")
+        first_timestamp = page[-1].get("timestamp", "N/A")
+        decimator.extend(values)
+
+    if decimator.count == 0:
+        click.echo(f"No tag history found in workspace '{workspace_label}'")
+        return
 
-        step = 1 if point_row > previous_row else -1
-        for row in range(previous_row + step, point_row, step):
+    minimum = decimator.minimum
+    maximum = decimator.maximum
+    columns = decimator.columns(reverse=True)
+    value_range = maximum - minimum
+
+    def value_row(value: float) -> int:
+        if value_range == 0:
+            return _TAG_HISTORY_GRAPH_HEIGHT // 2
+        return round((maximum - value) / value_range * (_TAG_HISTORY_GRAPH_HEIGHT - 1))
+
+    graph_rows = [[" "] * len(columns) for _ in range(_TAG_HISTORY_GRAPH_HEIGHT)]
+    previous_row: Optional[int] = None
+    for index, (point, low, high) in enumerate(columns):
+        point_row = value_row(point)
+        top_row = value_row(high)
+        bottom_row = value_row(low)
+        if previous_row is not None and previous_row != point_row:
+            step = 1 if point_row > previous_row else -1
+            top_row = min(top_row, previous_row + step)
+            bottom_row = max(bottom_row, previous_row + step)
+        for row in range(top_row, bottom_row + 1):
             graph_rows[row][index] = "│"
+        graph_rows[point_row][index] = "●"
+        previous_row = point_row
 
-    first_timestamp = chronological_history[0].get("timestamp", "N/A")
-    last_timestamp = chronological_history[-1].get("timestamp", "N/A")
     click.echo(f"Tag history graph for '{tag_path}'")
     click.echo(f"Workspace: {workspace_label}")
     click.echo(f"Range: {first_timestamp} to {last_timestamp}")
@@ -169,8 +335,14 @@ def _render_tag_history_graph(
             row_value = maximum - value_range * row / (_TAG_HISTORY_GRAPH_HEIGHT - 1)
             row_label = _format_graph_value(row_value)
         click.echo(f"  {row_label:>8} ┤{''.join(graph_row)}")
-    click.echo(f"  {_format_graph_value(minimum):>8} └{'─' * len(graph_values)}")
-    click.echo(f"  oldest{' ' * max(len(graph_values) - 12, 1)}newest")
+    click.echo(f"  {_format_graph_value(minimum):>8} └{'─' * len(columns)}")
+    if decimator.count > len(columns):
+        click.echo(
+            f"  oldest{' ' * max(len(columns) - 12, 1)}newest  "
+            f"({decimator.count} samples, min/max per column)"
+        )
+    else:
+        click.echo(f"  oldest{' ' * max(len(columns) - 12, 1)}newest")
 
 
 def _calculate_column_widths() -> List[int]:
@@ -285,16 +457,23 @@ def _detect_value_type(value_str: str) -> Tuple[Any, str]:
     return value_str, "STRING"
 
 
-def _get_tag_history(tag_path: str, workspace_id: Optional[str], take: int) -> List[Dict[str, Any]]:
-    """Fetch historical values for a tag.
+def _query_tag_history_page(
+    tag_path: str,
+    workspace_id: Optional[str],
+    take: int,
+    continuation_token: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Fetch one page of historical values for a tag.
 
     Args:
         tag_path: Tag path.
         workspace_id: Optional workspace ID.
         take: Maximum number of history entries to return.
+        continuation_token: Token from a previous page, if any.
 
     Returns:
-        Historical tag value dictionaries, most recent first.
+        Tuple of (historical tag value dictionaries, most recent first,
+        continuation token for the next page).
     """
     query_payload: Dict[str, Any] = {
         "path": tag_path,
@@ -305,18 +484,23 @@ def _get_tag_history(tag_path: str, workspace_id: Optional[str], take: int) -> L
     }
     if workspace_id:
         query_payload["workspace"] = workspace_id
+    if continuation_token:
+        query_payload["continuationToken"] = continuation_token
 
     url = f"{get_base_url()}/nitaghistorian/v2/tags/query-history"
     resp = make_api_request("POST", url, payload=query_payload)
     data = resp.json()
 
     if isinstance(data, list):
-        return [item for item in data if isinstance(item, dict)]
+        return [item for item in data if isinstance(item, dict)], None
 
     if not isinstance(data, dict):
-        return []
+        return [], None
 
     value_type = data.get("type")
+    next_token = data.get("continuationToken")
+    if not isinstance(next_token, str):
+        next_token = None
 
     def normalize_entries(entries: Any) -> List[Dict[str, Any]]:
         if not isinstance(entries, list):
@@ -333,9 +517,121 @@ def _get_tag_history(tag_path: str, workspace_id: Optional[str], take: int) -> L
     for key in ("values", "history", "tagsWithAggregates", "data"):
         entries = data.get(key)
         if isinstance(entries, list):
-            return normalize_entries(entries)
+            return normalize_entries(entries), next_token
+
+    return [], next_token
+
+
+def _get_tag_history(tag_path: str, workspace_id: Optional[str], take: int) -> List[Dict[str, Any]]:
+    """Fetch historical values for a tag.
 
-    return []
+    Args:
+        tag_path: Tag path.
+        workspace_id: Optional workspace ID.
+        take: Maximum number of history entries to return.
+
+    Returns:
+        Historical tag value dictionaries, most recent first.
+    """
+    entries, _ = _query_tag_history_page(tag_path, workspace_id, take)
+    return entries
+
+
+def _iter_tag_history_pages(
+    tag_path: str, workspace_id: Optional[str], take: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of historical values for a tag, most recent first.
+
+    Args:
+        tag_path: Tag path.
+        workspace_id: Optional workspace ID.
+        take: Maximum total number of history entries to yield.
+
+    Yields:
+        Pages of at most ``_TAG_HISTORY_PAGE_SIZE`` history entries.
+    """
+    remaining = take
+    continuation_token: Optional[str] = None
+    while remaining > 0:
+        entries, continuation_token = _query_tag_history_page(
+            tag_path,
+            workspace_id,
+            min(remaining, _TAG_HISTORY_PAGE_SIZE),
+            continuation_token,
+        )
+        entries = entries[:remaining]
+        if entries:
+            yield entries
+        remaining -= len(entries)
+        if not entries or not continuation_token:
+            break
+
+
+def _build_tag_watch_filter(tag_paths: Tuple[str, ...], workspace_id: Optional[str]) -> str:
+    """Build one query-tags-with-values filter covering every watched path.
+
+    Args:
+        tag_paths: Exact tag paths or ``*`` glob patterns.
+        workspace_id: Optional workspace ID.
+
+    Returns:
+        Filter expression matching all watched tags.
+    """
+    path_filters = [f'path = "{_escape_query_value(path)}"' for path in tag_paths]
+    path_filter = path_filters[0] if len(path_filters) == 1 else f"({' || '.join(path_filters)})"
+    if workspace_id:
+        return f'workspace = "{workspace_id}" && {path_filter}'
+    return path_filter
+
+
+def _query_watched_tags(query_filter: str) -> List[Dict[str, Any]]:
+    """Fetch current values for every tag matching the watch filter.
+
+    Args:
+        query_filter: Filter built by :func:`_build_tag_watch_filter`.
+
+    Returns:
+        TagWithValue dictionaries across all result pages.
+    """
+    url = f"{get_base_url()}/nitag/v2/query-tags-with-values"
+    query_params: Dict[str, Any] = {"filter": query_filter, "take": _TAG_WATCH_PAGE_SIZE}
+    tags: List[Dict[str, Any]] = []
+    while True:
+        data = make_api_request("POST", url, payload=query_params).json()
+        tags.extend(item for item in data.get("tagsWithValues", []) if isinstance(item, dict))
+        continuation_token = data.get("continuationToken")
+        if not continuation_token:
+            return tags
+        query_params["continuationToken"] = continuation_token
+
+
+def _tag_watch_record(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Flatten a TagWithValue into a watch event, if it has a current value."""
+    tag_data = item.get("tag", item)
+    current = item.get("current") or {}
+    value_obj = current.get("value")
+    if not isinstance(value_obj, dict) or not tag_data.get("path"):
+        return None
+
+    timestamp = current.get("timestamp") or datetime.datetime.now(datetime.timezone.utc).isoformat(
+        timespec="milliseconds"
+    )
+    return {
+        "timestamp": timestamp,
+        "path": tag_data.get("path"),
+        "workspace": tag_data.get("workspace"),
+        "type": value_obj.get("type", tag_data.get("type")),
+        "value": value_obj.get("value"),
+    }
+
+
+def _next_watch_interval(
+    current_interval: float, base_interval: float, max_interval: float, changed: bool
+) -> float:
+    """Reset the poll interval on change, otherwise back off toward the maximum."""
+    if changed:
+        return base_interval
+    return min(current_interval * _TAG_WATCH_BACKOFF_FACTOR, max_interval)
 
 
 def register_tag_commands(cli: Any) -> None:
@@ -357,7 +653,7 @@ def register_tag_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -542,13 +838,16 @@ def register_tag_commands(cli: Any) -> None:
 
         try:
             ws_id = resolve_workspace_id(workspace)
-            history = _get_tag_history(tag_path, ws_id, take)
             workspace_label = ws_id or workspace or "default workspace"
 
             if graph:
-                _render_tag_history_graph(tag_path, workspace_label, history)
+                _render_tag_history_graph(
+                    tag_path, workspace_label, _iter_tag_history_pages(tag_path, ws_id, take)
+                )
                 return
 
+            history = _get_tag_history(tag_path, ws_id, take)
+
             history_resp = FilteredResponse({"values": history})
 
             UniversalResponseHandler.handle_list_response(
@@ -1036,3 +1335,94 @@ def register_tag_commands(cli: Any) -> None:
 
         except Exception as exc:
             handle_api_error(exc)
+
+    @tag.command(name="watch")
+    @click.argument("tag_paths", nargs=-1, required=True)
+    @click.option(
+        "--workspace",
+        "-w",
+        type=str,
+        default=None,
+        help="Workspace ID or name (defaults to default workspace)",
+    )
+    @click.option(
+        "--interval",
+        type=click.FloatRange(min=0.1),
+        default=1.0,
+        show_default=True,
+        help="Seconds between polls while values are changing",
+    )
+    @click.option(
+        "--max-interval",
+        type=click.FloatRange(min=0.1),
+        default=30.0,
+        show_default=True,
+        help="Upper bound for the poll interval when nothing changes",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format (json emits one JSON object per line)",
+    )
+    @click.option("--once", is_flag=True, help="Print the current values once and exit")
+    def watch_tags(
+        tag_paths: Tuple[str, ...],
+        workspace: Optional[str],
+        interval: float,
+        max_interval: float,
+        format: str,
+        once: bool,
+    ) -> None:
+        """Follow tag values and print changes until Ctrl+C.
+
+        TAG_PATHS are tag paths or '*' glob patterns. All watched tags are read
+        with a single batched query per poll; only values that changed since the
+        previous poll are printed. The poll interval backs off when nothing
+        changes and resets as soon as a value changes.
+        """
+        validate_output_format(format)
+        max_interval = max(max_interval, interval)
+
+        try:
+            ws_id = resolve_workspace_id(workspace)
+            query_filter = _build_tag_watch_filter(tag_paths, ws_id)
+            last_values: Dict[Tuple[Any, Any], Tuple[Any, Any]] = {}
+            current_interval = interval
+            path_width = max(30, max(len(path) for path in tag_paths))
+            if format == "table":
+                click.echo(f"{'Timestamp':<28}  {'Path':<{path_width}}  {'Value':<20}  Type")
+
+            with pooled_http_session():
+                while True:
+                    changed = False
+                    for item in _query_watched_tags(query_filter):
+                        record = _tag_watch_record(item)
+                        if record is None:
+                            continue
+                        key = (record["workspace"], record["path"])
+                        observed = (record["value"], record["type"])
+                        if last_values.get(key) == observed:
+                            continue
+                        last_values[key] = observed
+                        changed = True
+                        if format == "json":
+                            click.echo(json.dumps(record))
+                        else:
+                            click.echo(
+                                f"{record['timestamp']:<28}  {record['path']:<{path_width}}  "
+                                f"{str(record['value']):<20}  {record['type'] or ''}"
+                            )
+
+                    if once:
+                        break
+                    current_interval = _next_watch_interval(
+                        current_interval, interval, max_interval, changed
+                    )
+                    time.sleep(current_interval)
+        except KeyboardInterrupt:
+            click.echo("\nTag watch stopped.")
+        except Exception as exc:
+            handle_api_error(exc)
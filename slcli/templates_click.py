@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 import click
 import questionary
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .platform import require_feature
 from .universal_handlers import UniversalResponseHandler, FilteredResponse
 from .utils import (
@@ -285,7 +285,7 @@ def register_templates_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -318,7 +318,7 @@ def register_templates_commands(cli: Any) -> None:
                 workspace_id,
                 workspace_map,
                 filter_text,
-                max_items=take if format_output.lower() == "json" else None,
+                max_items=take if format_output.lower() != "table" else None,
             )
 
             # Create a mock response with all data
@@ -0,0 +1,250 @@
+"""Streaming analytics over Test Monitor results.
+
+Result pages are converted to compact columns and folded into running
+aggregates page by page, so the full result set is never held in memory.
+Group keys are dictionary-encoded to small integers and each page is
+aggregated column-at-a-time with :class:`collections.Counter`, which does the
+counting in C. Durations are kept per group in ``array('d')`` buffers (8 bytes
+per result) so percentiles are exact.
+"""
+
+import math
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+ANALYTICS_FIELDS = {
+    "status": "status.statusType",
+    "programName": "programName",
+    "partNumber": "partNumber",
+    "serialNumber": "serialNumber",
+    "operator": "operator",
+    "hostName": "hostName",
+    "systemId": "systemId",
+    "workspace": "workspace",
+    "day": "startedAt",
+}
+
+FAILED_STATUSES = frozenset({"FAILED", "ERRORED", "TERMINATED", "TIMEDOUT"})
+PERCENTILES = (50, 90, 95, 99)
+
+_MISSING = "N/A"
+
+GroupKey = Tuple[int, ...]
+
+
+def _field_value(result: Dict[str, Any], field: str) -> str:
+    """Return one grouping value of a result as a string."""
+    if field == "day":
+        started = result.get("startedAt")
+        return str(started)[:10] if started else _MISSING
+    if field == "status":
+        status = result.get("status")
+        value = status.get("statusType") if isinstance(status, dict) else status
+    else:
+        value = result.get(ANALYTICS_FIELDS[field])
+    return _MISSING if value is None or value == "" else str(value)
+
+
+def _duration(result: Dict[str, Any]) -> float:
+    """Return the result duration in seconds, or NaN when it is unknown."""
+    value = result.get("totalTimeInSeconds")
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Return a percentile of pre-sorted values using linear interpolation."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class _Dictionary:
+    """Map strings to dense integer codes."""
+
+    def __init__(self) -> None:
+        """Create an empty dictionary."""
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, values: Iterable[str]) -> "array[int]":
+        """Return the codes of ``values``, assigning new codes as needed."""
+        codes = self.codes
+        encoded = array("I")
+        for value in values:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self.values)
+                self.values.append(value)
+            encoded.append(code)
+        return encoded
+
+
+class ResultColumns:
+    """One page of results as dictionary-encoded columns."""
+
+    def __init__(
+        self,
+        results: Sequence[Dict[str, Any]],
+        group_fields: Sequence[str],
+        dictionaries: Dict[str, _Dictionary],
+    ) -> None:
+        """Extract the columns needed for analytics from ``results``."""
+        self.keys: List["array[int]"] = [
+            dictionaries[field].encode(_field_value(result, field) for result in results)
+            for field in group_fields
+        ]
+        statuses = [_field_value(result, "status") for result in results]
+        self.passed = array("B", (status == "PASSED" for status in statuses))
+        self.failed = array("B", (status in FAILED_STATUSES for status in statuses))
+        self.serials = dictionaries["serialNumber"].encode(
+            _field_value(result, "serialNumber") for result in results
+        )
+        self.started = [str(result.get("startedAt") or "") for result in results]
+        self.durations = array("d", (_duration(result) for result in results))
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.passed)
+
+    def group_keys(self) -> List[GroupKey]:
+        """Return the combined group key of every row."""
+        if not self.keys:
+            return [()] * len(self)
+        return list(zip(*self.keys))
+
+
+class ResultAnalytics:
+    """Running group-by, yield, duration and failure Pareto aggregates."""
+
+    def __init__(self, group_by: Sequence[str], pareto_by: str) -> None:
+        """Create empty aggregates.
+
+        Args:
+            group_by: Fields from :data:`ANALYTICS_FIELDS` to group by (may be empty).
+            pareto_by: Field whose values rank failures in the Pareto.
+
+        Raises:
+            ValueError: If a field is not in :data:`ANALYTICS_FIELDS`.
+        """
+        for field in (*group_by, pareto_by):
+            if field not in ANALYTICS_FIELDS:
+                raise ValueError(f"Unsupported analytics field: {field}")
+        self.group_by = list(group_by)
+        self.pareto_by = pareto_by
+        self.total = 0
+        self._dictionaries = {
+            field: _Dictionary() for field in {*self.group_by, pareto_by, "serialNumber"}
+        }
+        self._counts: Counter[GroupKey] = Counter()
+        self._passed: Counter[GroupKey] = Counter()
+        self._failed: Counter[GroupKey] = Counter()
+        self._durations: Dict[GroupKey, "array[float]"] = {}
+        self._first_runs: Dict[Tuple[GroupKey, int], Tuple[str, bool]] = {}
+        self._pareto: Counter[int] = Counter()
+
+    def add_page(self, results: Sequence[Dict[str, Any]]) -> None:
+        """Fold one page of results into the aggregates."""
+        if not results:
+            return
+        columns = ResultColumns(results, self.group_by, self._dictionaries)
+        keys = columns.group_keys()
+        self.total += len(columns)
+        self._counts.update(keys)
+        self._passed.update(compress(keys, columns.passed))
+        self._failed.update(compress(keys, columns.failed))
+
+        for key, duration in zip(keys, columns.durations):
+            if not math.isnan(duration):
+                buffer = self._durations.get(key)
+                if buffer is None:
+                    buffer = self._durations[key] = array("d")
+                buffer.append(duration)
+
+        first_runs = self._first_runs
+        for key, serial, started, passed in zip(
+            keys, columns.serials, columns.started, columns.passed
+        ):
+            unit = (key, serial)
+            previous = first_runs.get(unit)
+            if previous is None or started < previous[0]:
+                first_runs[unit] = (started, bool(passed))
+
+        pareto_codes = self._dictionaries[self.pareto_by].encode(
+            _field_value(result, self.pareto_by) for result in results
+        )
+        self._pareto.update(compress(pareto_codes, columns.failed))
+
+    def _decode(self, key: GroupKey) -> Dict[str, str]:
+        """Return the field values of a group key."""
+        return {
+            field: self._dictionaries[field].values[code] for field, code in zip(self.group_by, key)
+        }
+
+    def groups(self) -> List[Dict[str, Any]]:
+        """Return per-group statistics, largest groups first."""
+        units: Counter[GroupKey] = Counter()
+        first_pass: Counter[GroupKey] = Counter()
+        serial_missing = self._dictionaries["serialNumber"].codes.get(_MISSING)
+        for (key, serial), (_, first_passed) in self._first_runs.items():
+            if serial == serial_missing:
+                continue
+            units[key] += 1
+            if first_passed:
+                first_pass[key] += 1
+
+        rows = []
+        for key, count in self._counts.most_common():
+            passed = self._passed[key]
+            failed = self._failed[key]
+            durations = sorted(self._durations.get(key, ()))
+            row: Dict[str, Any] = self._decode(key)
+            row.update(
+                {
+                    "total": count,
+                    "passed": passed,
+                    "failed": failed,
+                    "yield": passed / (passed + failed) if passed + failed else None,
+                    "units": units[key],
+                    "firstPassYield": first_pass[key] / units[key] if units[key] else None,
+                    "duration": {f"p{pct}": percentile(durations, pct) for pct in PERCENTILES},
+                }
+            )
+            rows.append(row)
+        return rows
+
+    def pareto(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return failure counts by :attr:`pareto_by` with cumulative shares."""
+        total_failures = sum(self._pareto.values())
+        values = self._dictionaries[self.pareto_by].values
+        rows = []
+        cumulative = 0
+        for code, failures in self._pareto.most_common(top):
+            cumulative += failures
+            rows.append(
+                {
+                    self.pareto_by: values[code],
+                    "failures": failures,
+                    "percent": failures / total_failures,
+                    "cumulativePercent": cumulative / total_failures,
+                }
+            )
+        return rows
+
+    def summary(self, pareto_top: Optional[int] = None) -> Dict[str, Any]:
+        """Return all aggregates as a JSON-serializable dictionary."""
+        return {
+            "total": self.total,
+            "groupBy": self.group_by,
+            "groups": self.groups(),
+            "paretoBy": self.pareto_by,
+            "pareto": self.pareto(pareto_top),
+        }
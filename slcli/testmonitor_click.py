@@ -3,12 +3,26 @@
 import json
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import click
 import questionary
 
-from .cli_utils import validate_output_format
+from .async_http import ApiCall, run_api_calls
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .field_projection import enum_projection, fields_table, parse_fields, project_items
+from .json_codec import response_json
+from .rich_output import render_table
+from .tabular_writers import PYARROW_INSTALL_HINT, TABULAR_FORMATS
+from .testmonitor_analytics import ANALYTICS_FIELDS, ResultAnalytics
+from .testmonitor_export import (
+    CHECKPOINT_FILE,
+    export_results as run_export,
+    iter_result_pages,
+    PARTITION_CHOICES,
+)
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -24,6 +38,54 @@ from .workspace_utils import (
     resolve_workspace_filter,
 )
 
+# Fields the query-results / query-products projection accepts
+_RESULT_PROJECTION_FIELDS = (
+    "ID",
+    "STATUS",
+    "STARTED_AT",
+    "UPDATED_AT",
+    "PROGRAM_NAME",
+    "SYSTEM_ID",
+    "HOST_NAME",
+    "OPERATOR",
+    "SERIAL_NUMBER",
+    "PART_NUMBER",
+    "KEYWORDS",
+    "PROPERTIES",
+    "FILE_IDS",
+    "DATA_TABLE_IDS",
+    "STATUS_TYPE_SUMMARY",
+    "WORKSPACE",
+    "TOTAL_TIME_IN_SECONDS",
+)
+_PRODUCT_PROJECTION_FIELDS = (
+    "ID",
+    "PART_NUMBER",
+    "NAME",
+    "FAMILY",
+    "UPDATED_AT",
+    "FILE_IDS",
+    "KEYWORDS",
+    "PROPERTIES",
+    "WORKSPACE",
+)
+# Fields the list tables render
+_RESULT_TABLE_PROJECTION = [
+    "STATUS",
+    "PROGRAM_NAME",
+    "PART_NUMBER",
+    "SERIAL_NUMBER",
+    "STARTED_AT",
+    "TOTAL_TIME_IN_SECONDS",
+    "ID",
+]
+_PRODUCT_TABLE_PROJECTION = ["NAME", "PART_NUMBER", "FAMILY", "UPDATED_AT", "WORKSPACE", "ID"]
+
+_FIELDS_HELP = (
+    "Comma-separated fields to return, e.g. id,name,status.statusType "
+    "(sent to the server as a projection)"
+)
+
 
 def _get_testmonitor_base_url() -> str:
     """Get the base URL for the Test Monitor API."""
@@ -114,6 +176,81 @@ def _append_filter(
     substitutions.append(value)
 
 
+def _build_result_filter(
+    status: Optional[str],
+    program_name: Optional[str],
+    serial_number: Optional[str],
+    part_number: Optional[str],
+    operator: Optional[str],
+    host_name: Optional[str],
+    system_id: Optional[str],
+    workspace: Optional[str],
+    filter_query: Optional[str],
+    substitutions: Tuple[str, ...],
+) -> Tuple[Optional[str], List[Any]]:
+    """Build a results filter from the convenience options and --filter.
+
+    Args:
+        status: Status type (e.g., PASSED, FAILED).
+        program_name: Program name (contains match).
+        serial_number: Serial number (contains match).
+        part_number: Part number (contains match).
+        operator: Operator name (contains match).
+        host_name: Host name (contains match).
+        system_id: System ID (exact match).
+        workspace: Workspace name or ID.
+        filter_query: User-provided Dynamic LINQ filter expression.
+        substitutions: Raw substitution values for ``filter_query``.
+
+    Returns:
+        Tuple of combined filter expression and substitutions.
+    """
+    filter_parts: List[str] = []
+    filter_substitutions: List[Any] = []
+
+    if status:
+        normalized_status = status.upper().replace("-", "_")
+        _append_filter(
+            filter_parts,
+            filter_substitutions,
+            "status.statusType == @{index}",
+            normalized_status,
+        )
+
+    _append_filter(
+        filter_parts,
+        filter_substitutions,
+        "programName.Contains(@{index})",
+        program_name,
+    )
+    _append_filter(
+        filter_parts,
+        filter_substitutions,
+        "serialNumber.Contains(@{index})",
+        serial_number,
+    )
+    _append_filter(
+        filter_parts,
+        filter_substitutions,
+        "partNumber.Contains(@{index})",
+        part_number,
+    )
+    _append_filter(filter_parts, filter_substitutions, "operator.Contains(@{index})", operator)
+    _append_filter(filter_parts, filter_substitutions, "hostName.Contains(@{index})", host_name)
+    _append_filter(filter_parts, filter_substitutions, "systemId == @{index}", system_id)
+
+    workspace = get_effective_workspace(workspace)
+    if workspace:
+        workspace_map = get_workspace_map()
+        workspace_id = resolve_workspace_filter(workspace, workspace_map)
+        _append_filter(filter_parts, filter_substitutions, "workspace == @{index}", workspace_id)
+
+    base_filter = " && ".join(filter_parts) if filter_parts else None
+    user_subs = _parse_substitutions(substitutions)
+
+    return _combine_filter_parts(base_filter, filter_substitutions, filter_query, user_subs)
+
+
 def _format_date(value: str) -> str:
     """Format an ISO-8601 date-time as a date string.
 
@@ -144,6 +281,11 @@ def _format_duration(value: Any) -> str:
     return str(value) if value is not None else ""
 
 
+def _format_ratio(value: Optional[float]) -> str:
+    """Format a ratio as a percentage, or an empty string when it is undefined."""
+    return "" if value is None else f"{value:.1%}"
+
+
 def _handle_interactive_pagination(
     fetch_page_func: Any,
     data_key: str,
@@ -259,7 +401,7 @@ def _warn_if_large_dataset(
 
     try:
         resp = make_api_request("POST", url, payload=payload)
-        data = resp.json()
+        data = response_json(resp)
         total_count = data.get("totalCount", 0) if isinstance(data, dict) else 0
 
         if total_count > 10000:
@@ -284,6 +426,7 @@ def _query_all_products(
     order_by: Optional[str],
     descending: bool,
     take: Optional[int] = 10000,
+    projection: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Query products using continuation token pagination.
 
@@ -296,6 +439,7 @@ def _query_all_products(
         descending: Whether to return results in descending order.
         take: Maximum number of items to fetch. Defaults to 10,000 to prevent
               performance issues with very large datasets.
+        projection: Optional list of fields for the server to return.
 
     Returns:
         List of product objects (up to take count).
@@ -328,9 +472,11 @@ def _query_all_products(
                 payload["substitutions"] = substitutions
         if continuation_token:
             payload["continuationToken"] = continuation_token
+        if projection:
+            payload["projection"] = projection
 
         resp = make_api_request("POST", url, payload=payload)
-        data = resp.json()
+        data = response_json(resp)
 
         products = data.get("products", []) if isinstance(data, dict) else []
         all_products.extend(products)
@@ -352,6 +498,7 @@ def _fetch_products_page(
     descending: bool,
     take: int = 25,
     continuation_token: Optional[str] = None,
+    projection: Optional[List[str]] = None,
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """Fetch a single page of products.
 
@@ -362,6 +509,7 @@ def _fetch_products_page(
         descending: Whether to return results in descending order.
         take: Number of items to fetch.
         continuation_token: Optional token to resume from a previous query.
+        projection: Optional list of fields for the server to return.
 
     Returns:
         Tuple of (products list, next continuation token or None).
@@ -380,9 +528,11 @@ def _fetch_products_page(
             payload["substitutions"] = substitutions
     if continuation_token:
         payload["continuationToken"] = continuation_token
+    if projection:
+        payload["projection"] = projection
 
     resp = make_api_request("POST", url, payload=payload)
-    data = resp.json()
+    data = response_json(resp)
 
     products = data.get("products", []) if isinstance(data, dict) else []
     next_token = data.get("continuationToken") if isinstance(data, dict) else None
@@ -399,6 +549,7 @@ def _fetch_results_page(
     descending: bool,
     take: int = 25,
     continuation_token: Optional[str] = None,
+    projection: Optional[List[str]] = None,
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """Fetch a single page of test results.
 
@@ -411,6 +562,7 @@ def _fetch_results_page(
         descending: Whether to return results in descending order.
         take: Number of items to fetch.
         continuation_token: Optional token to resume from a previous query.
+        projection: Optional list of fields for the server to return.
 
     Returns:
         Tuple of (results list, next continuation token or None).
@@ -433,9 +585,11 @@ def _fetch_results_page(
             payload["productSubstitutions"] = product_substitutions
     if continuation_token:
         payload["continuationToken"] = continuation_token
+    if projection:
+        payload["projection"] = projection
 
     resp = make_api_request("POST", url, payload=payload)
-    data = resp.json()
+    data = response_json(resp)
 
     results = data.get("results", []) if isinstance(data, dict) else []
     next_token = data.get("continuationToken") if isinstance(data, dict) else None
@@ -451,6 +605,7 @@ def _query_all_results(
     order_by: Optional[str],
     descending: bool,
     take: Optional[int] = 10000,
+    projection: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Query test results using continuation token pagination.
 
@@ -465,6 +620,7 @@ def _query_all_results(
         descending: Whether to return results in descending order.
         take: Maximum number of items to fetch. Defaults to 10,000 to prevent
               performance issues with very large datasets.
+        projection: Optional list of fields for the server to return.
 
     Returns:
         List of test result objects (up to take count).
@@ -501,9 +657,11 @@ def _query_all_results(
                 payload["productSubstitutions"] = product_substitutions
         if continuation_token:
             payload["continuationToken"] = continuation_token
+        if projection:
+            payload["projection"] = projection
 
         resp = make_api_request("POST", url, payload=payload)
-        data = resp.json()
+        data = response_json(resp)
 
         results = data.get("results", []) if isinstance(data, dict) else []
         all_results.extend(results)
@@ -576,9 +734,9 @@ def _query_counts_by_status(
     ]
 
     url = f"{_get_testmonitor_base_url()}/query-results"
-    counts: Dict[str, int] = {}
+    calls: List[ApiCall] = []
 
-    # Make a query for each status type to get counts
+    # One count query per status type, sent concurrently
     for status in status_types:
         # Build filter combining base filter with status filter
         # Use the same substitution approach as the working --status flag code
@@ -608,14 +766,17 @@ def _query_counts_by_status(
             if product_substitutions:
                 payload["productSubstitutions"] = product_substitutions
 
-        try:
-            resp = make_api_request("POST", url, payload=payload)
-            result_data = resp.json()
-            count = result_data.get("totalCount", 0)
+        calls.append(ApiCall("POST", url, payload))
+
+    counts: Dict[str, int] = {}
+    try:
+        responses = run_api_calls(calls, send=make_api_request)
+        for status, resp in zip(status_types, responses):
+            count = response_json(resp).get("totalCount", 0)
             if count > 0:
                 counts[status] = count
-        except Exception as exc:
-            handle_api_error(exc)
+    except Exception as exc:
+        handle_api_error(exc)
 
     # Return in same format as _summarize_results
     total = sum(counts.values())
@@ -676,37 +837,16 @@ def _summarize_results(
         summary["truncated"] = True
         summary["note"] = f"Results limited to {max_items} items"
 
-    # Group results
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-    if group_by_field:
-        for result in results:
-            # Special case for status field - extract statusType
-            if group_by_field == "status":
-                status_value = result.get("status", {})
-                if isinstance(status_value, dict):
-                    key = str(status_value.get("statusType", "N/A"))
-                else:
-                    key = str(status_value)
-            else:
-                key = str(result.get(group_by_field, "N/A"))
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(result)
-    else:
-        # Default grouping by status
-        for result in results:
-            status_value = result.get("status", {})
-            if isinstance(status_value, dict):
-                status_type = str(status_value.get("statusType", "N/A"))
-            else:
-                status_type = "N/A" if status_value is None else str(status_value)
-            if status_type not in groups:
-                groups[status_type] = []
-            groups[status_type].append(result)
+    # Count results per group; only the counts are reported
+    def _group_key(result: Dict[str, Any]) -> str:
+        if group_by_field and group_by_field != "status":
+            return str(result.get(group_by_field, "N/A"))
+        status_value = result.get("status", {})
+        if isinstance(status_value, dict):
+            return str(status_value.get("statusType", "N/A"))
+        return "N/A" if status_value is None else str(status_value)
 
-    # Calculate statistics per group - store as integers, not dicts
-    for group_key, group_results in groups.items():
-        summary["groups"][group_key] = len(group_results)
+    summary["groups"] = dict(Counter(map(_group_key, results)))
 
     return summary
 
@@ -756,7 +896,7 @@ def register_testmonitor_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -801,6 +941,7 @@ def register_testmonitor_commands(cli: Any) -> None:
         is_flag=True,
         help="Show summary statistics (total count and number of families)",
     )
+    @click.option("--fields", "fields_option", help=_FIELDS_HELP)
     def list_products(
         format: str,
         take: int,
@@ -813,9 +954,11 @@ def register_testmonitor_commands(cli: Any) -> None:
         order_by: Optional[str],
         descending: bool,
         summary: bool,
+        fields_option: Optional[str],
     ) -> None:
         """List products in Test Monitor."""
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
 
         try:
             # Fetch workspace map once for both filter resolution and display
@@ -862,8 +1005,18 @@ def register_testmonitor_commands(cli: Any) -> None:
                     item.get("id", ""),
                 ]
 
-            # If JSON output, fetch up to --take items.
-            if format_output.lower() == "json":
+            headers = ["Name", "Part Number", "Family", "Updated", "Workspace", "ID"]
+            column_widths = [30, 18, 16, 12, 20, 36]
+            formatter: Callable[[Dict[str, Any]], List[str]] = product_formatter
+            projection: Optional[List[str]] = _PRODUCT_TABLE_PROJECTION
+            if fields:
+                headers, column_widths, formatter = fields_table(fields)
+                projection = enum_projection(fields, _PRODUCT_PROJECTION_FIELDS)
+            elif format_output.lower() == "json":
+                projection = None
+
+            # For JSON and delimited output, fetch up to --take items.
+            if format_output.lower() != "table":
                 # Check total count first to warn about large datasets
                 _warn_if_large_dataset(
                     endpoint="query-products",
@@ -875,7 +1028,12 @@ def register_testmonitor_commands(cli: Any) -> None:
                     descending=descending,
                 )
                 products = _query_all_products(
-                    filter_expr, merged_subs, order_by, descending, take=take
+                    filter_expr,
+                    merged_subs,
+                    order_by,
+                    descending,
+                    take=take,
+                    projection=None if summary else projection,
                 )
 
                 # Handle --summary flag for JSON output
@@ -883,15 +1041,15 @@ def register_testmonitor_commands(cli: Any) -> None:
                     summary_stats = _summarize_products(products, max_items=10000)
                     click.echo(json.dumps(summary_stats, indent=2))
                 else:
-                    mock_resp: Any = FilteredResponse({"products": products})
+                    mock_resp: Any = FilteredResponse({"products": project_items(products, fields)})
                     UniversalResponseHandler.handle_list_response(
                         resp=mock_resp,
                         data_key="products",
                         item_name="product",
                         format_output=format_output,
-                        formatter_func=product_formatter,
-                        headers=["Name", "Part Number", "Family", "Updated", "Workspace", "ID"],
-                        column_widths=[30, 18, 16, 12, 20, 36],
+                        formatter_func=formatter,
+                        headers=headers,
+                        column_widths=column_widths,
                         empty_message="No products found.",
                         enable_pagination=False,
                         page_size=take,
@@ -902,7 +1060,7 @@ def register_testmonitor_commands(cli: Any) -> None:
                     cont: Optional[str] = None,
                 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
                     return _fetch_products_page(
-                        filter_expr, merged_subs, order_by, descending, take, cont
+                        filter_expr, merged_subs, order_by, descending, take, cont, projection
                     )
 
                 # For table output with summary, collect all data first
@@ -933,9 +1091,9 @@ def register_testmonitor_commands(cli: Any) -> None:
                         data_key="products",
                         item_name="product",
                         format_output=format_output,
-                        formatter_func=product_formatter,
-                        headers=["Name", "Part Number", "Family", "Updated", "Workspace", "ID"],
-                        column_widths=[30, 18, 16, 12, 20, 36],
+                        formatter_func=formatter,
+                        headers=headers,
+                        column_widths=column_widths,
                         empty_message="No products found.",
                         take=take,
                     )
@@ -946,7 +1104,7 @@ def register_testmonitor_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1026,6 +1184,7 @@ def register_testmonitor_commands(cli: Any) -> None:
         ),
         help="Group summary by field (implies --summary)",
     )
+    @click.option("--fields", "fields_option", help=_FIELDS_HELP)
     def list_results(
         format: str,
         take: int,
@@ -1045,62 +1204,24 @@ def register_testmonitor_commands(cli: Any) -> None:
         descending: bool,
         summary: bool,
         group_by: Optional[str],
+        fields_option: Optional[str],
     ) -> None:
         """List test results in Test Monitor."""
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
 
         try:
-            filter_parts: List[str] = []
-            filter_substitutions: List[Any] = []
-
-            if status:
-                normalized_status = status.upper().replace("-", "_")
-                _append_filter(
-                    filter_parts,
-                    filter_substitutions,
-                    "status.statusType == @{index}",
-                    normalized_status,
-                )
-
-            _append_filter(
-                filter_parts,
-                filter_substitutions,
-                "programName.Contains(@{index})",
+            filter_expr, merged_subs = _build_result_filter(
+                status,
                 program_name,
-            )
-            _append_filter(
-                filter_parts,
-                filter_substitutions,
-                "serialNumber.Contains(@{index})",
                 serial_number,
-            )
-            _append_filter(
-                filter_parts,
-                filter_substitutions,
-                "partNumber.Contains(@{index})",
                 part_number,
-            )
-            _append_filter(
-                filter_parts, filter_substitutions, "operator.Contains(@{index})", operator
-            )
-            _append_filter(
-                filter_parts, filter_substitutions, "hostName.Contains(@{index})", host_name
-            )
-            _append_filter(filter_parts, filter_substitutions, "systemId == @{index}", system_id)
-
-            workspace = get_effective_workspace(workspace)
-            if workspace:
-                workspace_map = get_workspace_map()
-                workspace_id = resolve_workspace_filter(workspace, workspace_map)
-                _append_filter(
-                    filter_parts, filter_substitutions, "workspace == @{index}", workspace_id
-                )
-
-            base_filter = " && ".join(filter_parts) if filter_parts else None
-            user_subs = _parse_substitutions(substitutions)
-
-            filter_expr, merged_subs = _combine_filter_parts(
-                base_filter, filter_substitutions, filter_query, user_subs
+                operator,
+                host_name,
+                system_id,
+                workspace,
+                filter_query,
+                substitutions,
             )
 
             product_filter_expr: Optional[str] = None
@@ -1126,8 +1247,26 @@ def register_testmonitor_commands(cli: Any) -> None:
                     item.get("id", ""),
                 ]
 
-            # If JSON output, fetch all pages
-            if format_output.lower() == "json":
+            headers = [
+                "Status",
+                "Program",
+                "Part Number",
+                "Serial",
+                "Started",
+                "Duration(s)",
+                "ID",
+            ]
+            column_widths = [12, 30, 16, 16, 12, 12, 36]
+            formatter: Callable[[Dict[str, Any]], List[str]] = result_formatter
+            projection: Optional[List[str]] = _RESULT_TABLE_PROJECTION
+            if fields:
+                headers, column_widths, formatter = fields_table(fields)
+                projection = enum_projection(fields, _RESULT_PROJECTION_FIELDS)
+            elif format_output.lower() == "json":
+                projection = None
+
+            # For JSON and delimited output, fetch all pages
+            if format_output.lower() != "table":
                 # Handle --summary flag for JSON output using efficient count queries
                 if summary or group_by:
                     group_field = _resolve_group_field(group_by)
@@ -1164,25 +1303,18 @@ def register_testmonitor_commands(cli: Any) -> None:
                             order_by,
                             descending,
                             take=take,
+                            projection=projection,
                         )
 
-                    mock_resp: Any = FilteredResponse({"results": results})
+                    mock_resp: Any = FilteredResponse({"results": project_items(results, fields)})
                     UniversalResponseHandler.handle_list_response(
                         resp=mock_resp,
                         data_key="results",
                         item_name="result",
                         format_output=format_output,
-                        formatter_func=result_formatter,
-                        headers=[
-                            "Status",
-                            "Program",
-                            "Part Number",
-                            "Serial",
-                            "Started",
-                            "Duration(s)",
-                            "ID",
-                        ],
-                        column_widths=[12, 30, 16, 16, 12, 12, 36],
+                        formatter_func=formatter,
+                        headers=headers,
+                        column_widths=column_widths,
                         empty_message="No test results found.",
                         enable_pagination=False,
                         page_size=take,
@@ -1201,6 +1333,7 @@ def register_testmonitor_commands(cli: Any) -> None:
                         descending,
                         take,
                         cont,
+                        projection,
                     )
 
                 # For table output with summary, collect all data first
@@ -1243,17 +1376,9 @@ def register_testmonitor_commands(cli: Any) -> None:
                         data_key="results",
                         item_name="result",
                         format_output=format_output,
-                        formatter_func=result_formatter,
-                        headers=[
-                            "Status",
-                            "Program",
-                            "Part Number",
-                            "Serial",
-                            "Started",
-                            "Duration(s)",
-                            "ID",
-                        ],
-                        column_widths=[12, 30, 16, 16, 12, 12, 36],
+                        formatter_func=formatter,
+                        headers=headers,
+                        column_widths=column_widths,
                         empty_message="No test results found.",
                         take=take,
                     )
@@ -1596,6 +1721,385 @@ def register_testmonitor_commands(cli: Any) -> None:
         except Exception as exc:  # noqa: BLE001
             handle_api_error(exc)
 
+    @testmonitor.command(name="export")
+    @click.option(
+        "--output-dir",
+        "-o",
+        type=click.Path(file_okay=False),
+        required=True,
+        help="Directory to write results/, steps/ and the export checkpoint to",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        "file_format",
+        type=click.Choice(list(TABULAR_FORMATS)),
+        default="jsonl",
+        show_default=True,
+        help="File format (parquet and arrow require pyarrow)",
+    )
+    @click.option(
+        "--partition-by",
+        type=click.Choice(list(PARTITION_CHOICES)),
+        default="none",
+        show_default=True,
+        help="Split files by result start day or by product (part number)",
+    )
+    @click.option(
+        "--steps/--no-steps",
+        "include_steps",
+        default=True,
+        show_default=True,
+        help="Export steps with one row per measurement parameter",
+    )
+    @click.option("--status", help="Filter by status type (e.g., PASSED, FAILED)")
+    @click.option("--program-name", help="Filter by program name (contains)")
+    @click.option("--serial-number", help="Filter by serial number (contains)")
+    @click.option("--part-number", help="Filter by part number (contains)")
+    @click.option("--operator", help="Filter by operator name (contains)")
+    @click.option("--host-name", help="Filter by host name (contains)")
+    @click.option("--system-id", help="Filter by system ID")
+    @click.option("--workspace", "-w", help="Filter by workspace name or ID")
+    @click.option(
+        "--filter",
+        "filter_query",
+        help="Dynamic LINQ filter expression for results",
+    )
+    @click.option(
+        "--substitution",
+        "substitutions",
+        multiple=True,
+        help="Substitution value for --filter (repeatable)",
+    )
+    @click.option(
+        "--product-filter",
+        help="Dynamic LINQ filter expression for associated products",
+    )
+    @click.option(
+        "--product-substitution",
+        "product_substitutions",
+        multiple=True,
+        help="Substitution value for --product-filter (repeatable)",
+    )
+    @click.option(
+        "--page-size",
+        type=click.IntRange(1, 1000),
+        default=500,
+        show_default=True,
+        help="Results per page; each page is written as one part file per partition",
+    )
+    @click.option(
+        "--step-batch-size",
+        type=click.IntRange(min=1),
+        default=50,
+        show_default=True,
+        help="Result IDs per step query",
+    )
+    @click.option(
+        "--concurrency",
+        "-c",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="Concurrent step queries",
+    )
+    @click.option(
+        "--max-results",
+        type=click.IntRange(min=1),
+        help="Stop after exporting this many results",
+    )
+    @click.option(
+        "--resume",
+        is_flag=True,
+        help="Continue an interrupted export from its checkpoint",
+    )
+    def export_results(
+        output_dir: str,
+        file_format: str,
+        partition_by: str,
+        include_steps: bool,
+        status: Optional[str],
+        program_name: Optional[str],
+        serial_number: Optional[str],
+        part_number: Optional[str],
+        operator: Optional[str],
+        host_name: Optional[str],
+        system_id: Optional[str],
+        workspace: Optional[str],
+        filter_query: Optional[str],
+        substitutions: Tuple[str, ...],
+        product_filter: Optional[str],
+        product_substitutions: Tuple[str, ...],
+        page_size: int,
+        step_batch_size: int,
+        concurrency: int,
+        max_results: Optional[int],
+        resume: bool,
+    ) -> None:
+        """Export test results and their steps to partitioned files.
+
+        Results matching the filters are streamed page by page (oldest first).
+        Steps for each page are fetched concurrently in batched queries and
+        flattened to one row per measurement parameter. Files are written as
+        results/[partition/]part-NNNNN.<ext> and steps/[partition/]part-NNNNN.<ext>.
+        A checkpoint is saved after every page; rerun with --resume to continue
+        an interrupted export.
+        """
+        output_path = Path(output_dir)
+        if not resume and (output_path / CHECKPOINT_FILE).exists():
+            click.echo(
+                f"✗ {output_path} already contains an export. "
+                "Use --resume to continue it or choose another directory.",
+                err=True,
+            )
+            sys.exit(ExitCodes.INVALID_INPUT)
+
+        try:
+            filter_expr, merged_subs = _build_result_filter(
+                status,
+                program_name,
+                serial_number,
+                part_number,
+                operator,
+                host_name,
+                system_id,
+                workspace,
+                filter_query,
+                substitutions,
+            )
+            query: Dict[str, Any] = {"orderBy": "STARTED_AT", "descending": False}
+            if filter_expr:
+                query["filter"] = filter_expr
+                if merged_subs:
+                    query["substitutions"] = merged_subs
+            if product_filter:
+                query["productFilter"] = product_filter
+                product_subs = _parse_substitutions(product_substitutions)
+                if product_subs:
+                    query["productSubstitutions"] = product_subs
+
+            def _report_page(checkpoint: Dict[str, Any]) -> None:
+                click.echo(
+                    f"  Exported {checkpoint['results']} results, "
+                    f"{checkpoint['stepRows']} step rows",
+                    err=True,
+                )
+
+            checkpoint = run_export(
+                output_path,
+                query,
+                file_format,
+                partition_by=partition_by,
+                include_steps=include_steps,
+                page_size=page_size,
+                step_batch_size=step_batch_size,
+                concurrency=concurrency,
+                resume=resume,
+                max_results=max_results,
+                on_page=_report_page,
+            )
+
+            details: Dict[str, Any] = {
+                "Output": str(output_path),
+                "Format": file_format.upper(),
+                "Results": checkpoint["results"],
+                "Parts": checkpoint["nextPart"],
+            }
+            if include_steps:
+                details["Step rows"] = checkpoint["stepRows"]
+            format_success("Export complete", details)
+
+        except ImportError:
+            click.echo(PYARROW_INSTALL_HINT, err=True)
+            sys.exit(ExitCodes.GENERAL_ERROR)
+        except ValueError as exc:
+            click.echo(f"✗ {exc}", err=True)
+            sys.exit(ExitCodes.INVALID_INPUT)
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
+
+    @result.command(name="analytics")
+    @click.option(
+        "--group-by",
+        "-g",
+        "group_by",
+        multiple=True,
+        type=click.Choice(list(ANALYTICS_FIELDS)),
+        help="Group by field (repeatable for multi-key groups; day uses startedAt)",
+    )
+    @click.option(
+        "--pareto-by",
+        type=click.Choice(list(ANALYTICS_FIELDS)),
+        default="programName",
+        show_default=True,
+        help="Field to rank failures by in the Pareto",
+    )
+    @click.option(
+        "--pareto-top",
+        type=click.IntRange(min=1),
+        default=10,
+        show_default=True,
+        help="Number of Pareto entries to show",
+    )
+    @click.option("--status", help="Filter by status type (e.g., PASSED, FAILED)")
+    @click.option("--program-name", help="Filter by program name (contains)")
+    @click.option("--serial-number", help="Filter by serial number (contains)")
+    @click.option("--part-number", help="Filter by part number (contains)")
+    @click.option("--operator", help="Filter by operator name (contains)")
+    @click.option("--host-name", help="Filter by host name (contains)")
+    @click.option("--system-id", help="Filter by system ID")
+    @click.option("--workspace", "-w", help="Filter by workspace name or ID")
+    @click.option(
+        "--filter",
+        "filter_query",
+        help="Dynamic LINQ filter expression for results",
+    )
+    @click.option(
+        "--substitution",
+        "substitutions",
+        multiple=True,
+        help="Substitution value for --filter (repeatable)",
+    )
+    @click.option(
+        "--product-filter",
+        help="Dynamic LINQ filter expression for associated products",
+    )
+    @click.option(
+        "--product-substitution",
+        "product_substitutions",
+        multiple=True,
+        help="Substitution value for --product-filter (repeatable)",
+    )
+    @click.option(
+        "--page-size",
+        type=click.IntRange(1, 1000),
+        default=1000,
+        show_default=True,
+        help="Results per query page",
+    )
+    @click.option(
+        "--max-results",
+        type=click.IntRange(min=1),
+        help="Stop after analyzing this many results",
+    )
+    @click.option(
+        "--format",
+        "-f",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        show_default=True,
+        help="Output format",
+    )
+    def result_analytics(
+        group_by: Tuple[str, ...],
+        pareto_by: str,
+        pareto_top: int,
+        status: Optional[str],
+        program_name: Optional[str],
+        serial_number: Optional[str],
+        part_number: Optional[str],
+        operator: Optional[str],
+        host_name: Optional[str],
+        system_id: Optional[str],
+        workspace: Optional[str],
+        filter_query: Optional[str],
+        substitutions: Tuple[str, ...],
+        product_filter: Optional[str],
+        product_substitutions: Tuple[str, ...],
+        page_size: int,
+        max_results: Optional[int],
+        format: str,
+    ) -> None:
+        """Compute yield, first-pass yield, durations and a failure Pareto.
+
+        All matching results are streamed page by page and aggregated as they
+        arrive, so there is no 10,000 result limit. Yield is passed / (passed +
+        failed, errored, terminated or timed out). First-pass yield counts each
+        serial number once per group, using its earliest result.
+        """
+        format_output = validate_output_format(format)
+        try:
+            filter_expr, merged_subs = _build_result_filter(
+                status,
+                program_name,
+                serial_number,
+                part_number,
+                operator,
+                host_name,
+                system_id,
+                workspace,
+                filter_query,
+                substitutions,
+            )
+            query: Dict[str, Any] = {"orderBy": "STARTED_AT", "descending": False}
+            if filter_expr:
+                query["filter"] = filter_expr
+                if merged_subs:
+                    query["substitutions"] = merged_subs
+            if product_filter:
+                query["productFilter"] = product_filter
+                product_subs = _parse_substitutions(product_substitutions)
+                if product_subs:
+                    query["productSubstitutions"] = product_subs
+
+            analytics = ResultAnalytics(group_by, pareto_by)
+            for page, _ in iter_result_pages(query, page_size, None):
+                if max_results is not None:
+                    page = page[: max_results - analytics.total]
+                analytics.add_page(page)
+                if max_results is not None and analytics.total >= max_results:
+                    break
+            summary = analytics.summary(pareto_top)
+        except Exception as exc:  # noqa: BLE001
+            handle_api_error(exc)
+            return
+
+        if format_output == "json":
+            click.echo(json.dumps(summary, indent=2))
+            return
+
+        if not summary["total"]:
+            click.echo("No test results found.")
+            return
+
+        headers = [*group_by, "Total", "Passed", "Failed", "Yield", "FPY", "P50 s", "P95 s"]
+        widths = [24] * len(group_by) + [8, 8, 8, 8, 8, 9, 9]
+        render_table(
+            headers,
+            widths,
+            [
+                [
+                    *(row[field] for field in group_by),
+                    row["total"],
+                    row["passed"],
+                    row["failed"],
+                    _format_ratio(row["yield"]),
+                    _format_ratio(row["firstPassYield"]),
+                    _format_duration(row["duration"]["p50"]),
+                    _format_duration(row["duration"]["p95"]),
+                ]
+                for row in summary["groups"]
+            ],
+            show_total=True,
+            total_label="result(s)",
+            total_count=summary["total"],
+        )
+        if summary["pareto"]:
+            click.echo(f"\nFailure Pareto by {pareto_by}:")
+            render_table(
+                [pareto_by, "Failures", "Share", "Cumulative"],
+                [40, 10, 10, 12],
+                [
+                    [
+                        row[pareto_by],
+                        row["failures"],
+                        _format_ratio(row["percent"]),
+                        _format_ratio(row["cumulativePercent"]),
+                    ]
+                    for row in summary["pareto"]
+                ],
+            )
+
     @result.command(name="get")
     @click.argument("result_id")
     @click.option("--include-steps", is_flag=True, help="Include step details in output.")
@@ -0,0 +1,378 @@
+"""Bulk export of Test Monitor results and steps to partitioned tabular files.
+
+Results are read page by page with continuation tokens. For every page, the
+steps of its results are fetched concurrently in batched ``resultId`` queries
+and flattened to one row per measurement parameter. Each page is written as a
+new ``part-NNNNN`` file per partition, after which a checkpoint records the
+continuation token, so an interrupted export can resume at the next page.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .json_codec import response_json
+from .tabular_writers import open_tabular_writer, TABULAR_EXTENSIONS, TabularWriter
+from .utils import get_base_url, make_api_request
+
+CHECKPOINT_FILE = "_checkpoint.json"
+PARTITION_CHOICES = ("none", "day", "product")
+
+RESULT_COLUMNS = [
+    "id",
+    "programName",
+    "status",
+    "partNumber",
+    "serialNumber",
+    "startedAt",
+    "updatedAt",
+    "totalTimeInSeconds",
+    "systemId",
+    "hostName",
+    "operator",
+    "workspace",
+    "keywords",
+    "properties",
+]
+
+STEP_COLUMNS = [
+    "resultId",
+    "stepId",
+    "parentId",
+    "path",
+    "name",
+    "stepType",
+    "status",
+    "startedAt",
+    "totalTimeInSeconds",
+    "parameterIndex",
+    "parameterName",
+    "parameterStatus",
+    "measurement",
+    "lowLimit",
+    "highLimit",
+    "units",
+    "comparisonType",
+    "parameterAttributes",
+]
+
+_PARAMETER_FIELDS = {
+    "name": "parameterName",
+    "status": "parameterStatus",
+    "measurement": "measurement",
+    "lowLimit": "lowLimit",
+    "highLimit": "highLimit",
+    "units": "units",
+    "comparisonType": "comparisonType",
+}
+
+_STEP_PAGE_SIZE = 1000
+
+
+def _get_testmonitor_base_url() -> str:
+    """Get the base URL for the Test Monitor API."""
+    return f"{get_base_url()}/nitestmonitor/v2"
+
+
+def _status_type(value: Any) -> Optional[str]:
+    """Return the ``statusType`` of a status object, or the value as text."""
+    if isinstance(value, dict):
+        status = value.get("statusType") or value.get("statusName")
+        return str(status) if status is not None else None
+    return None if value is None else str(value)
+
+
+def _encode(value: Any) -> Any:
+    """Encode nested values as JSON text so every cell is a scalar."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def flatten_result(result: Dict[str, Any]) -> List[Any]:
+    """Flatten a test result into a row matching :data:`RESULT_COLUMNS`."""
+    row: List[Any] = []
+    for column in RESULT_COLUMNS:
+        value = result.get(column)
+        row.append(_status_type(value) if column == "status" else _encode(value))
+    return row
+
+
+def flatten_step(step: Dict[str, Any]) -> List[List[Any]]:
+    """Flatten a step into one row per measurement parameter.
+
+    Steps without parameters produce a single row with empty parameter
+    columns. Parameter keys other than the standard ones are kept as JSON in
+    ``parameterAttributes``.
+
+    Returns:
+        Rows matching :data:`STEP_COLUMNS`.
+    """
+    base = {
+        "resultId": step.get("resultId"),
+        "stepId": step.get("stepId"),
+        "parentId": step.get("parentId"),
+        "path": _encode(step.get("path")),
+        "name": step.get("name"),
+        "stepType": step.get("stepType"),
+        "status": _status_type(step.get("status")),
+        "startedAt": step.get("startedAt"),
+        "totalTimeInSeconds": step.get("totalTimeInSeconds"),
+    }
+    data = step.get("data")
+    parameters = data.get("parameters") if isinstance(data, dict) else None
+    if not isinstance(parameters, list) or not parameters:
+        return [[base.get(column) for column in STEP_COLUMNS]]
+
+    rows: List[List[Any]] = []
+    for index, parameter in enumerate(parameters):
+        record = dict(base, parameterIndex=index)
+        if isinstance(parameter, dict):
+            extra: Dict[str, Any] = {}
+            for key, value in parameter.items():
+                if key in _PARAMETER_FIELDS:
+                    record[_PARAMETER_FIELDS[key]] = _encode(value)
+                else:
+                    extra[key] = value
+            if extra:
+                record["parameterAttributes"] = _encode(extra)
+        else:
+            record["measurement"] = _encode(parameter)
+        rows.append([record.get(column) for column in STEP_COLUMNS])
+    return rows
+
+
+def _sanitize_partition_value(value: str) -> str:
+    """Make a partition value safe to use as a directory name."""
+    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._")
+    return cleaned or "unknown"
+
+
+def partition_key(result: Dict[str, Any], partition_by: str) -> Optional[str]:
+    """Return the ``name=value`` partition directory for a result, if any."""
+    if partition_by == "day":
+        started = str(result.get("startedAt") or "")
+        day = started.split("T", maxsplit=1)[0] if started else ""
+        return f"day={_sanitize_partition_value(day)}"
+    if partition_by == "product":
+        return f"product={_sanitize_partition_value(str(result.get('partNumber') or ''))}"
+    return None
+
+
+def build_step_filter(result_ids: List[str]) -> Tuple[str, List[str]]:
+    """Build a ``resultId`` filter that matches any of ``result_ids``."""
+    expression = " || ".join(f"resultId == @{index}" for index in range(len(result_ids)))
+    return expression, list(result_ids)
+
+
+def query_steps_for_results(result_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch all steps that belong to a batch of results."""
+    url = f"{_get_testmonitor_base_url()}/query-steps"
+    filter_expr, substitutions = build_step_filter(result_ids)
+    steps: List[Dict[str, Any]] = []
+    continuation_token: Optional[str] = None
+    while True:
+        payload: Dict[str, Any] = {
+            "filter": filter_expr,
+            "substitutions": substitutions,
+            "take": _STEP_PAGE_SIZE,
+        }
+        if continuation_token:
+            payload["continuationToken"] = continuation_token
+        data = response_json(make_api_request("POST", url, payload=payload))
+        steps.extend(data.get("steps", []) if isinstance(data, dict) else [])
+        continuation_token = data.get("continuationToken") if isinstance(data, dict) else None
+        if not continuation_token:
+            return steps
+
+
+def iter_result_pages(
+    query: Dict[str, Any], page_size: int, continuation_token: Optional[str]
+) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Yield ``(results, next_continuation_token)`` for each results page.
+
+    Args:
+        query: ``query-results`` payload fields (filter, substitutions, and so on).
+        page_size: Results per page.
+        continuation_token: Token to resume from, or None to start at the beginning.
+    """
+    url = f"{_get_testmonitor_base_url()}/query-results"
+    while True:
+        payload = dict(query, take=page_size)
+        if continuation_token:
+            payload["continuationToken"] = continuation_token
+        data = response_json(make_api_request("POST", url, payload=payload))
+        results = data.get("results", []) if isinstance(data, dict) else []
+        continuation_token = data.get("continuationToken") if isinstance(data, dict) else None
+        yield results, continuation_token
+        if not continuation_token or not results:
+            return
+
+
+def export_signature(query: Dict[str, Any], options: Dict[str, Any]) -> str:
+    """Return a stable hash identifying an export, used to validate resumes."""
+    text = json.dumps({"query": query, "options": options}, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_checkpoint(output_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load the export checkpoint from ``output_dir``, if one exists."""
+    path = output_dir / CHECKPOINT_FILE
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return data if isinstance(data, dict) else None
+
+
+def save_checkpoint(output_dir: Path, checkpoint: Dict[str, Any]) -> None:
+    """Write the export checkpoint atomically."""
+    path = output_dir / CHECKPOINT_FILE
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(checkpoint, handle, indent=2)
+    os.replace(temp_path, path)
+
+
+class _PartitionedPart:
+    """Lazily opened writers for one part number across partitions."""
+
+    def __init__(self, root: Path, file_format: str, columns: List[str], part_number: int) -> None:
+        self._root = root
+        self._format = file_format
+        self._columns = columns
+        self._name = f"part-{part_number:05d}{TABULAR_EXTENSIONS[file_format]}"
+        self._writers: Dict[Optional[str], TabularWriter] = {}
+        self.rows_written = 0
+
+    def write_row(self, partition: Optional[str], row: List[Any]) -> None:
+        writer = self._writers.get(partition)
+        if writer is None:
+            directory = self._root / partition if partition else self._root
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = open_tabular_writer(directory / self._name, self._format, self._columns)
+            self._writers[partition] = writer
+        writer.write_row(row)
+        self.rows_written += 1
+
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+def export_results(
+    output_dir: Path,
+    query: Dict[str, Any],
+    file_format: str,
+    partition_by: str = "none",
+    include_steps: bool = True,
+    page_size: int = 500,
+    step_batch_size: int = 50,
+    concurrency: int = 4,
+    resume: bool = False,
+    max_results: Optional[int] = None,
+    on_page: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Export results (and optionally their steps) to ``output_dir``.
+
+    Args:
+        output_dir: Destination directory; ``results/`` and ``steps/`` are created in it.
+        query: ``query-results`` payload fields.
+        file_format: One of the tabular formats.
+        partition_by: ``none``, ``day`` (result start date) or ``product`` (part number).
+        include_steps: Whether to export steps.
+        page_size: Results fetched and written per part.
+        step_batch_size: Result IDs per ``query-steps`` request.
+        concurrency: Concurrent ``query-steps`` requests.
+        resume: Continue from the checkpoint in ``output_dir``.
+        max_results: Stop after this many results in total.
+        on_page: Called with the checkpoint after each written page.
+
+    Returns:
+        The final checkpoint.
+
+    Raises:
+        ValueError: If ``resume`` is set but the checkpoint is missing or was
+            written for a different export.
+        ImportError: If the format needs ``pyarrow`` and it is not installed.
+    """
+    signature = export_signature(
+        query,
+        {"format": file_format, "partitionBy": partition_by, "steps": include_steps},
+    )
+    checkpoint: Dict[str, Any] = {
+        "signature": signature,
+        "continuationToken": None,
+        "nextPart": 0,
+        "results": 0,
+        "stepRows": 0,
+        "complete": False,
+    }
+    if resume:
+        previous = load_checkpoint(output_dir)
+        if previous is None:
+            raise ValueError(f"No export checkpoint found in {output_dir}")
+        if previous.get("signature") != signature:
+            raise ValueError("The checkpoint was written for a different export configuration")
+        checkpoint.update(previous)
+        if checkpoint["complete"]:
+            return checkpoint
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results_root = output_dir / "results"
+    steps_root = output_dir / "steps"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pages = iter_result_pages(query, page_size, checkpoint["continuationToken"])
+        for results, next_token in pages:
+            if max_results is not None:
+                results = results[: max(max_results - checkpoint["results"], 0)]
+            part_number = checkpoint["nextPart"]
+
+            partitions: Dict[str, Optional[str]] = {}
+            result_part = _PartitionedPart(results_root, file_format, RESULT_COLUMNS, part_number)
+            try:
+                for result in results:
+                    partition = partition_key(result, partition_by)
+                    partitions[str(result.get("id", ""))] = partition
+                    result_part.write_row(partition, flatten_result(result))
+            finally:
+                result_part.close()
+
+            step_rows = 0
+            if include_steps and results:
+                result_ids = list(partitions)
+                batches = [
+                    result_ids[start : start + step_batch_size]
+                    for start in range(0, len(result_ids), step_batch_size)
+                ]
+                step_part = _PartitionedPart(steps_root, file_format, STEP_COLUMNS, part_number)
+                try:
+                    futures = [executor.submit(query_steps_for_results, b) for b in batches]
+                    for future in concurrent.futures.as_completed(futures):
+                        for step in future.result():
+                            partition = partitions.get(str(step.get("resultId", "")))
+                            for row in flatten_step(step):
+                                step_part.write_row(partition, row)
+                finally:
+                    step_part.close()
+                step_rows = step_part.rows_written
+
+            checkpoint["results"] += len(results)
+            checkpoint["stepRows"] += step_rows
+            checkpoint["nextPart"] = part_number + 1
+            checkpoint["continuationToken"] = next_token
+            reached_limit = max_results is not None and checkpoint["results"] >= max_results
+            checkpoint["complete"] = not next_token or not results or reached_limit
+            save_checkpoint(output_dir, checkpoint)
+            if on_page is not None:
+                on_page(checkpoint)
+            if checkpoint["complete"]:
+                break
+
+    return checkpoint
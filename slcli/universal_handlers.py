@@ -1,12 +1,13 @@
 """Enhanced response handlers for all CLI commands."""
 
-import json
 import sys
 from typing import Dict, List, Any, Optional, Union, Callable
 
 import click
 import requests
 
+from .json_codec import response_json
+from .rich_output import print_json
 from .utils import ExitCodes, handle_api_error, format_success
 
 
@@ -61,7 +62,7 @@ class UniversalResponseHandler:
             resp: API response
             data_key: Key to extract items from response
             item_name: Name of item type (for messages)
-            format_output: 'table' or 'json'
+            format_output: 'table', 'json', 'csv' or 'tsv'
             formatter_func: Function to format table rows
             headers: Table headers
             column_widths: Table column widths
@@ -72,10 +73,10 @@ class UniversalResponseHandler:
             shown_count: Optional count of items shown so far (useful for paged responses).
         """
         from .cli_utils import paginate_list_output
-        from .table_utils import output_formatted_list
+        from .table_utils import is_delimited_format, output_delimited_items, output_formatted_list
 
         try:
-            data = resp.json()
+            data = response_json(resp)
             # Support both dict with data_key and direct array responses
             if isinstance(data, list):
                 items = data
@@ -87,7 +88,10 @@ class UniversalResponseHandler:
             if not empty_message:
                 empty_message = f"No {item_name}s found."
 
-            if enable_pagination and format_output.lower() == "table":
+            if is_delimited_format(format_output):
+                # CSV/TSV output is for scripts: every row, no paging or footers
+                output_delimited_items(items, format_output, headers, formatter_func)
+            elif enable_pagination and format_output.lower() == "table":
                 # Use pagination for table output
                 paginate_list_output(
                     items,
@@ -101,7 +105,7 @@ class UniversalResponseHandler:
                 )
             elif format_output.lower() == "json":
                 # For JSON format, always output all items (no display pagination)
-                click.echo(json.dumps(items, indent=2))
+                print_json(items)
             elif formatter_func and headers and column_widths:
                 # Use traditional output (no pagination)
                 output_formatted_list(
@@ -125,7 +129,7 @@ class UniversalResponseHandler:
             else:
                 # Fallback to simple JSON/basic formatting
                 if format_output.lower() == "json":
-                    click.echo(json.dumps(items, indent=2))
+                    print_json(items)
                 else:
                     if not items:
                         click.echo(empty_message)
@@ -159,10 +163,10 @@ class UniversalResponseHandler:
     ) -> None:
         """Handle get response with standardized formatting."""
         try:
-            data = resp.json()
+            data = response_json(resp)
 
             if format_output.lower() == "json":
-                click.echo(json.dumps(data, indent=2))
+                print_json(data)
             else:
                 if table_formatter_func:
                     table_formatter_func(data)
@@ -247,7 +251,7 @@ class UniversalResponseHandler:
         from .utils import save_json_file
 
         try:
-            data = resp.json()
+            data = response_json(resp)
             save_json_file(data, output_file)
 
             message = success_message_template.format(
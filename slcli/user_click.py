@@ -15,7 +15,7 @@ import click
 import questionary
 from click.core import ParameterSource
 
-from .cli_utils import paginate_list_output, validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, paginate_list_output, validate_output_format
 from .rich_output import render_table
 from .utils import (
     ExitCodes,
@@ -598,7 +598,7 @@ def register_user_commands(cli: click.Group) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1,17 +1,33 @@
 """Shared utility functions for SystemLink CLI."""
 
+import contextlib
 import datetime
+import io
 import json
 import os
 import sys
+import threading
+import time
+import uuid
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import keyring
 import requests
 
-from . import ssl_trust
+from . import json_codec, ssl_trust
 from .rich_output import print_json
 from .ssl_trust import use_standard_ssl_context
 
@@ -677,6 +693,8 @@ def get_ssl_verify(server_uri: Optional[str] = None) -> Union[bool, str]:
     managed PEM path when the server has an accepted certificate, or ``True``
     for the normal OS/certifi verification path.
     """
+    # Every HTTPS caller resolves verification first, so OS trust is injected here
+    ssl_trust.ensure_os_trust()
     env = os.environ.get("SLCLI_SSL_VERIFY")
     if env is not None:
         if env.lower() in ("0", "false", "no"):
@@ -718,6 +736,21 @@ def get_workspace_id_by_name(name: str) -> str:
     raise ValueError(f"Workspace name '{name}' not found.")
 
 
+_workspace_map_ttl = 0.0
+_workspace_map_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+
+
+def set_workspace_map_cache_ttl(seconds: float) -> None:
+    """Cache workspace maps per server and credential for ``seconds``.
+
+    Used by long-lived processes such as ``slcli daemon`` so consecutive
+    commands do not refetch every workspace. A TTL of 0 disables the cache.
+    """
+    global _workspace_map_ttl
+    _workspace_map_ttl = seconds
+    _workspace_map_cache.clear()
+
+
 def get_workspace_map() -> Dict[str, str]:
     """Get a mapping of workspace IDs to names.
 
@@ -727,6 +760,13 @@ def get_workspace_map() -> Dict[str, str]:
         Dictionary mapping workspace ID to workspace name
     """
     try:
+        cache_key: Optional[Tuple[str, str]] = None
+        if _workspace_map_ttl > 0:
+            cache_key = (get_base_url(), get_api_key())
+            cached = _workspace_map_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _workspace_map_ttl:
+                return dict(cached[1])
+
         workspace_map: Dict[str, str] = {}
         skip = 0
         page_size = 100  # API max take is 100
@@ -749,6 +789,8 @@ def get_workspace_map() -> Dict[str, str]:
 
             skip += page_size
 
+        if cache_key is not None and workspace_map:
+            _workspace_map_cache[cache_key] = (time.monotonic(), dict(workspace_map))
         return workspace_map
     except Exception:
         return {}
@@ -801,14 +843,140 @@ def save_json_file(
     serializer = custom_serializer or _default_json_serializer
 
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=serializer)
+        with open(filepath, "wb") as f:
+            f.write(json_codec.dumpb(data, indent=True, default=serializer))
     except Exception as exc:
         click.echo(f"✗ Error writing file {filepath}: {exc}", err=True)
         sys.exit(ExitCodes.GENERAL_ERROR)
 
 
 # --- API Request Utilities ---
+class PooledSessions:
+    """Keep-alive ``requests`` sessions, one per thread.
+
+    ``requests.Session`` is not thread-safe, so each thread that makes
+    requests inside :func:`pooled_http_session` (upload workers, parallel
+    batch commands) gets its own session and keeps reusing it.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty pool; sessions are opened on first use."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, opening it if needed."""
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def clear_cookies(self) -> None:
+        """Drop the cookies held by every session in the pool."""
+        with self._lock:
+            for session in self._sessions:
+                session.cookies.clear()
+
+    def close(self) -> None:
+        """Close every session in the pool."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+_pooled_sessions: Optional[PooledSessions] = None
+
+
+@contextlib.contextmanager
+def pooled_http_session() -> Iterator[PooledSessions]:
+    """Route ``make_api_request`` calls through keep-alive sessions.
+
+    Long-running commands (watchers, monitors, batch runners) use this so every
+    poll reuses the same pooled TLS connections instead of opening a new one per
+    request. Each thread gets its own session. Nested uses share the outermost
+    pool.
+
+    Yields:
+        The active :class:`PooledSessions`.
+    """
+    global _pooled_sessions
+    if _pooled_sessions is not None:
+        yield _pooled_sessions
+        return
+
+    pool = PooledSessions()
+    _pooled_sessions = pool
+    try:
+        yield pool
+    finally:
+        _pooled_sessions = None
+        pool.close()
+
+
+class MultipartFileStream:
+    """Stream one file from disk as a ``multipart/form-data`` request body.
+
+    ``requests`` encodes ``files=`` uploads in memory before sending them. This
+    body is read in chunks while it is sent, so uploading large packages needs
+    constant memory. Pass it as ``data`` together with its ``content_type``.
+    """
+
+    def __init__(
+        self, field_name: str, file_path: str, content_type: str = "application/octet-stream"
+    ) -> None:
+        """Open the file and prepare the multipart envelope around it."""
+        self.boundary = uuid.uuid4().hex
+        file_name = os.path.basename(file_path).replace('"', "%22")
+        head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{file_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._file = open(file_path, "rb")
+        self._length = len(head) + os.fstat(self._file.fileno()).st_size + len(tail)
+        self._parts: List[Any] = [io.BytesIO(head), self._file, io.BytesIO(tail)]
+
+    @property
+    def content_type(self) -> str:
+        """Return the Content-Type header value including the boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        """Return the total body length so requests can send Content-Length."""
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes of the body (all remaining bytes when negative)."""
+        chunks: List[bytes] = []
+        remaining = size
+        while self._parts and (size < 0 or remaining > 0):
+            chunk = self._parts[0].read(remaining if size >= 0 else -1)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> "MultipartFileStream":
+        """Return the stream for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the underlying file."""
+        self.close()
+
+
 def make_api_request(
     method: str,
     url: str,
@@ -816,7 +984,7 @@ def make_api_request(
     headers: Optional[Dict[str, str]] = None,
     handle_errors: bool = True,
     files: Optional[Dict[str, Any]] = None,
-    data: Optional[Dict[str, Any]] = None,
+    data: Optional[Any] = None,
     stream: bool = False,
     credential: Optional[str] = None,
     auth_scheme: Optional[str] = None,
@@ -830,7 +998,8 @@ def make_api_request(
         headers: Additional headers (will be merged with default headers)
         handle_errors: Whether to handle errors with consistent formatting
         files: Files to upload (for multipart form data)
-        data: Form data (for multipart requests, used with files)
+        data: Form data (for multipart requests, used with files), or a raw request
+            body such as a :class:`MultipartFileStream` when no files are given
         stream: Whether to stream the response (for large file downloads)
         credential: Optional explicit credential for this request. When omitted, the active
             credential is resolved from configuration.
@@ -857,14 +1026,17 @@ def make_api_request(
             default_headers.pop("Content-Type", None)
 
         ssl_verify = get_ssl_verify(url)
+        # Reuse this thread's pooled session when a long-running command opened a pool
+        pool = _pooled_sessions
+        http: Any = pool.session() if pool is not None else requests
 
         with use_standard_ssl_context(ssl_verify):
             if method.upper() == "GET":
-                resp = requests.get(url, headers=default_headers, verify=ssl_verify, stream=stream)
+                resp = http.get(url, headers=default_headers, verify=ssl_verify, stream=stream)
             elif method.upper() == "POST":
                 if files:
                     # Multipart file upload
-                    resp = requests.post(
+                    resp = http.post(
                         url,
                         headers=default_headers,
                         files=files,
@@ -872,8 +1044,17 @@ def make_api_request(
                         verify=ssl_verify,
                         stream=stream,
                     )
+                elif data is not None and not isinstance(data, dict):
+                    # Raw or streamed body; the caller supplies the Content-Type
+                    resp = http.post(
+                        url,
+                        headers=default_headers,
+                        data=data,
+                        verify=ssl_verify,
+                        stream=stream,
+                    )
                 else:
-                    resp = requests.post(
+                    resp = http.post(
                         url,
                         headers=default_headers,
                         json=payload,
@@ -881,11 +1062,11 @@ def make_api_request(
                         stream=stream,
                     )
             elif method.upper() == "PUT":
-                resp = requests.put(url, headers=default_headers, json=payload, verify=ssl_verify)
+                resp = http.put(url, headers=default_headers, json=payload, verify=ssl_verify)
             elif method.upper() == "PATCH":
-                resp = requests.patch(url, headers=default_headers, json=payload, verify=ssl_verify)
+                resp = http.patch(url, headers=default_headers, json=payload, verify=ssl_verify)
             elif method.upper() == "DELETE":
-                resp = requests.delete(url, headers=default_headers, verify=ssl_verify)
+                resp = http.delete(url, headers=default_headers, verify=ssl_verify)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
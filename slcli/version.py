@@ -0,0 +1,25 @@
+"""Version lookup kept free of heavy imports for the ``--version`` fast path."""
+
+import tomllib
+from pathlib import Path
+
+
+def get_version() -> str:
+    """Get version from _version.py (built binary) or pyproject.toml (development)."""
+    try:
+        # Try to import from _version.py first (works in built binary)
+        from ._version import __version__
+
+        return __version__
+    except ImportError:
+        # Fall back to reading pyproject.toml (works in development)
+        try:
+            current_dir = Path(__file__).parent
+            pyproject_path = current_dir.parent / "pyproject.toml"
+
+            with open(pyproject_path, "rb") as f:
+                pyproject_data = tomllib.load(f)
+
+            return pyproject_data["tool"]["poetry"]["version"]
+        except Exception:
+            return "unknown"
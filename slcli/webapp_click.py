@@ -5,13 +5,12 @@ management (list, get, delete, publish, open).
 """
 
 import hashlib
-import io
+import json
+import os
 import re
 import shutil
 import sys
-import tarfile
 import tempfile
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -19,7 +18,8 @@ import click
 import questionary
 import requests
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .nipkg_utils import iter_folder_entries, write_nipkg
 from .skill_click import install_skills_to_directory
 from .universal_handlers import UniversalResponseHandler
 from .utils import (
@@ -52,6 +52,7 @@ _MAX_SCREENSHOT_COUNT = 3
 _SOURCE_REPO_PATTERN = re.compile(r"^[A-Za-z0-9._-]+/[A-Za-z0-9._-]+$")
 _SOURCE_COMMIT_PATTERN = re.compile(r"^[0-9a-f]{40}$")
 _WEBAPP_PROJECT_SKILLS = ["slcli"]
+_CONTENT_DIGEST_PROPERTY = "slcliContentDigest"
 _ALLOWED_PLUGIN_MANAGER_KEYS = {
     "buildCommand",
     "buildDir",
@@ -426,6 +427,127 @@ def _compute_sha256(file_path: Path) -> str:
     return sha256_hash.hexdigest()
 
 
+def _get_publish_state_path() -> Path:
+    """Return the local file that caches file hashes and published content digests."""
+    from .config import get_config_file_path
+
+    return get_config_file_path().parent / "webapp-publish-state.json"
+
+
+def _load_publish_state() -> Dict[str, Any]:
+    """Load the local publish state, tolerating a missing or corrupt file."""
+    try:
+        with open(_get_publish_state_path(), "r", encoding="utf-8") as state_file:
+            state = json.load(state_file)
+    except (OSError, ValueError):
+        state = {}
+    if not isinstance(state, dict):
+        state = {}
+    state.setdefault("hashCache", {})
+    state.setdefault("published", {})
+    return state
+
+
+def _save_publish_state(state: Dict[str, Any]) -> None:
+    """Atomically write the local publish state; failures only cost a cache miss."""
+    state_path = _get_publish_state_path()
+    temp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, state_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+
+def _build_content_manifest(folder: Path, state: Dict[str, Any]) -> Dict[str, str]:
+    """Return the SHA-256 of every file in a build folder keyed by relative path.
+
+    Hashes are reused from the local index when a file's size and modification
+    time are unchanged, so only edited files are read. The index in ``state``
+    is replaced with the current entries.
+    """
+    folder_key = str(folder.resolve())
+    cached: Dict[str, List[Any]] = state["hashCache"].get(folder_key, {})
+    entries: Dict[str, List[Any]] = {}
+    manifest: Dict[str, str] = {}
+    for path, arcname in iter_folder_entries(folder):
+        if not path.is_file() or path.is_symlink():
+            continue
+        relative_path = arcname[2:]
+        stat = path.stat()
+        cached_entry = cached.get(relative_path)
+        if cached_entry and cached_entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            digest = cached_entry[2]
+        else:
+            digest = _compute_sha256(path)
+        entries[relative_path] = [stat.st_size, stat.st_mtime_ns, digest]
+        manifest[relative_path] = digest
+    state["hashCache"][folder_key] = entries
+    return manifest
+
+
+def _manifest_digest(manifest: Dict[str, str]) -> str:
+    """Return a digest identifying the full content of a build folder."""
+    content_hash = hashlib.sha256()
+    for relative_path in sorted(manifest):
+        content_hash.update(f"{relative_path}\0{manifest[relative_path]}\n".encode("utf-8"))
+    return content_hash.hexdigest()
+
+
+def _diff_manifests(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, int]:
+    """Count files added, modified, removed and unchanged between two manifests."""
+    shared = previous.keys() & current.keys()
+    modified = sum(1 for path in shared if previous[path] != current[path])
+    return {
+        "added": len(current.keys() - previous.keys()),
+        "modified": modified,
+        "removed": len(previous.keys() - current.keys()),
+        "unchanged": len(shared) - modified,
+    }
+
+
+def _get_webapp_record(webapp_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch webapp metadata, returning None if it cannot be read."""
+    try:
+        resp = requests.get(
+            f"{_get_webapp_base_url()}/webapps/{webapp_id}",
+            headers=get_headers("application/json"),
+            verify=get_ssl_verify(),
+        )
+        resp.raise_for_status()
+        record = resp.json()
+    except Exception:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _store_published_digest(webapp_id: str, digest: str) -> bool:
+    """Save the published content digest in the webapp properties.
+
+    The metadata is read again first, since uploading content updates it.
+
+    Returns:
+        True when the webapp metadata was updated.
+    """
+    record = _get_webapp_record(webapp_id)
+    if record is None:
+        return False
+    properties = dict(record.get("properties") or {})
+    properties[_CONTENT_DIGEST_PROPERTY] = digest
+    try:
+        resp = requests.put(
+            f"{_get_webapp_base_url()}/webapps/{webapp_id}",
+            headers=get_headers("application/json"),
+            json={**record, "properties": properties},
+            verify=get_ssl_verify(),
+        )
+        resp.raise_for_status()
+    except Exception:
+        return False
+    return True
+
+
 def _normalize_plugin_manager_metadata(raw_metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize legacy App Store keys to Plugin Manager keys."""
     metadata = dict(raw_metadata)
@@ -576,11 +698,10 @@ def pack_folder_to_nipkg(
     """Pack a folder into a .nipkg (ar) file and return the output path.
 
     The .nipkg produced by this helper uses a Debian-style ar layout with
-    three members: debian-binary, control.tar.gz and data.tar.gz. The
-    implementation writes the ar archive directly; long member names are
-    truncated to 16 bytes (simple strategy) which is acceptable for our
-    use-case but could be extended to support GNU longname tables if
-    needed.
+    three members: debian-binary, control.tar.gz and data.tar.gz. The payload
+    is streamed from disk and compressed on several threads, and entry
+    metadata is normalized so packing the same folder twice produces the same
+    bytes (see :func:`slcli.nipkg_utils.write_nipkg`).
     """
     if not folder.exists() or not folder.is_dir():
         raise click.ClickException(f"Folder not found: {folder}")
@@ -608,13 +729,6 @@ def pack_folder_to_nipkg(
         else:
             output = folder.with_suffix(".nipkg")
 
-    # Ensure parent exists
-    output.parent.mkdir(parents=True, exist_ok=True)
-    # Debian-style package layout inside an ar archive:
-    # - debian-binary (contains version string, e.g. "2.0\n")
-    # - control.tar.gz (contains a control file with package metadata)
-    # - data.tar.gz (contains the payload files)
-
     if metadata is not None:
         control_fields = {
             "Package": metadata["package"],
@@ -651,86 +765,16 @@ def pack_folder_to_nipkg(
     control_lines = [f"{k}: {v}" for k, v in control_fields.items()]
     control_content = ("\n".join(control_lines) + "\n").encode("utf-8")
 
-    # Create control.tar.gz in-memory containing a single file 'control'
-    control_buf = io.BytesIO()
-    with tarfile.open(fileobj=control_buf, mode="w:gz") as tf:
-        ti = tarfile.TarInfo(name="control")
-        ti.size = len(control_content)
-        ti.mtime = int(time.time())
-        tf.addfile(ti, io.BytesIO(control_content))
-    control_bytes = control_buf.getvalue()
-
-    # Create data.tar.gz in-memory containing the folder contents at the root
-    data_buf = io.BytesIO()
-    with tempfile.TemporaryDirectory() as temp_dir:
-        payload_folder = folder
-        if metadata is not None and icon_source is not None:
-            icon_name = Path(metadata["iconFile"]).name
-            folder_icon = folder.resolve() / icon_name
-            resolved_icon_source = icon_source.resolve()
-            if not folder_icon.exists() or folder_icon.resolve() != resolved_icon_source:
-                payload_folder = Path(temp_dir) / folder.name
-                shutil.copytree(folder, payload_folder)
-                shutil.copy2(resolved_icon_source, payload_folder / icon_name)
-
-        with tarfile.open(fileobj=data_buf, mode="w:gz") as dtf:
-            # tarfile.add will handle directories and files; preserve relative paths
-            dtf.add(str(payload_folder), arcname=".")
-        data_bytes = data_buf.getvalue()
-
-    # debian-binary content
-    debian_bin = b"2.0\n"
-
-    # Write an ar archive (the Debian .deb format) but use .nipkg extension
-    def _ar_header(
-        name: str,
-        size: int,
-        mtime: Optional[int] = None,
-        uid: int = 0,
-        gid: int = 0,
-        mode: int = 0o100644,
-    ) -> bytes:
-        if mtime is None:
-            mtime = int(time.time())
-        # Header fields: name(16) mtime(12) uid(6) gid(6) mode(8) size(10) magic(2)
-        name_field = name.encode("utf-8")
-        if len(name_field) > 16:
-            # use truncated name (simple strategy)
-            name_field = name_field[:16]
-        header = (
-            name_field.ljust(16, b" ")
-            + str(int(mtime)).encode("ascii").ljust(12, b" ")
-            + str(int(uid)).encode("ascii").ljust(6, b" ")
-            + str(int(gid)).encode("ascii").ljust(6, b" ")
-            + oct(mode)[2:].encode("ascii").ljust(8, b" ")
-            + str(int(size)).encode("ascii").ljust(10, b" ")
-            + b"`\n"
-        )
-        return header
-
-    with open(output, "wb") as out_f:
-        # Global header
-        out_f.write(b"!<arch>\n")
-
-        # debian-binary
-        out_f.write(_ar_header("debian-binary", len(debian_bin)))
-        out_f.write(debian_bin)
-        if len(debian_bin) % 2:
-            out_f.write(b"\n")
+    extra_files: Dict[str, Path] = {}
+    if metadata is not None and icon_source is not None:
+        icon_name = Path(metadata["iconFile"]).name
+        folder_icon = folder.resolve() / icon_name
+        resolved_icon_source = icon_source.resolve()
+        if not folder_icon.exists() or folder_icon.resolve() != resolved_icon_source:
+            # Inject the icon as a virtual payload entry instead of copying the folder
+            extra_files[icon_name] = resolved_icon_source
 
-        # control.tar.gz
-        out_f.write(_ar_header("control.tar.gz", len(control_bytes)))
-        out_f.write(control_bytes)
-        if len(control_bytes) % 2:
-            out_f.write(b"\n")
-
-        # data.tar.gz
-        out_f.write(_ar_header("data.tar.gz", len(data_bytes)))
-        out_f.write(data_bytes)
-        if len(data_bytes) % 2:
-            out_f.write(b"\n")
-
-    return output
+    return write_nipkg(output, control_content, folder, extra_files)
 
 
 # Keep the original private name for callers and tests that still use it.
@@ -1280,7 +1324,7 @@ def register_webapp_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "format_output",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1292,9 +1336,9 @@ def register_webapp_commands(cli: Any) -> None:
             # Validate and normalize format option
             format_output = validate_output_format(format_output)
 
-            # JSON uses --take as a total cap; table mode keeps fetching pages
+            # JSON and CSV use --take as a total cap; table mode keeps fetching pages
             # so the user can choose whether to continue after each page.
-            api_take = take if format_output.lower() == "json" else (take if take != 25 else 1000)
+            api_take = take if format_output.lower() != "table" else (take if take != 25 else 1000)
             # Use server-side query to only retrieve WebVI documents
             base_filter = 'type == "WebVI"'
             workspace = get_effective_workspace(workspace) or workspace
@@ -1322,10 +1366,10 @@ def register_webapp_commands(cli: Any) -> None:
                 name_clause = f"({' or '.join(variants)})"
                 base_filter = f"({base_filter}) and ({name_clause})"
 
-            # JSON is bounded by --take. Table output remains interactive and
+            # JSON and CSV are bounded by --take. Table output remains interactive and
             # fetches the next page only after the user confirms.
             webapps: List[Dict[str, Any]] = []
-            if format_output.lower() == "json" or take == 0:
+            if format_output.lower() != "table" or take == 0:
                 webapps = _query_webapps_http(base_filter, max_items=api_take)
             else:
                 # Interactive server-side paging: show each fetched page immediately
@@ -1578,11 +1622,18 @@ def register_webapp_commands(cli: Any) -> None:
         default="Default",
         help="Workspace name or ID for new webapp",
     )
-    def publish(source: Path, webapp_id: str, name: str, workspace: str) -> None:
+    @click.option(
+        "--force",
+        is_flag=True,
+        help="Publish a folder even if it matches the last published content",
+    )
+    def publish(source: Path, webapp_id: str, name: str, workspace: str, force: bool) -> None:
         """Publish a .nipkg (or folder) to the WebApp service.
 
         SOURCE may be a .nipkg file or a folder. If a folder is provided it will be
-        packed into a .nipkg archive prior to upload.
+        packed into a .nipkg archive prior to upload. Publishing a folder to an
+        existing webapp is skipped when its content matches the last published
+        build, as recorded in the webapp properties.
         """
         from .utils import check_readonly_mode
 
@@ -1592,6 +1643,36 @@ def register_webapp_commands(cli: Any) -> None:
         try:
             # If folder, pack it first using a context-managed TemporaryDirectory
             if source.is_dir():
+                publish_state = _load_publish_state()
+                manifest = _build_content_manifest(source, publish_state)
+                content_digest = _manifest_digest(manifest)
+                webapp_record: Optional[Dict[str, Any]] = None
+                if webapp_id:
+                    webapp_record = _get_webapp_record(webapp_id)
+                    previous = publish_state["published"].get(webapp_id, {})
+                    # Only the webapp itself says what is live; without its record, or
+                    # when it has no digest, the content is uploaded again
+                    remote_properties = (webapp_record or {}).get("properties") or {}
+                    previous_digest = remote_properties.get(_CONTENT_DIGEST_PROPERTY)
+                    if previous.get("files") and previous.get("digest") == previous_digest:
+                        changes = _diff_manifests(previous["files"], manifest)
+                        click.echo(
+                            f"Content changes since last publish: {changes['added']} added, "
+                            f"{changes['modified']} modified, {changes['removed']} removed, "
+                            f"{changes['unchanged']} unchanged"
+                        )
+                    if previous_digest == content_digest and not force:
+                        _save_publish_state(publish_state)
+                        format_success(
+                            "Webapp content unchanged, skipped publish",
+                            {
+                                "Webapp ID": webapp_id,
+                                "Files": len(manifest),
+                                "Content digest": content_digest,
+                            },
+                        )
+                        return
+
                 click.echo("Packing folder into .nipkg...")
                 # Keep the TemporaryDirectory alive for the duration of the
                 # metadata creation and upload so the packaged file remains
@@ -1640,16 +1721,25 @@ def register_webapp_commands(cli: Any) -> None:
                             sys.exit(ExitCodes.GENERAL_ERROR)
                         click.echo(f"✓ Created webapp metadata: {webapp_id}")
 
-                    # Upload content (binary). Use requests.put because content may be binary.
-                    with open(packaged, "rb") as f:  # type: ignore[arg-type]
-                        data = f.read()
-
+                    # Upload content (binary), streamed from disk
                     upload_headers = get_headers("application/octet-stream")
                     url = f"{base}/webapps/{webapp_id}/content"
-                    resp = requests.put(
-                        url, headers=upload_headers, data=data, verify=get_ssl_verify()
-                    )
+                    with open(packaged, "rb") as f:  # type: ignore[arg-type]
+                        resp = requests.put(
+                            url, headers=upload_headers, data=f, verify=get_ssl_verify()
+                        )
                     if resp.status_code in (200, 201, 204):
+                        publish_state["published"][webapp_id] = {
+                            "digest": content_digest,
+                            "files": manifest,
+                        }
+                        _save_publish_state(publish_state)
+                        if not _store_published_digest(webapp_id, content_digest):
+                            click.echo(
+                                "⚠️ Could not store the content digest on the webapp; "
+                                "the next publish uploads the content again.",
+                                err=True,
+                            )
                         workspace_name_hint = (
                             get_effective_workspace(workspace) or workspace
                             if created_workspace_id
@@ -1666,6 +1756,7 @@ def register_webapp_commands(cli: Any) -> None:
                             {
                                 "Webapp ID": webapp_id,
                                 "Source": str(packaged),
+                                "Content digest": content_digest,
                                 "Published URL": published_url,
                             },
                         )
@@ -1718,13 +1809,13 @@ def register_webapp_commands(cli: Any) -> None:
                         sys.exit(ExitCodes.GENERAL_ERROR)
                     click.echo(f"✓ Created webapp metadata: {webapp_id}")
 
-                # Upload content (binary). Use requests.put because content may be binary.
-                with open(packaged, "rb") as f:  # type: ignore[arg-type]
-                    data = f.read()
-
+                # Upload content (binary), streamed from disk
                 upload_headers = get_headers("application/octet-stream")
                 url = f"{base}/webapps/{webapp_id}/content"
-                resp = requests.put(url, headers=upload_headers, data=data, verify=get_ssl_verify())
+                with open(packaged, "rb") as f:  # type: ignore[arg-type]
+                    resp = requests.put(
+                        url, headers=upload_headers, data=f, verify=get_ssl_verify()
+                    )
                 if resp.status_code in (200, 201, 204):
                     workspace_name_hint = (
                         (get_effective_workspace(workspace) or workspace)
@@ -13,7 +13,7 @@ import questionary
 import requests
 
 from . import workflow_preview
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .platform import require_feature
 from .universal_handlers import UniversalResponseHandler, FilteredResponse
 from .utils import (
@@ -368,7 +368,7 @@ def register_workflows_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -400,7 +400,7 @@ def register_workflows_commands(cli: Any) -> None:
             all_workflows = _query_all_workflows(
                 workspace_id,
                 workspace_map,
-                max_items=take if format_output.lower() == "json" else None,
+                max_items=take if format_output.lower() != "table" else None,
             )
 
             # Create a mock response with all data
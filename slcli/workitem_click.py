@@ -6,14 +6,16 @@ import sys
 import tempfile
 import webbrowser
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import click
 import requests
 
 from . import workflow_preview
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
+from .field_projection import enum_projection, fields_table, parse_fields, project_items
 from .platform import require_feature
+from .table_utils import output_formatted_list
 from .universal_handlers import FilteredResponse, UniversalResponseHandler
 from .utils import (
     ExitCodes,
@@ -50,6 +52,31 @@ def _wf_url(path: str) -> str:
     return f"{get_base_url()}/niworkorder/v1{path}?ff-userdefinedworkflowsfortestplaninstances=true"
 
 
+# Fields the query-workitems projection accepts
+_WORKITEM_PROJECTION_FIELDS = (
+    "ID",
+    "TEMPLATE_ID",
+    "NAME",
+    "TYPE",
+    "STATE",
+    "SUBSTATE",
+    "DESCRIPTION",
+    "ASSIGNED_TO",
+    "REQUESTED_BY",
+    "CREATED_BY",
+    "CREATED_AT",
+    "UPDATED_BY",
+    "UPDATED_AT",
+    "PART_NUMBER",
+    "TEST_PROGRAM",
+    "WORKFLOW_ID",
+    "WORKSPACE",
+    "PROPERTIES",
+    "FILE_IDS",
+)
+# Fields the work item list table renders
+_WORKITEM_TABLE_PROJECTION = ["ID", "NAME", "TYPE", "STATE", "ASSIGNED_TO", "WORKSPACE"]
+
 # ---------------------------------------------------------------------------
 # Pagination helpers
 # ---------------------------------------------------------------------------
@@ -61,6 +88,7 @@ def _query_all_workitems(
     workspace_filter: Optional[str] = None,
     max_items: Optional[int] = None,
     page_size: int = 100,
+    projection: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch work items via continuation-token pagination.
 
@@ -72,6 +100,7 @@ def _query_all_workitems(
             all.  Used to guard against buggy continuation tokens that are
             returned even when the requested take has been satisfied.
         page_size: Number of items to request from the service per page.
+        projection: Optional list of fields for the server to return.
 
     Returns:
         List of up to *max_items* matching work items.
@@ -101,6 +130,8 @@ def _query_all_workitems(
 
         if continuation_token:
             payload["continuationToken"] = continuation_token
+        if projection:
+            payload["projection"] = projection
 
         resp = make_api_request("POST", url, payload)
         data = resp.json()
@@ -248,6 +279,7 @@ def _fetch_workitems_page(
     workspace_filter: Optional[str],
     take: int,
     continuation_token: Optional[str],
+    projection: Optional[List[str]] = None,
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """Fetch a single page of work items from the server.
 
@@ -279,6 +311,8 @@ def _fetch_workitems_page(
 
     if continuation_token:
         payload["continuationToken"] = continuation_token
+    if projection:
+        payload["projection"] = projection
 
     resp = make_api_request("POST", url, payload)
     data = resp.json()
@@ -442,7 +476,7 @@ def register_workitem_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -482,6 +516,15 @@ def register_workitem_commands(cli: Any) -> None:
         default=None,
         help="Filter by workspace name or ID",
     )
+    @click.option(
+        "--fields",
+        "fields_option",
+        default=None,
+        help=(
+            "Comma-separated fields to return, e.g. id,name,state "
+            "(sent to the server as a projection)"
+        ),
+    )
     def list_workitems(
         format: str,
         take: int,
@@ -489,9 +532,12 @@ def register_workitem_commands(cli: Any) -> None:
         filter_substitutions: Tuple[str, ...],
         state: Optional[str],
         workspace: Optional[str],
+        fields_option: Optional[str],
     ) -> None:
         """List work items."""
         format_output = validate_output_format(format)
+        fields = parse_fields(fields_option)
+        projection = enum_projection(fields, _WORKITEM_PROJECTION_FIELDS) if fields else None
 
         try:
             workspace_map = get_workspace_map()
@@ -525,14 +571,7 @@ def register_workitem_commands(cli: Any) -> None:
             if parts:
                 final_filter = " && ".join(parts)
 
-            if format_output == "json":
-                items = _query_all_workitems(
-                    final_filter, subs or None, workspace_id, max_items=take, page_size=take
-                )
-                click.echo(json.dumps(items, indent=2))
-                return
-
-            def _fmt(item: Dict[str, Any]) -> list:
+            def _fmt(item: Dict[str, Any]) -> List[str]:
                 ws_name = get_workspace_display_name(item.get("workspace", ""), workspace_map)
                 assigned = item.get("assignedTo", "") or ""
                 # Shorten UUID to 8 chars
@@ -547,12 +586,35 @@ def register_workitem_commands(cli: Any) -> None:
                     ws_name[:20],
                 ]
 
+            headers = ["ID", "Name", "Type", "State", "Assigned To", "Workspace"]
+            column_widths = [12, 36, 16, 18, 10, 21]
+            formatter: Callable[[Dict[str, Any]], List[str]] = _fmt
+            if fields:
+                headers, column_widths, formatter = fields_table(fields)
+            elif format_output != "json":
+                projection = _WORKITEM_TABLE_PROJECTION
+
+            if format_output != "table":
+                items = _query_all_workitems(
+                    final_filter,
+                    subs or None,
+                    workspace_id,
+                    max_items=take,
+                    page_size=take,
+                    projection=projection,
+                )
+                if format_output == "json":
+                    click.echo(json.dumps(project_items(items, fields), indent=2))
+                else:
+                    output_formatted_list(items, format_output, headers, column_widths, formatter)
+                return
+
             # Table: server-side pagination — fetch exactly `take` items per request
             cont: Optional[str] = None
             displayed = 0
             while True:
                 page, cont = _fetch_workitems_page(
-                    final_filter, subs or None, workspace_id, take, cont
+                    final_filter, subs or None, workspace_id, take, cont, projection
                 )
                 if not page:
                     if displayed == 0:
@@ -565,9 +627,9 @@ def register_workitem_commands(cli: Any) -> None:
                     data_key="workItems",
                     item_name="work item",
                     format_output=format_output,
-                    formatter_func=_fmt,
-                    headers=["ID", "Name", "Type", "State", "Assigned To", "Workspace"],
-                    column_widths=[12, 36, 16, 18, 10, 21],
+                    formatter_func=formatter,
+                    headers=headers,
+                    column_widths=column_widths,
                     empty_message="No work items found.",
                     enable_pagination=False,
                 )
@@ -1204,7 +1266,7 @@ def register_workitem_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1240,13 +1302,7 @@ def register_workitem_commands(cli: Any) -> None:
             if workspace:
                 workspace_id = resolve_workspace_filter(workspace, workspace_map)
 
-            if format_output == "json":
-                items = _query_all_templates(filter_expr, None, workspace_id, max_items=take)
-                click.echo(json.dumps(items, indent=2))
-                return
-
-            # Table: server-side pagination
-            def _fmt(item: Dict[str, Any]) -> list:
+            def _fmt(item: Dict[str, Any]) -> List[str]:
                 ws_name = get_workspace_display_name(item.get("workspace", ""), workspace_map)
                 return [
                     item.get("id", ""),
@@ -1256,6 +1312,18 @@ def register_workitem_commands(cli: Any) -> None:
                     ws_name[:20],
                 ]
 
+            headers = ["ID", "Name", "Type", "Template Group", "Workspace"]
+            column_widths = [12, 41, 16, 20, 21]
+
+            if format_output != "table":
+                items = _query_all_templates(filter_expr, None, workspace_id, max_items=take)
+                if format_output == "json":
+                    click.echo(json.dumps(items, indent=2))
+                else:
+                    output_formatted_list(items, format_output, headers, column_widths, _fmt)
+                return
+
+            # Table: server-side pagination
             cont: Optional[str] = None
             displayed = 0
             while True:
@@ -1272,8 +1340,8 @@ def register_workitem_commands(cli: Any) -> None:
                     item_name="template",
                     format_output=format_output,
                     formatter_func=_fmt,
-                    headers=["ID", "Name", "Type", "Template Group", "Workspace"],
-                    column_widths=[12, 41, 16, 20, 21],
+                    headers=headers,
+                    column_widths=column_widths,
                     empty_message="No templates found.",
                     enable_pagination=False,
                 )
@@ -1805,7 +1873,7 @@ def register_workitem_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -1825,12 +1893,6 @@ def register_workitem_commands(cli: Any) -> None:
             if workspace:
                 workspace_id = resolve_workspace_filter(workspace, workspace_map)
 
-            if format_output == "json":
-                all_workflows = _query_all_workflows(workspace_id, max_items=take)
-                click.echo(json.dumps(all_workflows, indent=2))
-                return
-
-            # Table: server-side pagination
             def _wf_fmt(wf: Dict[str, Any]) -> list:
                 ws_name = get_workspace_display_name(wf.get("workspace", ""), workspace_map)
                 return [
@@ -1840,6 +1902,20 @@ def register_workitem_commands(cli: Any) -> None:
                     (wf.get("description", "") or "")[:30],
                 ]
 
+            headers = ["Name", "Workspace", "ID", "Description"]
+            column_widths = [40, 30, 36, 32]
+
+            if format_output != "table":
+                all_workflows = _query_all_workflows(workspace_id, max_items=take)
+                if format_output == "json":
+                    click.echo(json.dumps(all_workflows, indent=2))
+                else:
+                    output_formatted_list(
+                        all_workflows, format_output, headers, column_widths, _wf_fmt
+                    )
+                return
+
+            # Table: server-side pagination
             cont: Optional[str] = None
             displayed = 0
             while True:
@@ -1856,8 +1932,8 @@ def register_workitem_commands(cli: Any) -> None:
                     item_name="workflow",
                     format_output=format_output,
                     formatter_func=_wf_fmt,
-                    headers=["Name", "Workspace", "ID", "Description"],
-                    column_widths=[40, 30, 36, 32],
+                    headers=headers,
+                    column_widths=column_widths,
                     empty_message="No workflows found.",
                     enable_pagination=False,
                 )
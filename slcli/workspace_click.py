@@ -6,8 +6,9 @@ from typing import Any, Dict, Optional, Tuple
 
 import click
 
-from .cli_utils import validate_output_format
+from .cli_utils import LIST_OUTPUT_FORMATS, validate_output_format
 from .rich_output import render_table
+from .table_utils import output_formatted_list
 from .utils import (
     ExitCodes,
     format_success,
@@ -66,7 +67,7 @@ def register_workspace_commands(cli: Any) -> None:
     @click.option(
         "--format",
         "-f",
-        type=click.Choice(["table", "json"]),
+        type=click.Choice(LIST_OUTPUT_FORMATS),
         default="table",
         show_default=True,
         help="Output format",
@@ -104,8 +105,18 @@ def register_workspace_commands(cli: Any) -> None:
         format_output = validate_output_format(format)
 
         try:
-            # For JSON format, respect --take and output without interactive pagination
-            if format_output.lower() == "json":
+
+            def workspace_formatter(workspace: dict) -> list:
+                enabled = "✓" if workspace.get("enabled", True) else "✗"
+                default = "✓" if workspace.get("default", False) else ""
+                return [workspace.get("name", "Unknown"), workspace.get("id", ""), enabled, default]
+
+            headers = ["Name", "ID", "Enabled", "Default"]
+            column_widths = [30, 36, 8, 8]
+
+            # For JSON and delimited formats, respect --take and output without
+            # interactive pagination
+            if format_output.lower() != "table":
                 all_workspaces = []
                 skip = 0
                 remaining = take if take and take > 0 else 25
@@ -134,7 +145,12 @@ def register_workspace_commands(cli: Any) -> None:
                 # Trim in case we over-collected due to page boundaries
                 if take:
                     all_workspaces = all_workspaces[:take]
-                click.echo(json.dumps(all_workspaces, indent=2))
+                if format_output.lower() == "json":
+                    click.echo(json.dumps(all_workspaces, indent=2))
+                else:
+                    output_formatted_list(
+                        all_workspaces, format_output, headers, column_widths, workspace_formatter
+                    )
                 return
 
             # For table format, implement interactive lazy loading
@@ -142,11 +158,6 @@ def register_workspace_commands(cli: Any) -> None:
             total_count_from_api = 0
             shown_count = 0
 
-            def workspace_formatter(workspace: dict) -> list:
-                enabled = "✓" if workspace.get("enabled", True) else "✗"
-                default = "✓" if workspace.get("default", False) else ""
-                return [workspace.get("name", "Unknown"), workspace.get("id", ""), enabled, default]
-
             while True:
                 # Fetch next page
                 workspaces, total_count_from_api, error = _fetch_workspaces_page(
@@ -170,13 +181,11 @@ def register_workspace_commands(cli: Any) -> None:
                     break
 
                 # Display the page
-                from .table_utils import output_formatted_list
-
                 output_formatted_list(
                     workspaces,
                     format_output,
-                    ["Name", "ID", "Enabled", "Default"],
-                    [30, 36, 8, 8],
+                    headers,
+                    column_widths,
                     workspace_formatter,
                     "",  # Empty message not needed here
                     "workspace(s)",
@@ -0,0 +1 @@
+"""CLI benchmarks against a local SystemLink stand-in server."""
@@ -0,0 +1,109 @@
+"""Benchmark fixtures: a local SystemLink stand-in and an in-process CLI runner."""
+
+import os
+import tracemalloc
+from typing import Any, Dict, Generator, List
+
+import pytest
+from click.testing import CliRunner
+
+from .standin_server import StandInServer
+
+
+def pytest_addoption(parser: Any) -> None:
+    """Register stand-in server options."""
+    group = parser.getgroup("standin", "SystemLink stand-in server")
+    group.addoption(
+        "--standin-latency",
+        type=float,
+        default=float(os.getenv("SLCLI_BENCH_LATENCY", "0")),
+        help="Seconds the stand-in adds to every response (default: 0).",
+    )
+    group.addoption(
+        "--standin-max-rps",
+        type=float,
+        default=None,
+        help="Answer HTTP 429 once this many requests per second are exceeded.",
+    )
+
+
+@pytest.fixture(scope="session")
+def standin(
+    request: Any, tmp_path_factory: pytest.TempPathFactory
+) -> Generator[StandInServer, None, None]:
+    """Start the stand-in and point slcli at it for the whole session."""
+    server = StandInServer(
+        latency=request.config.getoption("standin_latency"),
+        max_requests_per_second=request.config.getoption("standin_max_rps"),
+    ).start()
+    overrides = {
+        "SLCLI_API_URL": server.url,
+        "SLCLI_API_KEY": "benchmark-key",
+        "SYSTEMLINK_PLATFORM": "SLE",
+        "SLCLI_NO_DAEMON": "1",
+        "XDG_CONFIG_HOME": str(tmp_path_factory.mktemp("config")),
+    }
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield server
+    finally:
+        server.stop()
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class CliBenchmark:
+    """Run slcli commands in-process against the stand-in and record their cost."""
+
+    def __init__(self, benchmark: Any, server: StandInServer) -> None:
+        """Wrap the pytest-benchmark fixture."""
+        from slcli.main import cli
+
+        self.benchmark = benchmark
+        self.server = server
+        self.cli = cli
+
+    def invoke(self, args: List[str]) -> Any:
+        """Run one command and fail the test when it exits non-zero."""
+        result = CliRunner().invoke(self.cli, args, catch_exceptions=False)
+        assert result.exit_code == 0, result.output
+        return result
+
+    def profile(self, args: List[str]) -> Dict[str, Any]:
+        """Run ``args`` once on fresh data, returning request count and peak memory."""
+        self.server.reset()
+        tracemalloc.start()
+        try:
+            self.invoke(args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            "requests": self.server.request_count,
+            "requestsByEndpoint": dict(sorted(self.server.requests.items())),
+            "throttled": self.server.throttled,
+            "peakMemoryKiB": round(peak / 1024, 1),
+        }
+
+    def __call__(self, args: List[str], rounds: int = 5) -> Dict[str, Any]:
+        """Benchmark ``args`` and attach request count and peak memory to the report.
+
+        Every round starts from freshly seeded data so commands that create
+        resources always do the same work.
+        """
+        stats = self.profile(args)
+        self.benchmark.extra_info.update(stats)
+        self.benchmark.pedantic(
+            self.invoke, args=(args,), setup=self.server.reset, rounds=rounds, iterations=1
+        )
+        return stats
+
+
+@pytest.fixture
+def run_cli(benchmark: Any, standin: StandInServer) -> CliBenchmark:
+    """Return a callable that benchmarks one slcli command line."""
+    return CliBenchmark(benchmark, standin)
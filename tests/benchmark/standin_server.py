@@ -0,0 +1,765 @@
+"""Local stand-in for the SystemLink services that slcli calls.
+
+The server keeps seeded synthetic data in memory and implements the subset of
+the niuser, nitag, nisysmgmt, niapm, nitestmonitor, nifile, nidataframe and
+nilocation endpoints the CLI uses. It counts every request and can add a
+fixed latency per request or answer with HTTP 429 when a request-rate budget is
+exceeded, so benchmarks can measure how chatty and how slow a command is
+without a live tenant.
+
+Filters are only partially understood: equality and ``Contains`` clauses
+joined by ``&&`` are applied; any other expression matches every item.
+
+Run it standalone with ``python -m tests.benchmark.standin_server --port 8765``.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+STATUS_TYPES = ("PASSED", "FAILED", "ERRORED", "TERMINATED", "RUNNING")
+PROGRAMS = ("Calibration", "Functional Test", "Burn-in", "Final Inspection")
+MODELS = (("PXIe-4139", "SMU"), ("PXIe-4081", "DMM"), ("PXIe-5171", "Oscilloscope"))
+
+_CLAUSE = re.compile(
+    r"^\(?\s*([A-Za-z_][\w.]*)\s*(?:==\s*(@\d+|\"[^\"]*\")|\.Contains\((@\d+|\"[^\"]*\")\))\s*\)?$"
+)
+
+Handler = Callable[["StandInServer", Dict[str, Any], Dict[str, List[str]], Any], Tuple[int, Any]]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:24]
+
+
+def _lookup(item: Dict[str, Any], path: str) -> Any:
+    value: Any = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part, value.get(part[:1].lower() + part[1:]))
+    return value
+
+
+def _compile_filter(expression: Optional[str], substitutions: List[Any]) -> Callable[[Any], bool]:
+    """Return a predicate for the simple clauses of a Dynamic LINQ filter."""
+    if not expression:
+        return lambda _item: True
+    checks = []
+    for clause in expression.split("&&"):
+        match = _CLAUSE.match(clause.strip())
+        if not match:
+            continue
+        field, equals, contains = match.groups()
+        token = equals or contains
+        if token.startswith("@"):
+            index = int(token[1:])
+            expected = substitutions[index] if index < len(substitutions) else None
+        else:
+            expected = token.strip('"')
+        if equals is not None:
+            checks.append(lambda item, f=field, e=expected: str(_lookup(item, f)) == str(e))
+        else:
+            checks.append(
+                lambda item, f=field, e=expected: str(e).lower()
+                in str(_lookup(item, f) or "").lower()
+            )
+    return lambda item: all(check(item) for check in checks)
+
+
+class StandInServer:
+    """In-memory SystemLink stand-in served over HTTP on a background thread."""
+
+    def __init__(
+        self,
+        seed: int = 1,
+        workspaces: int = 3,
+        systems: int = 200,
+        assets: int = 500,
+        products: int = 20,
+        results: int = 2000,
+        files: int = 300,
+        tags: int = 500,
+        tables: int = 20,
+        latency: float = 0.0,
+        max_requests_per_second: Optional[float] = None,
+    ) -> None:
+        """Seed synthetic data.
+
+        Args:
+            seed: Random seed so every run serves identical data.
+            workspaces: Number of workspaces; other items are spread across them.
+            systems: Number of managed systems.
+            assets: Number of assets.
+            products: Number of Test Monitor products.
+            results: Number of test results.
+            files: Number of files.
+            tags: Number of tags.
+            tables: Number of DataFrame tables.
+            latency: Seconds added to every response.
+            max_requests_per_second: Answer 429 when this rate is exceeded.
+        """
+        self.latency = latency
+        self.max_requests_per_second = max_requests_per_second
+        self.requests: Counter[str] = Counter()
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._window: List[float] = []
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._sizes = (seed, workspaces, systems, assets, products, results, files, tags, tables)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the seeded data and forget recorded requests."""
+        seed, workspaces, systems, assets, products, results, files, tags, tables = self._sizes
+        with self._lock:
+            self._seed(random.Random(seed), workspaces, systems, assets, products, results, files)
+            self._seed_tags_and_tables(tags, tables)
+        self.reset_counters()
+
+    # --- seeding -------------------------------------------------------------------
+
+    def _seed(
+        self,
+        rng: random.Random,
+        workspaces: int,
+        systems: int,
+        assets: int,
+        products: int,
+        results: int,
+        files: int,
+    ) -> None:
+        self.workspaces: List[Dict[str, Any]] = [
+            {"id": f"ws-{index}", "name": "Default" if index == 0 else f"Lab {index}"}
+            for index in range(workspaces)
+        ]
+        ws_ids = [ws["id"] for ws in self.workspaces]
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        self.systems: List[Dict[str, Any]] = [
+            {
+                "id": f"sys-{index:05d}",
+                "alias": f"PXI-{index:05d}",
+                "workspace": ws_ids[index % len(ws_ids)],
+                "createdTimestamp": start.isoformat(),
+                "lastUpdatedTimestamp": (start + timedelta(hours=index)).isoformat(),
+                "connected": {"data": {"state": "CONNECTED" if index % 5 else "DISCONNECTED"}},
+                "grains": {
+                    "data": {"host": f"host-{index:05d}", "kernel": "Linux", "cpuarch": "x86_64"}
+                },
+                "packages": {"data": {"ni-daqmx": {"displayversion": "24.0.0"}}},
+                "keywords": {"data": []},
+                "properties": {"data": {}},
+            }
+            for index in range(systems)
+        ]
+        self.assets: List[Dict[str, Any]] = []
+        for index in range(assets):
+            model, kind = MODELS[index % len(MODELS)]
+            self.assets.append(
+                {
+                    "id": f"asset-{index:05d}",
+                    "name": f"{kind} {index}",
+                    "modelName": model,
+                    "vendorName": "NI",
+                    "serialNumber": f"SN{index:07d}",
+                    "assetType": "GENERIC",
+                    "busType": "PCI_PXI",
+                    "workspace": ws_ids[index % len(ws_ids)],
+                    "location": (
+                        {"minionId": self.systems[index % max(systems, 1)]["id"]} if systems else {}
+                    ),
+                    "keywords": [],
+                    "properties": {},
+                    "lastUpdatedTimestamp": (start + timedelta(minutes=index)).isoformat(),
+                }
+            )
+        self.products: List[Dict[str, Any]] = [
+            {
+                "id": f"prod-{index:04d}",
+                "partNumber": f"PN-{index:04d}",
+                "name": f"Product {index}",
+                "family": f"Family {index % 4}",
+                "workspace": ws_ids[index % len(ws_ids)],
+                "keywords": [],
+                "properties": {},
+                "fileIds": [],
+                "updatedAt": start.isoformat(),
+            }
+            for index in range(products)
+        ]
+        self.results: List[Dict[str, Any]] = []
+        for index in range(results):
+            started = start + timedelta(minutes=7 * index)
+            status = STATUS_TYPES[0] if rng.random() < 0.8 else rng.choice(STATUS_TYPES[1:])
+            self.results.append(
+                {
+                    "id": f"res-{index:06d}",
+                    "programName": PROGRAMS[index % len(PROGRAMS)],
+                    "status": {"statusType": status, "statusName": status.title()},
+                    "partNumber": f"PN-{index % max(products, 1):04d}",
+                    "serialNumber": f"DUT-{index // 2:06d}",
+                    "systemId": self.systems[index % max(systems, 1)]["id"] if systems else "",
+                    "hostName": f"host-{index % 50:05d}",
+                    "operator": f"operator{index % 7}",
+                    "startedAt": started.isoformat().replace("+00:00", "Z"),
+                    "updatedAt": started.isoformat().replace("+00:00", "Z"),
+                    "totalTimeInSeconds": round(rng.uniform(5, 120), 2),
+                    "workspace": ws_ids[index % len(ws_ids)],
+                    "keywords": [],
+                    "properties": {},
+                    "fileIds": [],
+                }
+            )
+        self.steps: List[Dict[str, Any]] = []
+        self.files: List[Dict[str, Any]] = [
+            {
+                "id": f"file-{index:05d}",
+                "workspace": ws_ids[index % len(ws_ids)],
+                "created": start.isoformat(),
+                "size": 1024 * (index + 1),
+                "size64": 1024 * (index + 1),
+                "properties": {"Name": f"report-{index:05d}.csv"},
+                "serviceGroup": "Default",
+            }
+            for index in range(files)
+        ]
+        self.file_contents: Dict[str, bytes] = {}
+        self.locations: List[Dict[str, Any]] = []
+
+    def _seed_tags_and_tables(self, tags: int, tables: int) -> None:
+        ws_id = self.workspaces[0]["id"]
+        self.tags: List[Dict[str, Any]] = [
+            {
+                "path": f"Line{index % 10}.Station{index}.Temperature",
+                "type": "DOUBLE",
+                "workspace": ws_id,
+                "keywords": [],
+                "properties": {},
+                "collectAggregates": False,
+                "current": {"value": {"type": "DOUBLE", "value": str(20 + index % 10)}},
+            }
+            for index in range(tags)
+        ]
+        self.tables: List[Dict[str, Any]] = [
+            {
+                "id": f"table-{index:04d}",
+                "name": f"Measurements {index}",
+                "workspace": ws_id,
+                "columns": [
+                    {"name": "index", "dataType": "INT32", "columnType": "INDEX"},
+                    {"name": "value", "dataType": "FLOAT64", "columnType": "NORMAL"},
+                ],
+                "rowCount": 0,
+                "supportsAppend": True,
+                "properties": {},
+                "createdAt": _now(),
+                "metadataModified": _now(),
+            }
+            for index in range(tables)
+        ]
+        self.table_rows: Dict[str, List[List[str]]] = {table["id"]: [] for table in self.tables}
+
+    # --- lifecycle -----------------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("server is not running")
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self, port: int = 0) -> "StandInServer":
+        """Start serving on 127.0.0.1 (``port`` 0 picks a free port)."""
+        server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                server.dispatch(self)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle  # noqa: N815
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _RequestHandler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StandInServer":
+        """Start the server for use in a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def reset_counters(self) -> None:
+        """Forget recorded requests."""
+        with self._lock:
+            self.requests.clear()
+            self.throttled = 0
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests received since the last reset."""
+        return sum(self.requests.values())
+
+    # --- dispatch ------------------------------------------------------------------
+
+    def _throttle(self) -> bool:
+        if not self.max_requests_per_second:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.max_requests_per_second:
+                self.throttled += 1
+                return True
+            self._window.append(now)
+        return False
+
+    def dispatch(self, request: BaseHTTPRequestHandler) -> None:
+        """Route one HTTP request."""
+        parsed = urlparse(request.path)
+        length = int(request.headers.get("Content-Length") or 0)
+        raw = request.rfile.read(length) if length else b""
+        with self._lock:
+            self.requests[f"{request.command} {parsed.path}"] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        body: Any
+        if self._throttle():
+            status, body = 429, {"error": {"name": "Throttled", "message": "Too many requests"}}
+            extra = {"Retry-After": "1"}
+        else:
+            extra = {}
+            content_type = request.headers.get("Content-Type", "")
+            payload: Any = raw
+            if raw and "json" in content_type:
+                try:
+                    payload = json.loads(raw)
+                except ValueError:
+                    payload = {}
+            status, body = self.route(request.command, parsed.path, parse_qs(parsed.query), payload)
+
+        if isinstance(body, (bytes, bytearray)):
+            data, content_type = bytes(body), "application/octet-stream"
+        else:
+            data = b"" if body is None else json.dumps(body).encode("utf-8")
+            content_type = "application/json"
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(data)))
+        for key, value in extra.items():
+            request.send_header(key, value)
+        request.end_headers()
+        request.wfile.write(data)
+
+    def route(
+        self, method: str, path: str, query: Dict[str, List[str]], payload: Any
+    ) -> Tuple[int, Any]:
+        """Return ``(status, body)`` for a request."""
+        for pattern_method, pattern, handler in _ROUTES:
+            if pattern_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return handler(self, match.groupdict(), query, payload)
+        return 404, {"error": {"name": "NotFound", "message": f"No stand-in for {method} {path}"}}
+
+
+# --- endpoint helpers ------------------------------------------------------------------
+
+
+def _page(items: List[Any], payload: Dict[str, Any], default_take: int = 1000) -> List[Any]:
+    skip = int(payload.get("skip") or 0)
+    take = payload.get("take")
+    take = default_take if take is None else int(take)
+    return items[skip : skip + take]
+
+
+def _token_page(
+    items: List[Any], payload: Dict[str, Any], default_take: int = 1000
+) -> Tuple[List[Any], Optional[str]]:
+    offset = int(payload.get("continuationToken") or 0)
+    take = payload.get("take")
+    take = default_take if take is None else int(take)
+    page = items[offset : offset + take]
+    next_offset = offset + len(page)
+    return page, (str(next_offset) if take and next_offset < len(items) else None)
+
+
+def _filtered(items: List[Dict[str, Any]], payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    predicate = _compile_filter(payload.get("filter"), list(payload.get("substitutions") or []))
+    return [item for item in items if predicate(item)]
+
+
+def _workspaces(
+    server: StandInServer, _: Dict[str, str], query: Dict[str, List[str]], __: Any
+) -> Tuple[int, Any]:
+    take = int((query.get("take") or ["100"])[0])
+    skip = int((query.get("skip") or ["0"])[0])
+    return 200, {
+        "workspaces": server.workspaces[skip : skip + take],
+        "totalCount": len(server.workspaces),
+    }
+
+
+def _query_systems(
+    server: StandInServer, _: Dict[str, str], __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.systems, payload)
+    return 200, {"data": _page(items, payload, 100), "count": len(items)}
+
+
+def _search_systems(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.systems, payload)
+    systems = [
+        {
+            "id": system["id"],
+            "alias": system["alias"],
+            "workspace": system["workspace"],
+            "connected": system["connected"]["data"]["state"],
+            "advancedGrains": {
+                "host": system["grains"]["data"]["host"],
+                "os": system["grains"]["data"]["kernel"],
+            },
+        }
+        for system in _page(items, payload, 100)
+    ]
+    return 200, {"systems": systems, "totalCount": len(items)}
+
+
+def _create_virtual_system(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    system = {"id": f"sys-{_new_id()}", "alias": payload.get("alias", ""), **payload}
+    system.setdefault("workspace", server.workspaces[0]["id"])
+    server.systems.append(system)
+    return 200, {"minionId": system["id"]}
+
+
+def _query_assets(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.assets, payload)
+    return 200, {"assets": _page(items, payload, 100), "totalCount": len(items)}
+
+
+def _create_assets(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    created = []
+    for asset in payload.get("assets", []):
+        item = dict(asset, id=f"asset-{_new_id()}", lastUpdatedTimestamp=_now())
+        server.assets.append(item)
+        created.append(item)
+    return 201, {"assets": created, "failed": []}
+
+
+def _query_results(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.results, payload)
+    if payload.get("orderBy") == "STARTED_AT":
+        items = sorted(
+            items, key=lambda item: item["startedAt"], reverse=bool(payload.get("descending"))
+        )
+    page, token = _token_page(items, payload)
+    body: Dict[str, Any] = {"results": page, "continuationToken": token}
+    if payload.get("returnCount"):
+        body["totalCount"] = len(items)
+    return 200, body
+
+
+def _list_results(
+    server: StandInServer, _: Any, query: Dict[str, List[str]], __: Any
+) -> Tuple[int, Any]:
+    payload: Dict[str, Any] = {
+        "continuationToken": query.get("continuationToken", [None])[0],
+        "take": query.get("take", ["1000"])[0],
+    }
+    page, token = _token_page(server.results, payload)
+    return 200, {"results": page, "continuationToken": token, "totalCount": len(server.results)}
+
+
+def _create_results(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    created = []
+    for result in payload.get("results", []):
+        item = dict(result, id=f"res-{_new_id()}", updatedAt=_now())
+        status = item.get("status")
+        if isinstance(status, dict):
+            status.setdefault("statusName", str(status.get("statusType", "")).title())
+        server.results.append(item)
+        created.append(item)
+    return 201, {"results": created, "failed": []}
+
+
+def _create_steps(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    created = []
+    for step in payload.get("steps", []):
+        item = dict(step)
+        item.setdefault("stepId", _new_id())
+        server.steps.append(item)
+        created.append(item)
+    return 201, {"steps": created, "failed": []}
+
+
+def _query_steps(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.steps, payload)
+    page, token = _token_page(items, payload)
+    return 200, {"steps": page, "continuationToken": token, "totalCount": len(items)}
+
+
+def _list_products(
+    server: StandInServer, _: Any, query: Dict[str, List[str]], __: Any
+) -> Tuple[int, Any]:
+    payload = {"continuationToken": query.get("continuationToken", [None])[0]}
+    page, token = _token_page(server.products, payload)
+    return 200, {"products": page, "continuationToken": token}
+
+
+def _query_products(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = _filtered(server.products, payload)
+    page, token = _token_page(items, payload)
+    body: Dict[str, Any] = {"products": page, "continuationToken": token}
+    if payload.get("returnCount"):
+        body["totalCount"] = len(items)
+    return 200, body
+
+
+def _create_products(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    created = []
+    for product in payload.get("products", []):
+        item = dict(product, id=f"prod-{_new_id()}", updatedAt=_now())
+        server.products.append(item)
+        created.append(item)
+    return 201, {"products": created, "failed": []}
+
+
+def _list_locations(server: StandInServer, _: Any, __: Any, ___: Any) -> Tuple[int, Any]:
+    return 200, {"locations": server.locations}
+
+
+def _create_location(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    item = dict(payload, id=f"loc-{_new_id()}")
+    server.locations.append(item)
+    return 201, item
+
+
+def _query_files(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = server.files
+    name_filter = re.search(r'Name\.Contains\("([^"]*)"\)', str(payload.get("filter") or ""))
+    if name_filter:
+        needle = name_filter.group(1).lower()
+        items = [item for item in items if needle in item["properties"]["Name"].lower()]
+    return 200, {"availableFiles": _page(items, payload, 1000), "totalCount": len(items)}
+
+
+def _search_files(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    items = server.files
+    for needle in re.findall(r'name:\("\*?([^"*]*)\*?"\)', str(payload.get("filter") or "")):
+        items = [item for item in items if needle.lower() in item["properties"]["Name"].lower()]
+    page = _page(items, payload, 1000)
+    return 200, {"availableFiles": page, "totalCount": len(items)}
+
+
+def _file_data(server: StandInServer, match: Dict[str, str], __: Any, ___: Any) -> Tuple[int, Any]:
+    file_id = match["id"]
+    if not any(item["id"] == file_id for item in server.files):
+        return 404, {"error": {"name": "NotFound", "message": "File not found"}}
+    return 200, server.file_contents.get(file_id, b"index,value\n1,2.5\n")
+
+
+def _query_tags(server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]) -> Tuple[int, Any]:
+    items = server.tags
+    path_filter = payload.get("filter") or ""
+    prefix = re.search(r'path\s*=\s*"([^"*]*)\*?"', path_filter)
+    if prefix:
+        items = [tag for tag in items if tag["path"].startswith(prefix.group(1))]
+    page, token = _token_page(items, payload)
+    return 200, {
+        "tagsWithValues": [{"tag": tag, "current": tag["current"]} for tag in page],
+        "continuationToken": token,
+        "totalCount": len(items),
+    }
+
+
+def _get_tag(server: StandInServer, match: Dict[str, str], __: Any, ___: Any) -> Tuple[int, Any]:
+    path = unquote(match["path"])
+    for tag in server.tags:
+        if tag["path"] == path:
+            return 200, tag
+    return 404, {"error": {"name": "NotFound", "message": "Tag not found"}}
+
+
+def _put_tag(
+    server: StandInServer, match: Dict[str, str], __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    path = unquote(match["path"])
+    server.tags = [tag for tag in server.tags if tag["path"] != path]
+    server.tags.append(dict(payload, path=path, current=None))
+    return 200, None
+
+
+def _query_tables(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    page, token = _token_page(server.tables, payload)
+    return 200, {"tables": page, "continuationToken": token, "totalCount": len(server.tables)}
+
+
+def _get_table(server: StandInServer, match: Dict[str, str], __: Any, ___: Any) -> Tuple[int, Any]:
+    for table in server.tables:
+        if table["id"] == match["id"]:
+            return 200, table
+    return 404, {"error": {"name": "NotFound", "message": "Table not found"}}
+
+
+def _create_table(
+    server: StandInServer, _: Any, __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    table = dict(
+        payload, id=f"table-{_new_id()}", rowCount=0, supportsAppend=True, createdAt=_now()
+    )
+    table.setdefault("workspace", server.workspaces[0]["id"])
+    server.tables.append(table)
+    server.table_rows[table["id"]] = []
+    return 201, {"id": table["id"]}
+
+
+def _append_rows(
+    server: StandInServer, match: Dict[str, str], __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    rows = server.table_rows.get(match["id"])
+    if rows is None:
+        return 404, {"error": {"name": "NotFound", "message": "Table not found"}}
+    frame = payload.get("frame") or {}
+    rows.extend(frame.get("data") or [])
+    for table in server.tables:
+        if table["id"] == match["id"]:
+            table["rowCount"] = len(rows)
+    return 204, None
+
+
+def _query_table_data(
+    server: StandInServer, match: Dict[str, str], __: Any, payload: Dict[str, Any]
+) -> Tuple[int, Any]:
+    rows = server.table_rows.get(match["id"])
+    if rows is None:
+        return 404, {"error": {"name": "NotFound", "message": "Table not found"}}
+    table = next(table for table in server.tables if table["id"] == match["id"])
+    page, token = _token_page(rows, payload, 1000)
+    columns = payload.get("columns") or [column["name"] for column in table["columns"]]
+    return 200, {
+        "frame": {"columns": columns, "data": page},
+        "totalRowCount": len(rows),
+        "continuationToken": token,
+    }
+
+
+_ROUTES: List[Tuple[str, "re.Pattern[str]", Handler]] = [
+    ("GET", re.compile(r"^/niuser/v1/workspaces$"), _workspaces),
+    ("POST", re.compile(r"^/nisysmgmt/v1/query-systems$"), _query_systems),
+    ("POST", re.compile(r"^/nisysmgmt/v1/materialized/search-systems$"), _search_systems),
+    ("POST", re.compile(r"^/nisysmgmt/v1/virtual$"), _create_virtual_system),
+    ("POST", re.compile(r"^/niapm/v1/query-assets$"), _query_assets),
+    ("POST", re.compile(r"^/niapm/v1/assets$"), _create_assets),
+    ("POST", re.compile(r"^/nitestmonitor/v2/query-results$"), _query_results),
+    ("GET", re.compile(r"^/nitestmonitor/v2/results$"), _list_results),
+    ("POST", re.compile(r"^/nitestmonitor/v2/results$"), _create_results),
+    ("POST", re.compile(r"^/nitestmonitor/v2/steps$"), _create_steps),
+    ("POST", re.compile(r"^/nitestmonitor/v2/query-steps$"), _query_steps),
+    ("GET", re.compile(r"^/nitestmonitor/v2/products$"), _list_products),
+    ("POST", re.compile(r"^/nitestmonitor/v2/products$"), _create_products),
+    ("POST", re.compile(r"^/nitestmonitor/v2/query-products$"), _query_products),
+    ("GET", re.compile(r"^/nilocation/v1/locations$"), _list_locations),
+    ("POST", re.compile(r"^/nilocation/v1/locations$"), _create_location),
+    ("POST", re.compile(r"^/nifile/v1/service-groups/Default/search-files$"), _search_files),
+    ("POST", re.compile(r"^/nifile/v1/service-groups/Default/query-files-linq$"), _query_files),
+    (
+        "GET",
+        re.compile(r"^/nifile/v1/service-groups/Default/files/(?P<id>[^/]+)/data$"),
+        _file_data,
+    ),
+    ("POST", re.compile(r"^/nitag/v2/query-tags-with-values$"), _query_tags),
+    ("GET", re.compile(r"^/nitag/v2/tags/(?:[^/]+/)?(?P<path>[^/]+)$"), _get_tag),
+    ("PUT", re.compile(r"^/nitag/v2/tags/(?:[^/]+/)?(?P<path>[^/]+)$"), _put_tag),
+    ("POST", re.compile(r"^/nidataframe/v1/query-tables$"), _query_tables),
+    ("POST", re.compile(r"^/nidataframe/v1/tables$"), _create_table),
+    ("GET", re.compile(r"^/nidataframe/v1/tables/(?P<id>[^/]+)$"), _get_table),
+    ("POST", re.compile(r"^/nidataframe/v1/tables/(?P<id>[^/]+)/data$"), _append_rows),
+    ("POST", re.compile(r"^/nidataframe/v1/tables/(?P<id>[^/]+)/query-data$"), _query_table_data),
+]
+
+
+def main() -> None:
+    """Serve seeded data until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--max-rps", type=float, default=None, help="Answer 429 above this rate")
+    parser.add_argument("--results", type=int, default=2000)
+    parser.add_argument("--systems", type=int, default=200)
+    args = parser.parse_args()
+    server = StandInServer(
+        results=args.results,
+        systems=args.systems,
+        latency=args.latency,
+        max_requests_per_second=args.max_rps,
+    ).start(args.port)
+    print(f"SystemLink stand-in listening on {server.url} (API key: any value)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
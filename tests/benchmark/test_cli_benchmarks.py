@@ -0,0 +1,59 @@
+"""Wall time, request count and peak memory of key commands against the stand-in.
+
+Request budgets are exact for the seeded data set, so a change that makes a
+command chattier fails here even when the stand-in answers instantly.
+"""
+
+from typing import Any
+
+import pytest
+
+from .conftest import CliBenchmark
+from .standin_server import StandInServer
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_system_list(run_cli: CliBenchmark) -> None:
+    """Test system list fetches workspaces and two pages of systems."""
+    stats = run_cli(["system", "list", "--format", "json", "--take", "200"])
+    # Workspace names plus two pages of materialized search results
+    assert stats["requests"] == 3
+
+
+def test_testmonitor_result_summary(run_cli: CliBenchmark, standin: StandInServer) -> None:
+    """Test the result summary pages through results after one count request."""
+    stats = run_cli(["testmonitor", "result", "list", "--summary", "--format", "json"])
+    # One count request plus one request per page of results
+    assert stats["requests"] == 1 + len(standin.results) // 200
+
+
+def test_file_query(run_cli: CliBenchmark) -> None:
+    """Test a filtered file query is answered by a single search request."""
+    stats = run_cli(["file", "query", "--format", "json", "--filter", 'name:("*report-001*")'])
+    assert stats["requests"] == 1
+
+
+def test_example_install(run_cli: CliBenchmark) -> None:
+    """Test installing an example keeps its request budget."""
+    stats = run_cli(
+        ["example", "install", "exercise-5-1-parametric-insights", "--workspace", "Default"],
+        rounds=3,
+    )
+    assert stats["requests"] == 105
+
+
+def test_standin_serves_seeded_data(standin: StandInServer) -> None:
+    """Test the stand-in answers queries from its seeded data and counts requests."""
+    import requests
+
+    standin.reset()
+    response = requests.post(
+        f"{standin.url}/nisysmgmt/v1/query-systems",
+        json={"take": 5, "filter": "alias == @0", "substitutions": ["PXI-00003"]},
+        timeout=10,
+    )
+    body: Any = response.json()
+    assert [system["id"] for system in body["data"]] == ["sys-00003"]
+    assert standin.requests == {"POST /nisysmgmt/v1/query-systems": 1}
+    assert requests.get(f"{standin.url}/nothing", timeout=10).status_code == 404
@@ -0,0 +1,88 @@
+"""Cold-start import budget for ``slcli --version`` and ``slcli --help``.
+
+Each case runs in a fresh interpreter under ``python -X importtime`` and sums
+the cumulative time of every module imported after interpreter start-up
+(``site`` and everything before it are excluded), so the budget measures what
+slcli itself pulls in. The best of several runs is compared with the budget to
+keep scheduler noise out of the result. Set ``SLCLI_IMPORT_BUDGET_SCALE`` to
+loosen the budgets on slow CI runners.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+# Milliseconds of import time allowed per command line.
+IMPORT_BUDGETS_MS = {
+    "--version": 40.0,
+    "--help": 200.0,
+}
+# Modules that must stay behind first use; loading any of them at start-up
+# costs tens of milliseconds.
+DEFERRED_MODULES = ("requests", "urllib3", "keyring", "questionary", "cryptography", "truststore")
+RUNS = 5
+
+_PROBE = (
+    "import sys\n"
+    "from slcli.__main__ import main\n"
+    "sys.argv = ['slcli'] + sys.argv[1:]\n"
+    "try:\n"
+    "    main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+def _parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """Return total milliseconds after interpreter start-up and per-module cumulative times."""
+    modules: Dict[str, float] = {}
+    total_us = 0
+    started = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # column header
+        stripped = name.strip()
+        modules[stripped] = int(cumulative) / 1000
+        top_level = name.startswith(" ") and not name.startswith("  ")
+        if not top_level:
+            continue
+        if started:
+            total_us += int(cumulative)
+        elif stripped == "site":
+            started = True
+    return total_us / 1000, modules
+
+
+def _measure(args: List[str]) -> Tuple[float, Dict[str, float]]:
+    env = {**os.environ, "SLCLI_NO_DAEMON": "1"}
+    command = [sys.executable, "-X", "importtime", "-c", _PROBE, *args]
+    subprocess.run(command, capture_output=True, env=env, check=True)  # warm bytecode caches
+    best: Tuple[float, Dict[str, float]] = (float("inf"), {})
+    for _ in range(RUNS):
+        result = subprocess.run(command, capture_output=True, text=True, env=env, check=True)
+        total, modules = _parse_importtime(result.stderr)
+        if total < best[0]:
+            best = (total, modules)
+    return best
+
+
+@pytest.mark.parametrize("flag", sorted(IMPORT_BUDGETS_MS))
+def test_startup_import_budget(flag: str) -> None:
+    scale = float(os.getenv("SLCLI_IMPORT_BUDGET_SCALE", "1"))
+    budget = IMPORT_BUDGETS_MS[flag] * scale
+    total, modules = _measure([flag])
+
+    loaded = [name for name in DEFERRED_MODULES if name in modules]
+    assert loaded == [], f"slcli {flag} imported {', '.join(loaded)}"
+
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]
+    report = "\n".join(f"  {ms:8.1f} ms  {name}" for name, ms in slowest)
+    assert (
+        total <= budget
+    ), f"slcli {flag} imports took {total:.1f} ms (budget {budget:.0f} ms)\n{report}"
@@ -7,7 +7,7 @@ because the Keychain is locked and no user session exists.
 Also patches network utilities to prevent real HTTP calls during tests.
 """
 
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 import keyring
 import pytest
@@ -102,3 +102,18 @@ def mock_network_calls(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("requests.put", mock_requests_method)
     monkeypatch.setattr("requests.patch", mock_requests_method)
     monkeypatch.setattr("requests.delete", mock_requests_method)
+
+
+@pytest.fixture(autouse=True)
+def reset_platform_cache() -> Iterator[None]:
+    """Start every test without a cached platform or service probe result.
+
+    ``get_platform`` and the service status probes are cached for the life of
+    the process, so without this a test could inherit the platform another
+    test on the same worker detected (or probe a server with its HTTP mocks).
+    """
+    from slcli.platform import clear_platform_cache
+
+    clear_platform_cache()
+    yield
+    clear_platform_cache()
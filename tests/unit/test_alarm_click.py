@@ -8,7 +8,9 @@ import pytest
 from click.testing import CliRunner
 
 from slcli.alarm_click import (
+    _AlarmIndex,
     _build_alarm_filter,
+    _build_alarm_predicate,
     _extract_alarm_items,
     _extract_json,
     _parse_properties,
@@ -628,3 +630,144 @@ def test_monitor_stops_cleanly_on_keyboard_interrupt(runner: CliRunner, monkeypa
 
     assert result.exit_code == 0, result.output
     assert "Alarm monitor stopped." in result.output
+
+
+def test_monitor_tracks_alarms_beyond_take_and_warns_on_no_clear(
+    runner: CliRunner, monkeypatch: Any
+) -> None:
+    """--take limits the snapshot only; a resync must not remove alarms beyond it."""
+    patch_alarm_config(monkeypatch)
+    alarms = [
+        {"instanceId": f"instance-{n}", "active": True, "updatedAt": f"2024-01-01T00:00:0{n}Z"}
+        for n in range(3)
+    ]
+    payloads: List[Dict[str, Any]] = []
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> MockResponse:
+        payloads.append(kwargs["payload"])
+        payload = kwargs["payload"]
+        newest_first = list(reversed(alarms))[: payload["take"]]
+        return MockResponse({"alarms": [] if "substitutions" in payload else newest_first})
+
+    def stop_after_resync(interval: float) -> None:
+        if len(payloads) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("slcli.alarm_click.make_api_request", fake_request)
+    monkeypatch.setattr("slcli.alarm_click.time.sleep", stop_after_resync)
+
+    snapshot = runner.invoke(
+        make_cli(), ["alarm", "monitor", "--once", "--take", "2", "--format", "json"]
+    )
+    assert snapshot.exit_code == 0, snapshot.output
+    assert [alarm["instanceId"] for alarm in json.loads(snapshot.output)] == [
+        "instance-2",
+        "instance-1",
+    ]
+    assert payloads[0]["take"] > 2
+
+    payloads.clear()
+    result = runner.invoke(
+        make_cli(),
+        ["alarm", "monitor", "--events", "--take", "2", "--resync-every", "2", "--no-clear"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(payloads) == 3 and "substitutions" not in payloads[2]
+    assert "--no-clear is deprecated" in result.output
+    events = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+    assert len(events) == 3
+    assert all(event["event"] == "added" for event in events)
+
+
+def test_alarm_index_applies_only_deltas() -> None:
+    """The monitor index should report adds, updates, removals and advance its watermark."""
+    index = _AlarmIndex(_build_alarm_predicate("active", None, None, None, None, 2, None))
+    first = {
+        "instanceId": "a",
+        "active": True,
+        "currentSeverityLevel": 3,
+        "updatedAt": "2024-01-01T00:00:01Z",
+    }
+    second = {
+        "instanceId": "b",
+        "active": True,
+        "currentSeverityLevel": 2,
+        "updatedAt": "2024-01-01T00:00:00.5Z",
+    }
+
+    assert index.replace([first, second]) == [("added", first), ("added", second)]
+    assert index.watermark == "2024-01-01T00:00:01Z"
+    assert index.apply([dict(first)]) == []
+
+    cleared = {**first, "active": False, "updatedAt": "2024-01-01T00:00:05Z"}
+    lowered = {**second, "currentSeverityLevel": 1, "updatedAt": "2024-01-01T00:00:04Z"}
+    assert index.apply([cleared, lowered]) == [("removed", cleared), ("removed", lowered)]
+    assert index.alarms == {}
+    assert index.watermark == "2024-01-01T00:00:05Z"
+
+
+def test_alarm_index_resync_reports_deleted_alarms() -> None:
+    """A full resync should drop alarms that no longer exist on the server."""
+    index = _AlarmIndex(_build_alarm_predicate("all", None, None, None, None, None, None))
+    alarm = {"instanceId": "a", "updatedAt": "2024-01-01T00:00:00Z"}
+    index.replace([alarm])
+
+    assert index.replace([]) == [("removed", alarm)]
+
+
+def test_monitor_polls_updates_since_watermark(runner: CliRunner, monkeypatch: Any) -> None:
+    """After the first snapshot, the monitor should only request and render changed alarms."""
+    patch_alarm_config(monkeypatch)
+    unchanged = {
+        "instanceId": "instance-1",
+        "active": True,
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+    updated = {
+        "instanceId": "instance-2",
+        "active": True,
+        "currentSeverityLevel": 4,
+        "updatedAt": "2024-01-01T00:00:09Z",
+    }
+    payloads: List[Dict[str, Any]] = []
+    pages = [{"alarms": [unchanged]}, {"alarms": [updated]}]
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> MockResponse:
+        payloads.append(kwargs["payload"])
+        return MockResponse(pages[len(payloads) - 1])
+
+    def stop_after_second_poll(interval: float) -> None:
+        if len(payloads) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("slcli.alarm_click.make_api_request", fake_request)
+    monkeypatch.setattr("slcli.alarm_click.time.sleep", stop_after_second_poll)
+
+    result = runner.invoke(make_cli(), ["alarm", "monitor", "--workspace", "all"])
+
+    assert result.exit_code == 0, result.output
+    assert payloads[0]["filter"] == "active == true"
+    assert payloads[1]["filter"] == "updatedAt >= DateTime.parse(@0)"
+    assert payloads[1]["substitutions"] == ["2024-01-01T00:00:00Z"]
+    assert "1 added, 0 updated, 0 removed" in result.output
+    delta_output = result.output.split("1 added", 1)[1]
+    assert "instance-2" in delta_output
+    assert "instance-1" not in delta_output
+
+
+def test_monitor_events_emit_jsonl(runner: CliRunner, monkeypatch: Any) -> None:
+    """Event mode should emit one parseable JSON object per alarm change."""
+    patch_alarm_config(monkeypatch)
+    monkeypatch.setattr(
+        "slcli.alarm_click.make_api_request",
+        lambda method, url, **kwargs: MockResponse(
+            {"alarms": [{"instanceId": "instance-1", "active": True}]}
+        ),
+    )
+
+    result = runner.invoke(make_cli(), ["alarm", "monitor", "--once", "--events"])
+
+    assert result.exit_code == 0, result.output
+    events = [json.loads(line) for line in result.output.splitlines()]
+    assert [(event["event"], event["instanceId"]) for event in events] == [("added", "instance-1")]
@@ -0,0 +1,110 @@
+"""Unit tests for concurrent API calls and the async transport."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Generator, List
+
+import pytest
+import requests
+
+from slcli import async_http, http_trace
+from slcli.async_http import ApiCall, run_api_calls
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = json.loads(self.rfile.read(length)) if length else None
+        body = json.dumps(
+            {"path": self.path, "auth": self.headers.get("x-ni-api-key"), "body": request_body}
+        ).encode()
+        self.send_response(404 if "missing" in self.path else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply  # noqa: N815
+    do_POST = _reply  # noqa: N815
+
+
+@pytest.fixture
+def server_url(monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
+    httpd = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    monkeypatch.setenv("SLCLI_API_URL", url)
+    monkeypatch.setenv("SLCLI_API_KEY", "async-key")
+    yield url
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def async_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    if async_http._httpx_module() is None:
+        pytest.skip("httpx is not installed")
+    monkeypatch.setenv(async_http.TRANSPORT_ENV, "async")
+
+
+def test_threaded_calls_keep_order_and_return_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(async_http.TRANSPORT_ENV, raising=False)
+    seen: List[str] = []
+
+    def send(method: str, url: str, **kwargs: Any) -> Any:
+        seen.append(url)
+        if url.endswith("/3"):
+            raise requests.ConnectionError("boom")
+        assert kwargs["handle_errors"] is False
+        return url
+
+    calls = [ApiCall("GET", f"https://host/{index}") for index in range(5)]
+    results = run_api_calls(calls, send=send, return_exceptions=True)
+
+    assert sorted(seen) == [call.url for call in calls]
+    assert results[:3] == ["https://host/0", "https://host/1", "https://host/2"]
+    assert isinstance(results[3], requests.ConnectionError)
+    with pytest.raises(requests.ConnectionError):
+        run_api_calls(calls, send=send, handle_errors=False)
+
+
+def test_async_transport_matches_make_api_request(server_url: str, async_transport: None) -> None:
+    calls = [
+        ApiCall("POST", f"{server_url}/nitestmonitor/v2/query-results", {"take": index})
+        for index in range(20)
+    ]
+    responses = run_api_calls(calls, concurrency=8)
+
+    assert all(isinstance(response, requests.Response) for response in responses)
+    bodies = [response.json() for response in responses]
+    assert [body["body"]["take"] for body in bodies] == list(range(20))
+    assert {body["auth"] for body in bodies} == {"async-key"}
+
+
+def test_async_transport_raises_requests_errors(server_url: str, async_transport: None) -> None:
+    calls = [ApiCall("GET", f"{server_url}/ok"), ApiCall("GET", f"{server_url}/missing")]
+    ok, missing = run_api_calls(calls, return_exceptions=True)
+
+    assert ok.status_code == 200
+    assert isinstance(missing, requests.HTTPError)
+    assert missing.response is not None and missing.response.status_code == 404
+
+    with pytest.raises(SystemExit):
+        run_api_calls(calls)
+
+
+def test_async_transport_is_traced(server_url: str, async_transport: None) -> None:
+    tracer = http_trace.start_trace()
+    try:
+        run_api_calls([ApiCall("GET", f"{server_url}/nitag/v2/tags/a/values/current")])
+    finally:
+        http_trace.stop_trace()
+
+    assert [(record.route, record.status) for record in tracer.records] == [
+        ("/nitag/v2/tags/a/values/current", 200)
+    ]
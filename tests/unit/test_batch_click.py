@@ -0,0 +1,143 @@
+"""Unit tests for the run-batch command."""
+
+import json
+import threading
+import time
+from typing import Any, List
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from slcli.batch_click import parse_batch, register_batch_commands
+from slcli.platform import clear_platform_cache, get_platform
+from slcli.profiles import get_profile_override, set_profile_override
+
+
+def make_cli() -> click.Group:
+    """Create a CLI with run-batch and a few stand-in commands."""
+
+    @click.group()
+    @click.option("--profile", "-p")
+    def test_cli(profile: Any) -> None:
+        pass
+
+    @test_cli.command()
+    @click.argument("words", nargs=-1)
+    def say(words: List[str]) -> None:
+        click.echo(" ".join(words))
+
+    @test_cli.command()
+    @click.argument("code", type=int)
+    def fail(code: int) -> None:
+        click.echo(f"failing with {code}", err=True)
+        raise SystemExit(code)
+
+    @test_cli.command()
+    @click.argument("seconds", type=float)
+    def sleep(seconds: float) -> None:
+        time.sleep(seconds)
+        click.echo(f"slept in {threading.current_thread().name}")
+
+    register_batch_commands(test_cli)
+    return test_cli
+
+
+def test_parse_batch_lines_and_json() -> None:
+    """Test both script formats, comments and the optional slcli prefix."""
+    script = "# provision\nslcli say 'hello world'\n\nsay again\n"
+    assert parse_batch(script) == [["say", "hello world"], ["say", "again"]]
+    assert parse_batch('[["say", "a b"], "slcli say c"]') == [["say", "a b"], ["say", "c"]]
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_batch("say 'unterminated\n")
+    with pytest.raises(ValueError, match="item 1"):
+        parse_batch("[1]")
+
+
+def test_run_batch_text_output_and_exit_code() -> None:
+    """Test output is replayed in order and a failing line makes the batch fail."""
+    result = CliRunner().invoke(make_cli(), ["run-batch", "-"], input="say one\nfail 3\nsay two\n")
+
+    assert result.exit_code == 1
+    assert result.stdout == "one\ntwo\n"
+    assert "failing with 3" in result.stderr
+    assert "[2] exit 3" in result.stderr
+    assert "3 of 3 command(s) run, 1 failed" in result.stderr
+
+
+def test_run_batch_jsonl_stop_on_error() -> None:
+    """Test per-command JSON records and that --stop-on-error skips the rest."""
+    result = CliRunner().invoke(
+        make_cli(),
+        ["run-batch", "-", "-f", "jsonl", "--stop-on-error"],
+        input='[["say", "one"], ["fail", "4"], ["say", "never"]]',
+    )
+
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["index"], r["exitCode"], r["stdout"]) for r in records] == [
+        (1, 0, "one\n"),
+        (2, 4, ""),
+    ]
+    assert records[1]["stderr"] == "failing with 4\n"
+    assert result.exit_code == 1
+
+
+def test_run_batch_parallel_keeps_output_separate_and_ordered() -> None:
+    """Test parallel commands run concurrently yet report in input order."""
+    script = "\n".join(f"sleep 0.{3 - index}" for index in range(3))
+    result = CliRunner().invoke(
+        make_cli(), ["run-batch", "-", "-j", "3", "-f", "jsonl"], input=script
+    )
+
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["index"] for r in records] == [1, 2, 3]
+    assert all(
+        r["stdout"].startswith("slept in ") and r["stdout"].count("\n") == 1 for r in records
+    )
+    assert len({r["stdout"] for r in records}) == 3
+
+
+def test_run_batch_rejects_nesting_and_parallel_profiles() -> None:
+    """Test unsupported batch contents are reported."""
+    result = CliRunner().invoke(make_cli(), ["run-batch", "-", "-f", "jsonl"], input="run-batch x")
+    assert json.loads(result.stdout)["exitCode"] == 2
+
+    result = CliRunner().invoke(
+        make_cli(), ["run-batch", "-", "-j", "2"], input="-p prod say hi\nsay there\n"
+    )
+    assert result.exit_code == 2
+    assert "--parallel 1" in result.output
+
+
+def test_run_batch_redetects_platform_when_profile_changes(monkeypatch: Any) -> None:
+    """Test a --profile line and the lines after it see their own profile's platform."""
+
+    @click.group()
+    @click.option("--profile", "-p")
+    def test_cli(profile: Any) -> None:
+        if profile:
+            set_profile_override(profile)
+
+    @test_cli.command(name="platform")
+    def show_platform() -> None:
+        click.echo(get_platform())
+
+    register_batch_commands(test_cli)
+    platforms = {"sls": "SLS"}
+    monkeypatch.delenv("SYSTEMLINK_PLATFORM", raising=False)
+    monkeypatch.setattr(
+        "slcli.platform._get_keyring_config",
+        lambda: {"platform": platforms.get(get_profile_override() or "", "SLE")},
+    )
+    clear_platform_cache()
+    try:
+        result = CliRunner().invoke(
+            test_cli, ["run-batch", "-"], input="platform\n-p sls platform\nplatform\n"
+        )
+    finally:
+        set_profile_override(None)
+        clear_platform_cache()
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "SLE\nSLS\nSLE\n"
@@ -0,0 +1,66 @@
+"""Unit tests for compiled client-side filter predicates."""
+
+from typing import Any, Dict, Iterator, List
+
+from slcli.client_filters import (
+    all_of,
+    any_of,
+    contains_text,
+    equals_text,
+    field,
+    number_between,
+    take_matches,
+)
+
+
+def test_text_predicates_ignore_case_and_missing_values() -> None:
+    name = field("properties.Name")
+
+    assert contains_text(name, "VOLT")({"properties": {"Name": "voltage.csv"}})
+    assert not contains_text(name, "volt")({"properties": None})
+    assert equals_text(field("ext"), "CSV")({"ext": "csv"})
+    assert not equals_text(field("ext"), "csv")({"ext": "csv.gz"})
+
+
+def test_number_between_requires_numbers_within_bounds() -> None:
+    in_range = number_between(field("limit.max"), minimum=1, maximum=5)
+
+    assert in_range({"limit": {"max": 5}})
+    assert not in_range({"limit": {"max": 5.5}})
+    assert not in_range({"limit": {"max": "3"}})
+    assert not in_range({"limit": None})
+
+
+def test_all_of_short_circuits_in_order() -> None:
+    seen: List[str] = []
+
+    def check(label: str, result: bool) -> Any:
+        def predicate(item: Dict[str, Any]) -> bool:
+            seen.append(label)
+            return result
+
+        return predicate
+
+    assert all_of([None, None]) is None
+    combined = all_of([check("cheap", False), None, check("costly", True)])
+    assert combined is not None and not combined({})
+    assert seen == ["cheap"]
+    either = any_of([check("first", True), check("second", True)])
+    assert either is not None and either({})
+    assert seen == ["cheap", "first"]
+
+
+def test_take_matches_stops_after_take() -> None:
+    consumed: List[int] = []
+
+    def items() -> Iterator[Dict[str, Any]]:
+        for index in range(100):
+            consumed.append(index)
+            yield {"index": index}
+
+    odd = number_between(field("index"), minimum=0)
+    matches = take_matches(items(), lambda item: item["index"] % 2 == 1 and odd(item), 3)
+
+    assert [item["index"] for item in matches] == [1, 3, 5]
+    assert consumed == list(range(6))
+    assert take_matches([{"a": 1}], None) == [{"a": 1}]
@@ -690,7 +690,7 @@ class TestAddProfileTrailingSlash:
                 "services": {"Auth": "ok"},
             },
         )
-        monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+        monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
         from slcli.main import cli
 
@@ -732,7 +732,7 @@ class TestAddProfileTrailingSlash:
                 "services": {"Auth": "ok"},
             },
         )
-        monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+        monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
         from slcli.main import cli
 
@@ -0,0 +1,209 @@
+"""Unit tests for the slcli daemon client and server."""
+
+import io
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator, Tuple
+
+import click
+import pytest
+
+from slcli import daemon
+from slcli.daemon import DaemonServer, forward_to_daemon, send_control, should_forward
+from slcli.daemon_click import _reset_command_state
+from slcli.platform import get_platform
+from slcli.utils import PooledSessions
+
+pytestmark = pytest.mark.skipif(not daemon.daemon_supported(), reason="requires AF_UNIX")
+
+
+@click.group()
+def fake_cli() -> None:
+    """Stand-in for the slcli root group."""
+
+
+@fake_cli.command()
+@click.argument("code", type=int)
+def echo(code: int) -> None:
+    """Print the environment and working directory, then exit with CODE."""
+    click.echo(f"token={os.environ.get('SLCLI_TEST_TOKEN')}")
+    click.echo(f"cwd={os.getcwd()}")
+    click.echo("to stderr", err=True)
+    raise SystemExit(code)
+
+
+@fake_cli.command(name="platform")
+def show_platform() -> None:
+    """Print the detected SystemLink platform."""
+    click.echo(get_platform())
+
+
+@fake_cli.command()
+def boom() -> None:
+    """Raise an unexpected error."""
+    raise RuntimeError("kaboom")
+
+
+WAIT_STARTED = threading.Event()
+WAIT_INTERRUPTED = threading.Event()
+
+
+@fake_cli.command(name="wait")
+def wait_forever() -> None:
+    """Run until interrupted, like a watcher."""
+    WAIT_STARTED.set()
+    try:
+        while True:
+            time.sleep(0.01)
+    except KeyboardInterrupt:
+        WAIT_INTERRUPTED.set()
+        raise
+
+
+@pytest.fixture(autouse=True)
+def empty_stdin(monkeypatch: Any) -> Iterator[None]:
+    """Run each test with stdin redirected from the null device, as scripts do."""
+    with open(os.devnull) as stdin:
+        monkeypatch.setattr("sys.stdin", stdin)
+        yield
+
+
+@pytest.fixture
+def running_server(monkeypatch: Any, tmp_path: Path) -> Iterator[Tuple[DaemonServer, Path]]:
+    """Serve ``fake_cli`` on a socket in a temporary directory."""
+    monkeypatch.delenv("SLCLI_NO_DAEMON", raising=False)
+    socket_path = tmp_path / "d.sock"
+    resets = []
+    server = DaemonServer(socket_path, fake_cli, before_command=lambda: resets.append(1))
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, socket_path
+    send_control("stop", socket_path)
+    thread.join(timeout=5)
+
+
+def _forward(argv: Any, socket_path: Path) -> Tuple[Any, str, str]:
+    out, err = io.BytesIO(), io.BytesIO()
+    code = forward_to_daemon(argv, stdout=out, stderr=err, socket_path=socket_path)
+    return code, out.getvalue().decode(), err.getvalue().decode()
+
+
+def test_should_forward(monkeypatch: Any) -> None:
+    """Test which invocations are eligible for forwarding."""
+    monkeypatch.delenv("SLCLI_NO_DAEMON", raising=False)
+    assert should_forward(["system", "list"])
+    assert should_forward(["--profile", "daemon", "system", "list"])
+    assert not should_forward(["-p", "prod", "daemon", "status"])
+    assert not should_forward(["login"])
+    assert not should_forward(["--version"])
+    assert not should_forward(["notebook", "execute", "batch", "--params", "-"])
+    assert not should_forward(["tag", "watch", "a.b"])
+    assert not should_forward(["-p", "prod", "alarm", "monitor"])
+    assert not should_forward(["mcp", "serve"])
+    assert should_forward(["alarm", "list"])
+    monkeypatch.setenv("SLCLI_NO_DAEMON", "1")
+    assert not should_forward(["system", "list"])
+
+
+def test_should_forward_keeps_terminal_and_piped_stdin_local(monkeypatch: Any) -> None:
+    """Test commands run locally when stdin could prompt or carries input."""
+    monkeypatch.delenv("SLCLI_NO_DAEMON", raising=False)
+    read_fd, write_fd = os.pipe()
+    with open(read_fd) as pipe, open(write_fd, "w"):
+        assert not should_forward(["system", "list"], stdin=pipe)
+    primary_fd, terminal_fd = os.openpty()
+    with open(primary_fd, "rb"), open(terminal_fd) as terminal:
+        assert not should_forward(["system", "list"], stdin=terminal)
+    assert should_forward(["system", "list"], stdin=io.StringIO())
+
+
+def test_forward_streams_output_env_cwd_and_exit_code(
+    running_server: Tuple[DaemonServer, Path], monkeypatch: Any, tmp_path: Path
+) -> None:
+    """Test a forwarded command sees the client's env and cwd and reports its exit code."""
+    server, socket_path = running_server
+    monkeypatch.setenv("SLCLI_TEST_TOKEN", "abc")
+    monkeypatch.chdir(tmp_path)
+    daemon_cwd = os.getcwd()
+
+    code, out, err = _forward(["echo", "3"], socket_path)
+
+    assert code == 3
+    assert f"token=abc\ncwd={tmp_path}\n" == out
+    assert err == "to stderr\n"
+    assert os.getcwd() == daemon_cwd
+
+    code, out, err = _forward(["boom"], socket_path)
+    assert code == 1
+    assert "RuntimeError: kaboom" in err
+
+    status = send_control("status", socket_path)
+    assert status is not None and status["requestsServed"] == 2
+
+
+def test_falls_back_without_daemon_or_on_build_mismatch(
+    running_server: Tuple[DaemonServer, Path], tmp_path: Path
+) -> None:
+    """Test forwarding returns None so the caller runs the command in-process."""
+    server, socket_path = running_server
+    assert forward_to_daemon(["echo", "0"], socket_path=tmp_path / "missing.sock") is None
+
+    server.build_id = "other-install"
+    assert _forward(["echo", "0"], socket_path) == (None, "", "")
+
+
+def test_bind_refuses_second_daemon(running_server: Tuple[DaemonServer, Path]) -> None:
+    """Test a second daemon does not steal a live socket."""
+    _, socket_path = running_server
+    with pytest.raises(RuntimeError, match="already listening"):
+        DaemonServer(socket_path, fake_cli).bind()
+
+
+def test_forwarded_commands_detect_platform_each_time(monkeypatch: Any, tmp_path: Path) -> None:
+    """Test the platform cached by one forwarded command does not apply to the next."""
+    monkeypatch.delenv("SLCLI_NO_DAEMON", raising=False)
+    socket_path = tmp_path / "d.sock"
+    sessions = PooledSessions()
+    server = DaemonServer(
+        socket_path, fake_cli, before_command=lambda: _reset_command_state(sessions)
+    )
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setenv("SYSTEMLINK_PLATFORM", "SLE")
+        assert _forward(["platform"], socket_path) == (0, "SLE\n", "")
+        monkeypatch.setenv("SYSTEMLINK_PLATFORM", "SLS")
+        assert _forward(["platform"], socket_path) == (0, "SLS\n", "")
+    finally:
+        send_control("stop", socket_path)
+        thread.join(timeout=5)
+
+
+def test_busy_daemon_falls_back_and_interrupts_abandoned_command(
+    running_server: Tuple[DaemonServer, Path],
+) -> None:
+    """Test a busy daemon does not block clients and stops commands whose client left."""
+    server, socket_path = running_server
+    WAIT_STARTED.clear()
+    WAIT_INTERRUPTED.clear()
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(socket_path))
+    daemon._send_message(client, {"argv": ["wait"], "env": {}, "build": server.build_id})
+    assert daemon._recv_exact(client, daemon._HEADER.size)[:1] == daemon.CHANNEL_ACCEPTED
+    client.sendall(daemon.CLIENT_GO)
+    assert WAIT_STARTED.wait(timeout=5)
+
+    started = time.monotonic()
+    assert _forward(["echo", "0"], socket_path) == (None, "", "")
+    assert time.monotonic() - started < 2
+
+    client.close()
+    assert WAIT_INTERRUPTED.wait(timeout=5)
+    status = send_control("status", socket_path)
+    # The echo the client ran itself is not run again by the daemon
+    assert status is not None and status["requestsServed"] == 1
@@ -483,6 +483,42 @@ def test_dataframe_list_table_output_renders_rows(monkeypatch: Any, runner: CliR
     assert "Dev" in result.output
 
 
+def test_dataframe_list_tsv_writes_table_columns(monkeypatch: Any, runner: CliRunner) -> None:
+    """Test TSV list output writes the table columns without footers or prompts."""
+    patch_keyring(monkeypatch)
+
+    def mock_request(
+        method: str, url: str, payload: Optional[Dict[str, Any]] = None, **_: Any
+    ) -> Any:
+        return MockResponse(
+            {
+                "tables": [
+                    {
+                        "id": "tbl-1",
+                        "name": "Voltage Log",
+                        "workspace": "ws-1",
+                        "rowCount": 42,
+                        "supportsAppend": True,
+                        "rowsModifiedAt": "2026-04-27T10:00:00Z",
+                    }
+                ],
+                "continuationToken": "more",
+            }
+        )
+
+    monkeypatch.setattr("slcli.dataframe_click.make_api_request", mock_request)
+    monkeypatch.setattr("slcli.dataframe_click.get_workspace_map", lambda: {"ws-1": "Dev"})
+
+    cli = make_cli()
+    result = runner.invoke(cli, ["dataframe", "list", "--format", "tsv", "--take", "1"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "Name\tID\tWorkspace\tRows\tAppend\tModified",
+        "Voltage Log\ttbl-1\tDev\t42\t✓\t2026-04-27T10:00:00Z",
+    ]
+
+
 def test_dataframe_list_json_fetches_all_pages(monkeypatch: Any, runner: CliRunner) -> None:
     """Test JSON list output combines continuation-token pages."""
     patch_keyring(monkeypatch)
@@ -818,6 +854,8 @@ def test_dataframe_append_arrow_uses_binary_request(monkeypatch: Any, runner: Cl
         return MockResponse(status_code=204, text_data="")
 
     monkeypatch.setattr("slcli.dataframe_click.requests_lib.post", mock_post)
+    # requests_lib.post is requests.post, which the service probe also uses
+    monkeypatch.setattr("slcli.dataframe_click.require_feature", lambda feature: None)
 
     cli = make_cli()
     with runner.isolated_filesystem():
@@ -894,6 +932,267 @@ def test_dataframe_append_uses_click_path_validation(monkeypatch: Any, runner: C
     assert "does not exist" in result.output
 
 
+_SCHEMA_COLUMNS = [
+    {"name": "Index", "dataType": "INT32", "columnType": "INDEX"},
+    {"name": "Voltage", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+    {"name": "Label", "dataType": "STRING", "columnType": "NULLABLE"},
+]
+
+
+def mock_chunked_append(monkeypatch: Any) -> List[Dict[str, Any]]:
+    """Serve the table schema and record the bodies of chunked append requests."""
+    posted: List[Dict[str, Any]] = []
+
+    def mock_request(method: str, url: str, **kwargs: Any) -> Any:
+        if method == "GET":
+            return MockResponse({"id": "tbl-1", "columns": _SCHEMA_COLUMNS})
+        posted.append({"url": url, **json.loads(kwargs["data"])})
+        return MockResponse(status_code=204, text_data="")
+
+    monkeypatch.setattr("slcli.dataframe_append.make_api_request", mock_request)
+    return posted
+
+
+def test_dataframe_append_csv_streams_chunks_with_end_of_data_last(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test CSV append sends one JSON frame per chunk and endOfData only on the last."""
+    patch_keyring(monkeypatch)
+    posted = mock_chunked_append(monkeypatch)
+
+    cli = make_cli()
+    with runner.isolated_filesystem():
+        with open("rows.csv", "w", encoding="utf-8") as rows_file:
+            rows_file.write("Index,Voltage,Label\n1,5.0,a\n2,,b\n3,4.9,\n4,5.1,d\n5,5.2,e\n")
+
+        result = runner.invoke(
+            cli,
+            [
+                "dataframe",
+                "append",
+                "tbl-1",
+                "-i",
+                "rows.csv",
+                "--chunk-rows",
+                "2",
+                "--upload-format",
+                "json",
+                "--end-of-data",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert [len(body["frame"]["data"]) for body in posted] == [2, 2, 1]
+    assert [body["endOfData"] for body in posted] == [False, False, True]
+    assert posted[0]["frame"]["columns"] == ["Index", "Voltage", "Label"]
+    assert posted[0]["frame"]["data"][1] == ["2", None, "b"]
+    assert posted[1]["frame"]["data"][0] == ["3", "4.9", ""]
+    assert "rows: 5" in result.output
+
+
+def test_dataframe_append_resumes_after_checkpointed_rows(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test --resume skips the rows recorded in the checkpoint."""
+    patch_keyring(monkeypatch)
+    posted = mock_chunked_append(monkeypatch)
+
+    cli = make_cli()
+    with runner.isolated_filesystem():
+        with open("rows.jsonl", "w", encoding="utf-8") as rows_file:
+            for index in range(1, 6):
+                rows_file.write(json.dumps({"Index": index, "Voltage": index / 2}) + "\n")
+        args = ["dataframe", "append", "tbl-1", "-i", "rows.jsonl", "--chunk-rows", "2"]
+        args += ["--upload-format", "json", "--checkpoint", "append.ckpt"]
+
+        first = runner.invoke(cli, args)
+        assert first.exit_code == 0, first.output
+        again = runner.invoke(cli, args)
+        assert again.exit_code == 2
+        assert "--resume" in again.output
+
+        with open("append.ckpt", "r", encoding="utf-8") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        checkpoint.update({"rowsAppended": 4, "chunks": 2, "complete": False})
+        with open("append.ckpt", "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        posted.clear()
+
+        resumed = runner.invoke(cli, args + ["--resume"])
+
+    assert resumed.exit_code == 0, resumed.output
+    assert [body["frame"]["data"] for body in posted] == [[["5", "2.5"]]]
+    assert "rows: 5" in resumed.output
+
+
+def test_dataframe_append_csv_rejects_columns_outside_schema(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test chunked append checks the input header against the table schema first."""
+    patch_keyring(monkeypatch)
+    posted = mock_chunked_append(monkeypatch)
+
+    cli = make_cli()
+    with runner.isolated_filesystem():
+        with open("rows.csv", "w", encoding="utf-8") as rows_file:
+            rows_file.write("Voltage,Current\n5.0,1.2\n")
+
+        result = runner.invoke(cli, ["dataframe", "append", "tbl-1", "-i", "rows.csv"])
+
+    assert result.exit_code == 2
+    assert "Current" in result.output
+    assert posted == []
+
+
+def test_dataframe_append_arrow_chunks_are_typed_by_schema(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test Arrow uploads cast each CSV chunk to the table column types."""
+    pa = pytest.importorskip("pyarrow")
+    patch_keyring(monkeypatch)
+    batches: List[Any] = []
+    urls: List[str] = []
+
+    def mock_request(method: str, url: str, **kwargs: Any) -> Any:
+        if method == "GET":
+            return MockResponse({"id": "tbl-1", "columns": _SCHEMA_COLUMNS})
+        urls.append(url)
+        batches.append(pa.ipc.open_stream(kwargs["data"]).read_all())
+        return MockResponse(status_code=204, text_data="")
+
+    monkeypatch.setattr("slcli.dataframe_append.make_api_request", mock_request)
+
+    cli = make_cli()
+    with runner.isolated_filesystem():
+        with open("rows.csv", "w", encoding="utf-8") as rows_file:
+            rows_file.write("Index,Voltage\n1,5.0\n2,\n3,4.5\n")
+
+        result = runner.invoke(
+            cli,
+            ["dataframe", "append", "tbl-1", "-i", "rows.csv", "--chunk-rows", "2"]
+            + ["--upload-format", "arrow", "--end-of-data"],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema.field("Index").type == pa.int32()
+    assert batches[0].column("Voltage").to_pylist() == [5.0, None]
+    assert not urls[0].endswith("endOfData=true")
+    assert urls[1].endswith("/tables/tbl-1/data?endOfData=true")
+
+
+def test_dataframe_create_from_csv_infers_schema_and_appends(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test create --from posts the inferred schema, then appends the rows in chunks."""
+    patch_keyring(monkeypatch)
+    created: List[Dict[str, Any]] = []
+
+    def mock_create(method: str, url: str, payload: Any = None, **_: Any) -> Any:
+        created.append(payload)
+        return MockResponse({"id": "tbl-new"})
+
+    monkeypatch.setattr("slcli.dataframe_click.make_api_request", mock_create)
+    posted = mock_chunked_append(monkeypatch)
+
+    cli = make_cli()
+    with runner.isolated_filesystem():
+        with open("voltages.csv", "w", encoding="utf-8") as rows_file:
+            rows_file.write("Index,Voltage,Label\n1,5.0,a\n2,4.9,b\n3,,c\n")
+
+        result = runner.invoke(
+            cli,
+            ["dataframe", "create", "--from", "voltages.csv", "--chunk-rows", "2"]
+            + ["--upload-format", "json", "--end-of-data"],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert created[0]["name"] == "voltages"
+    assert [column["dataType"] for column in created[0]["columns"]] == [
+        "INT32",
+        "FLOAT64",
+        "STRING",
+    ]
+    assert created[0]["columns"][0]["columnType"] == "INDEX"
+    assert all(body["url"].endswith("/tables/tbl-new/data") for body in posted)
+    assert [body["endOfData"] for body in posted] == [False, True]
+    assert posted[1]["frame"]["data"] == [["3", None, "c"]]
+
+
+def test_dataframe_create_requires_definition_or_from(monkeypatch: Any, runner: CliRunner) -> None:
+    """Test create rejects calls with neither or both of --definition and --from."""
+    patch_keyring(monkeypatch)
+    result = runner.invoke(make_cli(), ["dataframe", "create"])
+
+    assert result.exit_code == 2
+    assert "--definition or --from" in result.output
+
+
+def test_dataframe_query_csv_appends_every_page(monkeypatch: Any, runner: CliRunner) -> None:
+    """Test file formats follow continuation tokens into one output."""
+    patch_keyring(monkeypatch)
+    payloads: List[Dict[str, Any]] = []
+    pages = [
+        {
+            "frame": {"columns": ["Index", "Voltage"], "data": [["1", "5.0"]]},
+            "continuationToken": "t",
+        },
+        {"frame": {"columns": ["Index", "Voltage"], "data": [["2", None]]}},
+    ]
+
+    def mock_request(method: str, url: str, payload: Any = None, **_: Any) -> Any:
+        payloads.append(dict(payload))
+        return MockResponse(pages[len(payloads) - 1])
+
+    monkeypatch.setattr("slcli.dataframe_click.make_api_request", mock_request)
+
+    result = runner.invoke(make_cli(), ["dataframe", "query", "tbl-1", "--format", "csv"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["Index,Voltage", "1,5.0", "2,"]
+    assert payloads[0]["take"] == 10000
+    assert payloads[1]["continuationToken"] == "t"
+
+
+def test_dataframe_query_npy_requires_output(monkeypatch: Any, runner: CliRunner) -> None:
+    """Test binary formats are not written to the terminal."""
+    patch_keyring(monkeypatch)
+    result = runner.invoke(make_cli(), ["dataframe", "query", "tbl-1", "--format", "npy"])
+
+    assert result.exit_code == 2
+    assert "--output" in result.output
+
+
+def test_dataframe_decimate_writes_npy_with_schema_types(
+    monkeypatch: Any, runner: CliRunner
+) -> None:
+    """Test decimate --format npy types the columns from the table schema."""
+    patch_keyring(monkeypatch)
+    monkeypatch.setattr(
+        "slcli.dataframe_append.make_api_request",
+        lambda method, url, **_: MockResponse({"columns": _SCHEMA_COLUMNS}),
+    )
+    monkeypatch.setattr(
+        "slcli.dataframe_click.make_api_request",
+        lambda method, url, **_: MockResponse(
+            {"frame": {"columns": ["Index", "Voltage"], "data": [["1", "5.0"], ["9", "4.5"]]}}
+        ),
+    )
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            make_cli(),
+            ["dataframe", "decimate", "tbl-1", "--x-column", "Index", "-f", "npy", "-o", "d.npy"],
+        )
+        with open("d.npy", "rb") as npy_file:
+            content = npy_file.read()
+
+    assert result.exit_code == 0, result.output
+    assert "rows: 2" in result.output
+    assert b"('Index', '<i4'), ('Voltage', '<f8')" in content
+    assert b"'shape': (2,)" in content
+
+
 def test_dataframe_decimate_builds_payload(monkeypatch: Any, runner: CliRunner) -> None:
     """Test decimation request payload construction."""
     patch_keyring(monkeypatch)
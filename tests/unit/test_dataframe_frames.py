@@ -0,0 +1,76 @@
+"""Unit tests for typed DataFrame frame writers."""
+
+import ast
+import math
+import struct
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from slcli.dataframe_frames import open_frame_writer
+
+_TYPES = {"Index": "INT32", "Voltage": "FLOAT64", "Time": "TIMESTAMP", "Ok": "BOOL"}
+
+
+def read_npy(path: Path) -> Tuple[Dict[str, Any], bytes]:
+    """Return the header dictionary and data bytes of a version 1.0 .npy file."""
+    content = path.read_bytes()
+    assert content[:8] == b"\x93NUMPY\x01\x00"
+    (length,) = struct.unpack("<H", content[8:10])
+    assert (10 + length) % 64 == 0
+    return ast.literal_eval(content[10 : 10 + length].decode("latin-1")), content[10 + length :]
+
+
+def test_npy_writer_appends_pages_as_packed_records(tmp_path: Path) -> None:
+    path = tmp_path / "rows.npy"
+    columns = ["Index", "Voltage", "Time", "Ok"]
+
+    with open_frame_writer(path, "npy", _TYPES) as writer:
+        writer.write_frame(
+            {"columns": columns, "data": [["1", "2.5", "1970-01-01T00:00:01.500Z", "True"]]}
+        )
+        writer.write_frame({"columns": columns, "data": [["2", None, None, "false"]]})
+
+    header, data = read_npy(path)
+    assert header["shape"] == (2,)
+    assert header["descr"] == [
+        ("Index", "<i4"),
+        ("Voltage", "<f8"),
+        ("Time", "<M8[ms]"),
+        ("Ok", "|b1"),
+    ]
+    first, second = struct.Struct("<idq?").iter_unpack(data)
+    assert first == (1, 2.5, 1500, True)
+    assert second[0] == 2 and math.isnan(second[1]) and second[2] == -(2**63) and not second[3]
+
+
+def test_npy_writer_rejects_strings_and_empty_integers(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Label"):
+        with open_frame_writer(tmp_path / "a.npy", "npy", {"Label": "STRING"}) as writer:
+            writer.write_frame({"columns": ["Label"], "data": [["a"]]})
+    with pytest.raises(ValueError, match="empty values"):
+        with open_frame_writer(tmp_path / "b.npy", "npy", _TYPES) as writer:
+            writer.write_frame({"columns": ["Index"], "data": [["1"], [None]]})
+
+
+def test_frame_writer_requires_matching_page_columns(tmp_path: Path) -> None:
+    with open_frame_writer(tmp_path / "rows.csv", "csv", {}) as writer:
+        writer.write_frame({"columns": ["a", "b"], "data": [["1", None]]})
+        with pytest.raises(ValueError, match="different columns"):
+            writer.write_frame({"columns": ["a"], "data": [["2"]]})
+
+    assert (tmp_path / "rows.csv").read_bytes() == b"a,b\n1,\n"
+
+
+def test_parquet_writer_types_columns_from_schema(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "rows.parquet"
+
+    with open_frame_writer(path, "parquet", _TYPES) as writer:
+        writer.write_frame({"columns": ["Index", "Voltage"], "data": [["1", "2.5"]]})
+        writer.write_frame({"columns": ["Index", "Voltage"], "data": [["2", None]]})
+
+    table = pq.read_table(path)
+    assert str(table.schema.field("Index").type) == "int32"
+    assert table.column("Voltage").to_pylist() == [2.5, None]
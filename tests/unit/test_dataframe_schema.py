@@ -0,0 +1,63 @@
+"""Unit tests for DataFrame column type and index inference."""
+
+from pathlib import Path
+
+import pytest
+
+from slcli.dataframe_schema import infer_columns, infer_text_column, table_columns
+
+
+def test_infer_text_column_picks_narrowest_type() -> None:
+    assert infer_text_column("a", ["1", "-2", "2147483647"]).data_type == "INT32"
+    assert infer_text_column("a", ["1", "2147483648"]).data_type == "INT64"
+    assert infer_text_column("a", ["1", "2.5", "1e-3", "NaN"]).data_type == "FLOAT64"
+    assert infer_text_column("a", ["TRUE", "false"]).data_type == "BOOL"
+    assert infer_text_column("a", ["2024-01-01", "2024-01-02T03:04:05.6+01:00"]).data_type == (
+        "TIMESTAMP"
+    )
+    assert infer_text_column("a", ["1", "two"]).data_type == "STRING"
+    assert infer_text_column("a", ["1\n2", "3"]).data_type == "STRING"
+    assert infer_text_column("a", ["", None]).data_type == "STRING"
+
+
+def test_infer_text_column_tracks_nulls_and_order() -> None:
+    increasing = infer_text_column("t", ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"])
+    repeated = infer_text_column("i", ["1", "2", "2"])
+    sparse = infer_text_column("i", ["1", "", "3"])
+
+    assert increasing.increasing and increasing.can_index
+    assert repeated.can_index and not repeated.increasing
+    assert sparse.has_nulls and not sparse.can_index
+
+
+def test_table_columns_infers_index_from_csv(tmp_path: Path) -> None:
+    source = tmp_path / "data.csv"
+    source.write_text("Label,Index,Voltage\na,1,5.0\nb,2,\nc,3,4.9\n", encoding="utf-8")
+
+    columns = table_columns(infer_columns(source, "csv", sample_rows=2))
+
+    assert columns == [
+        {"name": "Label", "dataType": "STRING", "columnType": "NULLABLE"},
+        {"name": "Index", "dataType": "INT32", "columnType": "INDEX"},
+        {"name": "Voltage", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+    ]
+
+
+def test_table_columns_rejects_unusable_index() -> None:
+    inferred = [infer_text_column("Label", ["a", "b"]), infer_text_column("n", ["2", "1"])]
+
+    with pytest.raises(ValueError, match="--index-column"):
+        table_columns(inferred)
+    with pytest.raises(ValueError, match="integer or timestamp"):
+        table_columns(inferred, index_column="Label")
+    assert table_columns(inferred, index_column="n")[1]["columnType"] == "INDEX"
+
+
+def test_infer_text_column_rejects_mixed_sample_quickly() -> None:
+    # A failing cell at the end of a sample-sized column must not backtrack
+    mixed = [str(number) for number in range(100, 1099)] + ["N/A"]
+    digits = ["12345678"] * 10 + ["abc"]
+
+    assert infer_text_column("a", mixed).data_type == "STRING"
+    assert infer_text_column("a", digits).data_type == "STRING"
+    assert infer_text_column("a", ["1.5"] * 999 + ["1.5.1"]).data_type == "STRING"
@@ -484,6 +484,8 @@ def test_feed_package_upload_sle_no_wait(
     assert result.exit_code == 0
     assert "upload started" in result.output.lower()
     mock_wait.assert_not_called()
+    # The single-package path lets make_api_request report errors and exit
+    assert mock_request.call_args.kwargs["handle_errors"] is True
 
 
 @patch("slcli.feed_click.get_platform")
@@ -1139,3 +1141,296 @@ def test_delete_package_synchronous_response(
 
     job_id = _delete_package("pkg-1")
     assert job_id == ""
+
+
+def _write_nipkg(path: Any, name: str, version: str, payload: bytes = b"data") -> None:
+    """Write a minimal ar-based package with a control file."""
+    import io
+    import tarfile
+
+    control = f"Package: {name}\nVersion: {version}\nArchitecture: all\n".encode()
+    control_tar = io.BytesIO()
+    with tarfile.open(fileobj=control_tar, mode="w:gz") as tar:
+        info = tarfile.TarInfo("./control")
+        info.size = len(control)
+        tar.addfile(info, io.BytesIO(control))
+
+    def member(member_name: str, data: bytes) -> bytes:
+        header = f"{member_name:<16}{0:<12}{0:<6}{0:<6}{100644:<8}{len(data):<10}`\n"
+        return header.encode() + data + (b"\n" if len(data) % 2 else b"")
+
+    path.write_bytes(
+        b"!<arch>\n"
+        + member("debian-binary", b"2.0\n")
+        + member("control.tar.gz", control_tar.getvalue())
+        + member("data.tar.gz", payload)
+    )
+
+
+class FakeFeedServer:
+    """Route bulk upload requests made through make_api_request."""
+
+    def __init__(self, packages: Optional[Dict[str, Any]] = None, pending_polls: int = 1) -> None:
+        """Initialize the fake server.
+
+        Args:
+            packages: Existing packages per feed ID.
+            pending_polls: Number of polls each job reports as running.
+        """
+        self.packages = packages or {}
+        self.pending_polls = pending_polls
+        self.polls: Dict[str, int] = {}
+        self.uploads: list = []
+        self.references: list = []
+
+    def __call__(self, method: str, url: str, **kwargs: Any) -> MockResponse:
+        """Handle a request."""
+        if method == "GET" and url.endswith("/packages"):
+            feed_id = url.split("/feeds/")[1].split("/")[0]
+            return MockResponse(json_data={"packages": self.packages.get(feed_id, [])})
+        if method == "POST" and "packages" in url and "data" in kwargs:
+            body = kwargs["data"].read()
+            assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+            file_name = body.split(b'filename="')[1].split(b'"')[0].decode()
+            self.uploads.append((url, file_name))
+            job_id = f"job-{len(self.uploads)}"
+            if "/upload-packages" in url:
+                return MockResponse(json_data={"jobIds": [job_id]})
+            return MockResponse(json_data={"jobId": job_id})
+        if method == "POST" and url.endswith("/add-package-references"):
+            self.references.append((url, kwargs["payload"]["packageReferences"]))
+            return MockResponse(json_data={"jobId": f"ref-{len(self.references)}"})
+        if method == "GET" and "/jobs/" in url:
+            job_id = url.rsplit("/", 1)[1]
+            self.polls[job_id] = self.polls.get(job_id, 0) + 1
+            if self.polls[job_id] <= self.pending_polls:
+                return MockResponse(json_data={"job": {"id": job_id, "status": "IN_PROGRESS"}})
+            return MockResponse(
+                json_data={
+                    "job": {"id": job_id, "status": "SUCCEEDED", "resourceId": f"pkg-{job_id}"}
+                }
+            )
+        raise AssertionError(f"Unexpected request {method} {url}")
+
+
+@patch("slcli.feed_click.get_platform", return_value="SLE")
+def test_feed_package_bulk_upload_sle_skips_existing(
+    mock_detect: MagicMock, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Bulk upload skips identical packages, flags changed ones and uploads the rest."""
+    import hashlib
+
+    _write_nipkg(tmp_path / "same_1.0.0_all.nipkg", "same", "1.0.0")
+    _write_nipkg(tmp_path / "changed_1.0.0_all.nipkg", "changed", "1.0.0")
+    _write_nipkg(tmp_path / "new_2.0.0_all.nipkg", "new", "2.0.0")
+    (tmp_path / "notes.txt").write_text("not a package")
+    same_sha = hashlib.sha256((tmp_path / "same_1.0.0_all.nipkg").read_bytes()).hexdigest()
+    existing = [
+        {
+            "id": "pkg-same",
+            "metadata": {
+                "packageName": "same",
+                "version": "1.0.0",
+                "architecture": "all",
+                "sha256": same_sha,
+            },
+        },
+        {
+            "id": "pkg-changed",
+            "metadata": {
+                "packageName": "changed",
+                "version": "1.0.0",
+                "architecture": "all",
+                "sha256": "0" * 64,
+            },
+        },
+    ]
+    server = FakeFeedServer({"feed-a": existing, "feed-b": []})
+    monkeypatch.setattr("slcli.feed_click.make_api_request", server)
+
+    result = CliRunner().invoke(
+        make_cli(),
+        [
+            "feed",
+            "package",
+            "bulk-upload",
+            str(tmp_path),
+            "-f",
+            "feed-a",
+            "-f",
+            "feed-b",
+            "--poll-interval",
+            "0.1",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == ExitCodes.GENERAL_ERROR
+    import json
+
+    records = json.loads(result.stdout)
+    statuses = {(r["file"], r["feedId"]): r["status"] for r in records}
+    assert statuses == {
+        ("changed_1.0.0_all.nipkg", "feed-a"): "failed",
+        ("changed_1.0.0_all.nipkg", "feed-b"): "uploaded",
+        ("new_2.0.0_all.nipkg", "feed-a"): "uploaded",
+        ("new_2.0.0_all.nipkg", "feed-b"): "uploaded",
+        ("same_1.0.0_all.nipkg", "feed-a"): "skipped",
+        ("same_1.0.0_all.nipkg", "feed-b"): "uploaded",
+    }
+    assert len(server.uploads) == 4
+    assert all(r["packageId"].startswith("pkg-") for r in records if r["status"] == "uploaded")
+
+
+@patch("slcli.feed_click.get_platform", return_value="SLE")
+def test_feed_package_bulk_upload_overwrite_replaces_changed(
+    mock_detect: MagicMock, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """--overwrite uploads packages whose content differs from the feed copy."""
+    package = tmp_path / "changed_1.0.0_all.nipkg"
+    _write_nipkg(package, "changed", "1.0.0")
+    existing = [
+        {
+            "id": "pkg-changed",
+            "metadata": {"packageName": "changed", "version": "1.0.0", "md5sum": "0" * 32},
+        }
+    ]
+    server = FakeFeedServer({"feed-a": existing}, pending_polls=0)
+    monkeypatch.setattr("slcli.feed_click.make_api_request", server)
+
+    result = CliRunner().invoke(
+        make_cli(),
+        ["feed", "package", "bulk-upload", str(package), "-f", "feed-a", "--overwrite"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert server.uploads[0][0].endswith("/feeds/feed-a/packages?shouldOverwrite=true")
+    assert "1 uploaded, 0 skipped, 0 failed" in result.output
+
+
+@patch("slcli.feed_click.get_platform", return_value="SLS")
+def test_feed_package_bulk_upload_sls_adds_references(
+    mock_detect: MagicMock, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """On SLS each package is uploaded to the pool once and referenced from every feed."""
+    package = tmp_path / "new_2.0.0_all.nipkg"
+    _write_nipkg(package, "new", "2.0.0")
+    server = FakeFeedServer()
+    monkeypatch.setattr("slcli.feed_click.make_api_request", server)
+
+    result = CliRunner().invoke(
+        make_cli(),
+        [
+            "feed",
+            "package",
+            "bulk-upload",
+            str(package),
+            "-f",
+            "feed-a",
+            "-f",
+            "feed-b",
+            "--poll-interval",
+            "0.1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(server.uploads) == 1
+    assert server.uploads[0][0].endswith("/upload-packages")
+    assert [refs for _, refs in server.references] == [["pkg-job-1"], ["pkg-job-1"]]
+    assert "2 uploaded, 0 skipped, 0 failed" in result.output
+
+
+@patch("slcli.feed_click.get_platform", return_value="SLE")
+def test_feed_package_bulk_upload_timeout(
+    mock_detect: MagicMock, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Jobs still running at the global timeout are reported as timed out."""
+    package = tmp_path / "slow_1.0.0_all.nipkg"
+    _write_nipkg(package, "slow", "1.0.0")
+    server = FakeFeedServer(pending_polls=1000)
+    monkeypatch.setattr("slcli.feed_click.make_api_request", server)
+
+    result = CliRunner().invoke(
+        make_cli(),
+        [
+            "feed",
+            "package",
+            "bulk-upload",
+            str(package),
+            "-f",
+            "feed-a",
+            "--timeout",
+            "1",
+            "--poll-interval",
+            "0.1",
+            "--no-skip-existing",
+        ],
+    )
+
+    assert result.exit_code == ExitCodes.GENERAL_ERROR
+    assert "timed out (job job-1)" in result.output
+
+
+@patch("slcli.feed_click.get_platform", return_value="SLE")
+def test_feed_package_bulk_upload_timeout_stops_waiting_for_uploads(
+    mock_detect: MagicMock, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Uploads still sending at the global timeout are reported without waiting for them."""
+    import threading
+    import time
+
+    package = tmp_path / "big_1.0.0_all.nipkg"
+    _write_nipkg(package, "big", "1.0.0")
+    server = FakeFeedServer()
+    release = threading.Event()
+
+    def slow_upload(method: str, url: str, **kwargs: Any) -> MockResponse:
+        if "data" in kwargs:
+            release.wait(timeout=30)
+        return server(method, url, **kwargs)
+
+    monkeypatch.setattr("slcli.feed_click.make_api_request", slow_upload)
+
+    started = time.monotonic()
+    try:
+        result = CliRunner().invoke(
+            make_cli(),
+            ["feed", "package", "bulk-upload", str(package), "-f", "feed-a", "--timeout", "1"]
+            + ["--no-skip-existing"],
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert result.exit_code == ExitCodes.GENERAL_ERROR
+    assert "timed out (upload not finished)" in result.output
+    assert elapsed < 10
+    assert "0 uploaded, 0 skipped, 1 failed" in result.output
+
+
+def test_feed_package_bulk_upload_requires_packages(tmp_path: Any) -> None:
+    """A directory without package files is rejected."""
+    result = CliRunner().invoke(
+        make_cli(), ["feed", "package", "bulk-upload", str(tmp_path), "-f", "feed-a"]
+    )
+
+    assert result.exit_code == ExitCodes.INVALID_INPUT
+    assert "No package files found" in result.output
+
+
+def test_read_package_control(tmp_path: Any) -> None:
+    """Control fields are read from the control archive of a package."""
+    from slcli.feed_click import _read_package_control
+
+    package = tmp_path / "demo.nipkg"
+    _write_nipkg(package, "demo", "1.2.3")
+    (tmp_path / "plain.nipkg").write_bytes(b"not an archive")
+
+    assert _read_package_control(package) == {
+        "package": "demo",
+        "version": "1.2.3",
+        "architecture": "all",
+    }
+    assert _read_package_control(tmp_path / "plain.nipkg") == {}
@@ -0,0 +1,49 @@
+"""Unit tests for --fields parsing and projection helpers."""
+
+from typing import Any, Dict, List
+
+import click
+import pytest
+
+from slcli.field_projection import enum_projection, fields_table, parse_fields, project_items
+
+
+def test_parse_fields_rejects_malformed_names() -> None:
+    assert parse_fields(None) is None
+    assert parse_fields("id,name, id") == ["id", "name"]
+    with pytest.raises(click.BadParameter):
+        parse_fields("id,,name")
+    with pytest.raises(click.BadParameter):
+        parse_fields("status.")
+
+
+def test_project_items_keeps_nested_paths() -> None:
+    items: List[Dict[str, Any]] = [
+        {"id": "1", "status": {"statusType": "PASSED", "statusName": "Passed"}, "keywords": []},
+        {"id": "2"},
+    ]
+
+    assert project_items(items, ["id", "status.statusType"]) == [
+        {"id": "1", "status": {"statusType": "PASSED"}},
+        {"id": "2"},
+    ]
+    assert project_items(items, None) == items
+
+
+def test_enum_projection_falls_back_for_unknown_fields() -> None:
+    supported = ["ID", "STATUS", "PART_NUMBER"]
+
+    assert enum_projection(["partNumber", "status.statusType", "status"], supported) == [
+        "PART_NUMBER",
+        "STATUS",
+    ]
+    assert enum_projection(["id", "notAField"], supported) is None
+
+
+def test_fields_table_formats_each_field() -> None:
+    headers, widths, formatter = fields_table(["id", "status.statusType", "keywords", "missing"])
+
+    assert headers == ["id", "status.statusType", "keywords", "missing"]
+    assert widths == [36, 24, 24, 24]
+    row = formatter({"id": "1", "status": {"statusType": "FAILED"}, "keywords": ["a", "b"]})
+    assert row == ["1", "FAILED", "a, b", ""]
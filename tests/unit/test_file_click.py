@@ -142,6 +142,54 @@ def test_list_files_json_format(monkeypatch: Any, runner: CliRunner) -> None:
     assert data[0]["properties"]["Name"] == "test-file.txt"
 
 
+def test_list_files_fields_trims_json(monkeypatch: Any, runner: CliRunner) -> None:
+    """--fields trims file list JSON on the client."""
+    patch_keyring(monkeypatch)
+
+    def mock_post(*a: Any, **kw: Any) -> Any:
+        return MockResponse(
+            {
+                "availableFiles": [
+                    {
+                        "id": "file1",
+                        "properties": {"Name": "test-file.txt", "Owner": "me"},
+                        "size64": 1024,
+                    }
+                ]
+            }
+        )
+
+    monkeypatch.setattr("requests.post", mock_post)
+    cli = make_cli()
+    result = runner.invoke(
+        cli, ["file", "list", "--format", "json", "--fields", "id,properties.Name"]
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"id": "file1", "properties": {"Name": "test-file.txt"}}]
+
+
+def test_list_files_csv_output(monkeypatch: Any, runner: CliRunner) -> None:
+    """CSV output writes the table columns and quotes values as needed."""
+    patch_keyring(monkeypatch)
+
+    def mock_post(*a: Any, **kw: Any) -> Any:
+        return MockResponse(
+            {
+                "availableFiles": [
+                    {"id": "file1", "properties": {"Name": "a, b.txt"}, "size64": 1024},
+                ]
+            }
+        )
+
+    monkeypatch.setattr("requests.post", mock_post)
+    cli = make_cli()
+    result = runner.invoke(
+        cli, ["file", "list", "--format", "csv", "--fields", "id,properties.Name"]
+    )
+    assert result.exit_code == 0
+    assert result.output == 'id,properties.Name\nfile1,"a, b.txt"\n'
+
+
 def test_list_files_with_workspace(monkeypatch: Any, runner: CliRunner) -> None:
     """Test listing files filtered by workspace."""
     patch_keyring(monkeypatch)
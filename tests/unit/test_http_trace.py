@@ -0,0 +1,136 @@
+"""Unit tests for HTTP tracing (--trace / SLCLI_TRACE)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from slcli import http_trace
+from slcli.main import cli
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = b'{"items": [1, 2, 3]}'
+        self.send_response(200 if "missing" not in self.path else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url() -> Generator[str, None, None]:
+    httpd = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _stop_trace() -> Generator[None, None, None]:
+    yield
+    http_trace.stop_trace()
+
+
+def test_route_template_replaces_ids() -> None:
+    assert (
+        http_trace.route_template(
+            "https://x/nitestmonitor/v2/results/3fa85f64-5717-4562-b3fc-2c963f66afa6?take=1"
+        )
+        == "/nitestmonitor/v2/results/{id}"
+    )
+    assert http_trace.route_template("https://x/nidataframe/v1/tables/12/data") == (
+        "/nidataframe/v1/tables/{id}/data"
+    )
+
+
+def test_tracer_records_requests_and_pages(server_url: str) -> None:
+    tracer = http_trace.start_trace()
+    with requests.Session() as session:
+        session.post(f"{server_url}/nitestmonitor/v2/query-results", json={"take": 2})
+        session.post(f"{server_url}/nitestmonitor/v2/query-results", json={"take": 2})
+        session.post(f"{server_url}/missing", data=b"abc")
+
+    assert http_trace.stop_trace() is tracer
+    assert [(r.route, r.status, r.page) for r in tracer.records] == [
+        ("/nitestmonitor/v2/query-results", 200, 1),
+        ("/nitestmonitor/v2/query-results", 200, 2),
+        ("/missing", 404, 1),
+    ]
+    first = tracer.records[0]
+    assert first.bytes_out == len(b'{"take": 2}')
+    assert first.bytes_in == len(b'{"items": [1, 2, 3]}')
+    assert first.ttfb_ms is not None and first.total_ms >= first.ttfb_ms
+
+    summary = {row["route"]: row for row in tracer.summary()}
+    assert summary["/nitestmonitor/v2/query-results"]["requests"] == 2
+    assert summary["/nitestmonitor/v2/query-results"]["pages"] == 2
+    assert summary["/missing"]["statuses"] == {"404": 1}
+
+
+def test_requests_after_stop_are_not_recorded(server_url: str) -> None:
+    tracer = http_trace.start_trace()
+    http_trace.stop_trace()
+    requests.Session().post(f"{server_url}/nitag/v2/tags", json={})
+    assert tracer.records == []
+
+
+def test_trace_target_from_flag_and_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(http_trace.TRACE_ENV, raising=False)
+    assert http_trace.trace_target(False) == (False, None)
+    assert http_trace.trace_target(True) == (True, None)
+    monkeypatch.setenv(http_trace.TRACE_ENV, "1")
+    assert http_trace.trace_target(False) == (True, None)
+    monkeypatch.setenv(http_trace.TRACE_ENV, "/tmp/trace.jsonl")
+    assert http_trace.trace_target(False) == (False, "/tmp/trace.jsonl")
+
+
+def test_trace_env_writes_chrome_trace(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, server_url: str
+) -> None:
+    trace_file = tmp_path / "trace.json"
+    monkeypatch.setenv(http_trace.TRACE_ENV, str(trace_file))
+
+    @cli.command(name="_trace-probe", hidden=True)
+    def _probe() -> None:
+        requests.Session().post(f"{server_url}/nisysmgmt/v1/query-systems", json={})
+
+    try:
+        result = CliRunner().invoke(cli, ["_trace-probe"])
+    finally:
+        cli.commands.pop("_trace-probe", None)
+
+    assert result.exit_code == 0, result.output
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["POST /nisysmgmt/v1/query-systems"]
+    assert events[0]["ph"] == "X" and events[0]["args"]["status"] == 200
+
+
+def test_trace_flag_prints_summary(server_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(http_trace.TRACE_ENV, raising=False)
+
+    @cli.command(name="_trace-probe", hidden=True)
+    def _probe() -> None:
+        requests.Session().post(f"{server_url}/niapm/v1/query-assets", json={})
+
+    try:
+        result = CliRunner().invoke(cli, ["--trace", "_trace-probe"])
+    finally:
+        cli.commands.pop("_trace-probe", None)
+
+    assert result.exit_code == 0, result.output
+    assert "/niapm/v1/query-assets" in result.stderr
+    assert "1 request(s) to 1 route(s)" in result.stderr
+    assert result.stdout == ""
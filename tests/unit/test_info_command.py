@@ -9,6 +9,7 @@ import pytest
 from click.testing import CliRunner
 
 import slcli.main as main_module
+from slcli import ssl_trust
 from slcli.main import cli
 from slcli.profiles import Profile
 from slcli.utils import ResolvedConfigValue
@@ -307,7 +308,7 @@ class TestInfoCommand:
             "services": {"Web Server": "unauthorized"},
         }
         config = ProfileConfig(current_profile="pkce", profiles={"pkce": test_profile})
-        with patch("slcli.main.get_platform_info", return_value=platform_info), patch(
+        with patch("slcli.platform.get_platform_info", return_value=platform_info), patch(
             "slcli.profiles.get_active_profile", return_value=test_profile
         ), patch("slcli.profiles.ProfileConfig.load", return_value=config):
             result = CliRunner().invoke(cli, ["info"])
@@ -523,21 +524,21 @@ class TestGetCaSourceDisplay:
 
     def test_os_trust_injected(self) -> None:
         """Test CA source when OS trust is injected."""
-        with patch.object(main_module, "OS_TRUST_INJECTED", True), patch.object(
-            main_module, "OS_TRUST_REASON", "injected:requests"
+        with patch.object(ssl_trust, "OS_TRUST_INJECTED", True), patch.object(
+            ssl_trust, "OS_TRUST_REASON", "injected:requests"
         ):
             assert main_module._get_ca_source_display() == "system (reason=injected:requests)"
 
     def test_custom_pem(self, monkeypatch: Any) -> None:
         """Test CA source when custom PEM is set via env."""
-        with patch.object(main_module, "OS_TRUST_INJECTED", False):
+        with patch.object(ssl_trust, "OS_TRUST_INJECTED", False):
             monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/path/to/ca.pem")
             assert main_module._get_ca_source_display() == "custom-pem (/path/to/ca.pem)"
 
     def test_certifi_fallback(self, monkeypatch: Any) -> None:
         """Test CA source falls back to certifi."""
-        with patch.object(main_module, "OS_TRUST_INJECTED", False), patch.object(
-            main_module, "OS_TRUST_REASON", "error:ImportError"
+        with patch.object(ssl_trust, "OS_TRUST_INJECTED", False), patch.object(
+            ssl_trust, "OS_TRUST_REASON", "error:ImportError"
         ):
             monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
             monkeypatch.delenv("SSL_CERT_FILE", raising=False)
@@ -764,8 +765,8 @@ class TestCollectInfoDebugRows:
         for var in ("HTTPS_PROXY", "https_proxy", "HTTP_PROXY", "http_proxy"):
             monkeypatch.delenv(var, raising=False)
 
-        with patch.object(main_module, "OS_TRUST_INJECTED", False), patch.object(
-            main_module, "OS_TRUST_REASON", "not-attempted"
+        with patch.object(ssl_trust, "OS_TRUST_INJECTED", False), patch.object(
+            ssl_trust, "OS_TRUST_REASON", "not-attempted"
         ), patch("slcli.utils.get_ssl_verify", return_value=True), patch.object(
             main_module,
             "_probe_tls_connection",
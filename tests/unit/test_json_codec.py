@@ -0,0 +1,111 @@
+"""Unit tests for the pluggable JSON codec."""
+
+import datetime
+import io
+import json
+from typing import Any, Generator
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from slcli import json_codec
+
+SAMPLE = {
+    "id": "res-1",
+    "name": "Zoë's fixture",
+    "values": [1, 2.5, None, True, False],
+    "nested": {"empty": {}, "list": []},
+    "count": 2**63 - 1,
+}
+
+
+@pytest.fixture(params=["stdlib", "orjson", "msgspec"])
+def backend(request: Any, monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    monkeypatch.setenv(json_codec.BACKEND_ENV, request.param)
+    json_codec.reset_backend()
+    yield request.param
+    json_codec.reset_backend()
+
+
+def test_backend_follows_environment(backend: str) -> None:
+    assert json_codec.backend_name() == backend
+
+
+def test_unknown_backend_falls_back_to_auto(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(json_codec.BACKEND_ENV, "simdjson")
+    json_codec.reset_backend()
+    try:
+        assert json_codec.backend_name() in json_codec.BACKENDS
+    finally:
+        json_codec.reset_backend()
+
+
+def test_every_backend_writes_the_same_document(backend: str) -> None:
+    expected = json.dumps(SAMPLE, indent=2)
+    assert json_codec.dumps(SAMPLE, indent=True) == expected
+    assert json_codec.dumpb(SAMPLE, indent=True) == expected.encode("ascii")
+    unescaped = json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+    assert json_codec.dumps(SAMPLE, indent=True, ensure_ascii=False) == unescaped
+    assert json_codec.loads(json_codec.dumpb(SAMPLE)) == SAMPLE
+
+
+def test_unencodable_values_use_stdlib_or_default(backend: str) -> None:
+    assert json_codec.loads(json_codec.dumps({"big": 2**70, 1: "x"})) == {"big": 2**70, "1": "x"}
+    stamp = datetime.date(2024, 5, 1)
+    assert json_codec.dumps({"when": stamp}, default=lambda obj: obj.isoformat()) == (
+        '{"when":"2024-05-01"}'
+    )
+
+
+def test_non_ascii_text_is_escaped_like_json_dumps(backend: str) -> None:
+    text = {"name": "测试 Zoë 🚀", "ok": True}
+    assert json_codec.dumps(text) == json.dumps(text, separators=(",", ":"))
+    assert json_codec.dumps(text, indent=True).isascii()
+
+
+def test_print_json_works_on_a_non_utf8_console(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from slcli.rich_output import print_json
+
+    console = io.TextIOWrapper(io.BytesIO(), encoding="cp1252")
+    monkeypatch.setattr("sys.stdout", console)
+    print_json({"name": "测试"})
+    console.flush()
+    assert json.loads(console.buffer.getvalue().decode("cp1252")) == {"name": "测试"}
+    assert b"\\u6d4b\\u8bd5" in console.buffer.getvalue()
+
+
+def test_default_decides_datetime_encoding(backend: str) -> None:
+    stamp = {"at": datetime.datetime(2024, 1, 1)}
+    assert json_codec.dumps(stamp, default=str) == '{"at":"2024-01-01 00:00:00"}'
+    assert json_codec.dumps(stamp, indent=True, default=str) == json.dumps(
+        stamp, indent=2, default=str
+    )
+
+
+def test_loads_accepts_stdlib_extensions_and_raises_json_errors(backend: str) -> None:
+    assert json_codec.loads("[NaN]")[0] != json_codec.loads("[NaN]")[0]
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
+
+
+def test_response_json_parses_body_bytes(backend: str) -> None:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(SAMPLE).encode("utf-8")
+    assert json_codec.response_json(response) == SAMPLE
+
+
+def test_response_json_uses_json_method_for_other_objects() -> None:
+    fake = MagicMock()
+    fake.json.return_value = {"items": []}
+    assert json_codec.response_json(fake) == {"items": []}
+
+    empty = requests.Response()
+    empty._content = b""
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        json_codec.response_json(empty)
@@ -2,6 +2,9 @@
 
 import importlib
 import json
+import os
+import subprocess
+import sys
 from typing import Any, Optional
 from unittest.mock import patch
 
@@ -9,7 +12,7 @@ import click
 from click.testing import CliRunner
 
 import slcli
-from slcli.main import cli, get_version
+from slcli.main import LAZY_COMMANDS, cli, get_version, _CliGroup
 from slcli.platform import PLATFORM_SLE
 
 VALID_API_KEY = "4LpbauiNA-UI9IhjqZoS4UeikZtExLK9Q_Q77d1bJd"
@@ -41,6 +44,41 @@ def test_get_version() -> None:
             assert part.isdigit()  # Each part should be numeric
 
 
+def test_lazy_command_specs_match_loaded_commands() -> None:
+    """Placeholder help must match what each command module registers."""
+    group = _CliGroup(name="probe", lazy_commands=LAZY_COMMANDS)
+    for name, spec in LAZY_COMMANDS.items():
+        command = group.load_command(name)
+        assert command is not None, name
+        assert command.get_short_help_str(limit=1000) == spec.short_help, name
+        assert command.hidden == spec.hidden, name
+    assert group.lazy_commands == {}
+
+
+def test_version_skips_heavy_imports() -> None:
+    """`slcli --version` and `--help` must not import HTTP, keyring or crypto modules."""
+    probe = (
+        "import sys\n"
+        "from slcli.__main__ import main\n"
+        "for argv in (['slcli', '--version'], ['slcli', '--help']):\n"
+        "    sys.argv = argv\n"
+        "    try:\n"
+        "        main()\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        "heavy = ('requests', 'keyring', 'questionary', 'cryptography', 'truststore')\n"
+        "print('loaded:' + ','.join(sorted(m for m in heavy if m in sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "SLCLI_NO_DAEMON": "1"},
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "loaded:"
+
+
 def test_help_includes_version() -> None:
     """Test that help includes the version option."""
     runner = CliRunner()
@@ -108,7 +146,7 @@ def test_login_with_flags(monkeypatch: Any, tmp_path: Any) -> None:
         },
     )
     # Mock keyring to return None (no existing credentials)
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -168,7 +206,7 @@ def test_login_prompts_to_trust_certificate_and_retries(monkeypatch: Any, tmp_pa
         "services": {"Auth": "ok"},
         "platform": PLATFORM_SLE,
     }
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     with patch(
         "slcli.config_click.check_service_status", side_effect=[failed_status, verified_status]
@@ -212,7 +250,7 @@ def test_login_rejects_unauthorized_api_key(monkeypatch: Any, tmp_path: Any) ->
             "platform": PLATFORM_SLE,
         },
     )
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -252,7 +290,7 @@ def test_login_rejects_inconclusive_profile_verification(monkeypatch: Any, tmp_p
             "platform": PLATFORM_SLE,
         },
     )
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -292,7 +330,7 @@ def test_login_rejects_unknown_auth_verification_state(monkeypatch: Any, tmp_pat
             "platform": PLATFORM_SLE,
         },
     )
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -334,7 +372,7 @@ def test_login_reports_file_query_fallback(monkeypatch: Any, tmp_path: Any) -> N
             "platform": PLATFORM_SLE,
         },
     )
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -375,7 +413,7 @@ def test_login_reports_sls_query_files(monkeypatch: Any, tmp_path: Any) -> None:
             "platform": "SLS",
         },
     )
-    monkeypatch.setattr("slcli.main.keyring.get_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.get_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -423,7 +461,7 @@ def test_logout_removes_credentials(monkeypatch: Any, tmp_path: Any) -> None:
         "slcli.profiles.ProfileConfig.get_config_path", classmethod(lambda cls: config_file)
     )
     # Mock keyring deletes to avoid errors
-    monkeypatch.setattr("slcli.main.keyring.delete_password", lambda *a, **kw: None)
+    monkeypatch.setattr("keyring.delete_password", lambda *a, **kw: None)
 
     runner = CliRunner()
     result = runner.invoke(cli, ["logout", "--force"])
@@ -454,7 +492,7 @@ def test_info_json(monkeypatch: Any, tmp_path: Any) -> None:
         "features": {"templates": True},
     }
 
-    monkeypatch.setattr("slcli.main.get_platform_info", lambda **kw: sample)
+    monkeypatch.setattr("slcli.platform.get_platform_info", lambda **kw: sample)
     runner = CliRunner()
     result = runner.invoke(cli, ["info", "--format", "json"])
 
@@ -749,3 +749,14 @@ def test_get_file_by_id_raises_when_not_found(monkeypatch: Any) -> None:
 
     with pytest.raises(ValueError, match="not found"):
         get_file_by_id("missing")
+
+
+def test_dump_keeps_stdlib_separators_and_default() -> None:
+    """Tool output keeps json.dumps' spacing and stringifies datetimes with str()."""
+    import datetime
+
+    from slcli.mcp_server import _dump
+
+    assert _dump({"a": [1, 2], "at": datetime.datetime(2024, 1, 1)}) == (
+        '{"a": [1, 2], "at": "2024-01-01 00:00:00"}'
+    )
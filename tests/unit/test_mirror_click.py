@@ -0,0 +1,167 @@
+"""Unit tests for mirror CLI commands."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from slcli.mirror_click import MIRROR_ENTITIES, register_mirror_commands
+
+
+def make_cli() -> click.Group:
+    """Create CLI instance with mirror commands for testing."""
+
+    @click.group()
+    def test_cli() -> None:
+        pass
+
+    register_mirror_commands(test_cli)
+    return test_cli
+
+
+class FakeServer:
+    """Answer query endpoints from in-memory collections, honoring watermark filters."""
+
+    def __init__(self) -> None:
+        """Create a server with one system, two assets and one result."""
+        self.collections: Dict[str, List[Dict[str, Any]]] = {
+            "systems": [{"id": "sys-1", "alias": "PXI-1", "lastUpdatedTimestamp": "2026-01-01"}],
+            "assets": [
+                {
+                    "id": "a-1",
+                    "modelName": "PXI-4130",
+                    "location": {"minionId": "sys-1"},
+                    "lastUpdatedTimestamp": "2026-01-01",
+                },
+                {
+                    "id": "a-2",
+                    "modelName": "PXI-6255",
+                    "location": {"minionId": "sys-1"},
+                    "lastUpdatedTimestamp": "2026-01-03",
+                },
+            ],
+            "products": [],
+            "results": [
+                {"id": "r-1", "status": {"statusType": "PASSED"}, "updatedAt": "2026-01-02"}
+            ],
+            "workitems": [],
+        }
+        self.payloads: List[Dict[str, Any]] = []
+
+    def __call__(self, method: str, url: str, payload: Dict[str, Any], **_: Any) -> Any:
+        """Handle a query request."""
+        self.payloads.append(dict(payload, url=url))
+        entity = next(e for e in MIRROR_ENTITIES.values() if url.endswith(e.path))
+        items = self.collections[entity.name]
+        if "filter" in payload:
+            watermark = (payload.get("substitutions") or [None])[0] or payload["filter"].split('"')[
+                1
+            ]
+            items = [item for item in items if item[entity.updated_field] >= watermark]
+        skip = payload.get("skip", 0)
+        page = items[skip : skip + payload["take"]]
+
+        class _Response:
+            def json(self) -> Any:
+                return {entity.items_key: page}
+
+        return _Response()
+
+
+@pytest.fixture
+def server(monkeypatch: Any) -> FakeServer:
+    """Install a fake SystemLink server."""
+    fake = FakeServer()
+    monkeypatch.setattr("slcli.mirror_click.make_api_request", fake)
+    monkeypatch.setattr("slcli.mirror_click.get_base_url", lambda: "https://test.com")
+    return fake
+
+
+def test_sync_full_then_incremental(tmp_path: Path, server: FakeServer) -> None:
+    """Test the first sync loads everything and the next one asks for deltas only."""
+    db = str(tmp_path / "mirror.sqlite3")
+    runner = CliRunner()
+
+    result = runner.invoke(make_cli(), ["mirror", "sync", "--db", db, "-f", "json"])
+    assert result.exit_code == 0, result.output
+    stats = json.loads(result.output)["entities"]
+    assert stats["assets"] == {"mode": "full", "fetched": 2, "rows": 2}
+    assert not any("filter" in payload for payload in server.payloads)
+
+    server.collections["assets"][0]["lastUpdatedTimestamp"] = "2026-01-05"
+    server.collections["assets"][0]["modelName"] = "PXI-4132"
+    server.payloads.clear()
+    result = runner.invoke(
+        make_cli(), ["mirror", "sync", "--db", db, "-e", "assets", "-e", "results", "-f", "json"]
+    )
+    assert result.exit_code == 0, result.output
+    stats = json.loads(result.output)["entities"]
+    assert stats["assets"] == {"mode": "incremental", "fetched": 2, "rows": 2}
+    assert stats["results"]["fetched"] == 1
+    filters = {payload["url"].rsplit("/", 1)[1]: payload for payload in server.payloads}
+    assert filters["query-assets"]["filter"] == 'LastUpdatedTimestamp >= "2026-01-03"'
+    assert filters["query-results"]["filter"] == "updatedAt >= @0"
+    assert filters["query-results"]["substitutions"] == ["2026-01-02"]
+    assert filters["query-assets"]["orderBy"] == "LAST_UPDATED_TIMESTAMP"
+    assert filters["query-assets"]["descending"] is False
+    assert "orderBy" not in filters["query-results"]
+
+    result = runner.invoke(
+        make_cli(),
+        [
+            "mirror",
+            "query",
+            "SELECT s.alias, a.model_name FROM assets a JOIN systems s ON s.id = a.system_id "
+            "WHERE a.updated_at >= ? ORDER BY a.id",
+            "-p",
+            "2026-01-03",
+            "--db",
+            db,
+            "-f",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [
+        {"alias": "PXI-1", "model_name": "PXI-4132"},
+        {"alias": "PXI-1", "model_name": "PXI-6255"},
+    ]
+
+
+def test_full_sync_drops_deleted_items(tmp_path: Path, server: FakeServer) -> None:
+    """Test --full reloads an entity from scratch."""
+    db = str(tmp_path / "mirror.sqlite3")
+    runner = CliRunner()
+    assert runner.invoke(make_cli(), ["mirror", "sync", "--db", db, "-e", "assets"]).exit_code == 0
+
+    server.collections["assets"].pop()
+    result = runner.invoke(
+        make_cli(), ["mirror", "sync", "--db", db, "-e", "assets", "--full", "-f", "json"]
+    )
+    assert json.loads(result.output)["entities"]["assets"]["rows"] == 1
+
+
+def test_query_is_read_only(tmp_path: Path, server: FakeServer) -> None:
+    """Test the query command cannot modify the mirror."""
+    db = str(tmp_path / "mirror.sqlite3")
+    runner = CliRunner()
+    runner.invoke(make_cli(), ["mirror", "sync", "--db", db, "-e", "systems"])
+
+    result = runner.invoke(make_cli(), ["mirror", "query", "DELETE FROM systems", "--db", db])
+    assert result.exit_code == 2
+    assert "Query failed" in result.output
+
+    result = runner.invoke(make_cli(), ["mirror", "status", "--db", db, "-f", "json"])
+    assert json.loads(result.output)["entities"]["systems"]["rows"] == 1
+
+
+def test_query_without_mirror(tmp_path: Path) -> None:
+    """Test a helpful error when no mirror exists yet."""
+    result = CliRunner().invoke(
+        make_cli(), ["mirror", "query", "SELECT 1", "--db", str(tmp_path / "none.sqlite3")]
+    )
+    assert result.exit_code == 3
+    assert "mirror sync" in result.output
@@ -0,0 +1,111 @@
+"""Unit tests for nipkg_utils.py."""
+
+import io
+import os
+import tarfile
+import zlib
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from slcli.nipkg_utils import (
+    DEFAULT_SOURCE_DATE_EPOCH,
+    ParallelGzipWriter,
+    get_source_date_epoch,
+    iter_folder_entries,
+    write_nipkg,
+)
+
+
+def _read_ar_members(pkg_path: Path) -> Dict[str, bytes]:
+    """Return the members of an ar archive keyed by name."""
+    members: Dict[str, bytes] = {}
+    with open(pkg_path, "rb") as package_file:
+        assert package_file.read(8) == b"!<arch>\n"
+        while True:
+            header = package_file.read(60)
+            if not header:
+                break
+            size = int(header[48:58].decode("ascii").strip())
+            members[header[:16].decode("ascii").strip()] = package_file.read(size)
+            if size % 2:
+                package_file.read(1)
+    return members
+
+
+def test_parallel_gzip_writer_produces_single_member() -> None:
+    """Blocks compressed on several threads decode as one gzip member."""
+    payload = os.urandom(50_000) + b"repeated text " * 20_000 + os.urandom(10)
+    buffer = io.BytesIO()
+    with ParallelGzipWriter(buffer, workers=3, block_size=16 * 1024) as writer:
+        for start in range(0, len(payload), 7000):
+            writer.write(payload[start : start + 7000])
+
+    decompressor = zlib.decompressobj(wbits=31)
+    assert decompressor.decompress(buffer.getvalue()) == payload
+    assert decompressor.eof
+    assert decompressor.unused_data == b""
+
+
+def test_parallel_gzip_writer_empty_input() -> None:
+    """Closing without writing produces a valid empty gzip stream."""
+    buffer = io.BytesIO()
+    ParallelGzipWriter(buffer).close()
+
+    assert zlib.decompress(buffer.getvalue(), wbits=31) == b""
+
+
+def test_get_source_date_epoch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """SOURCE_DATE_EPOCH overrides the default archive timestamp."""
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    assert get_source_date_epoch() == DEFAULT_SOURCE_DATE_EPOCH
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert get_source_date_epoch() == 1700000000
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "not-a-number")
+    assert get_source_date_epoch() == DEFAULT_SOURCE_DATE_EPOCH
+
+
+def test_iter_folder_entries_matches_tarfile_order(tmp_path: Path) -> None:
+    """Entries are yielded in the same order tarfile.add uses."""
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "z.txt").write_text("z")
+    (tmp_path / "b" / "a.txt").write_text("a")
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "c.txt").write_text("c")
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        archive.add(str(tmp_path), arcname=".")
+        expected: List[str] = archive.getnames()
+
+    assert [arcname for _, arcname in iter_folder_entries(tmp_path)] == expected
+
+
+def test_write_nipkg_is_reproducible_and_injects_virtual_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Packing twice yields identical bytes and virtual files replace folder entries."""
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    folder = tmp_path / "dist"
+    (folder / "assets").mkdir(parents=True)
+    (folder / "index.html").write_text("<html></html>")
+    (folder / "assets" / "main.js").write_bytes(os.urandom(300_000))
+    (folder / "icon.svg").write_text("<svg>stale</svg>")
+    icon = tmp_path / "icon.svg"
+    icon.write_text("<svg>source</svg>")
+
+    first = write_nipkg(tmp_path / "first.nipkg", b"Package: demo\n", folder, {"icon.svg": icon})
+    os.utime(folder / "index.html", (1_000_000, 1_000_000))
+    second = write_nipkg(tmp_path / "second.nipkg", b"Package: demo\n", folder, {"icon.svg": icon})
+
+    assert first.read_bytes() == second.read_bytes()
+    members = _read_ar_members(first)
+    assert list(members) == ["debian-binary", "control.tar.gz", "data.tar.gz"]
+    with tarfile.open(fileobj=io.BytesIO(members["data.tar.gz"]), mode="r:gz") as archive:
+        names = archive.getnames()
+        icon_member = archive.extractfile("./icon.svg")
+        assert icon_member is not None
+        assert icon_member.read() == b"<svg>source</svg>"
+        assert {member.mtime for member in archive.getmembers()} == {DEFAULT_SOURCE_DATE_EPOCH}
+    assert names == ["."] + ["./icon.svg", "./assets", "./assets/main.js", "./index.html"]
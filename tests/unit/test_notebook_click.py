@@ -357,6 +357,136 @@ def test_notebook_execute_sync_success(monkeypatch: MonkeyPatch) -> None:
     assert '"exec-1"' in result.output
 
 
+def test_notebook_execute_batch_limits_in_flight_and_polls_in_bulk(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Batch execution should submit in chunks and track executions with bulk queries."""
+    import json
+
+    import slcli.notebook_click
+
+    runner = CliRunner()
+    patch_keyring(monkeypatch)
+    monkeypatch.setattr(slcli.notebook_click, "get_platform", lambda: PLATFORM_SLE)
+    monkeypatch.setattr(
+        slcli.notebook_click,
+        "_build_create_execution_payload",
+        lambda **_: {"notebookId": "nb1", "parameters": {"base": 1}},
+    )
+    monkeypatch.setattr(slcli.notebook_click.time, "sleep", lambda _: None)
+    matrix = tmp_path / "matrix.csv"
+    matrix.write_text("temp,label\n25,a\n50,b\n75,c\n", encoding="utf-8")
+
+    submitted: List[List[Dict[str, Any]]] = []
+    queried: List[str] = []
+    statuses: Dict[str, str] = {}
+
+    class Resp:
+        def __init__(self, data: Any) -> None:
+            self._data = data
+            self.text = json.dumps(data)
+
+        def json(self) -> Any:
+            return self._data
+
+    def fake_request(method: str, url: str, payload: Any = None, **_: Any) -> Resp:
+        if url.endswith("/executions"):
+            submitted.append(payload)
+            executions = []
+            for item in payload:
+                execution_id = f"exec-{item['parameters']['label']}"
+                statuses[execution_id] = "IN_PROGRESS"
+                executions.append({"id": execution_id, "status": "QUEUED"})
+            return Resp({"executions": executions})
+        queried.append(payload["filter"])
+        found = []
+        for execution_id in list(statuses):
+            if f'"{execution_id}"' in payload["filter"]:
+                found.append({"id": execution_id, "status": "SUCCEEDED"})
+                del statuses[execution_id]
+        return Resp({"executions": found})
+
+    monkeypatch.setattr(slcli.notebook_click, "make_api_request", fake_request)
+
+    result = runner.invoke(
+        cli,
+        [
+            "notebook",
+            "execute",
+            "batch",
+            "--notebook-id",
+            "nb1",
+            "--matrix",
+            str(matrix),
+            "--max-in-flight",
+            "2",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [len(batch) for batch in submitted] == [2, 1]
+    assert submitted[0][0]["parameters"] == {"base": 1, "temp": 25, "label": "a"}
+    assert queried[0] == 'id == "exec-a" || id == "exec-b"'
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert all(line["execution"]["status"] == "SUCCEEDED" for line in lines)
+
+
+def test_notebook_execute_batch_reports_created_rows_on_partial_create(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """A short create response should list the executions it started before failing."""
+    import slcli.notebook_click
+
+    runner = CliRunner()
+    patch_keyring(monkeypatch)
+    monkeypatch.setattr(slcli.notebook_click, "get_platform", lambda: PLATFORM_SLE)
+    monkeypatch.setattr(
+        slcli.notebook_click,
+        "_build_create_execution_payload",
+        lambda **_: {"notebookId": "nb1", "parameters": {}},
+    )
+    matrix = tmp_path / "matrix.jsonl"
+    matrix.write_text('{"n": 1}\n{"n": 2}\n{"n": 3}\n', encoding="utf-8")
+
+    class Resp:
+        def json(self) -> Any:
+            return {
+                "executions": [{"id": "exec-3", "status": "QUEUED", "parameters": {"n": 3}}],
+                "error": {"message": "2 executions failed"},
+            }
+
+    monkeypatch.setattr(slcli.notebook_click, "make_api_request", lambda *a, **k: Resp())
+
+    result = runner.invoke(
+        cli, ["notebook", "execute", "batch", "--notebook-id", "nb1", "--matrix", str(matrix)]
+    )
+
+    assert result.exit_code == slutils.ExitCodes.GENERAL_ERROR
+    assert "Error creating executions: 2 executions failed" in result.output
+    assert "Created 1 of 3 execution(s) in the failed request" in result.output
+    assert "row 3: exec-3" in result.output
+
+
+def test_notebook_execute_batch_rejects_invalid_matrix(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Non-object parameter sets should be rejected before anything is submitted."""
+    runner = CliRunner()
+    patch_keyring(monkeypatch)
+    matrix = tmp_path / "matrix.jsonl"
+    matrix.write_text('{"a": 1}\n[1, 2]\n', encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["notebook", "execute", "batch", "--notebook-id", "nb1", "--matrix", str(matrix)]
+    )
+
+    assert result.exit_code == slutils.ExitCodes.INVALID_INPUT
+    assert "Parameter set 2 is not an object" in result.output
+
+
 def test_set_notebook_interface_valid(monkeypatch: MonkeyPatch) -> None:
     """Test setting a valid interface on a notebook."""
     runner = CliRunner()
@@ -0,0 +1,71 @@
+"""Unit tests for polling_utils.py."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from slcli.polling_utils import CompletionWaiter
+
+
+def _is_done(status: Dict[str, Any]) -> bool:
+    return status.get("status") == "DONE"
+
+
+def test_waiter_polls_all_pending_ids_in_one_call() -> None:
+    """Each poll should request every pending ID together."""
+    calls: List[List[str]] = []
+    rounds = [
+        {"a": {"status": "RUNNING"}, "b": {"status": "DONE"}},
+        {"a": {"status": "DONE"}},
+    ]
+
+    def fetch(ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        calls.append(sorted(ids))
+        return rounds[len(calls) - 1]
+
+    waiter = CompletionWaiter(fetch, _is_done, sleep=lambda _: None)
+    waiter.add("a")
+    waiter.add("b")
+
+    finished = [operation_id for operation_id, _ in waiter.wait()]
+
+    assert finished == ["b", "a"]
+    assert calls == [["a", "b"], ["a"]]
+    assert waiter.pending == []
+
+
+def test_waiter_backs_off_until_progress() -> None:
+    """The interval should grow while idle and reset once something finishes."""
+    sleeps: List[float] = []
+    responses = [{}, {}, {}, {"a": {"status": "DONE"}}]
+
+    def fetch(ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return responses.pop(0)
+
+    waiter = CompletionWaiter(
+        fetch, _is_done, initial_interval=1.0, max_interval=3.0, sleep=sleeps.append
+    )
+    waiter.add("a")
+    list(waiter.wait())
+
+    assert sleeps == [2.0, 3.0, 3.0]
+    assert waiter.interval == 1.0
+
+
+def test_waiter_raises_after_timeout() -> None:
+    """Waiting past the overall timeout should raise and keep pending IDs."""
+    waiter = CompletionWaiter(lambda ids: {}, _is_done, timeout=0, sleep=lambda _: None)
+    waiter.add("a", {"status": "RUNNING"})
+
+    with pytest.raises(TimeoutError):
+        list(waiter.wait())
+    assert waiter.pending == ["a"]
+    assert waiter.last_status("a") == {"status": "RUNNING"}
+    assert waiter.remaining() == 0.0
+
+
+def test_waiter_remaining_time() -> None:
+    """The time left should be bounded by the timeout, and None without one."""
+    assert CompletionWaiter(lambda ids: {}, _is_done).remaining() is None
+    remaining = CompletionWaiter(lambda ids: {}, _is_done, timeout=60).remaining()
+    assert remaining is not None and 59 < remaining <= 60
@@ -5,6 +5,8 @@ from io import StringIO
 from typing import Any, cast
 
 import click
+from rich.box import ROUNDED
+from rich.console import Console
 from rich.json import JSON
 from rich.table import Table
 from rich.text import Text
@@ -131,6 +133,32 @@ def test_render_table_prints_table_and_total(monkeypatch: Any) -> None:
     assert console.calls[2]["args"][0].plain == "Total: 1 item(s)"
 
 
+def test_render_table_streams_same_layout_when_not_a_terminal(monkeypatch: Any) -> None:
+    """Piped output is streamed row by row with the layout Rich would produce."""
+    headers = ["Name", "Status", "Notes"]
+    widths = [8, 10, 12]
+    rows = [
+        ["demo", "SUCCEEDED", "short"],
+        ["a much longer name", "FAILED", "two\nlines"],
+        ["Zoë ✓", "", "tab\there"],
+    ]
+    streamed = StringIO()
+    console = Console(file=streamed, width=160, theme=rich_output._THEME)
+    assert not console.is_terminal
+    monkeypatch.setattr(rich_output, "_get_console", lambda err=False: console)
+
+    render_table(headers, widths, (row for row in rows), show_total=True)
+
+    expected = StringIO()
+    table = Table(box=ROUNDED, pad_edge=True)
+    for header, width in zip(headers, widths):
+        table.add_column(header, overflow="ellipsis", width=width, no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
+    Console(file=expected, width=160).print(table)
+    assert streamed.getvalue() == expected.getvalue() + "\nTotal: 3 item(s)\n"
+
+
 def test_rich_echo_uses_original_echo_for_non_stream_file(monkeypatch: Any) -> None:
     """Explicit file objects should bypass Rich rendering."""
     recorded: list[dict[str, Any]] = []
@@ -105,6 +105,8 @@ def test_managed_certificate_persistence_is_origin_scoped(monkeypatch: Any, tmp_
 
 def test_certificate_inspection_uses_unpatched_context_and_peer_chain(monkeypatch: Any) -> None:
     """Inspection should bypass truststore and retain the full peer certificate chain."""
+    from cryptography import x509
+
     from slcli import ssl_trust
 
     class FakeCertificate:
@@ -164,7 +166,7 @@ def test_certificate_inspection_uses_unpatched_context_and_peer_chain(monkeypatc
         ssl_trust.socket, "create_connection", lambda *args, **kwargs: FakeTcpSocket()
     )
     monkeypatch.setattr(
-        ssl_trust.x509, "load_der_x509_certificate", lambda _certificate_der: FakeCertificate()
+        x509, "load_der_x509_certificate", lambda _certificate_der: FakeCertificate()
     )
     monkeypatch.setattr(ssl_trust, "_certificate_name", lambda _name: "name")
     monkeypatch.setattr(
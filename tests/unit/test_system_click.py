@@ -1,7 +1,7 @@
 """Unit tests for system CLI commands."""
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from unittest.mock import patch
 
 import click
@@ -11,6 +11,8 @@ from click.testing import CliRunner
 from slcli.system_click import (
     _LIST_PROJECTION,
     _SLIM_LIST_PROJECTION,
+    _analyze_asset_drift,
+    _analyze_package_drift,
     _build_job_filter,
     _build_system_filter,
     _calculate_column_widths,
@@ -79,6 +81,11 @@ class MockResponse:
         """Return the JSON data."""
         return self._json_data
 
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Yield the body in chunks, as a streamed response does."""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
     def raise_for_status(self) -> None:
         """Raise on HTTP error status."""
         if self.status_code >= 400:
@@ -1685,6 +1692,124 @@ class TestSystemReport:
         assert captured_payloads[0]["type"] == "HARDWARE"
         assert captured_payloads[0]["filter"] == 'connected.data.state = "CONNECTED"'
 
+    def test_report_streams_chunks_to_jsonl(
+        self, monkeypatch: Any, runner: CliRunner, tmp_path: Any
+    ) -> None:
+        """Test the report body is streamed and converted row by row."""
+        patch_keyring(monkeypatch)
+        monkeypatch.setattr("slcli.profiles.is_active_profile_readonly", lambda: False)
+        body = b'Alias,Package\r\nPXI-1,"NI-DAQmx, Runtime"\r\nPXI-2,NI-VISA\r\n'
+        captured: List[Dict[str, Any]] = []
+
+        def mock_post(*a: Any, **kw: Any) -> Any:
+            captured.append(kw)
+            resp: Any = MockResponse({})
+            resp.iter_content = lambda chunk_size: iter([body[:10], body[10:25], body[25:]])
+            return resp
+
+        monkeypatch.setattr("slcli.system_click.make_api_request", mock_post)
+
+        output_file = tmp_path / "report.jsonl"
+        result = runner.invoke(
+            make_cli(),
+            [
+                "system",
+                "report",
+                "--type",
+                "SOFTWARE",
+                "-o",
+                str(output_file),
+                "--format",
+                "jsonl",
+                "--progress",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert captured[0]["stream"] is True
+        records = [json.loads(line) for line in output_file.read_text().splitlines()]
+        assert records == [
+            {"Alias": "PXI-1", "Package": "NI-DAQmx, Runtime"},
+            {"Alias": "PXI-2", "Package": "NI-VISA"},
+        ]
+        assert "Rows: 2" in result.output
+        assert f"Downloaded {len(body)} B" in result.output
+
+    def test_report_partitions_are_concatenated(
+        self, monkeypatch: Any, runner: CliRunner, tmp_path: Any
+    ) -> None:
+        """Test partitions are requested separately and joined with one header."""
+        patch_keyring(monkeypatch)
+        monkeypatch.setattr("slcli.profiles.is_active_profile_readonly", lambda: False)
+        bodies = {
+            '(connected.data.state = "CONNECTED") and (workspace = "ws-1")': b"A,B\n1,2\n3,4",
+            '(connected.data.state = "CONNECTED") and (workspace = "ws-2")': b"A,B\n5,6\n",
+        }
+        filters: List[str] = []
+
+        def mock_post(*a: Any, **kw: Any) -> Any:
+            filters.append(kw["payload"]["filter"])
+            resp: Any = MockResponse({})
+            resp.content = bodies[kw["payload"]["filter"]]
+            return resp
+
+        monkeypatch.setattr("slcli.system_click.make_api_request", mock_post)
+
+        output_file = tmp_path / "report.csv"
+        result = runner.invoke(
+            make_cli(),
+            [
+                "system",
+                "report",
+                "--type",
+                "HARDWARE",
+                "--filter",
+                'connected.data.state = "CONNECTED"',
+                "--partition",
+                'workspace = "ws-1"',
+                "--partition",
+                'workspace = "ws-2"',
+                "-o",
+                str(output_file),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert sorted(filters) == sorted(bodies)
+        assert output_file.read_bytes() == b"A,B\n1,2\n3,4\n5,6\n"
+        assert "Partitions: 2" in result.output
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_report_partitions_with_different_columns_fail(
+        self, monkeypatch: Any, runner: CliRunner, tmp_path: Any
+    ) -> None:
+        """Test partitions with mismatched headers are rejected."""
+        patch_keyring(monkeypatch)
+        monkeypatch.setattr("slcli.profiles.is_active_profile_readonly", lambda: False)
+
+        def mock_post(*a: Any, **kw: Any) -> Any:
+            resp: Any = MockResponse({})
+            resp.content = b"A,B\n1,2\n" if "one" in kw["payload"]["filter"] else b"A,C\n1,2\n"
+            return resp
+
+        monkeypatch.setattr("slcli.system_click.make_api_request", mock_post)
+
+        result = runner.invoke(
+            make_cli(),
+            [
+                "system",
+                "report",
+                "--type",
+                "HARDWARE",
+                "--partition",
+                'alias = "one"',
+                "--partition",
+                'alias = "two"',
+                "-o",
+                str(tmp_path / "report.csv"),
+            ],
+        )
+        assert result.exit_code == ExitCodes.GENERAL_ERROR
+        assert "different columns" in result.output
+
     def test_report_missing_output(self, monkeypatch: Any, runner: CliRunner) -> None:
         """Test report requires --output option."""
         patch_keyring(monkeypatch)
@@ -2894,3 +3019,121 @@ class TestCompareCommand:
         assert result.exit_code != 0
         # Should NOT say "System not found" — it's an auth error
         assert "System not found" not in result.output
+
+
+FLEET_SYSTEMS: List[Dict[str, Any]] = [
+    {
+        "id": "sys-bbb",
+        "alias": "System B",
+        "packages": SAMPLE_SYSTEM_B["packages"]["data"],
+    },
+    {
+        "id": "sys-ccc",
+        "alias": "System C",
+        "packages": SAMPLE_SYSTEM_A["packages"]["data"],
+    },
+    {
+        "id": "sys-aaa",
+        "alias": "System A",
+        "packages": SAMPLE_SYSTEM_A["packages"]["data"],
+    },
+]
+
+
+class TestAnalyzeDrift:
+    """Tests for the drift analysis helpers."""
+
+    def test_package_drift_per_system_and_histograms(self) -> None:
+        """Test deviations and version histograms against a baseline."""
+        result = _analyze_package_drift(SAMPLE_SYSTEM_A, FLEET_SYSTEMS[:2])
+
+        system_b, system_c = result["systems"]
+        assert system_b["missing"] == ["ni-visa"]
+        assert system_b["extra"] == ["ni-rfsa"]
+        assert system_b["version_differences"] == [
+            {"package": "NI-DAQmx", "baseline_version": "24.1.0", "version": "23.8.0"}
+        ]
+        assert system_c["missing"] == []
+        assert system_c["extra"] == []
+        assert system_c["version_differences"] == []
+
+        histograms = {pkg["package"]: pkg for pkg in result["packages"]}
+        assert histograms["ni-daqmx"]["versions"] == {"23.8.0": 1, "24.1.0": 1}
+        assert histograms["ni-visa"]["missing_count"] == 1
+        assert histograms["ni-rfsa"]["baseline_version"] is None
+        assert histograms["ni-rfsa"]["installed_count"] == 1
+
+    def test_asset_drift_by_model_and_vendor(self) -> None:
+        """Test asset deviations are counted per model and vendor."""
+        result = _analyze_asset_drift(SAMPLE_ASSETS_A, SAMPLE_ASSETS_B)
+        assert result["missing"] == []
+        assert result["extra"] == [{"model": "PXI-4130", "vendor": "NI", "count": 1}]
+        assert result["count_mismatches"] == []
+
+        result = _analyze_asset_drift(SAMPLE_ASSETS_B, SAMPLE_ASSETS_A + SAMPLE_ASSETS_A)
+        assert result["missing"] == [{"model": "PXI-4130", "vendor": "NI", "count": 1}]
+        assert result["count_mismatches"] == [
+            {"model": "PXI-6255", "vendor": "NI", "count_baseline": 1, "count_system": 2}
+        ]
+
+
+class TestDriftCommand:
+    """Tests for the system drift CLI command."""
+
+    def _install_mock(self, monkeypatch: Any, calls: List[Dict[str, Any]]) -> None:
+        patch_keyring(monkeypatch)
+
+        def mock_request(method: str, url: str, **kw: Any) -> Any:
+            calls.append({"method": method, "url": url, **kw})
+            if method == "GET" and "id=sys-aaa" in url:
+                return MockResponse([SAMPLE_SYSTEM_A])
+            if method == "POST" and "query-systems" in url:
+                payload = kw.get("payload", {})
+                page = FLEET_SYSTEMS[payload["skip"] : payload["skip"] + payload["take"]]
+                return MockResponse({"data": page, "count": len(page)})
+            if method == "POST" and "query-assets" in url:
+                filt = kw.get("payload", {}).get("filter", "")
+                if "sys-bbb" in filt:
+                    return MockResponse({"assets": SAMPLE_ASSETS_B, "totalCount": 2})
+                return MockResponse({"assets": SAMPLE_ASSETS_A, "totalCount": 1})
+            return MockResponse({})
+
+        monkeypatch.setattr("slcli.system_click.make_api_request", mock_request)
+        monkeypatch.setattr("slcli.system_click.get_effective_workspace", lambda ws: ws)
+
+    def test_drift_json_output(self, monkeypatch: Any, runner: CliRunner) -> None:
+        """Test drift uses one projected query and excludes the baseline."""
+        calls: List[Dict[str, Any]] = []
+        self._install_mock(monkeypatch, calls)
+
+        result = runner.invoke(
+            make_cli(),
+            ["system", "drift", "--baseline", "sys-aaa", "--state", "CONNECTED", "-f", "json"],
+        )
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["baseline"] == {"id": "sys-aaa", "alias": "System A"}
+        assert [entry["id"] for entry in data["systems"]] == ["sys-bbb", "sys-ccc"]
+        assert data["drifted_count"] == 1
+        assert "assets" not in data["systems"][0]
+
+        queries = [call for call in calls if "query-systems" in call["url"]]
+        assert len(queries) == 1
+        assert "packages.data as packages" in queries[0]["payload"]["projection"]
+        assert queries[0]["payload"]["filter"] == 'connected.data.state = "CONNECTED"'
+        assert not any("query-assets" in call["url"] for call in calls)
+
+    def test_drift_table_output_with_assets(self, monkeypatch: Any, runner: CliRunner) -> None:
+        """Test drift table output including asset deviations."""
+        calls: List[Dict[str, Any]] = []
+        self._install_mock(monkeypatch, calls)
+
+        result = runner.invoke(make_cli(), ["system", "drift", "-b", "sys-aaa", "--assets"])
+        assert result.exit_code == 0, result.output
+        assert "Drift against baseline: System A" in result.output
+        assert "System B" in result.output
+        assert "Package Version Histograms" in result.output
+        assert "≠ 23.8.0: 1" in result.output
+        assert "Summary: 1 matching, 1 drifted, 3 drifting packages" in result.output
+        asset_calls = [call for call in calls if "query-assets" in call["url"]]
+        assert len(asset_calls) == 3
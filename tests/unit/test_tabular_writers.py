@@ -0,0 +1,65 @@
+"""Unit tests for tabular_writers.py."""
+
+import csv
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from slcli.tabular_writers import iter_csv_rows, iter_text_lines, open_tabular_writer
+
+
+def _split(data: bytes, size: int) -> List[bytes]:
+    """Split bytes into fixed-size chunks."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_iter_csv_rows_handles_chunk_boundaries() -> None:
+    """Test CSV records survive chunks that split characters and quoted newlines."""
+    text = '\ufeffname,notes\r\n"Système A","line one\nline two"\r\nB, x\r\n'
+    expected = [["name", "notes"], ["Système A", "line one\nline two"], ["B", " x"]]
+    for size in (1, 2, 3, 7, 1024):
+        assert list(iter_csv_rows(_split(text.encode("utf-8"), size))) == expected
+
+
+def test_iter_text_lines_keeps_unterminated_last_line() -> None:
+    """Test the final line is yielded even without a trailing newline."""
+    assert list(iter_text_lines([b"a\nb", b"c"])) == ["a\n", "bc"]
+
+
+def test_csv_and_jsonl_writers(tmp_path: Path) -> None:
+    """Test rows are written with a header (CSV) or keyed by column (JSONL)."""
+    csv_path = tmp_path / "out.csv"
+    with open_tabular_writer(csv_path, "csv", ["a", "b"]) as writer:
+        writer.write_row(["1", "x,y"])
+    with open(csv_path, newline="", encoding="utf-8") as handle:
+        assert list(csv.reader(handle)) == [["a", "b"], ["1", "x,y"]]
+
+    jsonl_path = tmp_path / "out.jsonl"
+    with open_tabular_writer(jsonl_path, "JSONL", ["a", "b"]) as writer:
+        writer.write_row(["1", "2"])
+        writer.write_row(["3", "4"])
+    lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+    assert writer.rows_written == 2
+
+
+def test_parquet_writer_batches_rows(tmp_path: Path) -> None:
+    """Test Parquet output is written in row groups."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    from slcli.tabular_writers import ParquetRowWriter
+
+    path = tmp_path / "out.parquet"
+    with ParquetRowWriter(path, ["a", "b"], batch_rows=2) as writer:
+        for index in range(5):
+            writer.write_row([str(index), None])
+    parquet_file = pq.ParquetFile(str(path))
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.read().column("a").to_pylist() == ["0", "1", "2", "3", "4"]
+
+
+def test_unknown_format_raises(tmp_path: Path) -> None:
+    """Test an unsupported format is rejected."""
+    with pytest.raises(ValueError):
+        open_tabular_writer(tmp_path / "out.xml", "xml", ["a"])
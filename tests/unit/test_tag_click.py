@@ -1,6 +1,7 @@
 """Unit tests for tag management CLI commands."""
 
 import json
+from array import array
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
 
@@ -8,7 +9,7 @@ import click
 import keyring
 from click.testing import CliRunner
 
-from slcli.tag_click import register_tag_commands
+from slcli.tag_click import _HistoryDecimator, _next_watch_interval, register_tag_commands
 
 
 def make_cli() -> click.Group:
@@ -373,6 +374,47 @@ class TestTagHistory:
         assert "●" in graph_rows[0]
         assert "●" in graph_rows[-1]
 
+    def test_history_graph_pages_and_keeps_spikes(self, monkeypatch: Any) -> None:
+        """Test graph mode follows continuation tokens and keeps outliers."""
+
+        def mock_get_password(service: str, key: str) -> Optional[str]:
+            if key == "SYSTEMLINK_CONFIG":
+                return json.dumps({"api_url": "http://localhost", "api_key": "test"})
+            return None
+
+        monkeypatch.setattr(keyring, "get_password", mock_get_password)
+
+        cli = make_cli()
+        runner = CliRunner()
+        page1: Any = [{"timestamp": f"t{1000 - i}", "value": 1.0} for i in range(500)]
+        page2: Any = [{"timestamp": f"t{500 - i}", "value": 1.0} for i in range(500)]
+        page1[250]["value"] = 99.0
+
+        with patch("slcli.tag_click._TAG_HISTORY_PAGE_SIZE", 500):
+            with patch("slcli.tag_click.shutil.get_terminal_size") as mock_size:
+                mock_size.return_value.columns = 56
+                with patch("slcli.tag_click.make_api_request") as mock_request:
+                    with patch("slcli.tag_click.resolve_workspace_id", return_value="ws-123"):
+                        mock_request.side_effect = [
+                            mock_response({"values": page1, "continuationToken": "next"}),
+                            mock_response({"values": page2}),
+                        ]
+                        result = runner.invoke(
+                            cli,
+                            ["tag", "history", "temperature", "--take", "1000", "--graph"],
+                        )
+
+        assert result.exit_code == 0
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1].kwargs["payload"]["continuationToken"] == "next"
+        assert mock_request.call_args_list[1].kwargs["payload"]["take"] == 500
+        assert "Range: t1 to t1000" in result.output
+        assert "Min: 1  Max: 99  Latest: 1" in result.output
+        graph_rows = [line for line in result.output.splitlines() if "┤" in line]
+        assert all(len(row.split("┤", 1)[1]) == 40 for row in graph_rows)
+        assert "●" in graph_rows[0]
+        assert "1000 samples" in result.output
+
     def test_history_graph_rejects_json_format(self, monkeypatch: Any) -> None:
         """Test graph mode cannot be combined with JSON output."""
         cli = make_cli()
@@ -1058,3 +1100,161 @@ class TestWorkspaceResolution:
             result = runner.invoke(cli, ["tag", "list"])
             assert result.exit_code != 0
             assert "API Error" in result.output
+
+
+class TestHistoryDecimator:
+    """Tests for the streaming tag history decimator."""
+
+    def test_short_history_is_not_decimated(self) -> None:
+        """Test fewer samples than columns are returned one per column."""
+        decimator = _HistoryDecimator(10)
+        decimator.extend(array("d", [3.0, 2.0, 1.0]))
+
+        assert decimator.columns(reverse=True) == [
+            (1.0, 1.0, 1.0),
+            (2.0, 2.0, 2.0),
+            (3.0, 3.0, 3.0),
+        ]
+
+    def test_envelope_preserves_extremes_across_pages(self) -> None:
+        """Test single-sample spikes survive decimating many pages."""
+        decimator = _HistoryDecimator(20)
+        for page in range(10):
+            values = array("d", [0.0] * 1000)
+            if page == 3:
+                values[417] = 50.0
+            if page == 8:
+                values[3] = -20.0
+            decimator.extend(values)
+
+        columns = decimator.columns()
+
+        assert decimator.count == 10000
+        assert len(columns) == 20
+        assert decimator.minimum == -20.0
+        assert decimator.maximum == 50.0
+        assert 50.0 in [point for point, _, _ in columns]
+        assert -20.0 in [point for point, _, _ in columns]
+        assert all(low <= point <= high for point, low, high in columns)
+
+    def test_bucket_memory_is_bounded(self) -> None:
+        """Test the number of retained buckets never exceeds twice the width."""
+        decimator = _HistoryDecimator(8)
+        for _ in range(100):
+            decimator.extend(array("d", range(97)))
+            assert len(decimator._counts) < 16
+
+
+class TestTagWatch:
+    """Tests for tag watch command."""
+
+    def test_watch_once_batches_paths_into_one_query(self, monkeypatch: Any) -> None:
+        """Test exact paths and globs are read with one query-tags-with-values call."""
+
+        def mock_get_password(service: str, key: str) -> Optional[str]:
+            if key == "SYSTEMLINK_CONFIG":
+                return json.dumps({"api_url": "http://localhost", "api_key": "test"})
+            return None
+
+        monkeypatch.setattr(keyring, "get_password", mock_get_password)
+
+        cli = make_cli()
+        runner = CliRunner()
+        data = {
+            "tagsWithValues": [
+                {
+                    "tag": {"path": "station1.temp", "workspace": "ws-123", "type": "DOUBLE"},
+                    "current": {
+                        "value": {"value": "21.5", "type": "DOUBLE"},
+                        "timestamp": "2024-01-02T00:00:00Z",
+                    },
+                },
+                {"tag": {"path": "station1.idle", "workspace": "ws-123"}, "current": None},
+            ]
+        }
+
+        with patch("slcli.tag_click.get_base_url", return_value="http://localhost"):
+            with patch("slcli.tag_click.make_api_request") as mock_request:
+                with patch("slcli.tag_click.resolve_workspace_id", return_value="ws-123"):
+                    mock_request.return_value = mock_response(data)
+                    result = runner.invoke(
+                        cli,
+                        ["tag", "watch", "station1.temp", "station2.*", "--once", "-f", "json"],
+                    )
+
+        assert result.exit_code == 0
+        mock_request.assert_called_once_with(
+            "POST",
+            "http://localhost/nitag/v2/query-tags-with-values",
+            payload={
+                "filter": (
+                    'workspace = "ws-123" && (path = "station1.temp" || path = "station2.*")'
+                ),
+                "take": 1000,
+            },
+        )
+        assert [json.loads(line) for line in result.output.splitlines()] == [
+            {
+                "timestamp": "2024-01-02T00:00:00Z",
+                "path": "station1.temp",
+                "workspace": "ws-123",
+                "type": "DOUBLE",
+                "value": "21.5",
+            }
+        ]
+
+    def test_watch_prints_only_changes_and_backs_off(self, monkeypatch: Any) -> None:
+        """Test unchanged values are suppressed and the interval backs off."""
+
+        def mock_get_password(service: str, key: str) -> Optional[str]:
+            if key == "SYSTEMLINK_CONFIG":
+                return json.dumps({"api_url": "http://localhost", "api_key": "test"})
+            return None
+
+        monkeypatch.setattr(keyring, "get_password", mock_get_password)
+
+        def tag_page(value: str) -> Any:
+            return mock_response(
+                {
+                    "tagsWithValues": [
+                        {
+                            "tag": {"path": "temp", "workspace": "ws-123"},
+                            "current": {
+                                "value": {"value": value, "type": "DOUBLE"},
+                                "timestamp": f"2024-01-02T00:00:0{value}Z",
+                            },
+                        }
+                    ]
+                }
+            )
+
+        sleeps: Any = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 4:
+                raise KeyboardInterrupt
+
+        cli = make_cli()
+        runner = CliRunner()
+        with patch("slcli.tag_click.make_api_request") as mock_request:
+            with patch("slcli.tag_click.resolve_workspace_id", return_value=None):
+                with patch("slcli.tag_click.time.sleep", side_effect=fake_sleep):
+                    mock_request.side_effect = [
+                        tag_page("1"),
+                        tag_page("1"),
+                        tag_page("1"),
+                        tag_page("2"),
+                    ]
+                    result = runner.invoke(cli, ["tag", "watch", "temp", "--interval", "2"])
+
+        assert result.exit_code == 0
+        rows = [line for line in result.output.splitlines() if line.startswith("2024")]
+        assert len(rows) == 2
+        assert "Tag watch stopped." in result.output
+        assert sleeps == [2.0, 3.0, 4.5, 2.0]
+
+    def test_next_watch_interval_is_capped(self) -> None:
+        """Test the adaptive interval never exceeds the configured maximum."""
+        assert _next_watch_interval(20.0, 1.0, 25.0, changed=False) == 25.0
+        assert _next_watch_interval(20.0, 1.0, 25.0, changed=True) == 1.0
@@ -0,0 +1,99 @@
+"""Unit tests for testmonitor_analytics.py."""
+
+from typing import Any, Dict, Optional
+
+import pytest
+
+from slcli.testmonitor_analytics import percentile, ResultAnalytics
+
+
+def _result(
+    serial: str,
+    status: str,
+    started: str,
+    program: str = "Cal",
+    duration: Optional[float] = 10.0,
+) -> Dict[str, Any]:
+    return {
+        "serialNumber": serial,
+        "status": {"statusType": status},
+        "startedAt": started,
+        "programName": program,
+        "partNumber": "P-1",
+        "totalTimeInSeconds": duration,
+    }
+
+
+def test_percentile_interpolates() -> None:
+    """Test linear interpolation between the nearest ranks."""
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4.0
+    assert percentile([], 50) is None
+
+
+def test_yield_first_pass_yield_and_durations_across_pages() -> None:
+    """Test aggregates are identical whether results arrive in one page or many."""
+    results = [
+        _result("A", "FAILED", "2026-01-01T10:00:00Z", duration=5),
+        _result("A", "PASSED", "2026-01-01T11:00:00Z", duration=15),
+        _result("B", "PASSED", "2026-01-01T09:00:00Z", duration=None),
+        _result("C", "RUNNING", "2026-01-02T09:00:00Z", program="Burn-in", duration=40),
+    ]
+    streamed = ResultAnalytics(["partNumber"], "programName")
+    for index in range(len(results)):
+        streamed.add_page(results[index : index + 1])
+    batched = ResultAnalytics(["partNumber"], "programName")
+    batched.add_page(results)
+
+    assert streamed.summary() == batched.summary()
+    [group] = streamed.groups()
+    assert group["partNumber"] == "P-1"
+    assert (group["total"], group["passed"], group["failed"]) == (4, 2, 1)
+    assert group["yield"] == pytest.approx(2 / 3)
+    assert group["units"] == 3
+    assert group["firstPassYield"] == pytest.approx(1 / 3)
+    assert group["duration"]["p50"] == 15
+
+
+def test_multi_key_groups_and_pareto() -> None:
+    """Test multi-key grouping and cumulative failure shares."""
+    analytics = ResultAnalytics(["programName", "day"], "programName")
+    analytics.add_page(
+        [
+            _result("A", "FAILED", "2026-01-01T10:00:00Z", program="Cal"),
+            _result("B", "FAILED", "2026-01-01T10:00:00Z", program="Cal"),
+            _result("C", "ERRORED", "2026-01-02T10:00:00Z", program="Burn-in"),
+            _result("D", "PASSED", "2026-01-02T10:00:00Z", program="Cal"),
+        ]
+    )
+
+    summary = analytics.summary(pareto_top=1)
+
+    assert summary["total"] == 4
+    assert summary["groups"][0] == {
+        "programName": "Cal",
+        "day": "2026-01-01",
+        "total": 2,
+        "passed": 0,
+        "failed": 2,
+        "yield": 0.0,
+        "units": 2,
+        "firstPassYield": 0.0,
+        "duration": {"p50": 10.0, "p90": 10.0, "p95": 10.0, "p99": 10.0},
+    }
+    assert len(summary["groups"]) == 3
+    assert summary["pareto"] == [
+        {
+            "programName": "Cal",
+            "failures": 2,
+            "percent": pytest.approx(2 / 3),
+            "cumulativePercent": pytest.approx(2 / 3),
+        }
+    ]
+
+
+def test_rejects_unknown_field() -> None:
+    """Test unsupported fields are reported."""
+    with pytest.raises(ValueError, match="Unsupported analytics field"):
+        ResultAnalytics(["color"], "programName")
@@ -261,6 +261,72 @@ def test_list_results_json_output(monkeypatch: Any, runner: CliRunner) -> None:
     assert data[0]["id"] == "res-1"
 
 
+def test_list_results_fields_sends_projection(monkeypatch: Any, runner: CliRunner) -> None:
+    """--fields is sent as a server projection and trims the JSON output."""
+    patch_keyring(monkeypatch)
+
+    captured_payloads: List[Dict[str, Any]] = []
+
+    def mock_request(
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        **_: Any,
+    ) -> Any:
+        captured_payloads.append(payload or {})
+        return MockResponse(
+            {
+                "totalCount": 1,
+                "results": [
+                    {
+                        "id": "res-1",
+                        "programName": "Calibration",
+                        "status": {"statusType": "PASSED", "statusName": "Passed"},
+                    }
+                ],
+            }
+        )
+
+    monkeypatch.setattr("slcli.testmonitor_click.make_api_request", mock_request)
+    monkeypatch.setattr("slcli.testmonitor_click.get_workspace_map", lambda: {})
+
+    cli = make_cli()
+    result = runner.invoke(
+        cli,
+        ["testmonitor", "result", "list", "--format", "json", "--fields", "id,status.statusType"],
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"id": "res-1", "status": {"statusType": "PASSED"}}]
+    assert captured_payloads[-1]["projection"] == ["ID", "STATUS"]
+
+
+def test_list_results_table_requests_rendered_columns(monkeypatch: Any, runner: CliRunner) -> None:
+    """Table output asks the server only for the columns it renders."""
+    patch_keyring(monkeypatch)
+
+    captured_payloads: List[Dict[str, Any]] = []
+
+    def mock_request(
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        **_: Any,
+    ) -> Any:
+        captured_payloads.append(payload or {})
+        return MockResponse({"results": [], "totalCount": 0})
+
+    monkeypatch.setattr("slcli.testmonitor_click.make_api_request", mock_request)
+    monkeypatch.setattr("slcli.testmonitor_click.get_workspace_map", lambda: {})
+
+    cli = make_cli()
+    result = runner.invoke(cli, ["testmonitor", "result", "list"])
+
+    assert result.exit_code == 0
+    projections = [p["projection"] for p in captured_payloads if "projection" in p]
+    assert projections and "PROPERTIES" not in projections[0]
+
+
 def test_product_list_take_parameter(monkeypatch: Any, runner: CliRunner) -> None:
     """Test that take parameter is correctly passed to API request."""
     patch_keyring(monkeypatch)
@@ -1530,3 +1596,93 @@ def test_delete_product_multiple_partial_failure(monkeypatch: Any, runner: CliRu
     result = runner.invoke(cli, ["testmonitor", "product", "delete", "--yes", "prod-1", "prod-2"])
 
     assert result.exit_code != 0
+
+
+# --- Export tests ---
+
+
+def test_export_writes_results_and_steps(
+    monkeypatch: Any, runner: CliRunner, tmp_path: Any
+) -> None:
+    """Test export builds the results filter and writes both tables."""
+    patch_keyring(monkeypatch)
+    payloads: List[Dict[str, Any]] = []
+
+    def mock_request(method: str, url: str, payload: Dict[str, Any], **_: Any) -> Any:
+        payloads.append(payload)
+        if url.endswith("/query-results"):
+            return MockResponse({"results": [{"id": "r1", "status": {"statusType": "FAILED"}}]})
+        return MockResponse({"steps": [{"resultId": "r1", "stepId": "s1", "name": "Step"}]})
+
+    monkeypatch.setattr("slcli.testmonitor_export.make_api_request", mock_request)
+
+    result = runner.invoke(
+        make_cli(),
+        ["testmonitor", "export", "-o", str(tmp_path), "--status", "failed", "-f", "csv"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert payloads[0]["filter"] == "status.statusType == @0"
+    assert payloads[0]["substitutions"] == ["FAILED"]
+    assert payloads[0]["orderBy"] == "STARTED_AT"
+    assert payloads[1]["substitutions"] == ["r1"]
+    assert (tmp_path / "results" / "part-00000.csv").read_text().splitlines()[1].startswith("r1,")
+    assert (tmp_path / "steps" / "part-00000.csv").exists()
+    assert "Results: 1" in result.output
+
+
+def test_export_refuses_existing_checkpoint(
+    monkeypatch: Any, runner: CliRunner, tmp_path: Any
+) -> None:
+    """Test export does not overwrite a previous export without --resume."""
+    patch_keyring(monkeypatch)
+    (tmp_path / "_checkpoint.json").write_text("{}")
+
+    result = runner.invoke(make_cli(), ["testmonitor", "export", "-o", str(tmp_path)])
+
+    assert result.exit_code == 2
+    assert "--resume" in result.output
+
+
+def test_result_analytics_streams_all_pages(monkeypatch: Any, runner: CliRunner) -> None:
+    """Test analytics follows continuation tokens and aggregates every page."""
+    patch_keyring(monkeypatch)
+    pages = [
+        {
+            "results": [
+                {"id": "r1", "serialNumber": "A", "status": {"statusType": "FAILED"}},
+                {"id": "r2", "serialNumber": "B", "status": {"statusType": "PASSED"}},
+            ],
+            "continuationToken": "next",
+        },
+        {"results": [{"id": "r3", "serialNumber": "C", "status": {"statusType": "PASSED"}}]},
+    ]
+    payloads: List[Dict[str, Any]] = []
+
+    def mock_request(method: str, url: str, payload: Dict[str, Any], **_: Any) -> Any:
+        payloads.append(payload)
+        return MockResponse(pages[len(payloads) - 1])
+
+    monkeypatch.setattr("slcli.testmonitor_export.make_api_request", mock_request)
+
+    result = runner.invoke(
+        make_cli(),
+        ["testmonitor", "result", "analytics", "--part-number", "P-1", "-f", "json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert payloads[0]["filter"] == "partNumber.Contains(@0)"
+    assert payloads[1]["continuationToken"] == "next"
+    summary = json.loads(result.output)
+    assert summary["total"] == 3
+    assert summary["groups"][0]["yield"] == pytest.approx(2 / 3)
+    assert summary["pareto"][0]["failures"] == 1
+
+    payloads.clear()
+    result = runner.invoke(
+        make_cli(), ["testmonitor", "result", "analytics", "-g", "status", "--max-results", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert len(payloads) == 1
+    assert "FAILED" in result.output
+    assert "Failure Pareto by programName" in result.output
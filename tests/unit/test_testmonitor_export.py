@@ -0,0 +1,172 @@
+"""Unit tests for testmonitor_export.py."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from slcli.testmonitor_export import (
+    CHECKPOINT_FILE,
+    STEP_COLUMNS,
+    build_step_filter,
+    export_results,
+    flatten_result,
+    flatten_step,
+    load_checkpoint,
+)
+
+
+def _result(index: int, day: str, part: str) -> Dict[str, Any]:
+    return {
+        "id": f"r{index}",
+        "programName": "Cal",
+        "status": {"statusType": "PASSED", "statusName": "Passed"},
+        "partNumber": part,
+        "startedAt": f"{day}T10:00:00Z",
+        "keywords": ["a"],
+    }
+
+
+def _step(result_id: str) -> Dict[str, Any]:
+    return {
+        "resultId": result_id,
+        "stepId": f"{result_id}-s1",
+        "name": "Voltage",
+        "status": {"statusType": "PASSED"},
+        "data": {
+            "parameters": [
+                {"name": "V", "measurement": "3.7", "units": "V", "custom": 1},
+                {"name": "I", "measurement": "0.2", "units": "A"},
+            ]
+        },
+    }
+
+
+class FakeTestMonitor:
+    """Serve query-results pages and query-steps batches from memory."""
+
+    def __init__(self, results: List[Dict[str, Any]], page_size: int) -> None:
+        """Create a server holding ``results``."""
+        self.results = results
+        self.page_size = page_size
+        self.result_payloads: List[Dict[str, Any]] = []
+        self.step_payloads: List[Dict[str, Any]] = []
+        self.fail_at_token: Any = None
+
+    def __call__(self, method: str, url: str, payload: Dict[str, Any], **_: Any) -> Any:
+        server = self
+
+        class _Response:
+            def json(self) -> Any:
+                return server.respond(url, payload)
+
+        return _Response()
+
+    def respond(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if url.endswith("/query-results"):
+            self.result_payloads.append(payload)
+            token = payload.get("continuationToken")
+            if token is not None and token == self.fail_at_token:
+                raise RuntimeError("connection reset")
+            start = int(token or 0)
+            end = start + payload["take"]
+            next_token = str(end) if end < len(self.results) else None
+            return {"results": self.results[start:end], "continuationToken": next_token}
+        self.step_payloads.append(payload)
+        return {"steps": [_step(result_id) for result_id in payload["substitutions"]]}
+
+
+@pytest.fixture
+def server(monkeypatch: Any) -> FakeTestMonitor:
+    fake = FakeTestMonitor(
+        [
+            _result(0, "2026-01-01", "P-1"),
+            _result(1, "2026-01-01", "P-2"),
+            _result(2, "2026-01-02", "P-1"),
+        ],
+        page_size=2,
+    )
+    monkeypatch.setattr("slcli.testmonitor_export.make_api_request", fake)
+    monkeypatch.setattr("slcli.testmonitor_export.get_base_url", lambda: "https://test.com")
+    return fake
+
+
+def _read_jsonl(root: Path) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for path in sorted(root.rglob("*.jsonl")):
+        rows.extend(json.loads(line) for line in path.read_text().splitlines())
+    return rows
+
+
+def test_flatten_step_one_row_per_parameter() -> None:
+    """Test measurement parameters become rows and unknown keys are kept."""
+    rows = flatten_step(_step("r1"))
+    assert len(rows) == 2
+    first = dict(zip(STEP_COLUMNS, rows[0]))
+    assert first["parameterName"] == "V"
+    assert first["measurement"] == "3.7"
+    assert first["status"] == "PASSED"
+    assert json.loads(first["parameterAttributes"]) == {"custom": 1}
+    assert flatten_step({"stepId": "s"})[0][STEP_COLUMNS.index("stepId")] == "s"
+
+
+def test_flatten_result_encodes_nested_values() -> None:
+    """Test status is reduced to its type and lists are JSON encoded."""
+    row = flatten_result(_result(0, "2026-01-01", "P-1"))
+    assert "PASSED" in row
+    assert '["a"]' in row
+
+
+def test_build_step_filter() -> None:
+    """Test step queries match any of the batched result IDs."""
+    assert build_step_filter(["a", "b"]) == ("resultId == @0 || resultId == @1", ["a", "b"])
+
+
+def test_export_partitions_by_day(tmp_path: Path, server: FakeTestMonitor) -> None:
+    """Test results and steps land in day partitions with one part per page."""
+    checkpoint = export_results(
+        tmp_path,
+        {"descending": False},
+        "jsonl",
+        partition_by="day",
+        page_size=2,
+        step_batch_size=1,
+    )
+    assert checkpoint["complete"] is True
+    assert checkpoint["results"] == 3
+    assert checkpoint["stepRows"] == 6
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("part-*")) == [
+        "results/day=2026-01-01/part-00000.jsonl",
+        "results/day=2026-01-02/part-00001.jsonl",
+        "steps/day=2026-01-01/part-00000.jsonl",
+        "steps/day=2026-01-02/part-00001.jsonl",
+    ]
+    assert len(server.step_payloads) == 3
+    assert [row["id"] for row in _read_jsonl(tmp_path / "results")] == ["r0", "r1", "r2"]
+
+
+def test_export_resumes_after_failure(tmp_path: Path, server: FakeTestMonitor) -> None:
+    """Test an interrupted export continues from the saved continuation token."""
+    server.fail_at_token = "2"
+    with pytest.raises(RuntimeError):
+        export_results(tmp_path, {}, "jsonl", page_size=2)
+    checkpoint = load_checkpoint(tmp_path)
+    assert checkpoint is not None
+    assert checkpoint["results"] == 2
+    assert checkpoint["continuationToken"] == "2"
+
+    server.fail_at_token = None
+    server.result_payloads.clear()
+    checkpoint = export_results(tmp_path, {}, "jsonl", page_size=2, resume=True)
+    assert checkpoint["results"] == 3
+    assert server.result_payloads[0]["continuationToken"] == "2"
+    assert [row["id"] for row in _read_jsonl(tmp_path / "results")] == ["r0", "r1", "r2"]
+
+
+def test_resume_rejects_different_configuration(tmp_path: Path, server: FakeTestMonitor) -> None:
+    """Test resuming with other options than the checkpoint fails."""
+    export_results(tmp_path, {}, "jsonl", page_size=2, max_results=1)
+    assert (tmp_path / CHECKPOINT_FILE).exists()
+    with pytest.raises(ValueError):
+        export_results(tmp_path, {}, "csv", page_size=2, resume=True)
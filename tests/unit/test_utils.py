@@ -8,6 +8,9 @@ from unittest.mock import MagicMock, patch
 import click
 import pytest
 
+# Captured at import time; the autouse network fixture replaces the module attribute
+from slcli.utils import get_workspace_map as real_get_workspace_map
+
 
 def patch_keyring(monkeypatch: Any, platform: str = "SLE") -> None:
     """Patch keyring to return a mock configuration.
@@ -230,6 +233,79 @@ def test_make_web_request_uses_explicit_bearer_credential(monkeypatch: Any) -> N
     assert "x-ni-api-key" not in call_kwargs["headers"]
 
 
+def test_pooled_http_session_routes_requests_through_one_session(monkeypatch: Any) -> None:
+    """Requests inside a pooled session reuse it and fall back afterwards."""
+    import requests
+
+    from slcli import utils
+
+    monkeypatch.setenv("SLCLI_WEB_URL", "https://web.example.com")
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+
+    with patch.object(requests.Session, "get", return_value=response) as session_get:
+        with patch("requests.get", return_value=response) as module_get:
+            with utils.pooled_http_session() as session:
+                with utils.pooled_http_session() as nested:
+                    assert nested is session
+                utils.make_web_request("GET", "/niauth/v1/auth", credential="token")
+                utils.make_web_request("GET", "/niauth/v1/auth", credential="token")
+            utils.make_web_request("GET", "/niauth/v1/auth", credential="token")
+
+    assert session_get.call_count == 2
+    assert module_get.call_count == 1
+    assert utils._pooled_sessions is None
+
+
+def test_pooled_http_session_gives_each_thread_its_own_session() -> None:
+    """Threads in one pooled scope never share a session."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from slcli import utils
+
+    with utils.pooled_http_session() as pool:
+        main_session = pool.session()
+        assert pool.session() is main_session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            worker_sessions = set(executor.map(lambda _: id(pool.session()), range(8)))
+        assert id(main_session) not in worker_sessions
+        assert len(worker_sessions) <= 2
+
+
+def test_multipart_file_stream_streams_body(tmp_path: Path, monkeypatch: Any) -> None:
+    """The streamed multipart body is posted as raw data with its boundary header."""
+    from slcli import utils
+
+    package = tmp_path / "demo_1.0.0_all.nipkg"
+    package.write_bytes(b"x" * 5000)
+    patch_keyring(monkeypatch)
+    sent: Dict[str, Any] = {}
+
+    def fake_post(url: str, **kwargs: Any) -> MagicMock:
+        body = kwargs["data"]
+        sent["length"] = len(body)
+        sent["body"] = b"".join(iter(lambda: body.read(1024), b""))
+        sent["headers"] = kwargs["headers"]
+        return MagicMock()
+
+    with utils.MultipartFileStream("package", str(package)) as stream:
+        with patch("requests.post", side_effect=fake_post):
+            utils.make_api_request(
+                "POST",
+                "https://api.example.com/upload",
+                headers={"Content-Type": stream.content_type},
+                data=stream,
+            )
+
+    body = sent["body"]
+    assert sent["length"] == len(body)
+    assert sent["headers"]["Content-Type"] == f"multipart/form-data; boundary={stream.boundary}"
+    assert body.startswith(f"--{stream.boundary}\r\n".encode())
+    assert b'name="package"; filename="demo_1.0.0_all.nipkg"' in body
+    assert b"x" * 5000 in body
+    assert body.endswith(f"\r\n--{stream.boundary}--\r\n".encode())
+
+
 def test_base_url_resolution_strips_trailing_slash_from_env(monkeypatch: Any) -> None:
     """Base URL env overrides should normalize a trailing slash."""
     from slcli.utils import get_base_url_resolution
@@ -324,3 +400,34 @@ def test_ssl_verify_prefers_os_trust_over_ssl_cert_file(monkeypatch: Any) -> Non
     monkeypatch.setattr("slcli.ssl_trust.OS_TRUST_INJECTED", True)
 
     assert get_ssl_verify("https://example.com") is True
+
+
+def test_workspace_map_cache_reuses_recent_lookups(monkeypatch: Any) -> None:
+    """Test the opt-in workspace map cache avoids refetching within its TTL."""
+    from slcli import utils
+
+    monkeypatch.setenv("SLCLI_API_URL", "https://example.test")
+    monkeypatch.setenv("SLCLI_API_KEY", "key-1")
+    calls = []
+
+    def fake_request(method: str, url: str, **_: Any) -> Any:
+        calls.append(url)
+        response = MagicMock()
+        response.json.return_value = {"workspaces": [{"id": "w1", "name": "Lab"}], "totalCount": 1}
+        return response
+
+    monkeypatch.setattr(utils, "make_api_request", fake_request)
+    try:
+        utils.set_workspace_map_cache_ttl(60)
+        assert real_get_workspace_map() == {"w1": "Lab"}
+        assert real_get_workspace_map() == {"w1": "Lab"}
+        assert len(calls) == 1
+
+        monkeypatch.setenv("SLCLI_API_KEY", "key-2")
+        real_get_workspace_map()
+        assert len(calls) == 2
+    finally:
+        utils.set_workspace_map_cache_ttl(0)
+
+    real_get_workspace_map()
+    assert len(calls) == 3
@@ -101,6 +101,14 @@ def _no_profile_workspace() -> Any:
         yield
 
 
+@pytest.fixture(autouse=True)
+def _isolated_publish_state(tmp_path_factory: pytest.TempPathFactory) -> Any:
+    """Keep the local webapp publish state out of the user's config directory."""
+    state_path = tmp_path_factory.mktemp("publish-state") / "webapp-publish-state.json"
+    with patch("slcli.webapp_click._get_publish_state_path", return_value=state_path):
+        yield state_path
+
+
 def test_webapp_init_creates_starter_files(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
     runner = CliRunner()
     patch_keyring(monkeypatch)
@@ -1718,14 +1726,22 @@ def test_webapp_publish_existing_id_includes_published_url(
         def raise_for_status(self) -> None:
             return None
 
+    uploaded: List[bytes] = []
+
+    def mock_put(url: str, **kwargs: Any) -> Any:
+        # The package is streamed from an open file rather than read into memory
+        uploaded.append(kwargs["data"].read())
+        return MockPutResp()
+
     monkeypatch.setattr(requests, "get", lambda *a, **k: MockGetResp())
-    monkeypatch.setattr(requests, "put", lambda *a, **k: MockPutResp())
+    monkeypatch.setattr(requests, "put", mock_put)
     monkeypatch.setattr(slcli.webapp_click, "get_workspace_map", lambda: {"ws1": "Default"})
     monkeypatch.setattr(slcli.webapp_click, "get_web_url", lambda: "https://web.example.test")
 
     result = runner.invoke(cli, ["webapp", "publish", str(package), "--id", "existing-id"])
 
     assert result.exit_code == 0
+    assert uploaded == [b"test"]
     assert "Published URL" in result.output
     assert "https://web.example.test/webapps/app/Default/Existing%20App" in result.output
 
@@ -1818,3 +1834,182 @@ def test_webapp_open_uses_workspace_url(monkeypatch: MonkeyPatch) -> None:
     assert result.exit_code == 0
     assert opened[0] == "https://web.example.test/webapps/app/Workspace%20One/AppOne"
     assert "Opening" in result.output
+
+
+class _PublishServer:
+    """Record webapp service calls made by incremental folder publishes."""
+
+    def __init__(self, store_digest: bool = True) -> None:
+        self.store_digest = store_digest
+        self.properties: Dict[str, Any] = {}
+        self.content_uploads = 0
+        self.stored_records: List[Dict[str, Any]] = []
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        server = self
+
+        class Resp:
+            status_code = 200
+
+            def json(self) -> Dict[str, Any]:
+                return {
+                    "id": "app-1",
+                    "name": "App",
+                    "version": server.content_uploads,
+                    "properties": dict(server.properties),
+                }
+
+            def raise_for_status(self) -> None:
+                return None
+
+        return Resp()
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        status = 204
+        if url.endswith("/content"):
+            kwargs["data"].read()
+            self.content_uploads += 1
+        elif self.store_digest:
+            self.stored_records.append(kwargs["json"])
+            self.properties = kwargs["json"]["properties"]
+        else:
+            status = 500
+
+        class Resp:
+            text = ""
+            status_code = status
+
+            def raise_for_status(self) -> None:
+                if status >= 400:
+                    import requests
+
+                    raise requests.HTTPError("failed")
+
+        return Resp()
+
+
+def _publish_folder(folder: Path, *extra: str) -> Any:
+    return CliRunner().invoke(cli, ["webapp", "publish", str(folder), "--id", "app-1", *extra])
+
+
+def _install_publish_server(monkeypatch: MonkeyPatch, server: _PublishServer) -> None:
+    import requests
+    import slcli.webapp_click
+
+    patch_keyring(monkeypatch)
+    monkeypatch.setattr(requests, "get", server.get)
+    monkeypatch.setattr(requests, "put", server.put)
+    monkeypatch.setattr(slcli.webapp_click, "get_web_url", lambda: "https://web.example.test")
+
+
+def test_webapp_publish_skips_unchanged_folder_using_webapp_property(
+    tmp_path: Path, monkeypatch: MonkeyPatch, _isolated_publish_state: Path
+) -> None:
+    server = _PublishServer()
+    _install_publish_server(monkeypatch, server)
+    folder = tmp_path / "dist"
+    folder.mkdir()
+    (folder / "index.html").write_text("v1")
+
+    first = _publish_folder(folder)
+    assert first.exit_code == 0, first.output
+    assert server.content_uploads == 1
+    assert len(server.properties["slcliContentDigest"]) == 64
+    # The digest is stored on the metadata as it is after the upload
+    assert server.stored_records[-1]["version"] == 1
+
+    # A different machine without local state still skips the upload
+    _isolated_publish_state.unlink()
+    second = _publish_folder(folder)
+    assert second.exit_code == 0, second.output
+    assert "Webapp content unchanged, skipped publish" in second.output
+    assert server.content_uploads == 1
+
+    forced = _publish_folder(folder, "--force")
+    assert forced.exit_code == 0, forced.output
+    assert server.content_uploads == 2
+
+
+def test_webapp_publish_reports_changes_from_local_state(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    server = _PublishServer()
+    _install_publish_server(monkeypatch, server)
+    folder = tmp_path / "dist"
+    (folder / "assets").mkdir(parents=True)
+    (folder / "index.html").write_text("v1")
+    (folder / "assets" / "main.js").write_text("console.log(1)")
+    (folder / "assets" / "old.css").write_text("body {}")
+
+    first = _publish_folder(folder)
+    assert first.exit_code == 0, first.output
+
+    unchanged = _publish_folder(folder)
+    assert "Webapp content unchanged, skipped publish" in unchanged.output
+    assert server.content_uploads == 1
+
+    (folder / "index.html").write_text("v2")
+    (folder / "assets" / "old.css").unlink()
+    (folder / "assets" / "new.css").write_text("body { margin: 0 }")
+    changed = _publish_folder(folder)
+
+    assert changed.exit_code == 0, changed.output
+    assert "1 added, 1 modified, 1 removed, 1 unchanged" in changed.output
+    assert server.content_uploads == 2
+
+
+def test_webapp_publish_uploads_when_webapp_digest_is_missing_or_unreadable(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    import requests
+
+    server = _PublishServer(store_digest=False)
+    _install_publish_server(monkeypatch, server)
+    folder = tmp_path / "dist"
+    folder.mkdir()
+    (folder / "index.html").write_text("v1")
+
+    first = _publish_folder(folder)
+    assert first.exit_code == 0, first.output
+    assert "Could not store the content digest" in first.output
+
+    # Local state alone does not prove the webapp still serves this build
+    again = _publish_folder(folder)
+    assert again.exit_code == 0, again.output
+    assert "skipped publish" not in again.output
+    assert server.content_uploads == 2
+
+    server.store_digest = True
+    stored = _publish_folder(folder)
+    assert stored.exit_code == 0, stored.output
+    assert server.content_uploads == 3
+
+    def unreadable(url: str, **kwargs: Any) -> Any:
+        raise requests.ConnectionError("webapp service unavailable")
+
+    monkeypatch.setattr(requests, "get", unreadable)
+    unknown = _publish_folder(folder)
+    assert "skipped publish" not in unknown.output
+    assert server.content_uploads == 4
+
+
+def test_build_content_manifest_reuses_cached_hashes(tmp_path: Path) -> None:
+    import slcli.webapp_click as webapp_click
+
+    folder = tmp_path / "dist"
+    folder.mkdir()
+    (folder / "a.js").write_text("a")
+    (folder / "b.js").write_text("b")
+    state: Dict[str, Any] = {"hashCache": {}, "published": {}}
+
+    first = webapp_click._build_content_manifest(folder, state)
+    (folder / "b.js").write_text("bb")
+    with patch.object(
+        webapp_click, "_compute_sha256", wraps=webapp_click._compute_sha256
+    ) as compute:
+        second = webapp_click._build_content_manifest(folder, state)
+
+    assert compute.call_count == 1
+    assert first["a.js"] == second["a.js"]
+    assert first["b.js"] != second["b.js"]
+    assert second["b.js"] == sha256(b"bb").hexdigest()
@@ -144,6 +144,42 @@ def test_list_workitems_json(monkeypatch: Any, runner: CliRunner) -> None:
     assert data[0]["id"] == "1000"
 
 
+def test_list_workitems_fields(monkeypatch: Any, runner: CliRunner) -> None:
+    """--fields sends a projection and trims the JSON output."""
+    patch_keyring(monkeypatch)
+
+    payloads: List[Dict[str, Any]] = []
+
+    def mock_post(*a: Any, **kw: Any) -> Any:
+        payloads.append(kw.get("json") or {})
+
+        class R:
+            status_code = 200
+
+            def raise_for_status(self) -> None:
+                pass
+
+            def json(self) -> Any:
+                return {"workItems": [_make_workitem()]}
+
+        return R()
+
+    monkeypatch.setattr("requests.post", mock_post)
+    monkeypatch.setattr("slcli.workitem_click.get_workspace_map", lambda: {"ws1": "Default"})
+
+    cli = make_cli()
+    result = runner.invoke(cli, ["workitem", "list", "--format", "json", "--fields", "id,state"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"id": "1000", "state": "NEW"}]
+    assert payloads[0]["projection"] == ["ID", "STATE"]
+
+    payloads.clear()
+    result = runner.invoke(cli, ["workitem", "list", "--fields", "id,state"])
+    assert result.exit_code == 0
+    assert "state" in result.output and "Battery Cycle Test" not in result.output
+    assert payloads[0]["projection"] == ["ID", "STATE"]
+
+
 def test_list_workitems_json_uses_requested_take(monkeypatch: Any, runner: CliRunner) -> None:
     """JSON work-item queries use requested page size and filter substitutions."""
     patch_keyring(monkeypatch)